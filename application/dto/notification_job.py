@@ -0,0 +1,18 @@
+"""通知ジョブ データ転送オブジェクト"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from domain.entities.channel import Channel
+from domain.entities.stream import Stream
+
+
+@dataclass
+class NotificationJob:
+    """検出ステージから通知ステージへ渡す配信開始通知（レイヤー間のデータ転送用）"""
+
+    channel: Channel
+    stream: Stream
+    detected_at: datetime  # 配信開始を検知した時刻（タイムゾーン付き）
+    queued_at: Optional[datetime] = None  # 通知キューに投入した時刻（タイムゾーン付き）
@@ -0,0 +1,68 @@
+"""通知遅延データ転送オブジェクト"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from domain.value_objects.webhook_delivery import WebhookDelivery
+
+
+@dataclass
+class NotificationLatencyDto:
+    """配信開始から通知到達までの各時刻を表すDTO（レイヤー間のデータ転送用）
+
+    時刻はすべてタイムゾーン付き。
+    """
+
+    channel_id: str
+    channel_name: str
+    video_id: str
+    started_at: datetime  # 配信開始時刻（actualStartTime）
+    detected_at: datetime  # 配信開始を検知した時刻
+    queued_at: Optional[datetime]  # 通知キューに投入した時刻
+    deliveries: List[WebhookDelivery] = field(default_factory=list)  # Webhookごとの送信完了
+
+    @property
+    def detection_seconds(self) -> float:
+        """配信開始 → 検知"""
+        return _seconds(self.started_at, self.detected_at)
+
+    @property
+    def queue_seconds(self) -> Optional[float]:
+        """検知 → 通知キュー投入"""
+        return _seconds(self.detected_at, self.queued_at) if self.queued_at else None
+
+    def end_to_end_seconds(self) -> List[float]:
+        """配信開始 → Webhookごとの送信完了"""
+        return [_seconds(self.started_at, d.delivered_at) for d in self.deliveries]
+
+    def dispatch_seconds(self) -> List[float]:
+        """通知キュー投入（なければ検知）→ Webhookごとの送信完了"""
+        origin = self.queued_at or self.detected_at
+        return [_seconds(origin, d.delivered_at) for d in self.deliveries]
+
+    def to_dict(self) -> dict:
+        """辞書形式に変換（JSON保存用、WebhookはトークンなしのIDのみ）"""
+        return {
+            "channel_id": self.channel_id,
+            "channel_name": self.channel_name,
+            "video_id": self.video_id,
+            "started_at": self.started_at.isoformat(),
+            "detected_at": self.detected_at.isoformat(),
+            "queued_at": self.queued_at.isoformat() if self.queued_at else None,
+            "deliveries": [
+                {"webhook_id": d.webhook_id, "delivered_at": d.delivered_at.isoformat()}
+                for d in self.deliveries
+            ],
+            "detection_seconds": round(self.detection_seconds, 3),
+            "end_to_end_seconds": [round(s, 3) for s in self.end_to_end_seconds()],
+        }
+
+
+def _seconds(start: datetime, end: datetime) -> float:
+    """経過秒数（時計のずれで負になる場合は0、タイムゾーンなしはローカル時刻とみなす）"""
+    if start.tzinfo is None:
+        start = start.astimezone()
+    if end.tzinfo is None:
+        end = end.astimezone()
+    return max(0.0, (end - start).total_seconds())
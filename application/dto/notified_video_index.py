@@ -0,0 +1,115 @@
+"""通知済み動画IDの履歴
+
+チャンネルごとに通知した動画IDを覚えておき、同じ配信を再通知しないために使う。
+
+- 直近の size 件は挿入順の辞書（LRU）で正確に保持する
+- bloom_bits を指定した場合、LRU から押し出した動画IDはブルームフィルターに移して長期間覚えておく
+  （偽陽性で新しい配信を通知済みと誤判定しうるため、既定では使わない。要素数が容量に達したら作り直す）
+
+どちらもサイズが固定のため、稼働時間によらずチャンネルあたりのメモリ・保存サイズは一定で、
+判定は O(1) で行える。状態（StreamStateDto）の一部として保存する。
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from application.services.bloom_filter import BloomFilter
+
+
+class NotifiedVideoIndex:
+    """チャンネルの通知済み動画ID（変更せず、with_video で新しい履歴を作る）"""
+
+    __slots__ = ("_recent", "_bloom")
+
+    def __init__(self, recent: Iterable[str] = (), bloom: Optional[BloomFilter] = None):
+        """
+        Args:
+            recent: 直近に通知した動画ID（古い順）
+            bloom: LRU から押し出した動画IDのブルームフィルター
+        """
+        self._recent: Dict[str, None] = dict.fromkeys(recent)
+        self._bloom = bloom
+
+    def __contains__(self, video_id: object) -> bool:
+        if video_id in self._recent:
+            return True
+        return self._bloom is not None and isinstance(video_id, str) and video_id in self._bloom
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, NotifiedVideoIndex):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"NotifiedVideoIndex({self.recent!r})"
+
+    @classmethod
+    def empty(cls) -> "NotifiedVideoIndex":
+        """空の履歴（変更しないため、全チャンネルで1つのインスタンスを共有する）"""
+        return _EMPTY
+
+    @property
+    def recent(self) -> List[str]:
+        """直近に通知した動画ID（古い順）"""
+        return list(self._recent)
+
+    def with_video(self, video_id: str, size: int, bloom_bits: int = 0) -> "NotifiedVideoIndex":
+        """
+        動画IDを追加した新しい履歴
+
+        Args:
+            video_id: 通知した動画ID
+            size: 正確に保持する件数（超えた分は古い順に押し出す）
+            bloom_bits: 押し出した動画IDを覚えておくブルームフィルターのビット数（0で使わない）
+        """
+        recent = dict(self._recent)
+        recent.pop(video_id, None)
+        recent[video_id] = None
+        evicted = []
+        while len(recent) > max(1, size):
+            oldest = next(iter(recent))
+            del recent[oldest]
+            evicted.append(oldest)
+
+        bloom = self._bloom
+        if bloom_bits <= 0:
+            bloom = None
+        elif bloom is not None and bloom.bits != (bloom_bits + 7) // 8 * 8:
+            # 設定が変わった場合は作り直す
+            bloom = None
+        if evicted and bloom_bits > 0:
+            if bloom is None or len(bloom) + len(evicted) > bloom.capacity:
+                # 偽陽性率が上がらないよう、容量に達したら空にする
+                bloom = BloomFilter(bloom_bits)
+            else:
+                bloom = bloom.copy()
+            for oldest in evicted:
+                bloom.add(oldest)
+        return NotifiedVideoIndex(recent, bloom)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書形式に変換（JSON保存用）"""
+        data: Dict[str, Any] = {"recent": self.recent}
+        if self._bloom is not None:
+            data["bloom"] = self._bloom.to_base64()
+            data["bloom_bits"] = self._bloom.bits
+            data["bloom_count"] = len(self._bloom)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NotifiedVideoIndex":
+        """辞書形式から復元（JSON読み込み用）"""
+        bloom = None
+        if data.get("bloom") and data.get("bloom_bits"):
+            bloom = BloomFilter.from_base64(
+                data["bloom"], data["bloom_bits"], count=data.get("bloom_count", 0)
+            )
+        recent = data.get("recent", [])
+        if not recent and bloom is None:
+            return _EMPTY
+        return cls(recent, bloom)
+
+
+_EMPTY = NotifiedVideoIndex()
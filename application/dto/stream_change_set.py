@@ -0,0 +1,23 @@
+"""配信状態の変化（一括検出の結果） データ転送オブジェクト"""
+
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from application.dto.stream_state_dto import StreamStateDto
+
+
+@dataclass(slots=True)
+class StreamChangeSet:
+    """
+    監視サイクル（チャンク）分の配信状態の変化
+
+    各リストは検出に渡した配列の添字で、1つのチャンネルはいずれか1つにだけ含まれる
+    （前回も今回も未配信のチャンネルはどれにも含まれず、状態も更新しない）。
+    """
+
+    started: List[int] = field(default_factory=list)  # 配信開始（通知後に状態を更新する）
+    ended: List[int] = field(default_factory=list)  # 配信終了（前回配信中 → 今回未配信）
+    continued: List[int] = field(default_factory=list)  # 通知済みの配信が継続中
+    went_offline: List[int] = field(default_factory=list)  # 初回の確認で未配信
+    # 保存が必要な状態（添字, 新しい状態）。配信開始は通知の成功後に保存するため含まない
+    updates: List[Tuple[int, StreamStateDto]] = field(default_factory=list)
@@ -1,11 +1,13 @@
 """配信状態データ転送オブジェクト"""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+from application.dto.notified_video_index import NotifiedVideoIndex
 
-@dataclass
+
+@dataclass(slots=True)
 class StreamStateDto:
     """配信状態を表すDTO（レイヤー間のデータ転送用）"""
 
@@ -13,6 +15,7 @@ class StreamStateDto:
     video_id: Optional[str]
     last_checked: datetime
     last_notified: Optional[datetime]
+    notified: NotifiedVideoIndex = field(default_factory=NotifiedVideoIndex.empty)  # 通知済み動画ID
 
     def to_dict(self) -> dict:
         """辞書形式に変換（JSON保存用）"""
@@ -21,11 +24,19 @@ class StreamStateDto:
             "video_id": self.video_id,
             "last_checked": self.last_checked.isoformat(),
             "last_notified": self.last_notified.isoformat() if self.last_notified else None,
+            "notified": self.notified.to_dict(),
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "StreamStateDto":
         """辞書形式から復元（JSON読み込み用）"""
+        if "notified" in data:
+            notified = NotifiedVideoIndex.from_dict(data["notified"])
+        elif data["is_live"] and data.get("video_id") and data.get("last_notified"):
+            # 履歴を保存していない状態ファイルは、通知済みの配信中の動画だけを引き継ぐ
+            notified = NotifiedVideoIndex([data["video_id"]])
+        else:
+            notified = NotifiedVideoIndex.empty()
         return cls(
             is_live=data["is_live"],
             video_id=data.get("video_id"),
@@ -33,4 +44,5 @@ class StreamStateDto:
             last_notified=(
                 datetime.fromisoformat(data["last_notified"]) if data.get("last_notified") else None
             ),
+            notified=notified,
         )
@@ -0,0 +1,83 @@
+"""ブルームフィルター
+
+固定サイズのビット配列で「追加済みかもしれない / 確実に未追加」を判定する集合。
+偽陽性（追加していない値を追加済みと判定する）はあるが、偽陰性はない。
+要素数 n に対してビット数 m、ハッシュ数 k の偽陽性率は約 (1 - e^(-kn/m))^k。
+"""
+
+import base64
+import hashlib
+from typing import Iterator
+
+# ハッシュ関数の数（m/n = 10 のとき偽陽性率が約1%になる値）
+DEFAULT_HASHES = 7
+# 偽陽性率を約1%に保てる要素数あたりのビット数
+BITS_PER_ITEM = 10
+
+
+class BloomFilter:
+    """固定サイズのブルームフィルター"""
+
+    __slots__ = ("_bits", "_hashes", "_array", "_count")
+
+    def __init__(self, bits: int, hashes: int = DEFAULT_HASHES, data: bytes = b"", count: int = 0):
+        """
+        Args:
+            bits: ビット数（8の倍数に切り上げる）
+            hashes: ハッシュ関数の数
+            data: 復元するビット配列（省略時は空）
+            count: 追加済みの要素数（復元用）
+        """
+        if bits <= 0:
+            raise ValueError(f"bits は1以上を指定してください: {bits}")
+        size = (bits + 7) // 8
+        self._bits = size * 8
+        self._hashes = hashes
+        self._array = bytearray(data) if len(data) == size else bytearray(size)
+        self._count = count if len(data) == size else 0
+
+    @property
+    def bits(self) -> int:
+        return self._bits
+
+    @property
+    def capacity(self) -> int:
+        """偽陽性率を約1%に保てる要素数"""
+        return max(1, self._bits // BITS_PER_ITEM)
+
+    def __len__(self) -> int:
+        """追加した要素数（重複を含む）"""
+        return self._count
+
+    def _positions(self, value: str) -> Iterator[int]:
+        # 2つのハッシュ値の線形結合で k 個の位置を作る（Kirsch-Mitzenmacher）
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        for i in range(self._hashes):
+            yield (h1 + i * h2) % self._bits
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self._array[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self._array[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+    def copy(self) -> "BloomFilter":
+        return BloomFilter(
+            self._bits, hashes=self._hashes, data=bytes(self._array), count=self._count
+        )
+
+    def to_base64(self) -> str:
+        return base64.b64encode(bytes(self._array)).decode("ascii")
+
+    @classmethod
+    def from_base64(
+        cls, encoded: str, bits: int, hashes: int = DEFAULT_HASHES, count: int = 0
+    ) -> "BloomFilter":
+        return cls(bits, hashes=hashes, data=base64.b64decode(encoded), count=count)
@@ -0,0 +1,196 @@
+"""チャンネルの確認と隔離
+
+設定の正規表現では形式しか確認できないため、存在しない・停止されたチャンネルは
+playlistItems.list の 404 として毎回の監視サイクルで再試行とクォータを浪費していた。
+監視を始める前に channels.list（50件で1 unit）でまとめて確認し、確認できなかった
+チャンネルを隔離して監視対象から外す。
+
+- 未確認のチャンネル（起動時・設定の再読み込みや制御APIでの追加時）だけを確認する
+- 確認したアップロードプレイリストIDとチャンネル名は YouTube リポジトリに登録し、
+  ウォーム状態として保存する（再起動後は確認しなおさない）
+- 隔離したチャンネルは設定ファイルの内容が変わるまで確認・監視しない
+- 後から停止されたチャンネルを検知するため、revalidate_interval ごとに確認しなおす
+- 確認に失敗した場合（クォータ超過以外）は隔離せずに監視を続ける
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from domain.entities.channel import Channel
+from domain.repositories.channel_catalog_repository import ChannelCatalogRepository
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.channel_metadata import ChannelMetadata
+from domain.repositories.errors import QuotaExceededError
+from application.services.clock import Clock, SystemClock
+from application.services.monitor_metrics import MonitorMetrics, NullMonitorMetrics
+from application.services.warm_state import WarmStateComponent
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelOnboarding(WarmStateComponent):
+    """監視対象チャンネルの存在の確認と、確認できなかったチャンネルの隔離"""
+
+    def __init__(
+        self,
+        catalog: ChannelCatalogRepository,
+        config_fingerprint: str = "",
+        revalidate_interval: int = 604800,
+        clock: Optional[Clock] = None,
+        metrics: Optional[MonitorMetrics] = None,
+    ):
+        """
+        Args:
+            catalog: チャンネル情報の取得に使うリポジトリ
+            config_fingerprint: 設定ファイルの内容のフィンガープリント（変わったら隔離を解除する）
+            revalidate_interval: 確認済みのチャンネルを確認しなおす間隔（秒、0で確認しなおさない）
+            clock: 確認時刻の記録に使う時計
+            metrics: 隔離中のチャンネル数の記録先
+        """
+        self._catalog = catalog
+        self._config_fingerprint = config_fingerprint
+        self._revalidate_interval = revalidate_interval
+        self._clock = clock if clock is not None else SystemClock()
+        self._metrics = metrics if metrics is not None else NullMonitorMetrics()
+        # 確認済みのチャンネル → (チャンネル情報, 確認したUNIX秒)
+        self._validated: Dict[ChannelId, Tuple[ChannelMetadata, float]] = {}
+        # 隔離中のチャンネル → 隔離したUNIX秒
+        self._quarantined: Dict[ChannelId, float] = {}
+        # 制御API・メトリクスのスレッドからも参照されるため保護する
+        self._lock = threading.Lock()
+        self._metrics.quarantined_channels(0)
+
+    def onboard(self, channels: List[Channel]) -> List[Channel]:
+        """
+        未確認のチャンネルをまとめて確認し、隔離中のチャンネルを除いた一覧を返す
+
+        Raises:
+            QuotaExceededError: 確認中にクォータを超過した場合（隔離はしない）
+        """
+        now = self._clock.time()
+        with self._lock:
+            pending = [
+                channel
+                for channel in channels
+                if channel.id not in self._quarantined and self._needs_validation(channel.id, now)
+            ]
+        if pending:
+            self._validate(pending, now)
+        return self.exclude_quarantined(channels)
+
+    def exclude_quarantined(self, channels: List[Channel]) -> List[Channel]:
+        """隔離中のチャンネルを除いた一覧"""
+        with self._lock:
+            if not self._quarantined:
+                return channels
+            return [channel for channel in channels if channel.id not in self._quarantined]
+
+    def config_changed(self, fingerprint: str) -> None:
+        """設定ファイルの内容が変わった場合に隔離を解除する（次の監視サイクルで確認しなおす）"""
+        with self._lock:
+            if fingerprint == self._config_fingerprint:
+                return
+            self._config_fingerprint = fingerprint
+            released = len(self._quarantined)
+            self._quarantined.clear()
+            self._metrics.quarantined_channels(0)
+        if released:
+            logger.info(f"設定ファイルが変更されたため、{released}チャンネルの隔離を解除しました")
+
+    def forget(self, channel_id: ChannelId) -> None:
+        """監視対象から外れたチャンネルの確認結果を破棄"""
+        with self._lock:
+            self._validated.pop(channel_id, None)
+            if self._quarantined.pop(channel_id, None) is not None:
+                self._metrics.quarantined_channels(len(self._quarantined))
+
+    def quarantined(self) -> List[ChannelId]:
+        """隔離中のチャンネルID"""
+        with self._lock:
+            return list(self._quarantined)
+
+    def metadata(self, channel_id: ChannelId) -> Optional[ChannelMetadata]:
+        """確認済みのチャンネル情報（未確認の場合はNone）"""
+        with self._lock:
+            entry = self._validated.get(channel_id)
+        return entry[0] if entry is not None else None
+
+    def _needs_validation(self, channel_id: ChannelId, now: float) -> bool:
+        entry = self._validated.get(channel_id)
+        if entry is None:
+            return True
+        return self._revalidate_interval > 0 and now - entry[1] >= self._revalidate_interval
+
+    def _validate(self, channels: List[Channel], now: float) -> None:
+        try:
+            results = self._catalog.lookup_channels([channel.id for channel in channels])
+        except QuotaExceededError:
+            raise
+        except Exception as e:
+            # 確認できないだけでチャンネルが存在しないとは限らないため、隔離せずに監視を続ける
+            logger.warning(f"チャンネルの確認に失敗しました（{len(channels)}チャンネル）: {e}")
+            return
+
+        quarantined = []
+        with self._lock:
+            for channel in channels:
+                metadata = results.get(channel.id)
+                if metadata is None:
+                    self._validated.pop(channel.id, None)
+                    self._quarantined[channel.id] = now
+                    quarantined.append(channel)
+                else:
+                    self._validated[channel.id] = (metadata, now)
+            self._metrics.quarantined_channels(len(self._quarantined))
+
+        logger.info(
+            f"チャンネルを確認しました: {len(channels) - len(quarantined)}件確認、"
+            f"{len(quarantined)}件隔離"
+        )
+        for channel in quarantined:
+            logger.warning(
+                f"チャンネルが見つからないため監視対象から外します（設定ファイルの変更まで隔離）: "
+                f"{channel.name} ({channel.id})"
+            )
+
+    def export_warm_state(self) -> Dict[str, Any]:
+        """確認済みのチャンネル情報と隔離中のチャンネル"""
+        with self._lock:
+            return {
+                "config": self._config_fingerprint,
+                "channels": {
+                    str(channel_id): {
+                        "title": metadata.title,
+                        "uploads_playlist_id": metadata.uploads_playlist_id,
+                        "validated_at": validated_at,
+                    }
+                    for channel_id, (metadata, validated_at) in self._validated.items()
+                },
+                "quarantined": {
+                    str(channel_id): quarantined_at
+                    for channel_id, quarantined_at in self._quarantined.items()
+                },
+            }
+
+    def restore_warm_state(self, state: Dict[str, Any]) -> None:
+        """
+        export_warm_state の内容を復元
+
+        隔離は設定ファイルの内容が保存時と同じ場合だけ引き継ぐ。
+        """
+        restored = []
+        with self._lock:
+            for channel_id, entry in state.get("channels", {}).items():
+                metadata = ChannelMetadata(
+                    channel_id=ChannelId(channel_id),
+                    title=entry.get("title", ""),
+                    uploads_playlist_id=entry["uploads_playlist_id"],
+                )
+                self._validated[metadata.channel_id] = (metadata, entry.get("validated_at", 0.0))
+                restored.append(metadata)
+            if state.get("config") == self._config_fingerprint:
+                for channel_id, quarantined_at in state.get("quarantined", {}).items():
+                    self._quarantined[ChannelId(channel_id)] = quarantined_at
+            self._metrics.quarantined_channels(len(self._quarantined))
+        self._catalog.register_channels(restored)
@@ -0,0 +1,87 @@
+"""監視対象チャンネルの差分
+
+設定の再読み込み時に、変更前後のチャンネル一覧を比較して
+追加・削除・変更（名前・Webhook・メンション）されたチャンネルを求める。
+Channel の同一性はIDだけで判断するため、変更の有無は各項目を比較して判定する。
+"""
+
+from dataclasses import dataclass, field
+from typing import List
+
+from domain.entities.channel import Channel
+
+
+@dataclass
+class ChannelSetDiff:
+    """チャンネル一覧の差分"""
+
+    added: List[Channel] = field(default_factory=list)
+    removed: List[Channel] = field(default_factory=list)
+    changed: List[Channel] = field(default_factory=list)  # 変更後のチャンネル
+
+    @property
+    def is_empty(self) -> bool:
+        """変更がないか"""
+        return not (self.added or self.removed or self.changed)
+
+    def describe(self) -> str:
+        """ログ用の要約"""
+        return f"追加 {len(self.added)} / 削除 {len(self.removed)} / 変更 {len(self.changed)}"
+
+
+def _same_settings(old: Channel, new: Channel) -> bool:
+    """名前・Webhook（順序を含む）・メンションが同じか"""
+    return old.name == new.name and old.webhooks == new.webhooks and old.mention == new.mention
+
+
+def diff_channels(old: List[Channel], new: List[Channel]) -> ChannelSetDiff:
+    """
+    変更前後のチャンネル一覧の差分を求める
+
+    Args:
+        old: 変更前のチャンネル一覧
+        new: 変更後のチャンネル一覧
+
+    Returns:
+        追加・削除・変更されたチャンネル（それぞれ new / old の出現順）
+    """
+    old_by_id = {channel.id: channel for channel in old}
+    new_ids = {channel.id for channel in new}
+
+    diff = ChannelSetDiff()
+    for channel in new:
+        previous = old_by_id.get(channel.id)
+        if previous is None:
+            diff.added.append(channel)
+        elif not _same_settings(previous, channel):
+            diff.changed.append(channel)
+    diff.removed = [channel for channel in old if channel.id not in new_ids]
+    return diff
+
+
+def apply_diff(channels: List[Channel], diff: ChannelSetDiff) -> List[Channel]:
+    """
+    チャンネル一覧に差分を適用した新しい一覧を返す
+
+    変更は一覧に存在するチャンネルだけを置き換え、追加は既に存在する場合は置き換える。
+    差分の作成後に別の経路（制御APIなど）で一覧が変わっていても適用できる。
+
+    Args:
+        channels: 適用先のチャンネル一覧（変更しない）
+        diff: 適用する差分
+
+    Returns:
+        適用後のチャンネル一覧（既存のチャンネルの順序を保ち、追加は末尾）
+    """
+    removed = {channel.id for channel in diff.removed}
+    changed = {channel.id: channel for channel in diff.changed}
+    added = {channel.id: channel for channel in diff.added}
+
+    result: List[Channel] = []
+    for channel in channels:
+        if channel.id in removed:
+            continue
+        replacement = added.pop(channel.id, None)
+        result.append(replacement if replacement is not None else changed.get(channel.id, channel))
+    result.extend(added.values())
+    return result
@@ -0,0 +1,104 @@
+"""時計
+
+監視のスケジュール・待機・タイムスタンプが参照する現在時刻を差し替え可能にする
+
+- SystemClock: 実際の時刻と time.sleep（既定）
+- VirtualClock: sleep で待たずに時刻を進める仮想時計（記録の再生や、
+  1日分の監視を数秒で再現するシミュレーションに使用）
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Optional
+
+
+class Clock(ABC):
+    """現在時刻と待機のインターフェース"""
+
+    @abstractmethod
+    def now(self, tz: Optional[tzinfo] = None) -> datetime:
+        """現在時刻（datetime.now と同じく、tz省略時はローカル時刻のnaiveなdatetime）"""
+        pass
+
+    @abstractmethod
+    def time(self) -> float:
+        """UNIX時刻（秒）"""
+        pass
+
+    @abstractmethod
+    def monotonic(self) -> float:
+        """経過時間の計測用の単調増加する時刻（秒）"""
+        pass
+
+    @abstractmethod
+    def sleep(self, seconds: float) -> None:
+        """指定秒数待機"""
+        pass
+
+
+class SystemClock(Clock):
+    """実際の時刻を使う時計"""
+
+    def now(self, tz: Optional[tzinfo] = None) -> datetime:
+        return datetime.now(tz)
+
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    """sleep で時刻が進む仮想時計（スレッドセーフ）"""
+
+    def __init__(self, start: datetime):
+        """
+        Args:
+            start: 開始時刻（naiveな場合はUTCとみなす）
+        """
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        self._start = start
+        self._elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def now(self, tz: Optional[tzinfo] = None) -> datetime:
+        with self._lock:
+            current = self._start + timedelta(seconds=self._elapsed)
+        if tz is None:
+            return current.astimezone().replace(tzinfo=None)
+        return current.astimezone(tz)
+
+    def time(self) -> float:
+        with self._lock:
+            return self._start.timestamp() + self._elapsed
+
+    def monotonic(self) -> float:
+        with self._lock:
+            return self._elapsed
+
+    def sleep(self, seconds: float) -> None:
+        self.advance(seconds)
+
+    def advance(self, seconds: float) -> None:
+        """時刻を進める"""
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._elapsed += seconds
+
+    def set(self, moment: datetime) -> None:
+        """指定した時刻まで進める（過去の時刻は指定できない）"""
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        with self._lock:
+            elapsed = (moment - self._start).total_seconds()
+            if elapsed < self._elapsed:
+                raise ValueError(f"仮想時計は過去に戻せません: {moment.isoformat()}")
+            self._elapsed = elapsed
@@ -0,0 +1,57 @@
+"""コンシステントハッシュ
+
+チャンネルをワーカーに割り当てるためのハッシュリング。
+ワーカーごとに replicas 個の仮想ノードをリング上に配置し、キーのハッシュから時計回りに
+最初の仮想ノードを持つワーカーを担当とする。ワーカーの増減で担当が変わるキーは約 1/N に限られる。
+"""
+
+import bisect
+import hashlib
+from typing import Iterable, List, Tuple
+
+
+def _hash(value: str) -> int:
+    """プロセス・実行環境によらず同じ値になる64ビットのハッシュ"""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class ConsistentHashRing:
+    """ワーカーの集合から、キーを担当するワーカーを決めるハッシュリング"""
+
+    def __init__(self, members: Iterable[str] = (), replicas: int = 100):
+        """
+        Args:
+            members: ワーカーID
+            replicas: ワーカーあたりの仮想ノード数（多いほど偏りが小さい）
+        """
+        if replicas <= 0:
+            raise ValueError(f"replicas は1以上を指定してください: {replicas}")
+        self._members = sorted(set(members))
+        self._replicas = replicas
+        points: List[Tuple[int, str]] = sorted(
+            (_hash(f"{member}#{index}"), member)
+            for member in self._members
+            for index in range(replicas)
+        )
+        self._hashes = [point for point, _ in points]
+        self._owners = [member for _, member in points]
+
+    @property
+    def members(self) -> List[str]:
+        """ワーカーID（昇順）"""
+        return list(self._members)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def owner(self, key: str) -> str:
+        """
+        キーを担当するワーカー
+
+        Raises:
+            ValueError: ワーカーがいない場合
+        """
+        if not self._owners:
+            raise ValueError("ハッシュリングにワーカーがいません")
+        index = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._owners[index]
@@ -0,0 +1,146 @@
+"""通知遅延記録サービス
+
+配信開始（actualStartTime）からDiscordへの通知到達までの遅延を記録する
+
+計測区間:
+- end_to_end: 配信開始 → Webhookごとの送信完了（SLOの対象）
+- detection: 配信開始 → 検知（チェック間隔・スケジューラーの影響）
+- queue: 検知 → 通知キュー投入（検出ステージの混雑）
+- dispatch: 通知キュー投入 → Webhookごとの送信完了（通知ワーカー・Discordの影響）
+
+チャンネルごと・全体でヒストグラムを保持し、p50/p95/p99を計算する。
+記録はリポジトリにも追記して後から分析できるようにする。
+"""
+
+import logging
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from domain.repositories.latency_repository import LatencyRepository
+from application.dto.notification_latency_dto import NotificationLatencyDto
+
+logger = logging.getLogger(__name__)
+
+# 計測区間
+END_TO_END = "end_to_end"
+DETECTION = "detection"
+QUEUE = "queue"
+DISPATCH = "dispatch"
+METRICS = (END_TO_END, DETECTION, QUEUE, DISPATCH)
+
+# 全体の集計を表すキー
+GLOBAL = "*"
+
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """直近のサンプルからパーセンタイルを計算するヒストグラム"""
+
+    def __init__(self, window: int = 1000):
+        """
+        Args:
+            window: 保持するサンプル数の上限（古いものから捨てる）
+        """
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._count = 0
+        self._sum = 0.0
+
+    def add(self, seconds: float) -> None:
+        """サンプルを追加"""
+        self._samples.append(seconds)
+        self._count += 1
+        self._sum += seconds
+
+    @property
+    def count(self) -> int:
+        """これまでに追加したサンプル数"""
+        return self._count
+
+    @property
+    def total(self) -> float:
+        """これまでに追加したサンプルの合計"""
+        return self._sum
+
+    def percentile(self, p: float) -> Optional[float]:
+        """保持しているサンプルのpパーセンタイル（最近傍順位法、サンプルなしはNone）"""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(p / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def summary(self) -> Dict[str, float]:
+        """件数・p50/p95/p99・最大値"""
+        result: Dict[str, float] = {"count": self._count}
+        for p in PERCENTILES:
+            value = self.percentile(p)
+            if value is not None:
+                result[f"p{p}"] = value
+        if self._samples:
+            result["max"] = max(self._samples)
+        return result
+
+
+class LatencyRecorder:
+    """通知遅延をチャンネルごと・全体のヒストグラムに記録するサービス"""
+
+    def __init__(self, repository: Optional[LatencyRepository] = None, window: int = 1000):
+        """
+        Args:
+            repository: 記録の追記先（省略時は永続化しない）
+            window: ヒストグラムごとに保持するサンプル数
+        """
+        self._repository = repository
+        self._window = window
+        self._lock = threading.Lock()
+        # 集計キー（チャンネルID or GLOBAL） → 計測区間 → ヒストグラム
+        self._histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+
+    def record(self, record: NotificationLatencyDto) -> None:
+        """1件の通知の遅延を記録"""
+        samples: Dict[str, List[float]] = {
+            END_TO_END: record.end_to_end_seconds(),
+            DETECTION: [record.detection_seconds],
+            QUEUE: [record.queue_seconds] if record.queue_seconds is not None else [],
+            DISPATCH: record.dispatch_seconds(),
+        }
+
+        with self._lock:
+            for key in (GLOBAL, record.channel_id):
+                histograms = self._histograms.setdefault(key, {})
+                for metric, values in samples.items():
+                    histogram = histograms.get(metric)
+                    if histogram is None:
+                        histogram = histograms[metric] = LatencyHistogram(self._window)
+                    for value in values:
+                        histogram.add(value)
+
+        if self._repository is not None:
+            try:
+                self._repository.append(record)
+            except Exception as e:
+                # 記録の失敗で通知処理を止めない
+                logger.warning(f"通知遅延の保存に失敗: {e}")
+
+    def summary(self, channel_id: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        """
+        計測区間ごとの集計を取得
+
+        Args:
+            channel_id: チャンネルID（省略時は全体）
+
+        Returns:
+            計測区間 → {"count", "p50", "p95", "p99", "max"}
+        """
+        key = channel_id if channel_id is not None else GLOBAL
+        with self._lock:
+            histograms = self._histograms.get(key, {})
+            return {metric: histogram.summary() for metric, histogram in histograms.items()}
+
+    def channel_ids(self) -> List[str]:
+        """記録のあるチャンネルID一覧"""
+        with self._lock:
+            return [key for key in self._histograms if key != GLOBAL]
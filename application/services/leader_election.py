@@ -0,0 +1,159 @@
+"""稼働系・待機系の冗長構成のリーダー選出
+
+複数のインスタンスを同じ設定で起動し、共有のリースを持つ1つだけが監視（APIの呼び出しと通知）を行う。
+
+- リーダーは renew_interval 秒ごとにリースを延長する（監視サイクルの実行中も延長するため、
+  バックグラウンドスレッドで行う）
+- 待機系も同じ間隔でリースの取得を試み、リーダーが終了（リースを手放す）または停止
+  （延長が lease_ttl 秒途絶える）した場合に引き継ぐ
+- 延長できないまま lease_ttl 秒経過したリーダーは、他のインスタンスが引き継いでいる可能性があるため
+  リーダーとみなさない
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from domain.repositories.lease_repository import LeaseRepository
+from application.services.clock import Clock, SystemClock
+from application.services.monitor_metrics import MonitorMetrics, NullMonitorMetrics
+
+logger = logging.getLogger(__name__)
+
+LEASE_NAME = "monitor"
+
+
+class NotLeaderError(Exception):
+    """待機系のインスタンスに監視の処理を依頼した"""
+
+    pass
+
+
+class LeaderElection:
+    """共有のリースでリーダー（稼働系）を1つに決める"""
+
+    def __init__(
+        self,
+        instance_id: str,
+        leases: LeaseRepository,
+        lease_ttl: int = 15,
+        renew_interval: int = 5,
+        clock: Optional[Clock] = None,
+        metrics: Optional[MonitorMetrics] = None,
+    ):
+        """
+        Args:
+            instance_id: このインスタンスのID（インスタンス間で一意）
+            leases: 共有のリース
+            lease_ttl: 延長が途絶えてから待機系が引き継ぐまでの秒数
+            renew_interval: リースを延長・取得を試みる間隔（秒、lease_ttl より短くする）
+            clock: リースの有効期限の判定に使う時計
+            metrics: リーダーかどうかの記録先
+        """
+        if not instance_id:
+            raise ValueError("instance_id を指定してください")
+        if renew_interval >= lease_ttl:
+            raise ValueError(
+                f"renew_interval ({renew_interval}) は lease_ttl ({lease_ttl}) "
+                f"より短くしてください"
+            )
+        self._instance_id = instance_id
+        self._leases = leases
+        self._metrics = metrics if metrics is not None else NullMonitorMetrics()
+        self._lease_ttl = lease_ttl
+        self._renew_interval = renew_interval
+        self._clock = clock if clock is not None else SystemClock()
+        self._lock = threading.Lock()
+        # リーダーとみなせる期限（monotonic、延長を試みる前の時刻から lease_ttl 秒）
+        self._valid_until: Optional[float] = None
+        self._promoted = False
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def instance_id(self) -> str:
+        return self._instance_id
+
+    @property
+    def is_leader(self) -> bool:
+        """このインスタンスがリーダーか"""
+        with self._lock:
+            return self._valid_until is not None and self._clock.monotonic() < self._valid_until
+
+    def leader(self) -> Optional[str]:
+        """現在のリーダーのインスタンスID（確認できない場合はNone）"""
+        try:
+            return self._leases.holder(LEASE_NAME)
+        except Exception as e:
+            logger.warning(f"リーダーを確認できませんでした: {e}")
+            return None
+
+    def renew(self) -> bool:
+        """
+        リースの延長・取得を1回試みる
+
+        Returns:
+            リーダーの場合True
+        """
+        was_leader = self.is_leader
+        attempted_at = self._clock.monotonic()
+        try:
+            acquired = self._leases.try_acquire(LEASE_NAME, self._instance_id, self._lease_ttl)
+        except Exception as e:
+            # 延長できなくても有効期限まではリーダーとして続ける
+            logger.warning(f"リースを延長できませんでした: {e}")
+            acquired = None
+        with self._lock:
+            if acquired:
+                self._valid_until = attempted_at + self._lease_ttl
+                if not was_leader:
+                    self._promoted = True
+            elif acquired is False:
+                self._valid_until = None
+        is_leader = self.is_leader
+        if is_leader != was_leader:
+            if is_leader:
+                logger.info(f"リーダーになりました: {self._instance_id}")
+            else:
+                logger.warning(f"リーダーではなくなりました: {self._instance_id}")
+        self._metrics.leader_changed(is_leader)
+        return is_leader
+
+    def take_promotion(self) -> bool:
+        """前回の呼び出し以降に待機系からリーダーになった場合True（すぐに監視を始めるため）"""
+        with self._lock:
+            promoted, self._promoted = self._promoted, False
+        return promoted
+
+    def start(self) -> None:
+        """リースの延長・取得をバックグラウンドスレッドで始める"""
+        if self._thread is not None:
+            return
+        self.renew()
+        # 起動時の取得は引き継ぎとみなさない（最初の監視サイクルは通常どおり行う）
+        self.take_promotion()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="leader-election", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._renew_interval):
+            self.renew()
+
+    def stop(self) -> None:
+        """延長を止め、リーダーの場合はリースを手放す（待機系が即座に引き継げるようにする）"""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join(timeout=5)
+            self._thread = None
+        if not self.is_leader:
+            return
+        with self._lock:
+            self._valid_until = None
+        self._metrics.leader_changed(False)
+        try:
+            self._leases.release(LEASE_NAME, self._instance_id)
+        except Exception as e:
+            logger.warning(f"リースを手放せませんでした: {e}")
+            return
+        logger.info(f"リースを手放しました: {self._instance_id}")
@@ -0,0 +1,130 @@
+"""配信中セット追跡サービス
+
+通常チェックの間の配信中チェックでは、通常のチェック（playlistItems.list + videos.list）を
+行わず、追跡中のvideo IDをまとめて videos.list で確認するだけで継続・終了を判定できる。
+
+ビジネスロジック:
+- 配信開始を検出したチャンネルのvideo IDを追跡対象に加える
+- actualEndTime がある、または配信中でなくなった動画は終了とみなす
+- 動画が取得できない（削除・非公開化）場合も終了とみなす
+- 追跡中のvideo IDはウォーム状態として保存し、再起動後に引き継げる
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from domain.entities.stream import Stream
+from domain.repositories.stream_repository import StreamRepository
+from domain.value_objects.channel_id import ChannelId
+from application.services.warm_state import WarmStateComponent
+
+logger = logging.getLogger(__name__)
+
+
+class LiveSetTracker(WarmStateComponent):
+    """配信中のvideo IDを保持し、継続・終了を一括確認するサービス"""
+
+    def __init__(self):
+        self._live_video_ids: Dict[ChannelId, str] = {}
+        self._concurrent_viewers: Dict[ChannelId, int] = {}
+        # パイプラインの各ステージから同時に更新されるため保護する
+        self._lock = threading.Lock()
+
+    def track(self, channel_id: ChannelId, video_id: str) -> None:
+        """チャンネルの配信中video IDを追跡対象に追加（既存は上書き）"""
+        with self._lock:
+            if self._live_video_ids.get(channel_id) != video_id:
+                self._concurrent_viewers.pop(channel_id, None)
+            self._live_video_ids[channel_id] = video_id
+
+    def untrack(self, channel_id: ChannelId) -> None:
+        """チャンネルを追跡対象から外す"""
+        with self._lock:
+            self._live_video_ids.pop(channel_id, None)
+            self._concurrent_viewers.pop(channel_id, None)
+
+    def is_tracked(self, channel_id: ChannelId) -> bool:
+        """チャンネルが追跡対象かどうか"""
+        return channel_id in self._live_video_ids
+
+    def get_video_id(self, channel_id: ChannelId) -> Optional[str]:
+        """追跡中のvideo IDを取得"""
+        return self._live_video_ids.get(channel_id)
+
+    def get_concurrent_viewers(self, channel_id: ChannelId) -> Optional[int]:
+        """最後に確認した同時視聴者数を取得"""
+        return self._concurrent_viewers.get(channel_id)
+
+    def tracked_channel_ids(self) -> List[ChannelId]:
+        """追跡中のチャンネルID一覧"""
+        with self._lock:
+            return list(self._live_video_ids)
+
+    def __len__(self) -> int:
+        return len(self._live_video_ids)
+
+    def export_warm_state(self) -> Dict[str, Any]:
+        """追跡中のvideo IDと最後に確認した同時視聴者数"""
+        with self._lock:
+            return {
+                "video_ids": {str(k): v for k, v in self._live_video_ids.items()},
+                "concurrent_viewers": {str(k): v for k, v in self._concurrent_viewers.items()},
+            }
+
+    def restore_warm_state(self, state: Dict[str, Any]) -> None:
+        """export_warm_state の内容を追跡対象に加える"""
+        for channel_id, video_id in state.get("video_ids", {}).items():
+            self.track(ChannelId(channel_id), video_id)
+        with self._lock:
+            for channel_id, viewers in state.get("concurrent_viewers", {}).items():
+                if ChannelId(channel_id) in self._live_video_ids:
+                    self._concurrent_viewers[ChannelId(channel_id)] = int(viewers)
+
+    def refresh(
+        self, stream_repository: StreamRepository, channel_ids: Optional[List[ChannelId]] = None
+    ) -> Dict[ChannelId, Optional[Stream]]:
+        """
+        追跡中の配信の継続・終了を一括確認
+
+        Args:
+            stream_repository: 配信情報取得リポジトリ
+            channel_ids: 確認対象のチャンネルID（Noneの場合は追跡中の全チャンネル）
+
+        Returns:
+            チャンネルID → 現在の配信（終了した場合はNone）
+
+        Raises:
+            QuotaExceededError: YouTube APIクォータ超過時
+            RepositoryError: APIエラー（呼び出し側で通常チェックにフォールバックする）
+        """
+        wanted = set(channel_ids) if channel_ids is not None else None
+        with self._lock:
+            targets = {
+                channel_id: video_id
+                for channel_id, video_id in self._live_video_ids.items()
+                if wanted is None or channel_id in wanted
+            }
+        if not targets:
+            return {}
+
+        streams = stream_repository.get_streams(list(targets.values()))
+
+        results: Dict[ChannelId, Optional[Stream]] = {}
+        for channel_id, video_id in targets.items():
+            stream = streams.get(video_id)
+
+            if stream is not None and stream.is_live():
+                if stream.concurrent_viewers is not None:
+                    with self._lock:
+                        self._concurrent_viewers[channel_id] = stream.concurrent_viewers
+                results[channel_id] = stream
+            else:
+                # 終了・削除・配信予定に戻った場合はいずれも配信なしとして扱う
+                results[channel_id] = None
+
+        logger.debug(
+            f"配信中セット確認: {len(targets)}件中 "
+            f"{sum(1 for s in results.values() if s is not None)}件が配信継続"
+        )
+        return results
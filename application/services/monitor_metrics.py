@@ -0,0 +1,81 @@
+"""監視のメトリクス
+
+アプリケーション層のサービスはこのインターフェースを通してメトリクスを記録し、
+記録先（/metrics で出力するレジストリなど）は Infrastructure 層の実装を main.py で注入する。
+
+- NullMonitorMetrics: 何も記録しない（既定。テストやメトリクスを出力しない実行で使用）
+"""
+
+from abc import ABC, abstractmethod
+
+
+class MonitorMetrics(ABC):
+    """監視の各サービスが記録するメトリクスのインターフェース"""
+
+    @abstractmethod
+    def shard_rebalanced(self, members: int) -> None:
+        """シャーディングで協調するワーカーの増減による再割り当て（members: 生存中のワーカー数）"""
+        pass
+
+    @abstractmethod
+    def shard_owned_channels(self, count: int) -> None:
+        """このワーカーが担当しているチャンネル数"""
+        pass
+
+    @abstractmethod
+    def leader_changed(self, is_leader: bool) -> None:
+        """冗長構成でこのインスタンスがリーダー（稼働系）か"""
+        pass
+
+    @abstractmethod
+    def quota_degraded(self, active: bool) -> None:
+        """クォータ超過による縮退運転中か"""
+        pass
+
+    @abstractmethod
+    def quota_probed(self, result: str) -> None:
+        """縮退運転中のクォータの回復の確認（result: recovered / quota / error）"""
+        pass
+
+    @abstractmethod
+    def quarantined_channels(self, count: int) -> None:
+        """存在を確認できなかったため隔離中のチャンネル数"""
+        pass
+
+    @abstractmethod
+    def notification_deduplicated(self) -> None:
+        """他のインスタンスが送信済みのため配信開始通知を送信しなかった"""
+        pass
+
+    @abstractmethod
+    def quota_units_total(self) -> float:
+        """起動から消費したYouTube APIクォータの累計（監視サイクルごとの消費量の計算に使用）"""
+        pass
+
+
+class NullMonitorMetrics(MonitorMetrics):
+    """何も記録しないメトリクス"""
+
+    def shard_rebalanced(self, members: int) -> None:
+        pass
+
+    def shard_owned_channels(self, count: int) -> None:
+        pass
+
+    def leader_changed(self, is_leader: bool) -> None:
+        pass
+
+    def quota_degraded(self, active: bool) -> None:
+        pass
+
+    def quota_probed(self, result: str) -> None:
+        pass
+
+    def quarantined_channels(self, count: int) -> None:
+        pass
+
+    def notification_deduplicated(self) -> None:
+        pass
+
+    def quota_units_total(self) -> float:
+        return 0.0
@@ -0,0 +1,522 @@
+"""配信監視パイプライン
+
+1回の監視サイクルを 取得 → 検出 → 通知 の3ステージで並行に処理する
+
+- 取得ワーカー: チャンネルをチャンク単位でまとめて取得
+- 検出ステージ: 前回の状態と比較して変化を検出（状態の読み書きを1スレッドに集約し、
+  チャンクごと・ユースケースごとにまとめて検出・保存する）
+- 通知ワーカー: 配信開始通知の送信と、送信成功後の状態更新
+- ステージ間は上限付きキューで接続し、後段が詰まると前段が待つ（バックプレッシャー）
+- 通知待ちがある間、取得ワーカーは次の取得を控える（通知を定期ポーリングより優先）
+- 各ワーカーのスパンは run を呼び出した時点のスパン（監視サイクル）の子として記録する
+- チャンネルごとのログはDEBUGに留め、サイクルの最後に集計を1行だけINFOで出力する
+
+遅い通知送信が次のチャンネルの取得を止めることも、
+取得待ちのチャンネル数が検出済みの通知を遅らせることもない。
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from datetime import timezone
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from domain.entities.channel import Channel
+from domain.entities.stream import Stream
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.stream_fetch_result import StreamFetchResult
+from domain.repositories.errors import QuotaExceededError
+from application.services.stream_fetch_service import StreamFetchService
+from application.services.clock import Clock, SystemClock
+from application.services.monitor_metrics import MonitorMetrics, NullMonitorMetrics
+from application.services.tracer import Span, get_tracer
+from application.dto.notification_job import NotificationJob
+
+if TYPE_CHECKING:
+    from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+
+logger = logging.getLogger(__name__)
+
+# ステージ名
+FETCH_STAGE = "fetch"
+DETECT_STAGE = "detect"
+NOTIFY_STAGE = "notify"
+STAGES = (FETCH_STAGE, DETECT_STAGE, NOTIFY_STAGE)
+
+# 取得結果を適用する先（チャンネル, そのチャンネルを監視するユースケース）
+MonitorTarget = Tuple[Channel, "MonitorStreamsUseCase"]
+FetchFunction = Callable[[List[Channel]], Dict[ChannelId, StreamFetchResult]]
+
+# ワーカー停止の合図
+_STOP = object()
+
+
+@dataclass
+class StageStats:
+    """ステージごとの統計情報"""
+
+    processed: int = 0  # 処理した件数（取得ステージはチャンネル数）
+    errors: int = 0  # 処理中のエラー数
+    queue_depth: int = 0  # 入力キューの現在の長さ
+    max_queue_depth: int = 0  # 入力キューの最大長
+    busy_seconds: float = 0.0  # 処理に費やした時間の合計
+
+    @property
+    def throughput(self) -> float:
+        """処理時間あたりの処理件数（件/秒）"""
+        return self.processed / self.busy_seconds if self.busy_seconds else 0.0
+
+
+@dataclass
+class CycleSummary:
+    """監視サイクル1回分の集計"""
+
+    channels: int = 0  # 取得対象のチャンネル数
+    live: int = 0  # 配信中だったチャンネル数
+    started: int = 0  # 配信開始を検知した件数
+    notified: int = 0  # 通知に成功した件数
+    errors: int = 0  # 取得・検出・通知に失敗した件数
+    seconds: float = 0.0  # 所要時間
+    quota_units: int = 0  # 消費したYouTube APIクォータ（同時に実行中の他の処理の分も含む）
+
+
+class MonitorPipeline:
+    """取得・検出・通知を上限付きキューでつないだ監視パイプライン"""
+
+    def __init__(
+        self,
+        fetch_service: StreamFetchService,
+        fetch_workers: int = 2,
+        notify_workers: int = 4,
+        chunk_size: int = 50,
+        queue_size: int = 100,
+        notify_priority_wait: float = 1.0,
+        clock: Optional[Clock] = None,
+        metrics: Optional[MonitorMetrics] = None,
+    ):
+        """
+        Args:
+            fetch_service: 配信情報取得サービス
+            fetch_workers: 取得ワーカー数
+            notify_workers: 通知ワーカー数
+            chunk_size: 取得ワーカーが1回にまとめて取得するチャンネル数
+            queue_size: 各ステージの入力キューの上限
+            notify_priority_wait: 通知待ちがある場合に取得を控える最大秒数
+            clock: 通知キュー投入時刻の記録に使う時計（省略時は実際の時刻）
+            metrics: サイクルごとのクォータ消費量の計算に使うメトリクス（省略時は0とする）
+        """
+        self._fetcher = fetch_service
+        self._fetch_workers = max(1, fetch_workers)
+        self._notify_workers = max(1, notify_workers)
+        self._chunk_size = max(1, chunk_size)
+        self._queue_size = max(1, queue_size)
+        self._notify_priority_wait = notify_priority_wait
+        self._clock = clock if clock is not None else SystemClock()
+        self._metrics = metrics if metrics is not None else NullMonitorMetrics()
+
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, StageStats] = {stage: StageStats() for stage in STAGES}
+        self._queues: Dict[str, queue.Queue] = {}
+
+        # 未送信の通知数（取得より通知を優先するために使用）
+        self._pending_notifications = 0
+        self._notify_idle = threading.Condition()
+
+    def stats(self) -> Dict[str, StageStats]:
+        """ステージごとの統計情報のスナップショットを取得"""
+        with self._stats_lock:
+            snapshot = {stage: StageStats(**vars(stats)) for stage, stats in self._stats.items()}
+            for stage, stage_queue in self._queues.items():
+                snapshot[stage].queue_depth = stage_queue.qsize()
+        return snapshot
+
+    def run(
+        self,
+        channels: List[Channel],
+        targets: Dict[ChannelId, List[MonitorTarget]],
+        fetch: Optional[FetchFunction] = None,
+    ) -> CycleSummary:
+        """
+        監視サイクルを1回実行（全ステージの処理が終わるまで待つ）
+
+        Args:
+            channels: 取得対象のチャンネル（ChannelIdで重複排除済みであること）
+            targets: チャンネルID → 取得結果を適用する先
+            fetch: 取得関数（省略時は StreamFetchService.fetch）
+
+        Returns:
+            サイクルの集計
+
+        Raises:
+            QuotaExceededError: YouTube APIクォータ超過時
+                （取得できたチャンネルの処理を終えてから送出する）
+        """
+        fetch = fetch or self._fetcher.fetch
+        fetch_queue: queue.Queue = queue.Queue(maxsize=self._queue_size)
+        detect_queue: queue.Queue = queue.Queue(maxsize=self._queue_size)
+        notify_queue: queue.Queue = queue.Queue(maxsize=self._queue_size)
+        with self._stats_lock:
+            self._queues = {
+                FETCH_STAGE: fetch_queue,
+                DETECT_STAGE: detect_queue,
+                NOTIFY_STAGE: notify_queue,
+            }
+
+        started = time.monotonic()
+        summary = CycleSummary(channels=len(channels))
+        quota_before = self._metrics.quota_units_total()
+        quota_errors: List[QuotaExceededError] = []
+        quota_hit = threading.Event()
+        # ワーカースレッドには contextvars が引き継がれないため、親スパンを明示的に渡す
+        parent_span = get_tracer().current_span()
+
+        fetch_threads = [
+            self._start(
+                f"pipeline-fetch-{i}",
+                self._fetch_worker,
+                fetch,
+                fetch_queue,
+                detect_queue,
+                quota_hit,
+                parent_span,
+            )
+            for i in range(self._fetch_workers)
+        ]
+        detect_thread = self._start(
+            "pipeline-detect",
+            self._detect_worker,
+            targets,
+            detect_queue,
+            notify_queue,
+            quota_errors,
+            summary,
+            parent_span,
+        )
+        notify_threads = [
+            self._start(
+                f"pipeline-notify-{i}", self._notify_worker, notify_queue, summary, parent_span
+            )
+            for i in range(self._notify_workers)
+        ]
+
+        try:
+            for chunk in self._chunks(channels):
+                self._put(FETCH_STAGE, fetch_queue, chunk)
+        finally:
+            # 前段から順に停止させ、各キューを空にしてから次へ進む
+            for _ in fetch_threads:
+                fetch_queue.put(_STOP)
+            for thread in fetch_threads:
+                thread.join()
+            detect_queue.put(_STOP)
+            detect_thread.join()
+            for _ in notify_threads:
+                notify_queue.put(_STOP)
+            for thread in notify_threads:
+                thread.join()
+            with self._stats_lock:
+                self._queues = {}
+
+        summary.seconds = time.monotonic() - started
+        summary.quota_units = int(self._metrics.quota_units_total() - quota_before)
+        logger.info(
+            "監視サイクル完了: %dチャンネル / 配信中 %d / 配信開始 %d / 通知 %d / エラー %d "
+            "(%.2f秒, クォータ %d units)",
+            summary.channels,
+            summary.live,
+            summary.started,
+            summary.notified,
+            summary.errors,
+            summary.seconds,
+            summary.quota_units,
+            extra={
+                "event": "cycle_summary",
+                "channels": summary.channels,
+                "live": summary.live,
+                "started": summary.started,
+                "notified": summary.notified,
+                "errors": summary.errors,
+                "duration_seconds": summary.seconds,
+                "quota_units": summary.quota_units,
+            },
+        )
+
+        if quota_errors:
+            # クォータ超過エラーは上位レイヤーで処理するため再送出
+            # （取得を中止したチャンクのエラーより、リセット時刻を持つAPIのエラーを優先する）
+            raise next((e for e in quota_errors if e.reset_at is not None), quota_errors[0])
+        return summary
+
+    @staticmethod
+    def _start(name: str, target: Callable, *args) -> threading.Thread:
+        """ワーカースレッドを起動"""
+        thread = threading.Thread(target=target, args=args, name=name, daemon=True)
+        thread.start()
+        return thread
+
+    def _chunks(self, channels: List[Channel]) -> List[List[Channel]]:
+        """
+        チャンネルをチャンクに分割
+
+        配信中セットのチャンネルを後ろにまとめ、videos.list の一括確認が
+        複数のチャンクに分散しないようにする（新しい配信開始の検出も先に行われる）。
+        """
+        live_set = self._fetcher.live_set
+        ordered = [c for c in channels if not live_set.is_tracked(c.id)]
+        ordered += [c for c in channels if live_set.is_tracked(c.id)]
+        chunks = []
+        for start in range(0, len(ordered), self._chunk_size):
+            end = start + self._chunk_size
+            chunks.append(ordered[start:end])
+        return chunks
+
+    def _put(self, stage: str, stage_queue: queue.Queue, item) -> None:
+        """ステージの入力キューに追加（満杯の場合は空くまで待つ）"""
+        stage_queue.put(item)
+        depth = stage_queue.qsize()
+        with self._stats_lock:
+            stats = self._stats[stage]
+            stats.max_queue_depth = max(stats.max_queue_depth, depth)
+
+    def _record(self, stage: str, started: float, count: int = 1, error: bool = False) -> None:
+        """ステージの処理結果を記録"""
+        elapsed = time.monotonic() - started
+        with self._stats_lock:
+            stats = self._stats[stage]
+            stats.processed += count
+            stats.busy_seconds += elapsed
+            if error:
+                stats.errors += 1
+
+    def _count(self, summary: CycleSummary, field: str) -> None:
+        """サイクルの集計に1件加算（検出と通知のワーカーから呼ばれる）"""
+        with self._stats_lock:
+            setattr(summary, field, getattr(summary, field) + 1)
+
+    def _wait_for_notifications(self) -> None:
+        """未送信の通知がある間は取得を控える（最大 notify_priority_wait 秒）"""
+        if self._notify_priority_wait <= 0:
+            return
+        with self._notify_idle:
+            self._notify_idle.wait_for(
+                lambda: self._pending_notifications == 0, timeout=self._notify_priority_wait
+            )
+
+    def _fetch_worker(
+        self,
+        fetch: FetchFunction,
+        fetch_queue: queue.Queue,
+        detect_queue: queue.Queue,
+        quota_hit: threading.Event,
+        parent_span: Optional[Span],
+    ) -> None:
+        """取得ステージ: チャンクごとにまとめて取得して検出ステージへ渡す"""
+        while True:
+            chunk = fetch_queue.get()
+            if chunk is _STOP:
+                return
+
+            if quota_hit.is_set():
+                # クォータ超過後は残りのチャンクを取得しない
+                error = QuotaExceededError("クォータ超過のため取得を中止しました")
+                self._put(
+                    DETECT_STAGE,
+                    detect_queue,
+                    (chunk, {c.id: StreamFetchResult(error=error) for c in chunk}),
+                )
+                continue
+
+            self._wait_for_notifications()
+            started = time.monotonic()
+            failed = False
+            with get_tracer().span(
+                "pipeline.fetch", parent=parent_span, channels=len(chunk)
+            ) as span:
+                try:
+                    results = fetch(chunk)
+                except Exception as e:
+                    failed = True
+                    span.record_error(e)
+                    results = {c.id: StreamFetchResult(error=e) for c in chunk}
+            self._record(FETCH_STAGE, started, count=len(chunk), error=failed)
+
+            if any(isinstance(r.error, QuotaExceededError) for r in results.values()):
+                quota_hit.set()
+            self._put(DETECT_STAGE, detect_queue, (chunk, results))
+
+    def _detect_worker(
+        self,
+        targets: Dict[ChannelId, List[MonitorTarget]],
+        detect_queue: queue.Queue,
+        notify_queue: queue.Queue,
+        quota_errors: List[QuotaExceededError],
+        summary: CycleSummary,
+        parent_span: Optional[Span],
+    ) -> None:
+        """検出ステージ: 取得結果を前回の状態と比較し、通知が必要なものを通知ステージへ渡す"""
+        while True:
+            item = detect_queue.get()
+            if item is _STOP:
+                return
+
+            chunk, results = item
+            self._detect_chunk(
+                chunk, results, targets, notify_queue, quota_errors, summary, parent_span
+            )
+
+    def _detect_chunk(
+        self,
+        chunk: List[Channel],
+        results: Dict[ChannelId, StreamFetchResult],
+        targets: Dict[ChannelId, List[MonitorTarget]],
+        notify_queue: queue.Queue,
+        quota_errors: List[QuotaExceededError],
+        summary: CycleSummary,
+        parent_span: Optional[Span],
+    ) -> None:
+        """
+        1チャンク分の取得結果を、チャンネルを監視するユースケースごとにまとめて適用
+
+        取得に失敗したチャンネルを除き、ユースケースごとに detect_batch を1回呼ぶ
+        （前回の状態の読み込みと保存はユースケースごとに1回）。
+        """
+        batches: Dict[int, Tuple["MonitorStreamsUseCase", List[Tuple[Channel, Optional[Stream]]]]]
+        batches = {}
+        errors: Dict[ChannelId, BaseException] = {}
+        live = 0
+        for channel in chunk:
+            result = results.get(channel.id)
+            if result is None:
+                continue
+            if result.error is not None:
+                errors[channel.id] = result.error
+                self._count(summary, "errors")
+                if isinstance(result.error, QuotaExceededError):
+                    quota_errors.append(result.error)
+                else:
+                    logger.error(
+                        "チャンネル %s の監視中にエラー: %s",
+                        channel.name,
+                        result.error,
+                        extra={"channel_id": channel.id.value},
+                    )
+                continue
+            if result.stream is not None:
+                live += 1
+            for target_channel, use_case in targets.get(channel.id, []):
+                batch = batches.setdefault(id(use_case), (use_case, []))[1]
+                batch.append((target_channel, result.stream))
+        if live:
+            with self._stats_lock:
+                summary.live += live
+
+        jobs: List[Tuple[NotificationJob, "MonitorStreamsUseCase"]] = []
+        failed: Dict[ChannelId, BaseException] = {}
+        for use_case, batch in batches.values():
+            started = time.monotonic()
+            try:
+                batch_jobs = use_case.detect_batch(batch)
+            except Exception as e:
+                # まとめて検出できない場合は、失敗したチャンネルを特定するため1件ずつ検出する
+                logger.warning(f"一括検出に失敗したため1チャンネルずつ検出します: {e}")
+                batch_jobs = []
+                for target_channel, stream in batch:
+                    try:
+                        job = use_case.detect(target_channel, stream)
+                    except Exception as e:
+                        logger.error(
+                            "チャンネル %s の監視中にエラー: %s",
+                            target_channel.name,
+                            e,
+                            exc_info=True,
+                            extra={"channel_id": target_channel.id.value},
+                        )
+                        failed[target_channel.id] = e
+                        self._record(DETECT_STAGE, time.monotonic(), count=0, error=True)
+                        self._count(summary, "errors")
+                        continue
+                    if job is not None:
+                        batch_jobs.append(job)
+            self._record(DETECT_STAGE, started, count=len(batch))
+            jobs.extend((job, use_case) for job in batch_jobs)
+
+        if parent_span is not None and parent_span.sampled:
+            self._trace_chunk(chunk, results, errors, failed, jobs, parent_span)
+
+        for job, use_case in jobs:
+            self._count(summary, "started")
+            with self._notify_idle:
+                self._pending_notifications += 1
+            job.queued_at = self._clock.now(timezone.utc)
+            self._put(NOTIFY_STAGE, notify_queue, (job, use_case))
+
+    @staticmethod
+    def _trace_chunk(
+        chunk: List[Channel],
+        results: Dict[ChannelId, StreamFetchResult],
+        errors: Dict[ChannelId, BaseException],
+        failed: Dict[ChannelId, BaseException],
+        jobs: List[Tuple[NotificationJob, "MonitorStreamsUseCase"]],
+        parent_span: Span,
+    ) -> None:
+        """記録対象のサイクルでは、チャンネルごとの検出結果をスパンとして記録"""
+        started = {job.channel.id: job.stream.video_id for job, _ in jobs}
+        tracer = get_tracer()
+        for channel in chunk:
+            result = results.get(channel.id)
+            if result is None:
+                continue
+            with tracer.span(
+                "channel.detect",
+                parent=parent_span,
+                channel_id=channel.id.value,
+                channel_name=channel.name,
+            ) as span:
+                error = errors.get(channel.id) or failed.get(channel.id)
+                if error is not None:
+                    span.record_error(error)
+                if result.error is None:
+                    span.set_attribute("live", result.stream is not None)
+                if channel.id in started:
+                    span.add_event("stream_started", video_id=started[channel.id])
+
+    def _notify_worker(
+        self, notify_queue: queue.Queue, summary: CycleSummary, parent_span: Optional[Span]
+    ) -> None:
+        """通知ステージ: 通知を送信し、成功した場合は状態を更新する"""
+        while True:
+            item = notify_queue.get()
+            if item is _STOP:
+                return
+
+            job, use_case = item
+            started = time.monotonic()
+            delivered = False
+            with get_tracer().span(
+                "channel.notify",
+                parent=parent_span,
+                channel_id=str(job.channel.id),
+                channel_name=job.channel.name,
+                video_id=job.stream.video_id,
+            ) as span:
+                try:
+                    delivered = use_case.deliver(job)
+                except Exception as e:
+                    logger.error(
+                        "通知処理中にエラー: %s - %s",
+                        job.channel.name,
+                        e,
+                        exc_info=True,
+                        extra={"channel_id": str(job.channel.id), "video_id": job.stream.video_id},
+                    )
+                    span.record_error(e)
+                finally:
+                    span.set_attribute("delivered", delivered)
+                    self._record(NOTIFY_STAGE, started, error=not delivered)
+                    self._count(summary, "notified" if delivered else "errors")
+                    with self._notify_idle:
+                        self._pending_notifications -= 1
+                        if self._pending_notifications == 0:
+                            self._notify_idle.notify_all()
@@ -0,0 +1,131 @@
+"""監視対象チャンネルの一覧
+
+設定の再読み込みと制御APIの両方から稼働中に変更されるため、変更はここに集約する。
+
+- 単一設定の場合は1つの一覧、マルチテナントモードでは Tenant.channels を差し替える
+- 監視サイクルは channels() が返す一覧を使う（変更時は新しいリストに差し替えるため、
+  実行中のサイクルが参照している一覧は変わらない）
+- どのテナントにも残っていないチャンネルは on_removed で通知する（配信中セット・キャッシュの破棄用）
+"""
+
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from domain.entities.channel import Channel
+from domain.value_objects.channel_id import ChannelId
+from application.services.channel_set_diff import ChannelSetDiff, apply_diff
+
+if TYPE_CHECKING:
+    from application.use_cases.multi_tenant_monitor_use_case import Tenant
+
+
+class MonitoredChannels:
+    """稼働中に変更できる監視対象チャンネルの一覧"""
+
+    def __init__(
+        self,
+        channels: List[Channel],
+        tenants: Optional[List["Tenant"]] = None,
+        on_removed: Optional[Callable[[ChannelId], None]] = None,
+    ):
+        """
+        Args:
+            channels: 単一設定の場合の監視対象チャンネル（マルチテナントモードでは無視）
+            tenants: マルチテナントモードのテナント（単一設定の場合はNone）
+            on_removed: 監視対象から外れたチャンネルごとに呼び出す関数
+        """
+        self._channels = list(channels)
+        self._tenants: Optional[Dict[str, "Tenant"]] = (
+            {tenant.name: tenant for tenant in tenants} if tenants is not None else None
+        )
+        self._on_removed = on_removed
+        self._lock = threading.Lock()
+        self._snapshot = self._build_snapshot()
+
+    @property
+    def is_multi_tenant(self) -> bool:
+        return self._tenants is not None
+
+    def tenant_names(self) -> List[str]:
+        """テナント名の一覧（単一設定の場合は空）"""
+        return list(self._tenants) if self._tenants is not None else []
+
+    def channels(self) -> List[Channel]:
+        """監視対象チャンネル（マルチテナントの場合は重複排除後）"""
+        return self._snapshot
+
+    def find(self, channel_id: ChannelId) -> Optional[Channel]:
+        """監視対象のチャンネルを取得（マルチテナントの場合は最初に出現したもの）"""
+        for channel in self._snapshot:
+            if channel.id == channel_id:
+                return channel
+        return None
+
+    def tenants_of(self, channel_id: ChannelId) -> List[str]:
+        """チャンネルを監視しているテナント名（単一設定の場合は空）"""
+        if self._tenants is None:
+            return []
+        return [
+            name
+            for name, tenant in self._tenants.items()
+            if any(channel.id == channel_id for channel in tenant.channels)
+        ]
+
+    def tenant_channels(self, tenant: Optional[str] = None) -> List[Channel]:
+        """
+        テナントの監視対象チャンネル
+
+        Raises:
+            ValueError: テナントの指定が不正な場合
+        """
+        return list(self._target(tenant))
+
+    def apply(self, diff: ChannelSetDiff, tenant: Optional[str] = None) -> List[Channel]:
+        """
+        差分を適用
+
+        Args:
+            diff: 適用する差分
+            tenant: 適用先のテナント名（マルチテナントモードでは必須）
+
+        Returns:
+            適用後の監視対象チャンネル
+
+        Raises:
+            ValueError: テナントの指定が不正な場合
+        """
+        with self._lock:
+            updated = apply_diff(self._target(tenant), diff)
+            if self._tenants is None:
+                self._channels = updated
+            elif tenant is not None:  # マルチテナントモードでは _target で指定を確認済み
+                self._tenants[tenant].channels = updated
+            before = {channel.id for channel in self._snapshot}
+            self._snapshot = self._build_snapshot()
+            remaining = {channel.id for channel in self._snapshot}
+
+        if self._on_removed is not None:
+            for channel in diff.removed:
+                if channel.id in before and channel.id not in remaining:
+                    self._on_removed(channel.id)
+        return self._snapshot
+
+    def _target(self, tenant: Optional[str]) -> List[Channel]:
+        if self._tenants is None:
+            if tenant:
+                raise ValueError(f"マルチテナントモードではありません: tenant={tenant}")
+            return self._channels
+        if tenant not in self._tenants:
+            raise ValueError(
+                f"テナントを指定してください（{', '.join(self._tenants)}）: tenant={tenant}"
+            )
+        return self._tenants[tenant].channels
+
+    def _build_snapshot(self) -> List[Channel]:
+        if self._tenants is None:
+            return list(self._channels)
+        unique: Dict[ChannelId, Channel] = {}
+        for tenant in self._tenants.values():
+            for channel in tenant.channels:
+                unique.setdefault(channel.id, channel)
+        return list(unique.values())
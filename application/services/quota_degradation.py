@@ -0,0 +1,177 @@
+"""クォータ超過中の縮退運転
+
+YouTube APIのクォータを超過した場合に、リセットまで監視を止めるのではなく縮退運転に切り替える。
+
+- 縮退運転中は新着動画フィード（クォータを消費しない）で、縮退運転の開始以降に公開された
+  動画・配信を検知する（配信中かは確認できない）
+- probe_interval 秒ごとに1 unitだけ消費する確認（videos.list 1回）を行い、リセット時刻より
+  早くクォータが戻った場合も検知する（リセット時刻を過ぎた後の最初の確認でも戻ったかを確かめる）
+- 確認に成功したら縮退運転を終了し、通常の監視（APIでの取得）を再開する
+- 縮退運転の状態はウォーム状態で引き継ぎ、単発実行（--once）の繰り返しでも縮退運転を続ける
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from domain.repositories.stream_repository import StreamRepository
+from domain.repositories.errors import QuotaExceededError
+from application.services.clock import Clock, SystemClock
+from application.services.monitor_metrics import MonitorMetrics, NullMonitorMetrics
+from application.services.quota_reset import next_quota_reset
+from application.services.warm_state import WarmStateComponent
+
+logger = logging.getLogger(__name__)
+
+# クォータの確認に使う動画ID（存在しないIDでも videos.list は1 unitを消費して空の結果を返す）
+PROBE_VIDEO_ID = "quota-probe"
+
+
+class QuotaDegradation(WarmStateComponent):
+    """クォータ超過による縮退運転の状態と、クォータの回復の確認"""
+
+    def __init__(
+        self,
+        stream_repository: StreamRepository,
+        probe_interval: int = 900,
+        clock: Optional[Clock] = None,
+        metrics: Optional[MonitorMetrics] = None,
+    ):
+        """
+        Args:
+            stream_repository: クォータの確認に使う配信情報取得リポジトリ
+            probe_interval: 縮退運転中にクォータの回復を確認する間隔（秒、1回1 unit）
+            clock: 確認の間隔とリセット時刻の判定に使う時計
+            metrics: 縮退運転の状態と確認結果の記録先
+        """
+        self._streams = stream_repository
+        self._probe_interval = probe_interval
+        self._clock = clock if clock is not None else SystemClock()
+        self._metrics = metrics if metrics is not None else NullMonitorMetrics()
+        self._since: Optional[datetime] = None
+        self._reset_at: Optional[datetime] = None
+        self._next_probe_at: Optional[float] = None
+        self._metrics.quota_degraded(False)
+
+    @property
+    def active(self) -> bool:
+        """縮退運転中か"""
+        return self._since is not None
+
+    @property
+    def since(self) -> Optional[datetime]:
+        """縮退運転を開始した時刻（タイムゾーン付き。この時刻以降の新着を検知する）"""
+        return self._since
+
+    @property
+    def reset_at(self) -> Optional[datetime]:
+        """クォータがリセットされる時刻（タイムゾーン付き）"""
+        return self._reset_at
+
+    def seconds_until_reset(self) -> int:
+        """クォータのリセットまでの秒数（縮退運転中でない場合は0）"""
+        if self._reset_at is None:
+            return 0
+        return max(0, int((self._reset_at - self._clock.now(timezone.utc)).total_seconds()))
+
+    def enter(self, error: QuotaExceededError) -> None:
+        """
+        クォータ超過を受けて縮退運転を開始（縮退運転中の場合はリセット時刻だけ更新）
+
+        Args:
+            error: クォータ超過エラー（リセット時刻が不明な場合は次の JST 18:00 とみなす）
+        """
+        now = self._clock.now(timezone.utc)
+        self._reset_at = error.reset_at or next_quota_reset(now)
+        if self._since is not None:
+            return
+        self._since = now
+        self._next_probe_at = self._clock.monotonic() + self._probe_interval
+        self._metrics.quota_degraded(True)
+        logger.warning(
+            f"YouTube APIクォータ超過のため縮退運転に切り替えます"
+            f"（新着動画フィードで検知、リセット予定: "
+            f"{self._reset_at.astimezone(timezone.utc).isoformat()}、"
+            f"{self._probe_interval}秒ごとにクォータの回復を確認）"
+        )
+
+    def probe_if_due(self) -> bool:
+        """
+        確認の間隔が経過した、またはリセット時刻を過ぎた場合にクォータの回復を確認
+
+        Returns:
+            縮退運転中でない（確認に成功して終了した場合を含む）場合True
+        """
+        if self._since is None:
+            return True
+        now = self._clock.monotonic()
+        reset_passed = self.seconds_until_reset() == 0
+        if not reset_passed and self._next_probe_at is not None and now < self._next_probe_at:
+            return False
+
+        self._next_probe_at = now + self._probe_interval
+        try:
+            self._streams.get_streams([PROBE_VIDEO_ID])
+        except QuotaExceededError as e:
+            self._metrics.quota_probed("quota")
+            if e.reset_at is not None:
+                self._reset_at = e.reset_at
+            logger.info(
+                f"クォータはまだ回復していません（残り約{self.seconds_until_reset() // 60}分）"
+            )
+            return False
+        except Exception as e:
+            self._metrics.quota_probed("error")
+            logger.warning(f"クォータの回復を確認できませんでした: {e}")
+            return False
+
+        self._metrics.quota_probed("recovered")
+        self.exit()
+        return True
+
+    def exit(self) -> None:
+        """縮退運転を終了"""
+        if self._since is None:
+            return
+        early = self.seconds_until_reset()
+        logger.info(
+            "YouTube APIクォータが回復したため通常の監視を再開します"
+            + (f"（リセット予定の約{early // 60}分前）" if early > 0 else "")
+        )
+        self._since = None
+        self._reset_at = None
+        self._next_probe_at = None
+        self._metrics.quota_degraded(False)
+
+    def export_warm_state(self) -> Dict[str, Any]:
+        """縮退運転の開始時刻・リセット時刻・次の確認の予定（縮退運転中でない場合は空）"""
+        if self._since is None or self._reset_at is None:
+            return {}
+        state: Dict[str, Any] = {
+            "since": self._since.isoformat(),
+            "reset_at": self._reset_at.isoformat(),
+        }
+        if self._next_probe_at is not None:
+            # 単調時刻はプロセスをまたいで使えないため、UNIX秒に換算して保存する
+            state["next_probe_at"] = self._clock.time() + (
+                self._next_probe_at - self._clock.monotonic()
+            )
+        return state
+
+    def restore_warm_state(self, state: Dict[str, Any]) -> None:
+        """export_warm_state の内容を復元（縮退運転中だった場合は縮退運転を続ける）"""
+        if "since" not in state or "reset_at" not in state:
+            return
+        self._since = datetime.fromisoformat(state["since"])
+        self._reset_at = datetime.fromisoformat(state["reset_at"])
+        next_probe_at = state.get("next_probe_at")
+        self._next_probe_at = (
+            self._clock.monotonic() + max(0.0, next_probe_at - self._clock.time())
+            if next_probe_at is not None
+            else None
+        )
+        self._metrics.quota_degraded(True)
+        logger.info(
+            f"縮退運転を引き継ぎます（リセット予定: "
+            f"{self._reset_at.astimezone(timezone.utc).isoformat()}）"
+        )
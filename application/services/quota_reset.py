@@ -0,0 +1,26 @@
+"""YouTube APIクォータのリセット時刻
+
+YouTube Data API のクォータは1日単位でリセットされる（太平洋時間の0時。
+本アプリでは余裕を見て JST 18:00 をリセット時刻として扱う）。
+"""
+
+from datetime import datetime, timedelta, timezone
+
+JST = timezone(timedelta(hours=9))
+
+# クォータがリセットされる時刻（JST）
+RESET_HOUR_JST = 18
+
+
+def quota_day(moment: datetime) -> str:
+    """時刻が属するクォータの日（JST 18:00 始まり、その日付のISO形式）"""
+    return (moment.astimezone(JST) - timedelta(hours=RESET_HOUR_JST)).date().isoformat()
+
+
+def next_quota_reset(moment: datetime) -> datetime:
+    """次にクォータがリセットされる時刻（JST）"""
+    now_jst = moment.astimezone(JST)
+    reset = now_jst.replace(hour=RESET_HOUR_JST, minute=0, second=0, microsecond=0)
+    if now_jst >= reset:
+        reset += timedelta(days=1)
+    return reset
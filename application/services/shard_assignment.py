@@ -0,0 +1,144 @@
+"""チャンネルのシャーディング
+
+複数のワーカー（プロセス・ノード）で監視対象チャンネルを分担する。
+
+- 各ワーカーは共有のメンバーシップに定期的に生存を記録し、生存しているワーカーの一覧から
+  コンシステントハッシュリングを作る
+- チャンネルIDをリングに当てて担当のワーカーを決め、自分が担当するチャンネルだけを監視する
+- ワーカーの増減で担当が移るのは約 1/N のチャンネルだけで、移った先のワーカーは
+  共有の状態リポジトリから前回の状態を引き継ぐ
+"""
+
+import logging
+from typing import Callable, Iterable, List, Optional, Set
+
+from domain.entities.channel import Channel
+from domain.value_objects.channel_id import ChannelId
+from domain.repositories.membership_repository import MembershipRepository
+from application.services.clock import Clock, SystemClock
+from application.services.consistent_hash import ConsistentHashRing
+from application.services.monitor_metrics import MonitorMetrics, NullMonitorMetrics
+
+logger = logging.getLogger(__name__)
+
+
+class ShardAssignment:
+    """このワーカーが担当するチャンネルを決める"""
+
+    def __init__(
+        self,
+        worker_id: str,
+        membership: MembershipRepository,
+        replicas: int = 100,
+        heartbeat_interval: int = 10,
+        member_ttl: int = 30,
+        clock: Optional[Clock] = None,
+        on_released: Optional[Callable[[ChannelId], None]] = None,
+        metrics: Optional[MonitorMetrics] = None,
+    ):
+        """
+        Args:
+            worker_id: このワーカーのID（ワーカー間で一意）
+            membership: ワーカーの生存を共有するリポジトリ
+            replicas: ワーカーあたりの仮想ノード数
+            heartbeat_interval: 生存を記録する間隔（秒）
+            member_ttl: 生存の記録が途絶えてから離脱とみなすまでの秒数（heartbeat_interval より長くする）
+            clock: 生存の記録の間隔に使う時計
+            on_released: 他のワーカーに担当が移ったチャンネルごとに呼び出す関数
+            metrics: ワーカー数と担当チャンネル数の記録先
+        """
+        if not worker_id:
+            raise ValueError("worker_id を指定してください")
+        if member_ttl <= heartbeat_interval:
+            raise ValueError(
+                f"member_ttl ({member_ttl}) は heartbeat_interval ({heartbeat_interval}) "
+                f"より長くしてください"
+            )
+        self._worker_id = worker_id
+        self._membership = membership
+        self._replicas = replicas
+        self._heartbeat_interval = heartbeat_interval
+        self._member_ttl = member_ttl
+        self._clock = clock if clock is not None else SystemClock()
+        self._on_released = on_released
+        self._metrics = metrics if metrics is not None else NullMonitorMetrics()
+        self._heartbeat_at: Optional[float] = None
+        self._ring = ConsistentHashRing([worker_id], replicas=replicas)
+        self._owned: Optional[Set[ChannelId]] = None
+
+    @property
+    def worker_id(self) -> str:
+        return self._worker_id
+
+    @property
+    def members(self) -> List[str]:
+        """最後に確認した生存中のワーカーID"""
+        return self._ring.members
+
+    def heartbeat_if_due(self) -> None:
+        """前回の記録から heartbeat_interval 秒経過していれば生存を記録"""
+        now = self._clock.monotonic()
+        if self._heartbeat_at is not None and now - self._heartbeat_at < self._heartbeat_interval:
+            return
+        try:
+            self._membership.heartbeat(self._worker_id, self._member_ttl)
+        except Exception as e:
+            # 記録できない間は他のワーカーから離脱とみなされ、担当が重複する場合がある
+            logger.warning(f"ワーカーの生存を記録できませんでした: {e}")
+            return
+        self._heartbeat_at = now
+
+    def refresh(self) -> None:
+        """生存中のワーカーを確認し、変わっていればハッシュリングを作り直す"""
+        self.heartbeat_if_due()
+        try:
+            members = set(self._membership.active_members())
+        except Exception as e:
+            # 確認できない場合は前回の割り当てで監視を続ける
+            logger.warning(f"ワーカーの一覧を取得できませんでした: {e}")
+            return
+        # 生存の記録に失敗していても自分は担当を持ち続ける
+        members.add(self._worker_id)
+        if sorted(members) == self._ring.members:
+            return
+        logger.info(
+            f"シャードの再割り当て: ワーカー {len(self._ring)} → {len(members)} "
+            f"({', '.join(sorted(members))})"
+        )
+        self._ring = ConsistentHashRing(members, replicas=self._replicas)
+        self._metrics.shard_rebalanced(len(members))
+
+    def owns(self, channel_id: ChannelId) -> bool:
+        """このワーカーがチャンネルを担当しているか（最後に確認したワーカーの一覧で判定）"""
+        return self._ring.owner(str(channel_id)) == self._worker_id
+
+    def select(self, channels: Iterable[Channel]) -> List[Channel]:
+        """
+        ワーカーの一覧を確認し、このワーカーが担当するチャンネルを返す
+
+        前回から担当が他のワーカーに移ったチャンネルは on_released で通知する。
+
+        Args:
+            channels: 全ワーカー共通の監視対象チャンネル
+
+        Returns:
+            このワーカーが担当するチャンネル（順序は channels のまま）
+        """
+        self.refresh()
+        owned = [channel for channel in channels if self.owns(channel.id)]
+        owned_ids = {channel.id for channel in owned}
+        if self._owned is not None and self._on_released is not None:
+            for channel_id in self._owned - owned_ids:
+                self._on_released(channel_id)
+        self._owned = owned_ids
+        self._metrics.shard_owned_channels(len(owned))
+        return owned
+
+    def leave(self) -> None:
+        """終了時に離脱を記録し、担当を他のワーカーに即座に引き継ぐ"""
+        try:
+            self._membership.leave(self._worker_id)
+        except Exception as e:
+            logger.warning(f"ワーカーの離脱を記録できませんでした: {e}")
+            return
+        logger.info(f"シャーディングから離脱しました: {self._worker_id}")
@@ -4,10 +4,20 @@
 - 前回未配信 & 今回配信中 → 配信開始
 - 前回配信中 & 今回未配信 → 配信終了
 - video_idの変化 → 新しい配信開始
+- 通知済みの動画（並行配信の切り替え・APIの不整合による配信中/未配信の揺れ）→ 開始とみなさない
+- 新着動画フィードで検知した動画（UPLOADED）→ 通知済みの履歴だけに記録し、配信中の状態は変更しない
+
+detect_changes は1サイクル（チャンク）分の前回の状態と取得結果を1回の走査で判定し、
+変化の種類ごとの添字と保存が必要な状態だけを返す（状態の保存と通知はまとめて行える）。
 """
 
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Sequence
+
 from domain.entities.stream import Stream
+from domain.value_objects.stream_status import StreamStatus
+from application.dto.notified_video_index import NotifiedVideoIndex
+from application.dto.stream_change_set import StreamChangeSet
 from application.dto.stream_state_dto import StreamStateDto
 
 
@@ -35,6 +45,10 @@ class StreamChangeDetector:
         if previous_state is None:
             return True
 
+        # 通知済みの動画は再通知しない
+        if current_stream.video_id in previous_state.notified:
+            return False
+
         # 前回未配信で今回配信中 → 配信開始
         if not previous_state.is_live:
             return True
@@ -64,3 +78,73 @@ class StreamChangeDetector:
 
         # 前回配信中で今回未配信 → 配信終了
         return previous_state.is_live and current_stream is None
+
+    def detect_changes(
+        self,
+        previous_states: Sequence[Optional[StreamStateDto]],
+        current_streams: Sequence[Optional[Stream]],
+        now: datetime,
+    ) -> StreamChangeSet:
+        """
+        複数チャンネルの配信状態の変化を一括で判定
+
+        判定は is_stream_started / is_stream_ended と同じ。
+
+        Args:
+            previous_states: チャンネルごとの前回の状態（初回はNone）
+            current_streams: 同じ順のチャンネルごとの現在の配信（配信していない場合はNone）
+            now: 更新する状態に記録する確認時刻
+
+        Returns:
+            変化の種類ごとの添字と、保存が必要な状態
+        """
+        if len(previous_states) != len(current_streams):
+            raise ValueError(
+                f"前回の状態と取得結果の件数が一致しません: "
+                f"{len(previous_states)} != {len(current_streams)}"
+            )
+
+        changes = StreamChangeSet()
+        started = changes.started
+        continued = changes.continued
+        ended = changes.ended
+        went_offline = changes.went_offline
+        updates = changes.updates
+        empty = NotifiedVideoIndex.empty()
+
+        for i, (previous, stream) in enumerate(zip(previous_states, current_streams)):
+            if stream is not None:
+                if previous is None:
+                    started.append(i)
+                    continue
+                video_id = stream.video_id
+                if video_id not in previous.notified and (
+                    not previous.is_live or previous.video_id != video_id
+                ):
+                    started.append(i)
+                    continue
+                continued.append(i)
+                if stream.status == StreamStatus.UPLOADED:
+                    # フィードで検知した動画は配信中かが分からないため、配信中の状態は変更しない
+                    continue
+                updates.append(
+                    (
+                        i,
+                        StreamStateDto(
+                            is_live=True,
+                            video_id=video_id,
+                            last_checked=now,
+                            last_notified=previous.last_notified,
+                            notified=previous.notified,
+                        ),
+                    )
+                )
+            elif previous is None:
+                went_offline.append(i)
+                updates.append((i, StreamStateDto(False, None, now, None, empty)))
+            elif previous.is_live:
+                ended.append(i)
+                updates.append(
+                    (i, StreamStateDto(False, None, now, previous.last_notified, previous.notified))
+                )
+        return changes
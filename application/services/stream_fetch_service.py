@@ -0,0 +1,147 @@
+"""配信情報取得サービス
+
+監視サイクル1回分の配信情報取得をまとめて行う
+
+責務:
+1. 通常の監視サイクルでは全チャンネルをリポジトリの一括取得でまとめて取得する
+   （配信中のチャンネルも、並行して始まった配信や終了直後の次の配信を検知するため確認する）
+2. 通常チェックの間の配信中チェックでは、配信中セットを videos.list の一括確認で済ませ、
+   終了した配信のチャンネルだけを通常どおり取得しなおす
+3. クォータ超過中（縮退運転）は新着動画フィードからクォータを消費せずに新着を取得する
+
+取得結果は通知先・状態管理と独立しているため、複数テナントで共有できる。
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from domain.entities.channel import Channel
+from domain.entities.stream import Stream
+from domain.repositories.stream_repository import StreamRepository
+from domain.repositories.upload_feed_repository import UploadFeedRepository
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.stream_fetch_result import StreamFetchResult
+from domain.repositories.errors import QuotaExceededError
+from application.services.live_set_tracker import LiveSetTracker
+
+logger = logging.getLogger(__name__)
+
+
+class StreamFetchService:
+    """監視対象チャンネルの配信情報をまとめて取得するサービス"""
+
+    def __init__(
+        self,
+        stream_repository: StreamRepository,
+        live_set_tracker: Optional[LiveSetTracker] = None,
+        feed_repository: Optional[UploadFeedRepository] = None,
+    ):
+        """
+        Args:
+            stream_repository: 配信情報取得リポジトリ
+            live_set_tracker: 配信中セットの追跡サービス（省略時は新規作成）
+            feed_repository: クォータ超過中に使う新着動画フィード（省略時は縮退運転しない）
+        """
+        self._stream_repo = stream_repository
+        self._feed_repo = feed_repository
+        self._live_set = live_set_tracker if live_set_tracker is not None else LiveSetTracker()
+
+    @property
+    def live_set(self) -> LiveSetTracker:
+        """配信中セットの追跡サービス"""
+        return self._live_set
+
+    def fetch(self, channels: List[Channel]) -> Dict[ChannelId, StreamFetchResult]:
+        """
+        チャンネルの現在の配信をまとめて取得
+
+        Args:
+            channels: 取得対象のチャンネルリスト（ChannelIdで重複排除済みであること）
+
+        Returns:
+            チャンネルID → 取得結果
+        """
+        # 配信中のチャンネルも含めて一括取得（実装側でAPI呼び出しをまとめる）
+        return self._stream_repo.get_current_streams(channels)
+
+    @property
+    def stream_repository(self) -> StreamRepository:
+        """配信情報取得リポジトリ"""
+        return self._stream_repo
+
+    @property
+    def supports_uploads_feed(self) -> bool:
+        """新着動画フィードで縮退運転できるか"""
+        return self._feed_repo is not None
+
+    def fetch_uploads(
+        self, channels: List[Channel], since: datetime
+    ) -> Dict[ChannelId, StreamFetchResult]:
+        """
+        新着動画フィードから、指定時刻以降に公開された最新の動画を取得（クォータを消費しない）
+
+        Args:
+            channels: 取得対象のチャンネルリスト
+            since: この時刻（タイムゾーン付き）以降に公開された動画だけを対象にする
+
+        Returns:
+            チャンネルID → 取得結果（新着がないチャンネルは含まない）
+        """
+        if self._feed_repo is None:
+            raise RuntimeError("新着動画フィードが設定されていません")
+        return self._feed_repo.get_latest_uploads(channels, since)
+
+    def fetch_live_set(self, channels: List[Channel]) -> Dict[ChannelId, StreamFetchResult]:
+        """
+        配信中セットのチャンネルのみ継続・終了を確認
+
+        追跡中の配信が終了したチャンネルは、すぐに次の配信を始めている場合があるため、
+        同じ確認の中で通常どおり取得しなおす。
+
+        Returns:
+            チャンネルID → 取得結果（確認できなかったチャンネルは含まない）
+
+        Raises:
+            QuotaExceededError: YouTube APIクォータ超過時
+        """
+        refreshed = self.refresh_live_set(channels)
+        results = {
+            channel_id: StreamFetchResult(stream=stream)
+            for channel_id, stream in refreshed.items()
+            if stream is not None
+        }
+
+        pending = [
+            channel
+            for channel in channels
+            if channel.id in refreshed and refreshed[channel.id] is None
+        ]
+        if pending:
+            results.update(self._stream_repo.get_current_streams(pending))
+
+        return results
+
+    def refresh_live_set(self, channels: List[Channel]) -> Dict[ChannelId, Optional[Stream]]:
+        """
+        配信中セットを一括確認
+
+        Returns:
+            チャンネルID → 現在の配信（終了した場合はNone）。確認できなかった場合は空
+
+        Raises:
+            QuotaExceededError: YouTube APIクォータ超過時
+        """
+        if not len(self._live_set):
+            return {}
+
+        try:
+            return self._live_set.refresh(
+                self._stream_repo, channel_ids=[channel.id for channel in channels]
+            )
+        except QuotaExceededError:
+            raise
+        except Exception as e:
+            # 一括確認に失敗した場合は次の通常チェックで確認する
+            logger.warning(f"配信中セットの一括確認に失敗（次の通常チェックで確認）: {e}")
+            return {}
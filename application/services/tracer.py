@@ -0,0 +1,213 @@
+"""構造化トレース
+
+監視サイクル → チャンネル → API呼び出し の入れ子をスパンとして記録する
+
+- スパンは開始・終了時刻、属性、イベント（リトライ・待機など）、状態を持つ
+- 現在のスパンは contextvars で保持し、同じスレッド内の呼び出しは自動的に子スパンになる
+- 別スレッド（パイプラインのワーカー）では親スパンを明示的に渡す
+- サンプリングはルートスパン（監視サイクル）で決定し、子スパンはそれを引き継ぐ
+- 記録しないスパンは時刻の取得もエクスポートもしないため、無効時のコストはほぼない
+- スパンの出力先（SpanExporter）は Infrastructure 層の実装を起動時に set_tracer で設定する
+"""
+
+import contextvars
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 親スパンを省略した場合に現在のスパンを使うための目印
+_CURRENT = object()
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+class Span:
+    """1つの処理区間"""
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        span_id: str,
+        parent_span_id: Optional[str] = None,
+        sampled: bool = True,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_span_id = parent_span_id
+        self.sampled = sampled
+        self.attributes: Dict[str, Any] = dict(attributes or {}) if sampled else {}
+        # (イベント名, 時刻（UNIXナノ秒）, 属性)
+        self.events: List[Tuple[str, int, Dict[str, Any]]] = []
+        self.start_time_ns = time.time_ns() if sampled else 0
+        self.end_time_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """属性を設定"""
+        if self.sampled:
+            self.attributes[key] = value
+
+    def add_event(self, name: str, **attributes: Any) -> None:
+        """イベント（リトライ・待機など）を記録"""
+        if self.sampled:
+            self.events.append((name, time.time_ns(), attributes))
+
+    def record_error(self, error: BaseException) -> None:
+        """スパンを失敗として記録"""
+        if self.sampled:
+            self.error = f"{type(error).__name__}: {error}"
+
+    def end(self) -> None:
+        """終了時刻を記録"""
+        if self.sampled and self.end_time_ns is None:
+            self.end_time_ns = time.time_ns()
+
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        """所要時間（終了前はNone）"""
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSONに変換できる辞書"""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "name": self.name,
+            "start_time_unix_nano": self.start_time_ns,
+            "end_time_unix_nano": self.end_time_ns,
+            "duration_seconds": self.duration_seconds,
+            "status": "error" if self.error else "ok",
+            "error": self.error,
+            "attributes": self.attributes,
+            "events": [
+                {"name": name, "time_unix_nano": timestamp, "attributes": attributes}
+                for name, timestamp, attributes in self.events
+            ],
+        }
+
+
+class SpanExporter(ABC):
+    """終了したスパンの出力先"""
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """スパンを出力"""
+        pass
+
+    def shutdown(self) -> None:
+        """未出力のスパンを書き出して終了"""
+
+
+class Tracer:
+    """スパンの生成・サンプリング・エクスポートを行う"""
+
+    def __init__(self, exporter: Optional[SpanExporter] = None, sample_ratio: float = 1.0):
+        """
+        Args:
+            exporter: スパンの出力先（省略時はトレースを記録しない）
+            sample_ratio: 記録する監視サイクルの割合（0.0〜1.0）
+        """
+        self._exporter = exporter
+        self._sample_ratio = min(1.0, max(0.0, sample_ratio))
+
+    @property
+    def enabled(self) -> bool:
+        """トレースを記録するか"""
+        return self._exporter is not None and self._sample_ratio > 0
+
+    @staticmethod
+    def current_span() -> Optional[Span]:
+        """現在のスレッド（コンテキスト）で実行中のスパン"""
+        return _current_span.get()
+
+    @contextmanager
+    def span(self, name: str, parent: Any = _CURRENT, **attributes: Any) -> Iterator[Span]:
+        """
+        スパンを開始し、ブロックの終了時に終了・エクスポートする
+
+        ブロック内で送出された例外はスパンに記録してから再送出する。
+
+        Args:
+            name: スパン名
+            parent: 親スパン（省略時は現在のスパン、Noneの場合はルートスパン）
+            **attributes: スパンの属性
+        """
+        if parent is _CURRENT:
+            parent = _current_span.get()
+        span = self._create(name, parent, attributes)
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            if span.sampled:
+                self._export(span)
+
+    def shutdown(self) -> None:
+        """エクスポーターを終了"""
+        if self._exporter is not None:
+            self._exporter.shutdown()
+
+    def _create(self, name: str, parent: Optional[Span], attributes: Dict[str, Any]) -> Span:
+        """サンプリングを判定してスパンを生成"""
+        if parent is not None:
+            return Span(
+                name,
+                parent.trace_id,
+                _new_id(64),
+                parent_span_id=parent.span_id,
+                sampled=parent.sampled,
+                attributes=attributes,
+            )
+
+        sampled = self.enabled and (
+            self._sample_ratio >= 1.0 or random.random() < self._sample_ratio
+        )
+        return Span(name, _new_id(128), _new_id(64), sampled=sampled, attributes=attributes)
+
+    def _export(self, span: Span) -> None:
+        if self._exporter is None:
+            return
+        try:
+            self._exporter.export(span)
+        except Exception as e:
+            # トレースの失敗で監視を止めない
+            logger.warning(f"スパンのエクスポートに失敗: {e}")
+
+
+def _new_id(bits: int) -> str:
+    """トレースID（128bit）・スパンID（64bit）の16進文字列"""
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+# アプリケーション全体で共有するトレーサー（既定は記録しない）
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """共有のトレーサーを取得"""
+    return _tracer
+
+
+def set_tracer(tracer: Tracer) -> None:
+    """共有のトレーサーを差し替え（起動時に設定から生成したものを設定する）"""
+    global _tracer
+    _tracer = tracer
@@ -0,0 +1,113 @@
+"""ウォーム状態のスナップショット
+
+再起動や --once での単発実行のたびにキャッシュ・スケジュールを捨てると、
+最初のサイクルが全チャンネル分の確認（コールドスタート）になる。
+各コンポーネントのメモリ上の状態を名前付きで1つのスナップショットにまとめ、
+WarmStateRepository に保存・復元する。
+
+対象のコンポーネントは WarmStateComponent を実装し、
+JSONに変換できる辞書で状態を出し入れする。
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from datetime import timezone
+from typing import Any, Dict, Optional
+
+from domain.repositories.warm_state_repository import WarmStateRepository
+from application.services.clock import Clock, SystemClock
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+class WarmStateComponent(ABC):
+    """スナップショットに状態を保存・復元できるコンポーネント"""
+
+    @abstractmethod
+    def export_warm_state(self) -> Dict[str, Any]:
+        """現在の状態（JSONに変換できる辞書）"""
+        pass
+
+    @abstractmethod
+    def restore_warm_state(self, state: Dict[str, Any]) -> None:
+        """export_warm_state が返した状態を復元"""
+        pass
+
+
+class WarmStateSnapshot:
+    """登録したコンポーネントの状態をまとめて保存・復元するサービス"""
+
+    def __init__(self, repository: WarmStateRepository, clock: Optional[Clock] = None):
+        """
+        Args:
+            repository: スナップショットの保存先
+            clock: 保存時刻の記録に使う時計（省略時は実際の時刻）
+        """
+        self._repository = repository
+        self._clock = clock if clock is not None else SystemClock()
+        self._components: Dict[str, WarmStateComponent] = {}
+
+    def register(self, name: str, component: WarmStateComponent) -> None:
+        """
+        コンポーネントを登録
+
+        Args:
+            name: スナップショット内の名前（コンポーネントごとに一意）
+            component: 状態を保存・復元するコンポーネント
+        """
+        if name in self._components:
+            raise ValueError(f"ウォーム状態のコンポーネント名が重複しています: {name}")
+        self._components[name] = component
+
+    def restore(self) -> int:
+        """
+        保存済みのスナップショットから各コンポーネントの状態を復元
+
+        復元できなかったコンポーネントは警告を出して空の状態のまま開始する。
+
+        Returns:
+            復元したコンポーネント数
+        """
+        snapshot = self._repository.load()
+        if not snapshot:
+            return 0
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            logger.warning(
+                f"ウォーム状態の形式が異なるため読み込みません: version={snapshot.get('version')}"
+            )
+            return 0
+
+        restored = 0
+        states = snapshot.get("components", {})
+        for name, component in self._components.items():
+            if name not in states:
+                continue
+            try:
+                component.restore_warm_state(states[name])
+                restored += 1
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"ウォーム状態の復元に失敗 ({name}): {e}")
+        logger.info(
+            f"ウォーム状態を復元しました: {restored}/{len(self._components)}コンポーネント "
+            f"(保存時刻 {snapshot.get('saved_at')})"
+        )
+        return restored
+
+    def save(self) -> None:
+        """
+        各コンポーネントの現在の状態をスナップショットとして保存
+
+        Raises:
+            WarmStateRepositoryError: 保存エラー
+        """
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "saved_at": self._clock.now(timezone.utc).isoformat(),
+            "components": {
+                name: component.export_warm_state() for name, component in self._components.items()
+            },
+        }
+        self._repository.save(snapshot)
+        logger.debug("ウォーム状態を保存しました: %dコンポーネント", len(self._components))
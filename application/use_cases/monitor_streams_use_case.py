@@ -5,21 +5,40 @@
 2. 前回の状態と比較して変化を検出
 3. 配信開始を検出した場合は通知
 4. 状態を更新して保存
+5. 配信中のチャンネルは追跡中のvideo IDを一括確認して継続・終了を判定
+
+取得・検出・通知は MonitorPipeline で並行に処理し、本クラスはチャンク単位の
+検出（detect_batch。状態の読み書きもまとめて行う）と通知（deliver）を提供する。
 
 依存性: インターフェース（抽象）のみに依存
 """
 
-from typing import List
+from typing import Dict, List, Optional, Sequence, Tuple
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 
 from domain.entities.channel import Channel
+from domain.entities.stream import Stream
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.stream_status import StreamStatus
 from domain.repositories.stream_repository import StreamRepository
 from domain.repositories.notification_gateway import NotificationGateway
 from domain.repositories.state_repository import StateRepository
+from domain.repositories.idempotency_key_repository import IdempotencyKeyRepository
 from application.services.stream_change_detector import StreamChangeDetector
+from application.services.live_set_tracker import LiveSetTracker
+from application.services.stream_fetch_service import StreamFetchService
+from application.services.monitor_pipeline import CycleSummary, MonitorPipeline, MonitorTarget
+from application.services.latency_recorder import LatencyRecorder
+from application.services.clock import Clock, SystemClock
+from application.services.monitor_metrics import MonitorMetrics, NullMonitorMetrics
 from application.dto.stream_state_dto import StreamStateDto
-from infrastructure.youtube.youtube_stream_repository import QuotaExceededError
+from application.dto.notified_video_index import NotifiedVideoIndex
+from application.dto.notification_job import NotificationJob
+from application.dto.notification_latency_dto import NotificationLatencyDto
+from domain.value_objects.webhook_delivery import WebhookDelivery
+from application.services.tracer import get_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -33,86 +52,384 @@ class MonitorStreamsUseCase:
         notification_gateway: NotificationGateway,
         state_repository: StateRepository,
         change_detector: StreamChangeDetector,
+        live_set_tracker: Optional[LiveSetTracker] = None,
+        fetch_service: Optional[StreamFetchService] = None,
+        pipeline: Optional[MonitorPipeline] = None,
+        latency_recorder: Optional[LatencyRecorder] = None,
+        clock: Optional[Clock] = None,
+        idempotency_keys: Optional[IdempotencyKeyRepository] = None,
+        notified_history_size: int = 16,
+        notified_bloom_bits: int = 0,
+        metrics: Optional[MonitorMetrics] = None,
     ):
         """
         依存性注入（すべて抽象インターフェースに依存）
+
+        Args:
+            live_set_tracker: 配信中セットの追跡サービス（省略時は新規作成）
+            fetch_service: 配信情報取得サービス（複数テナントで共有する場合に指定）
+            pipeline: 取得・検出・通知のパイプライン（省略時は既定の設定で作成）
+            latency_recorder: 通知遅延の記録サービス（省略時は記録しない）
+            clock: 検知・通知時刻の記録に使う時計（省略時は実際の時刻）
+            idempotency_keys: 複数のインスタンスで共有する通知の冪等キー（チャンネルID + 動画ID。
+                              記録済みの配信は通知しない。省略時は確認しない）
+            notified_history_size: チャンネルごとに正確に覚えておく通知済み動画IDの件数
+            notified_bloom_bits: 履歴から押し出した動画IDを覚えておくブルームフィルターの
+                                 チャンネルあたりのビット数（0で使わない）
+            metrics: 重複を防いだ通知の件数とクォータ消費量の記録先（省略時は記録しない）
         """
         self._stream_repo = stream_repository
         self._notification_gateway = notification_gateway
         self._state_repo = state_repository
         self._change_detector = change_detector
+        self._fetcher = (
+            fetch_service
+            if fetch_service is not None
+            else StreamFetchService(stream_repository, live_set_tracker)
+        )
+        self._live_set = self._fetcher.live_set
+        self._clock = clock if clock is not None else SystemClock()
+        self._metrics = metrics if metrics is not None else NullMonitorMetrics()
+        self._pipeline = (
+            pipeline
+            if pipeline is not None
+            else MonitorPipeline(self._fetcher, clock=self._clock, metrics=self._metrics)
+        )
+        self._latency_recorder = latency_recorder
+        self._idempotency_keys = idempotency_keys
+        self._notified_history_size = notified_history_size
+        self._notified_bloom_bits = notified_bloom_bits
 
-    def execute(self, channels: List[Channel]) -> None:
+    def execute(self, channels: List[Channel]) -> CycleSummary:
         """
         監視を実行
 
+        配信中のチャンネルも含めて通常のチェックを行う（並行して始まった配信を検知する）。
+        取得・検出・通知はパイプラインで並行に処理する。
+
         Args:
             channels: 監視対象のチャンネルリスト
 
+        Returns:
+            サイクルの集計
+
         Raises:
             QuotaExceededError: YouTube APIクォータ超過時
         """
-        logger.info(f"監視開始: {len(channels)}チャンネル")
+        logger.debug("監視開始: %dチャンネル", len(channels))
 
-        for channel in channels:
-            try:
-                self._check_channel(channel)
-            except QuotaExceededError:
-                # クォータ超過エラーは上位レイヤーで処理するため再送出
-                raise
-            except Exception as e:
-                logger.error(f"チャンネル {channel.name} の監視中にエラー: {e}", exc_info=True)
+        with get_tracer().span("monitor.cycle", channels=len(channels)):
+            self.seed_live_set(channels)
+            return self._pipeline.run(channels, self.targets(channels))
 
-    def _check_channel(self, channel: Channel) -> None:
-        """単一チャンネルの監視処理"""
-        logger.debug(f"チャンネル {channel.name} をチェック中")
+    def check_live_streams(self, channels: List[Channel]) -> CycleSummary:
+        """
+        配信中として追跡しているチャンネルのみ継続・終了を確認
 
-        # 1. 現在の配信状態を取得
-        current_stream = self._stream_repo.get_current_stream(channel)
+        通常の監視サイクルの間に高頻度で呼び出すことを想定（1回あたり ceil(N / 50) units）。
+        配信が終了したチャンネルは、次の配信を始めていないかを同じ確認の中で通常どおり取得する。
 
-        # 2. 前回の状態を取得
-        previous_state = self._state_repo.get_state(channel.id)
+        Args:
+            channels: 監視対象のチャンネルリスト
+
+        Returns:
+            確認の集計（配信中のチャンネルがない場合は空の集計）
+
+        Raises:
+            QuotaExceededError: YouTube APIクォータ超過時
+        """
+        self.seed_live_set(channels)
+        live_channels = [channel for channel in channels if self._live_set.is_tracked(channel.id)]
+        if not live_channels:
+            return CycleSummary()
+
+        with get_tracer().span("monitor.live_check", channels=len(live_channels)):
+            return self._pipeline.run(
+                live_channels, self.targets(live_channels), fetch=self._fetcher.fetch_live_set
+            )
+
+    def execute_degraded(self, channels: List[Channel], since: datetime) -> CycleSummary:
+        """
+        クォータ超過中の縮退運転で、新着動画フィードから新着を検知（クォータを消費しない）
+
+        since 以降に公開された動画を配信開始と同じく検出・通知する（配信中かは確認できない）。
+        新着がないチャンネルの状態は変更しない。
 
-        # 3. 配信開始を検出
-        if self._change_detector.is_stream_started(previous_state, current_stream):
-            logger.info(f"配信開始を検知: {channel.name} - {current_stream.title}")
-
-            # 4. 通知送信
-            try:
-                self._notification_gateway.notify_stream_start(channel, current_stream)
-                logger.info(f"通知送信完了: {channel.name}")
-            except Exception as e:
-                logger.error(f"通知送信失敗: {channel.name} - {e}")
-                # 通知失敗しても状態は更新しない（次回再試行）
-                return
-
-            # 5. 状態更新
-            new_state = StreamStateDto(
-                is_live=True,
-                video_id=current_stream.video_id,
-                last_checked=datetime.now(),
-                last_notified=datetime.now(),
+        Args:
+            channels: 監視対象のチャンネルリスト
+            since: この時刻（タイムゾーン付き）以降に公開された動画を新着とみなす
+
+        Returns:
+            サイクルの集計
+        """
+        with get_tracer().span("monitor.degraded_cycle", channels=len(channels)):
+            return self._pipeline.run(
+                channels,
+                self.targets(channels),
+                fetch=partial(self._fetcher.fetch_uploads, since=since),
             )
-            self._state_repo.save_state(channel.id, new_state)
-
-        # 配信中だが通知済みの場合は状態のみ更新
-        elif current_stream is not None and previous_state and previous_state.is_live:
-            updated_state = StreamStateDto(
-                is_live=True,
-                video_id=current_stream.video_id,
-                last_checked=datetime.now(),
-                last_notified=previous_state.last_notified,
+
+    @property
+    def pipeline(self) -> MonitorPipeline:
+        """監視パイプライン"""
+        return self._pipeline
+
+    def targets(self, channels: List[Channel]) -> Dict[ChannelId, List[MonitorTarget]]:
+        """パイプラインに渡す、取得結果の適用先"""
+        return {channel.id: [(channel, self)] for channel in channels}
+
+    def seed_live_set(self, channels: List[Channel]) -> None:
+        """
+        前回の状態が配信中のチャンネルを配信中セットに加える
+
+        再起動直後でも状態ファイルから配信中セットを復元できる。
+
+        Args:
+            channels: 監視対象のチャンネルリスト
+        """
+        untracked = [
+            channel.id for channel in channels if not self._live_set.is_tracked(channel.id)
+        ]
+        if not untracked:
+            return
+        for channel_id, previous_state in zip(untracked, self._state_repo.get_states(untracked)):
+            if previous_state is not None and previous_state.is_live and previous_state.video_id:
+                self._live_set.track(channel_id, previous_state.video_id)
+
+    def detect(
+        self, channel: Channel, current_stream: Optional[Stream]
+    ) -> Optional[NotificationJob]:
+        """
+        取得した配信状態を前回の状態と比較し、変化を検出
+
+        配信開始以外の変化はこの場で状態を更新する。配信開始の場合は通知ジョブを返し、
+        状態は通知の送信に成功してから deliver で更新する。
+
+        Args:
+            channel: チャンネル
+            current_stream: 現在の配信（配信していない場合はNone）
+
+        Returns:
+            通知が必要な場合は通知ジョブ、不要な場合はNone
+        """
+        jobs = self.detect_batch([(channel, current_stream)])
+        return jobs[0] if jobs else None
+
+    def detect_batch(
+        self, items: Sequence[Tuple[Channel, Optional[Stream]]]
+    ) -> List[NotificationJob]:
+        """
+        複数チャンネルの取得結果を前回の状態とまとめて比較し、変化を検出
+
+        前回の状態はまとめて読み込み、配信開始以外の変化による状態の更新はまとめて保存する。
+        配信開始の状態は通知の送信に成功してから deliver で更新する。
+
+        Args:
+            items: (チャンネル, 現在の配信（配信していない場合はNone）) のリスト
+
+        Returns:
+            配信開始を検出したチャンネルの通知ジョブ（items の順）
+        """
+        if not items:
+            return []
+        channel_ids = [channel.id for channel, _ in items]
+        streams = [stream for _, stream in items]
+
+        # 2. 前回の状態を取得
+        previous_states = self._state_repo.get_states(channel_ids)
+
+        # 3. 変化を検出
+        changes = self._change_detector.detect_changes(previous_states, streams, self._clock.now())
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        live_set = self._live_set
+        # continued・started の添字の取得結果と、ended の添字の前回の状態は None ではない
+        for i in changes.continued:
+            channel, stream = items[i]
+            if stream is None or stream.status == StreamStatus.UPLOADED:
+                continue
+            live_set.track(channel.id, stream.video_id)
+            if not debug:
+                continue
+            previous_state = previous_states[i]
+            if previous_state is not None and (
+                not previous_state.is_live or previous_state.video_id != stream.video_id
+            ):
+                # 通知済みの動画に戻った（並行配信の切り替え・配信中/未配信の揺れ）
+                logger.debug(
+                    "通知済みの配信のため再通知しません: %s",
+                    channel.name,
+                    extra={"channel_id": channel.id.value, "video_id": stream.video_id},
+                )
+            if stream.concurrent_viewers is not None:
+                logger.debug(
+                    "配信継続中: %s - 同時視聴者数 %d",
+                    channel.name,
+                    stream.concurrent_viewers,
+                    extra={"channel_id": channel.id.value, "video_id": stream.video_id},
+                )
+
+        for i in changes.ended:
+            channel = items[i][0]
+            ended_state = previous_states[i]
+            if ended_state is None:
+                continue
+            logger.info(
+                "配信終了を検知: %s",
+                channel.name,
+                extra={
+                    "channel_id": channel.id.value,
+                    "video_id": ended_state.video_id,
+                    "event": "stream_ended",
+                },
             )
-            self._state_repo.save_state(channel.id, updated_state)
-
-        # 配信していない場合
-        elif current_stream is None:
-            if previous_state is None or previous_state.is_live:
-                # 状態を未配信に更新
-                offline_state = StreamStateDto(
-                    is_live=False,
-                    video_id=None,
-                    last_checked=datetime.now(),
-                    last_notified=previous_state.last_notified if previous_state else None,
+
+        # 配信していないチャンネルは配信中セットから外す
+        for channel_id, stream in zip(channel_ids, streams):
+            if stream is None and live_set.is_tracked(channel_id):
+                live_set.untrack(channel_id)
+
+        # 4. 状態をまとめて保存
+        if changes.updates:
+            self._state_repo.save_states({channel_ids[i]: state for i, state in changes.updates})
+
+        jobs = []
+        if changes.started:
+            detected_at = self._clock.now(timezone.utc)
+            for i in changes.started:
+                channel, stream = items[i]
+                if stream is None:
+                    continue
+                logger.info(
+                    "配信開始を検知: %s - %s",
+                    channel.name,
+                    stream.title,
+                    extra={
+                        "channel_id": channel.id.value,
+                        "video_id": stream.video_id,
+                        "event": "stream_started",
+                    },
+                )
+                jobs.append(
+                    NotificationJob(channel=channel, stream=stream, detected_at=detected_at)
                 )
-                self._state_repo.save_state(channel.id, offline_state)
+        return jobs
+
+    def deliver(self, job: NotificationJob) -> bool:
+        """
+        配信開始通知を送信し、成功した場合は状態を更新
+
+        Args:
+            job: detect が返した通知ジョブ
+
+        Returns:
+            通知に成功した場合True（失敗した場合は状態を更新せず、次回再試行する）
+        """
+        channel, stream = job.channel, job.stream
+
+        # 送信前に冪等キーを記録し、他のインスタンスが送信済み（送信中）の配信は通知しない
+        idempotency_key = f"{channel.id}:{stream.video_id}"
+        if self._idempotency_keys is not None and not self._idempotency_keys.claim(idempotency_key):
+            logger.info(
+                "通知済みのため送信しません: %s",
+                channel.name,
+                extra={"channel_id": str(channel.id), "video_id": stream.video_id},
+            )
+            self._metrics.notification_deduplicated()
+            self._mark_notified(channel, stream)
+            return True
+
+        # 4. 通知送信
+        try:
+            deliveries = self._notification_gateway.notify_stream_start(channel, stream)
+            logger.debug(
+                "通知送信完了: %s",
+                channel.name,
+                extra={"channel_id": str(channel.id), "video_id": stream.video_id},
+            )
+        except Exception as e:
+            logger.error(
+                "通知送信失敗: %s - %s",
+                channel.name,
+                e,
+                extra={"channel_id": str(channel.id), "video_id": stream.video_id},
+            )
+            # 通知失敗しても状態は更新しない（次回再試行）
+            if self._idempotency_keys is not None:
+                self._idempotency_keys.release(idempotency_key)
+            return False
+
+        # 5. 状態更新
+        self._mark_notified(channel, stream)
+
+        self._record_latency(job, deliveries)
+        return True
+
+    def _mark_notified(self, channel: Channel, stream: Stream) -> None:
+        """
+        配信を通知済みとして状態を更新（通知済み動画IDの履歴に追加）
+
+        新着動画フィードで検知した動画は配信中かが分からないため、配信中の状態は前回のまま
+        にする（配信中として記録すると、通常の監視に戻った後に配信終了と誤って検知する）。
+        """
+        previous_state = self._state_repo.get_state(channel.id)
+        notified = previous_state.notified if previous_state else NotifiedVideoIndex.empty()
+        now = self._clock.now()
+        if stream.status == StreamStatus.UPLOADED:
+            is_live = previous_state.is_live if previous_state else False
+            video_id = previous_state.video_id if previous_state else None
+        else:
+            is_live, video_id = True, stream.video_id
+        new_state = StreamStateDto(
+            is_live=is_live,
+            video_id=video_id,
+            last_checked=now,
+            last_notified=now,
+            notified=notified.with_video(
+                stream.video_id, self._notified_history_size, self._notified_bloom_bits
+            ),
+        )
+        self._state_repo.save_state(channel.id, new_state)
+        if is_live and video_id:
+            self._live_set.track(channel.id, video_id)
+
+    def _record_latency(
+        self, job: NotificationJob, deliveries: Optional[List[WebhookDelivery]]
+    ) -> None:
+        """配信開始から通知到達までの遅延を記録"""
+        if self._latency_recorder is None:
+            return
+
+        if deliveries is None:
+            # Webhookごとの送信完了時刻を返さないゲートウェイは、送信処理の完了時刻で代用
+            deliveries = [WebhookDelivery("", delivered_at=self._clock.now(timezone.utc))]
+
+        record = NotificationLatencyDto(
+            channel_id=str(job.channel.id),
+            channel_name=job.channel.name,
+            video_id=job.stream.video_id,
+            started_at=job.stream.started_at,
+            detected_at=job.detected_at,
+            queued_at=job.queued_at,
+            deliveries=deliveries,
+        )
+        self._latency_recorder.record(record)
+
+        end_to_end = record.end_to_end_seconds()
+        if not end_to_end:
+            # 送信できたWebhookがない場合は配信開始から通知到達までの遅延がない
+            return
+        slowest = max(end_to_end)
+        logger.info(
+            "通知遅延: %s - 配信開始から %.1f秒 (検知 %.1f秒)",
+            job.channel.name,
+            slowest,
+            record.detection_seconds,
+            extra={
+                "channel_id": record.channel_id,
+                "video_id": record.video_id,
+                "event": "notification_latency",
+                "duration_seconds": slowest,
+                "detection_seconds": record.detection_seconds,
+            },
+        )
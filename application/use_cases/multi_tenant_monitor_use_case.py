@@ -0,0 +1,177 @@
+"""マルチテナント配信監視ユースケース
+
+複数の設定（テナント）を1プロセスで監視する
+
+責務:
+1. 全テナントの監視対象チャンネルをChannelIdで重複排除する
+2. 重複排除したチャンネルの配信情報を1回だけ取得する
+3. 取得結果を各テナントのユースケースに配り、通知と状態更新を行わせる
+   （通知先Webhook・状態の保存先はテナントごとに独立）
+
+取得・検出・通知は全テナントで1つの MonitorPipeline を共有する。
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from typing import Dict, List, Optional
+
+from domain.entities.channel import Channel
+from domain.value_objects.channel_id import ChannelId
+from application.services.monitor_pipeline import CycleSummary, MonitorPipeline, MonitorTarget
+from application.services.stream_fetch_service import StreamFetchService
+from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from application.services.tracer import get_tracer
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Tenant:
+    """監視テナント（1つの設定ファイルに対応）"""
+
+    name: str
+    channels: List[Channel]
+    use_case: MonitorStreamsUseCase  # 共有のStreamFetchServiceを注入したユースケース
+
+
+def deduplicate_channels(tenants: List[Tenant]) -> List[Channel]:
+    """
+    全テナントのチャンネルをChannelIdで重複排除
+
+    同じチャンネルが複数テナントにある場合は最初に出現したものを代表とする
+    （取得にはチャンネルIDしか使わないため、名前やWebhookの違いは影響しない）。
+
+    Args:
+        tenants: テナントのリスト
+
+    Returns:
+        重複排除したチャンネルのリスト
+    """
+    unique: Dict[ChannelId, Channel] = {}
+    for tenant in tenants:
+        for channel in tenant.channels:
+            unique.setdefault(channel.id, channel)
+    return list(unique.values())
+
+
+class MultiTenantMonitorUseCase:
+    """複数テナントで配信情報の取得を共有する監視ユースケース"""
+
+    def __init__(
+        self,
+        fetch_service: StreamFetchService,
+        tenants: List[Tenant],
+        pipeline: Optional[MonitorPipeline] = None,
+    ):
+        """
+        Args:
+            fetch_service: 全テナントで共有する配信情報取得サービス
+            tenants: 監視テナントのリスト
+            pipeline: 取得・検出・通知のパイプライン（省略時は既定の設定で作成）
+        """
+        names = [tenant.name for tenant in tenants]
+        if len(set(names)) != len(names):
+            raise ValueError(f"テナント名が重複しています: {names}")
+
+        self._fetcher = fetch_service
+        self._tenants = tenants
+        self._pipeline = pipeline if pipeline is not None else MonitorPipeline(fetch_service)
+
+    @property
+    def tenants(self) -> List[Tenant]:
+        """監視テナントのリスト"""
+        return list(self._tenants)
+
+    @property
+    def pipeline(self) -> MonitorPipeline:
+        """監視パイプライン"""
+        return self._pipeline
+
+    def execute(self, channels: Optional[List[Channel]] = None) -> CycleSummary:
+        """
+        監視を実行
+
+        Args:
+            channels: 取得対象のチャンネル（省略時は全テナントのチャンネルを重複排除したもの）
+
+        Returns:
+            サイクルの集計
+
+        Raises:
+            QuotaExceededError: YouTube APIクォータ超過時
+        """
+        unique_channels = channels if channels is not None else deduplicate_channels(self._tenants)
+        total = sum(len(tenant.channels) for tenant in self._tenants)
+        logger.info(
+            f"監視開始: {len(self._tenants)}テナント / {len(unique_channels)}チャンネル "
+            f"(重複排除前 {total}チャンネル)"
+        )
+
+        with get_tracer().span(
+            "monitor.cycle", channels=len(unique_channels), tenants=len(self._tenants)
+        ):
+            for tenant in self._tenants:
+                tenant.use_case.seed_live_set(tenant.channels)
+
+            return self._pipeline.run(unique_channels, self._targets())
+
+    def check_live_streams(self, channels: Optional[List[Channel]] = None) -> CycleSummary:
+        """
+        配信中として追跡しているチャンネルのみ継続・終了を確認
+
+        Args:
+            channels: 確認対象のチャンネル（省略時は全テナントのチャンネル）
+
+        Returns:
+            確認の集計（配信中のチャンネルがない場合は空の集計）
+
+        Raises:
+            QuotaExceededError: YouTube APIクォータ超過時
+        """
+        unique_channels = channels if channels is not None else deduplicate_channels(self._tenants)
+
+        for tenant in self._tenants:
+            tenant.use_case.seed_live_set(tenant.channels)
+
+        live_set = self._fetcher.live_set
+        live_channels = [channel for channel in unique_channels if live_set.is_tracked(channel.id)]
+        if not live_channels:
+            return CycleSummary()
+
+        with get_tracer().span(
+            "monitor.live_check", channels=len(live_channels), tenants=len(self._tenants)
+        ):
+            return self._pipeline.run(
+                live_channels, self._targets(), fetch=self._fetcher.fetch_live_set
+            )
+
+    def execute_degraded(self, channels: Optional[List[Channel]], since: datetime) -> CycleSummary:
+        """
+        クォータ超過中の縮退運転で、新着動画フィードから新着を検知（クォータを消費しない）
+
+        Args:
+            channels: 取得対象のチャンネル（Noneの場合は全テナントのチャンネル）
+            since: この時刻（タイムゾーン付き）以降に公開された動画を新着とみなす
+
+        Returns:
+            サイクルの集計
+        """
+        unique_channels = channels if channels is not None else deduplicate_channels(self._tenants)
+        with get_tracer().span(
+            "monitor.degraded_cycle", channels=len(unique_channels), tenants=len(self._tenants)
+        ):
+            return self._pipeline.run(
+                unique_channels,
+                self._targets(),
+                fetch=partial(self._fetcher.fetch_uploads, since=since),
+            )
+
+    def _targets(self) -> Dict[ChannelId, List[MonitorTarget]]:
+        """取得結果の適用先（同じチャンネルを監視する全テナントに配る）"""
+        targets: Dict[ChannelId, List[MonitorTarget]] = {}
+        for tenant in self._tenants:
+            for channel_id, tenant_targets in tenant.use_case.targets(tenant.channels).items():
+                targets.setdefault(channel_id, []).extend(tenant_targets)
+        return targets
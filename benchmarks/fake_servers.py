@@ -0,0 +1,363 @@
+"""ベンチマーク用のローカルなYouTube Data API・Discord Webhookサーバー
+
+本番のAPIを使わずに数万チャンネル規模の監視を再現するための代替サーバー。
+
+FakeYouTubeServer:
+- playlistItems.list / videos.list と HTTPバッチ（/batch、multipart/mixed）に応答
+- 応答の遅延・エラー率（500 backendError）・クォータ上限（403 quotaExceeded）を設定可能
+- /_control/advance で指定数のチャンネルを配信開始・終了させる（配信開始パターンの再現）
+- /_control/stats でエンドポイント別の呼び出し数と消費クォータを返す
+
+FakeDiscordServer:
+- /api/webhooks/{id}/{token} への POST に 204 で応答
+- 応答の遅延・エラー率（500）を設定可能
+"""
+
+import email.message
+import email.parser
+import json
+import logging
+import random
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple, cast
+
+logger = logging.getLogger(__name__)
+
+# チャンネルごとのプレイリストに並ぶ過去動画（通常動画）の数
+ARCHIVE_VIDEOS = 20
+
+QUOTA_COST = {"playlistItems.list": 1, "videos.list": 1}
+
+
+def channel_id_for(index: int) -> str:
+    """ベンチマーク用のチャンネルID（UC + 22文字）"""
+    return f"UC{index:022d}"
+
+
+def _isoformat(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _error_body(status: int, reason: str, message: str) -> str:
+    return json.dumps(
+        {"error": {"code": status, "message": message, "errors": [{"reason": reason}]}}
+    )
+
+
+@dataclass
+class FakeServerConfig:
+    """代替サーバーの振る舞い"""
+
+    latency: float = 0.0  # HTTP往復ごとの遅延（秒）
+    error_rate: float = 0.0  # リクエストごとの500エラーの割合（0.0〜1.0）
+    quota_limit: int = 0  # 消費できるクォータの上限（0で無制限）
+    seed: int = 0  # 乱数のシード（配信開始するチャンネルの選び方・エラーの発生）
+
+
+class _FakeServer:
+    """ThreadingHTTPServer をバックグラウンドで動かす共通部分"""
+
+    name = "fake"
+
+    def __init__(self, config: FakeServerConfig, port: int = 0, host: str = "127.0.0.1"):
+        self.config = config
+        self._host = host
+        self._port = port
+        self._lock = threading.Lock()
+        self._random = random.Random(config.seed)
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        """実際に待ち受けているポート"""
+        return self._server.server_address[1] if self._server else self._port
+
+    @property
+    def url(self) -> str:
+        """ベースURL"""
+        return f"http://{self._host}:{self.port}/"
+
+    def start(self) -> None:
+        """バックグラウンドで待ち受けを開始"""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self._dispatch("GET")
+
+            def do_POST(self):
+                self._dispatch("POST")
+
+            def _dispatch(self, method):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, headers, content = server.handle(method, self.path, self.headers, body)
+                data = content.encode("utf-8") if isinstance(content, str) else content
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self._host, self._port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name=f"{self.name}-server", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """待ち受けを停止"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._server = None
+        self._thread = None
+
+    def handle(self, method: str, path: str, headers, body: bytes) -> Tuple[int, Dict, str]:
+        raise NotImplementedError
+
+    def _delay(self) -> None:
+        if self.config.latency > 0:
+            time.sleep(self.config.latency)
+
+    def _fails(self) -> bool:
+        if self.config.error_rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < self.config.error_rate
+
+
+class FakeYouTubeServer(_FakeServer):
+    """YouTube Data API v3 の代替サーバー"""
+
+    name = "fake-youtube"
+
+    def __init__(
+        self,
+        channel_count: int,
+        config: Optional[FakeServerConfig] = None,
+        port: int = 0,
+        host: str = "127.0.0.1",
+    ):
+        """
+        Args:
+            channel_count: チャンネル数（channel_id_for(0..N-1) のチャンネルが存在する）
+            config: 遅延・エラー率・クォータ上限
+        """
+        super().__init__(config or FakeServerConfig(), port, host)
+        self._channel_count = channel_count
+        self._index_of = {channel_id_for(i)[2:]: i for i in range(channel_count)}
+        # チャンネル → 最新の動画番号（配信開始のたびに増える、未配信は過去動画の数）
+        self._latest: Dict[int, int] = {}
+        # 配信中のチャンネル → 配信開始時刻（最新の動画が配信中）
+        self._live: Dict[int, datetime] = {}
+        self._calls: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        self._quota_used = 0
+        self._http_requests = 0
+
+    # ---- 配信開始パターン ----
+
+    def advance(self, go_live: int, end: int = 0) -> List[str]:
+        """
+        配信中でないチャンネルからgo_live件を配信開始させ、配信中のチャンネルからend件を終了させる
+
+        Returns:
+            配信を開始したチャンネルID
+        """
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            live = sorted(self._live)
+            for index in self._random.sample(live, min(end, len(live))):
+                del self._live[index]
+
+            idle = [i for i in range(self._channel_count) if i not in self._live]
+            started = self._random.sample(idle, min(go_live, len(idle)))
+            for index in started:
+                self._latest[index] = self._latest.get(index, ARCHIVE_VIDEOS) + 1
+                self._live[index] = now
+        return [channel_id_for(index) for index in started]
+
+    def stats(self) -> Dict:
+        """エンドポイント別の呼び出し数・エラー数と消費クォータ"""
+        with self._lock:
+            return {
+                "calls": dict(self._calls),
+                "errors": dict(self._errors),
+                "quota_units": self._quota_used,
+                "http_requests": self._http_requests,
+                "live_channels": len(self._live),
+            }
+
+    # ---- HTTP ----
+
+    def handle(self, method: str, path: str, headers, body: bytes) -> Tuple[int, Dict, str]:
+        json_headers = {"Content-Type": "application/json; charset=UTF-8"}
+        parsed = urllib.parse.urlsplit(path)
+
+        if parsed.path == "/_control/stats":
+            return 200, json_headers, json.dumps(self.stats())
+        if parsed.path == "/_control/advance":
+            params = json.loads(body or b"{}")
+            started = self.advance(params.get("go_live", 0), params.get("end", 0))
+            return 200, json_headers, json.dumps({"started": started})
+
+        with self._lock:
+            self._http_requests += 1
+        self._delay()
+
+        if parsed.path == "/batch" and method == "POST":
+            return self._handle_batch(headers.get("Content-Type", ""), body)
+        return self._handle_api(parsed.path, parsed.query)
+
+    def _handle_api(self, path: str, query: str) -> Tuple[int, Dict, str]:
+        """1件のAPIリクエストを処理"""
+        headers = {"Content-Type": "application/json; charset=UTF-8"}
+        params = urllib.parse.parse_qs(query)
+        endpoint = {
+            "/youtube/v3/playlistItems": "playlistItems.list",
+            "/youtube/v3/videos": "videos.list",
+        }.get(path)
+        if endpoint is None:
+            return 404, headers, _error_body(404, "notFound", f"unknown path: {path}")
+
+        with self._lock:
+            self._calls[endpoint] = self._calls.get(endpoint, 0) + 1
+            limit = self.config.quota_limit
+            if limit and self._quota_used + QUOTA_COST[endpoint] > limit:
+                self._errors[endpoint] = self._errors.get(endpoint, 0) + 1
+                return 403, headers, _error_body(403, "quotaExceeded", "quota exceeded")
+            self._quota_used += QUOTA_COST[endpoint]
+
+        if self._fails():
+            with self._lock:
+                self._errors[endpoint] = self._errors.get(endpoint, 0) + 1
+            return 500, headers, _error_body(500, "backendError", "backend error")
+
+        if endpoint == "playlistItems.list":
+            playlist_id = params.get("playlistId", [""])[0]
+            index = self._index_of.get(playlist_id[2:])
+            if index is None:
+                return 404, headers, _error_body(404, "playlistNotFound", playlist_id)
+            return 200, headers, json.dumps(self._playlist_items(index))
+
+        video_ids = [v for v in params.get("id", [""])[0].split(",") if v]
+        return 200, headers, json.dumps(self._videos(video_ids))
+
+    def _handle_batch(self, content_type: str, body: bytes) -> Tuple[int, Dict, str]:
+        """HTTPバッチ（multipart/mixed）を分解して各リクエストを処理"""
+        message = email.parser.Parser().parsestr(
+            f"Content-Type: {content_type}\r\n\r\n" + body.decode("utf-8")
+        )
+        boundary = f"batch_{random.getrandbits(64):016x}"
+        parts = []
+        # multipart のペイロードは各パートの Message のリスト
+        for part in cast(List[email.message.Message], message.get_payload()):
+            request_line = str(part.get_payload()).split("\r\n", 1)[0].split("\n", 1)[0]
+            _, target, _ = request_line.split(" ", 2)
+            parsed = urllib.parse.urlsplit(target)
+            status, _, content = self._handle_api(parsed.path, parsed.query)
+            content_id = part["Content-ID"]
+            parts.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id[1:]}\r\n\r\n"
+                f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+                f"{content}\r\n"
+            )
+        parts.append(f"--{boundary}--\r\n")
+        return 200, {"Content-Type": f"multipart/mixed; boundary={boundary}"}, "".join(parts)
+
+    # ---- レスポンス ----
+
+    @staticmethod
+    def _video_id(index: int, number: int) -> str:
+        return f"v{index:07d}n{number:03d}"
+
+    def _playlist_items(self, index: int) -> Dict:
+        with self._lock:
+            latest = self._latest.get(index, ARCHIVE_VIDEOS)
+        numbers = range(latest, latest - ARCHIVE_VIDEOS, -1)
+        return {
+            "items": [
+                {"contentDetails": {"videoId": self._video_id(index, number)}} for number in numbers
+            ]
+        }
+
+    def _videos(self, video_ids: List[str]) -> Dict:
+        items = []
+        with self._lock:
+            for video_id in video_ids:
+                try:
+                    index, number = int(video_id[1:8]), int(video_id[9:])
+                except ValueError:
+                    continue
+                started_at = self._live.get(index)
+                live = started_at is not None and number == self._latest.get(index)
+                item = {
+                    "id": video_id,
+                    "snippet": {
+                        "title": f"video {video_id}",
+                        "publishedAt": "2026-01-01T00:00:00Z",
+                        "liveBroadcastContent": "live" if live else "none",
+                        "thumbnails": {"high": {"url": "http://example.com/thumb.jpg"}},
+                    },
+                }
+                if live and started_at is not None:
+                    item["liveStreamingDetails"] = {
+                        "actualStartTime": _isoformat(started_at),
+                        "concurrentViewers": "100",
+                    }
+                items.append(item)
+        return {"items": items}
+
+
+class FakeDiscordServer(_FakeServer):
+    """Discord Webhook の代替サーバー"""
+
+    name = "fake-discord"
+
+    def __init__(
+        self, config: Optional[FakeServerConfig] = None, port: int = 0, host: str = "127.0.0.1"
+    ):
+        super().__init__(config or FakeServerConfig(), port, host)
+        self._requests = 0
+        self._errors = 0
+
+    def stats(self) -> Dict:
+        """受信した通知数とエラー数"""
+        with self._lock:
+            return {"requests": self._requests, "errors": self._errors}
+
+    def handle(self, method: str, path: str, headers, body: bytes) -> Tuple[int, Dict, str]:
+        if path.startswith("/_control/stats"):
+            return 200, {"Content-Type": "application/json"}, json.dumps(self.stats())
+        if method != "POST" or not path.startswith("/api/webhooks/"):
+            return 404, {}, ""
+
+        self._delay()
+        failed = self._fails()
+        with self._lock:
+            self._requests += 1
+            if failed:
+                self._errors += 1
+        if failed:
+            return 500, {"Content-Type": "application/json"}, '{"message": "error"}'
+        return 204, {}, ""
@@ -0,0 +1,219 @@
+"""メモリベンチマーク
+
+多数のチャンネルを監視する場合の、監視対象と状態の常駐メモリを計測する。
+
+- 設定の読み込みと同じように Channel（ChannelId・WebhookConfig）を作り、
+  状態ファイルの読み込みと同じように StreamStateDto を辞書から復元する
+- 状態の参照と API 応答の処理で作られる ChannelId（同じIDの重複）も再現する
+- 比較用に、スロットとインターンを使わない従来の表現（インスタンスごとの __dict__、
+  チャンネルごとの WebhookConfig・ChannelId）で同じデータを作って計測する
+
+計測は tracemalloc で、データを作る前後の確保済みメモリの差分。結果はJSON。
+
+使用方法:
+    python -m benchmarks.memory_benchmark --channels 100000 --webhooks 100 --output memory.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import re
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from domain.entities.channel import Channel
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.webhook_config import WebhookConfig
+from application.dto.stream_state_dto import StreamStateDto
+
+SCHEMA_VERSION = 1
+
+
+def channel_id_for(index: int) -> str:
+    return f"UC{index:022d}"
+
+
+def webhook_url_for(index: int) -> str:
+    return f"https://discord.com/api/webhooks/{100000 + index}/token-{index}"
+
+
+def state_data_for(index: int) -> Dict:
+    """状態ファイルの1チャンネル分（1割が配信中）"""
+    live = index % 10 == 0
+    return {
+        "is_live": live,
+        "video_id": f"video{index:06d}" if live else None,
+        "last_checked": "2026-01-29T12:00:00+09:00",
+        "last_notified": "2026-01-29T11:00:00+09:00" if live else None,
+    }
+
+
+# 従来の表現（スロット・インターンなし）。比較のためだけに使う
+
+
+@dataclass(frozen=True)
+class _LegacyChannelId:
+    value: str
+
+    PATTERN = re.compile(r"^UC[a-zA-Z0-9_-]{22}$")
+
+    def __post_init__(self):
+        if not self.PATTERN.match(self.value):
+            raise ValueError(self.value)
+
+
+@dataclass(frozen=True)
+class _LegacyWebhookConfig:
+    url: str
+    mention: str = ""
+
+
+@dataclass(frozen=True)
+class _LegacyChannel:
+    id: _LegacyChannelId
+    name: str
+    webhooks: List[_LegacyWebhookConfig]
+    mention: str = ""
+
+
+@dataclass
+class _LegacyStreamState:
+    is_live: bool
+    video_id: Optional[str]
+    last_checked: datetime
+    last_notified: Optional[datetime]
+
+
+def build_current(channel_count: int, webhook_count: int) -> List:
+    """現在の表現で監視対象・状態・重複するチャンネルIDを作る"""
+    channels = [
+        Channel(
+            id=ChannelId(channel_id_for(i)),
+            name=f"channel-{i}",
+            webhooks=[WebhookConfig(webhook_url_for(i % webhook_count), "@everyone")],
+        )
+        for i in range(channel_count)
+    ]
+    states = {
+        ChannelId(channel_id_for(i)).value: StreamStateDto.from_dict(state_data_for(i))
+        for i in range(channel_count)
+    }
+    responses = [ChannelId(channel_id_for(i)) for i in range(channel_count)]
+    return [channels, states, responses]
+
+
+def build_legacy(channel_count: int, webhook_count: int) -> List:
+    """従来の表現で同じデータを作る"""
+    channels = [
+        _LegacyChannel(
+            id=_LegacyChannelId(channel_id_for(i)),
+            name=f"channel-{i}",
+            webhooks=[_LegacyWebhookConfig(webhook_url_for(i % webhook_count), "@everyone")],
+        )
+        for i in range(channel_count)
+    ]
+    states = {}
+    for i in range(channel_count):
+        data = state_data_for(i)
+        states[str(_LegacyChannelId(channel_id_for(i)))] = _LegacyStreamState(
+            is_live=data["is_live"],
+            video_id=data["video_id"],
+            last_checked=datetime.fromisoformat(data["last_checked"]),
+            last_notified=(
+                datetime.fromisoformat(data["last_notified"]) if data["last_notified"] else None
+            ),
+        )
+    responses = [_LegacyChannelId(channel_id_for(i)) for i in range(channel_count)]
+    return [channels, states, responses]
+
+
+def measure(build: Callable[[int, int], List], channel_count: int, webhook_count: int) -> Dict:
+    """データを作る前後の確保済みメモリの差分"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        data = build(channel_count, webhook_count)
+        gc.collect()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del data
+    retained = after - before
+    return {
+        "bytes": retained,
+        "peak_bytes": peak - before,
+        "bytes_per_channel": round(retained / channel_count, 1),
+    }
+
+
+def run(channel_count: int = 100_000, webhook_count: int = 100) -> Dict:
+    """
+    現在の表現と従来の表現のメモリを計測
+
+    Returns:
+        それぞれの確保済みメモリと削減率
+    """
+    legacy = measure(build_legacy, channel_count, webhook_count)
+    current = measure(build_current, channel_count, webhook_count)
+    return {
+        "channels": channel_count,
+        "webhooks": webhook_count,
+        "legacy": legacy,
+        "current": current,
+        "reduction_ratio": round(1 - current["bytes"] / legacy["bytes"], 3),
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="監視対象と状態の常駐メモリのベンチマーク")
+    parser.add_argument("--channels", type=int, default=100_000, help="チャンネル数")
+    parser.add_argument(
+        "--webhooks", type=int, default=100, help="チャンネル間で共有するWebhook URLの数"
+    )
+    parser.add_argument("--output", metavar="PATH", help="結果のJSONの保存先（省略時は標準出力）")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    started_at = datetime.now(timezone.utc)
+    result = run(args.channels, args.webhooks)
+    print(
+        f"{args.channels}チャンネル: "
+        f"従来 {result['legacy']['bytes'] / 1024 / 1024:.1f}MiB "
+        f"({result['legacy']['bytes_per_channel']:.0f}B/ch) → "
+        f"現在 {result['current']['bytes'] / 1024 / 1024:.1f}MiB "
+        f"({result['current']['bytes_per_channel']:.0f}B/ch), "
+        f"削減率 {result['reduction_ratio'] * 100:.0f}%",
+        file=sys.stderr,
+    )
+
+    report = {
+        "schema_version": SCHEMA_VERSION,
+        "benchmark": "memory",
+        "started_at": started_at.isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        **result,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,646 @@
+"""クォータ・検知遅延の見積もり（オフライン）
+
+監視対象のチャンネルを増やす前に、1日のYouTube APIクォータ（既定 10,000 units）に収まるかを
+見積もる。APIは呼び出さず、設定ファイルと過去の記録から1日分の監視を模擬する。
+
+監視の方式（--policies）:
+- fixed: 全チャンネルを5分グリッドごとに確認する（現在の動作）
+- tiered: 最近配信したチャンネルは毎回、それ以外は cold_every 回に1回だけ確認する
+- predictive: 過去の配信開始の時間帯と、把握している配信予定の前後だけ毎回確認し、
+  それ以外は cold_every 回に1回だけ確認する
+
+それぞれを videos.list の一括化（確認対象の動画IDを全チャンネル分まとめて50件ずつ1 unitに詰め、
+HTTPバッチで送る）の有無と、新着動画フィード（クォータ不要）による事前絞り込みの有無と組み合わせる。
+
+クォータ消費は YouTubeStreamRepository と同じ規則で数える:
+- 通常チェック: チャンネルごとに playlistItems.list 1 unit
+  + 確認が必要な動画ID（配信予定・配信中・新着）の videos.list
+  （一括化ありは全チャンネル分を50件ずつ、なしはチャンネルごとに1回）
+- 配信中のチャンネル: 通常チェックでは方針によらず毎回確認する（並行して始まった配信を検知する）。
+  live_check_interval ごとの確認は配信中セットの videos.list（50件ずつ）で、終了したチャンネルは
+  次の配信を始めていないかを playlistItems.list と videos.list で確認しなおす
+- 終了済みの動画は videos.list の対象外（ウォーム状態で引き継いでいる前提）
+- フィードで絞り込む場合は playlistItems.list を呼ばず、フィードで見つかった動画IDだけを
+  videos.list で確認する（フィードの反映の遅れ --feed-lag だけ配信開始の検知が遅れる）
+
+過去の記録:
+- 状態ファイル（--state）: 最終通知時刻から最近配信したチャンネルを判定する
+- 通知遅延の記録（--latency-log）: 配信開始時刻からチャンネルごとの配信頻度と
+  配信開始の時間帯を推定する（記録のないチャンネルは --streams-per-day で一様に配信する）
+
+配信の発生は --seed で固定した乱数で決める。結果はJSON。
+
+使用方法:
+    python -m benchmarks.quota_planner --config config/config.json --add-channels 200 \\
+        --latency-log data/latency.jsonl --state data/state.json --output plan.json
+"""
+
+import argparse
+import itertools
+import json
+import random
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from application.services.latency_recorder import LatencyHistogram
+from application.services.quota_reset import JST, RESET_HOUR_JST
+
+SCHEMA_VERSION = 1
+
+DAY_SECONDS = 86400
+
+# 監視サイクルの間隔（MonitorController は JST の5分の倍数の時刻に監視する）
+GRID_SECONDS = 300
+
+# videos.list 1回で指定できるvideo IDの上限（APIの仕様）
+MAX_IDS_PER_VIDEOS_REQUEST = 50
+
+POLICIES = ("fixed", "tiered", "predictive")
+
+
+@dataclass
+class ChannelProfile:
+    """1チャンネルの配信傾向"""
+
+    channel_id: str
+    streams_per_day: float
+    start_offsets: List[int] = field(default_factory=list)  # 過去の配信開始（クォータの日の秒）
+    hot: bool = True  # 最近配信した（tiered・predictive で毎回確認する）
+
+
+@dataclass
+class StreamEvent:
+    """模擬する1件の配信"""
+
+    channel: int  # チャンネルの番号
+    start: int  # 配信開始（クォータの日の開始からの秒）
+    end: int
+    scheduled_at: Optional[int]  # 配信予定として公開された時刻（予定なしの配信は None）
+    detected_at: Optional[int] = None
+
+
+@dataclass
+class PlanOptions:
+    """模擬の前提"""
+
+    grid: int = GRID_SECONDS
+    live_check_interval: int = 0
+    batch_size: int = 50
+    budget: int = 10_000
+    scheduled_ratio: float = 0.7  # 配信予定を公開してから始まる配信の割合
+    schedule_lead: int = 6 * 3600  # 配信予定を公開してから配信開始までの秒数
+    stream_duration: int = 2 * 3600
+    uploads_per_day: float = 0.5  # チャンネルごとの通常動画の投稿数
+    feed_lag: int = 300  # 新着動画フィードに反映されるまでの秒数
+    cold_every: int = 3  # tiered・predictive で最近配信していないチャンネルを確認する間隔（回）
+    window: int = 3600  # predictive で配信開始の前後に毎回確認する秒数
+
+
+def percentile_summary(samples: Sequence[float]) -> Dict[str, float]:
+    """件数・平均・p50/p95/p99・最大値（LatencyRecorder と同じ最近傍順位法）"""
+    histogram = LatencyHistogram(window=max(1, len(samples)))
+    for sample in samples:
+        histogram.add(sample)
+    summary = histogram.summary()
+    if samples:
+        summary["mean"] = round(histogram.total / histogram.count, 1)
+    return summary
+
+
+def quota_day_offset(moment: datetime) -> int:
+    """時刻の、クォータの日（JST 18:00 始まり）の開始からの秒数"""
+    local = moment.astimezone(JST) - timedelta(hours=RESET_HOUR_JST)
+    return local.hour * 3600 + local.minute * 60 + local.second
+
+
+def _parse_time(value: str) -> datetime:
+    moment = datetime.fromisoformat(value)
+    return moment if moment.tzinfo is not None else moment.astimezone()
+
+
+def load_config(path: str) -> Dict:
+    """設定ファイル（config.json）を読み込む"""
+    with open(path, "r", encoding="utf-8") as f:
+        config: Dict = json.load(f)
+    return config
+
+
+def load_latency_log(path: str) -> Dict[str, List[datetime]]:
+    """通知遅延の記録（JSON Lines）からチャンネルごとの配信開始時刻"""
+    starts: Dict[str, List[datetime]] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            starts.setdefault(record["channel_id"], []).append(_parse_time(record["started_at"]))
+    return starts
+
+
+def load_state(path: str) -> Dict[str, Dict]:
+    """状態ファイル（JSON）のチャンネルごとの状態"""
+    with open(path, "r", encoding="utf-8") as f:
+        states: Dict[str, Dict] = json.load(f)
+    return states
+
+
+def build_profiles(
+    channel_ids: Sequence[str],
+    streams_per_day: float,
+    starts: Optional[Dict[str, List[datetime]]] = None,
+    states: Optional[Dict[str, Dict]] = None,
+    hot_days: int = 7,
+    unknown_hot: bool = True,
+) -> List[ChannelProfile]:
+    """
+    チャンネルごとの配信傾向を過去の記録から推定
+
+    Args:
+        channel_ids: 監視対象のチャンネルID
+        streams_per_day: 記録のないチャンネルの1日あたりの配信数
+        starts: チャンネルID → 過去の配信開始時刻（通知遅延の記録）
+        states: チャンネルID → 状態（状態ファイル）
+        hot_days: この日数以内に配信・通知したチャンネルを最近配信したとみなす
+        unknown_hot: 記録のないチャンネルを最近配信したとみなすか
+    """
+    starts = starts or {}
+    states = states or {}
+    moments = [moment for values in starts.values() for moment in values]
+    for state in states.values():
+        for key in ("last_checked", "last_notified"):
+            if state.get(key):
+                moments.append(_parse_time(state[key]))
+    reference = max(moments) if moments else None
+    # 通知遅延の記録の期間（日）。配信頻度の分母
+    history_days = (
+        max(1.0, (max(moments) - min(moments)).total_seconds() / DAY_SECONDS)
+        if starts and moments
+        else 1.0
+    )
+    recent = reference - timedelta(days=hot_days) if reference is not None else None
+
+    profiles = []
+    for channel_id in channel_ids:
+        channel_starts = starts.get(channel_id, [])
+        channel_state = states.get(channel_id)
+        known = bool(channel_starts) or channel_state is not None
+        last_notified = (
+            _parse_time(channel_state["last_notified"])
+            if channel_state and channel_state.get("last_notified")
+            else None
+        )
+        if not known:
+            hot = unknown_hot
+        elif recent is None:
+            # 記録はあるが時刻がない（状態ファイルに確認・通知の時刻がない）
+            hot = False
+        else:
+            hot = any(moment >= recent for moment in channel_starts) or (
+                last_notified is not None and last_notified >= recent
+            )
+        profiles.append(
+            ChannelProfile(
+                channel_id=channel_id,
+                streams_per_day=(
+                    len(channel_starts) / history_days if channel_starts else streams_per_day
+                ),
+                start_offsets=[quota_day_offset(moment) for moment in channel_starts],
+                hot=hot,
+            )
+        )
+    return profiles
+
+
+def _count(rng: random.Random, rate: float) -> int:
+    """1日あたり rate 件のとき、その日の件数（整数部 + 端数の確率で1件）"""
+    whole = int(rate)
+    return whole + (1 if rng.random() < rate - whole else 0)
+
+
+def generate_day(
+    profiles: Sequence[ChannelProfile], options: PlanOptions, rng: random.Random
+) -> tuple:
+    """
+    1日分の配信と通常動画の投稿を発生させる
+
+    Returns:
+        (配信のリスト, チャンネルの番号 → 通常動画の投稿時刻のリスト)
+    """
+    streams: List[StreamEvent] = []
+    uploads: Dict[int, List[int]] = {}
+    for index, profile in enumerate(profiles):
+        for _ in range(_count(rng, profile.streams_per_day)):
+            if profile.start_offsets:
+                # 過去の配信開始の前後30分
+                start = rng.choice(profile.start_offsets) + rng.randint(-1800, 1800)
+                start %= DAY_SECONDS
+            else:
+                start = rng.randrange(DAY_SECONDS)
+            scheduled_at = (
+                max(0, start - options.schedule_lead)
+                if rng.random() < options.scheduled_ratio
+                else None
+            )
+            end = min(DAY_SECONDS, start + options.stream_duration)
+            streams.append(StreamEvent(index, start, end, scheduled_at))
+        times = [rng.randrange(DAY_SECONDS) for _ in range(_count(rng, options.uploads_per_day))]
+        if times:
+            uploads[index] = sorted(times)
+    streams.sort(key=lambda stream: stream.start)
+    return streams, uploads
+
+
+def _ceil_div(count: int, size: int) -> int:
+    return -(-count // size) if count > 0 else 0
+
+
+def _near_offset(offsets: Iterable[int], now: int, window: int) -> bool:
+    """過去の配信開始の前後 window 秒以内か（日付をまたぐ場合も含む）"""
+    for offset in offsets:
+        distance = abs(now - offset) % DAY_SECONDS
+        if min(distance, DAY_SECONDS - distance) <= window:
+            return True
+    return False
+
+
+def simulate_day(
+    profiles: Sequence[ChannelProfile],
+    streams: List[StreamEvent],
+    uploads: Dict[int, List[int]],
+    policy: str,
+    batching: bool,
+    feed: bool,
+    options: PlanOptions,
+) -> Dict:
+    """
+    1日分の監視を模擬してクォータ消費・リクエスト数・検知遅延を数える
+
+    Returns:
+        units（エンドポイントごと）・分ごとのリクエスト数・検知遅延のサンプル
+    """
+    by_channel: Dict[int, List[StreamEvent]] = {}
+    for stream in streams:
+        by_channel.setdefault(stream.channel, []).append(stream)
+
+    units = {"playlistItems.list": 0, "videos.list": 0}
+    api_requests: Dict[int, int] = {}  # 分 → APIへのHTTPリクエスト数
+    feed_requests: Dict[int, int] = {}  # 分 → フィードへのHTTPリクエスト数
+    last_polled: Dict[int, int] = {}  # チャンネル → 最後に確認した時刻
+    live: Dict[int, StreamEvent] = {}  # 配信中セット（チャンネル → 検知した配信）
+
+    def add_requests(counter: Dict[int, int], now: int, count: int) -> None:
+        if count:
+            counter[now // 60] = counter.get(now // 60, 0) + count
+
+    def detect(channel: int, now: int, lag: int) -> None:
+        """確認したチャンネルで、まだ検知していない配信が見つかれば検知する"""
+        for stream in by_channel.get(channel, ()):
+            visible = stream.start + (lag if stream.scheduled_at is None else 0)
+            if stream.detected_at is None and visible <= now < stream.end:
+                stream.detected_at = now
+                live[channel] = stream
+                break
+
+    def confirm_live_set(now: int) -> None:
+        """
+        配信中セットを videos.list で一括確認し、終了した配信を外す
+
+        終了したチャンネルは、次の配信を始めていないかを同じ確認の中で通常どおり確認する。
+        """
+        calls = _ceil_div(len(live), MAX_IDS_PER_VIDEOS_REQUEST)
+        ended = [channel for channel, stream in live.items() if stream.end <= now]
+        for channel in ended:
+            del live[channel]
+        if feed:
+            add_requests(feed_requests, now, len(ended))
+            playlist_calls = 0
+        else:
+            playlist_calls = len(ended)
+        video_calls = _ceil_div(len(ended), MAX_IDS_PER_VIDEOS_REQUEST)
+        units["videos.list"] += calls + video_calls
+        units["playlistItems.list"] += playlist_calls
+        add_requests(api_requests, now, calls + playlist_calls + video_calls)
+        for channel in ended:
+            detect(channel, now, options.feed_lag if feed else 0)
+
+    def due(channel: int, tick: int, now: int) -> bool:
+        """通常チェックで確認するチャンネルか"""
+        profile = profiles[channel]
+        if policy == "fixed" or (policy == "tiered" and profile.hot):
+            return True
+        if policy == "predictive":
+            if profile.hot and not profile.start_offsets:
+                # 配信開始の時間帯がわからない場合は毎回確認する
+                return True
+            if _near_offset(profile.start_offsets, now, options.window):
+                return True
+            seen = last_polled.get(channel)
+            for stream in by_channel.get(channel, ()):
+                # 確認済みの配信予定の前後
+                scheduled_at = stream.scheduled_at
+                if scheduled_at is None or seen is None or stream.detected_at is not None:
+                    continue
+                if scheduled_at <= seen and stream.start - options.window <= now:
+                    return True
+        # 確認する回をチャンネルごとにずらして負荷を平準化する
+        return (tick + channel) % options.cold_every == 0
+
+    for tick in range(DAY_SECONDS // options.grid):
+        now = tick * options.grid
+        # 配信中のチャンネルは方針によらず確認し、終了した配信は videos.list で終了が分かる
+        ended = {channel for channel, stream in live.items() if stream.end <= now}
+        for channel in ended:
+            del live[channel]
+
+        polled = [
+            channel
+            for channel in range(len(profiles))
+            if channel in live or channel in ended or due(channel, tick, now)
+        ]
+        # チャンネル → videos.list で確認する動画IDの数（配信予定・配信中・新着の通常動画）
+        lag = options.feed_lag if feed else 0
+        candidates: Dict[int, int] = {}
+        for channel in polled:
+            since = last_polled.get(channel, -1)
+            count = 0
+            for stream in by_channel.get(channel, ()):
+                if stream.scheduled_at is not None and stream.scheduled_at <= now < stream.end:
+                    count += 1
+                elif stream.scheduled_at is None and stream.start + lag <= now < stream.end:
+                    # 予定なしの配信は、フィードで絞り込む場合は反映されてから見つかる
+                    count += 1
+            # 通常動画は一度確認すると終了済みとして対象外になる
+            count += sum(1 for t in uploads.get(channel, ()) if since < t + lag <= now)
+            if channel in ended:
+                count += 1
+            if count:
+                candidates[channel] = count
+            last_polled[channel] = now
+
+        if feed:
+            add_requests(feed_requests, now, len(polled))
+            playlist_calls = 0
+        else:
+            playlist_calls = len(polled)
+        if batching:
+            video_calls = _ceil_div(sum(candidates.values()), MAX_IDS_PER_VIDEOS_REQUEST)
+            http = _ceil_div(playlist_calls, options.batch_size) + _ceil_div(
+                video_calls, options.batch_size
+            )
+        else:
+            video_calls = len(candidates)
+            http = playlist_calls + video_calls
+        units["playlistItems.list"] += playlist_calls
+        units["videos.list"] += video_calls
+        add_requests(api_requests, now, http)
+
+        # 配信開始の検知
+        for channel in candidates:
+            detect(channel, now, lag)
+
+        # 通常チェックの間の配信中チャンネルの確認
+        if options.live_check_interval > 0:
+            check = now + options.live_check_interval
+            while check < now + options.grid:
+                if live:
+                    confirm_live_set(check)
+                check += options.live_check_interval
+
+    latencies = [
+        float(stream.detected_at - stream.start)
+        for stream in streams
+        if stream.detected_at is not None
+    ]
+    return {
+        "units": units,
+        "api_requests": api_requests,
+        "feed_requests": feed_requests,
+        "latencies": latencies,
+        "missed": sum(1 for stream in streams if stream.detected_at is None),
+    }
+
+
+def plan(
+    profiles: Sequence[ChannelProfile],
+    options: PlanOptions,
+    policies: Sequence[str] = POLICIES,
+    batching: Sequence[bool] = (True, False),
+    feed: Sequence[bool] = (False, True),
+    days: int = 1,
+    seed: int = 0,
+) -> List[Dict]:
+    """
+    監視の方式ごとにクォータ消費・リクエスト数・検知遅延を見積もる
+
+    全ての方式で同じ配信（同じ乱数）を模擬する。
+
+    Returns:
+        方式ごとの見積もり（1日あたりのクォータは模擬した日の最大値）
+    """
+    rng = random.Random(seed)
+    generated = [generate_day(profiles, options, rng) for _ in range(days)]
+
+    scenarios = []
+    for policy, batched, feed_filtered in itertools.product(policies, batching, feed):
+        daily_units: List[int] = []
+        by_endpoint: Dict[str, int] = {}
+        latencies: List[float] = []
+        missed = 0
+        peak_api = 0
+        peak_feed = 0
+        for streams, uploads in generated:
+            # 検知時刻は方式ごとに変わるため、配信は複製して模擬する
+            day_streams = [StreamEvent(s.channel, s.start, s.end, s.scheduled_at) for s in streams]
+            result = simulate_day(
+                profiles, day_streams, uploads, policy, batched, feed_filtered, options
+            )
+            daily_units.append(sum(result["units"].values()))
+            for endpoint, count in result["units"].items():
+                by_endpoint[endpoint] = max(by_endpoint.get(endpoint, 0), count)
+            latencies.extend(result["latencies"])
+            missed += result["missed"]
+            peak_api = max([peak_api, *result["api_requests"].values()])
+            peak_feed = max([peak_feed, *result["feed_requests"].values()])
+
+        quota_units = max(daily_units)
+        scenarios.append(
+            {
+                "policy": policy,
+                "batching": batched,
+                "feed_prefilter": feed_filtered,
+                "quota_units": quota_units,
+                "quota_units_mean": round(sum(daily_units) / len(daily_units), 1),
+                "quota_units_by_endpoint": by_endpoint,
+                "budget_ratio": round(quota_units / options.budget, 3),
+                "fits_budget": quota_units <= options.budget,
+                "peak_api_requests_per_minute": peak_api,
+                "peak_feed_requests_per_minute": peak_feed,
+                "detection_latency_seconds": percentile_summary(latencies),
+                "missed_streams": missed,
+            }
+        )
+    return scenarios
+
+
+def synthetic_channel_ids(count: int) -> List[str]:
+    """追加を検討しているチャンネルの仮のID"""
+    return [f"UCplanner{index:015d}" for index in range(count)]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="クォータ消費と検知遅延のオフライン見積もり")
+    parser.add_argument("--config", default="config/config.json", help="設定ファイル")
+    parser.add_argument(
+        "--add-channels", type=int, default=0, help="追加を検討しているチャンネル数（記録なし）"
+    )
+    parser.add_argument(
+        "--state", metavar="PATH", help="状態ファイル（最近配信したチャンネルの判定）"
+    )
+    parser.add_argument(
+        "--latency-log", metavar="PATH", help="通知遅延の記録（配信頻度・配信開始の時間帯の推定）"
+    )
+    parser.add_argument(
+        "--policies", nargs="+", choices=POLICIES, default=list(POLICIES), help="監視の方式"
+    )
+    parser.add_argument(
+        "--batching", choices=("both", "on", "off"), default="both", help="videos.list の一括化"
+    )
+    parser.add_argument(
+        "--feed", choices=("both", "on", "off"), default="both", help="フィードによる事前絞り込み"
+    )
+    parser.add_argument("--budget", type=int, default=10_000, help="1日のクォータ（units）")
+    parser.add_argument(
+        "--streams-per-day", type=float, default=0.3, help="記録のないチャンネルの1日の配信数"
+    )
+    parser.add_argument(
+        "--uploads-per-day", type=float, default=0.5, help="チャンネルごとの1日の通常動画の投稿数"
+    )
+    parser.add_argument(
+        "--scheduled-ratio", type=float, default=0.7, help="配信予定を公開してから始まる配信の割合"
+    )
+    parser.add_argument("--stream-hours", type=float, default=2.0, help="配信の長さ（時間）")
+    parser.add_argument("--feed-lag", type=int, default=300, help="フィードに反映されるまでの秒数")
+    parser.add_argument(
+        "--cold-every", type=int, default=3, help="最近配信していないチャンネルを確認する間隔（回）"
+    )
+    parser.add_argument("--hot-days", type=int, default=7, help="最近配信したとみなす日数")
+    parser.add_argument(
+        "--unknown",
+        choices=("hot", "cold"),
+        default="hot",
+        help="記録のないチャンネルを最近配信したとみなすか",
+    )
+    parser.add_argument("--days", type=int, default=1, help="模擬する日数")
+    parser.add_argument("--seed", type=int, default=0, help="配信の発生に使う乱数のシード")
+    parser.add_argument("--output", metavar="PATH", help="結果のJSONの保存先（省略時は標準出力）")
+    return parser.parse_args(argv)
+
+
+def _switch(value: str, default_first: bool) -> List[bool]:
+    if value == "on":
+        return [True]
+    if value == "off":
+        return [False]
+    return [default_first, not default_first]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    config = load_config(args.config)
+    channel_ids = [channel["id"] for channel in config.get("channels", [])]
+    channel_ids += synthetic_channel_ids(args.add_channels)
+    if not channel_ids:
+        print("監視対象のチャンネルがありません", file=sys.stderr)
+        return 1
+
+    options = PlanOptions(
+        live_check_interval=config.get("live_check_interval", 0),
+        batch_size=max(1, config.get("api_batch_size", 50)),
+        budget=args.budget,
+        scheduled_ratio=args.scheduled_ratio,
+        stream_duration=int(args.stream_hours * 3600),
+        uploads_per_day=args.uploads_per_day,
+        feed_lag=args.feed_lag,
+        cold_every=max(1, args.cold_every),
+    )
+    profiles = build_profiles(
+        channel_ids,
+        args.streams_per_day,
+        starts=load_latency_log(args.latency_log) if args.latency_log else None,
+        states=load_state(args.state) if args.state else None,
+        hot_days=args.hot_days,
+        unknown_hot=args.unknown == "hot",
+    )
+    # 現在の設定の方式（api_batch_size が1以下なら一括化なし）を先に並べる
+    current_batching = config.get("api_batch_size", 50) > 1
+    scenarios = plan(
+        profiles,
+        options,
+        policies=args.policies,
+        batching=_switch(args.batching, current_batching),
+        feed=_switch(args.feed, False),
+        days=max(1, args.days),
+        seed=args.seed,
+    )
+    for scenario in scenarios:
+        scenario["current"] = (
+            scenario["policy"] == "fixed"
+            and scenario["batching"] == current_batching
+            and not scenario["feed_prefilter"]
+        )
+
+    print(
+        f"{len(profiles)}チャンネル（最近配信 {sum(1 for p in profiles if p.hot)}）、"
+        f"予算 {options.budget} units/日",
+        file=sys.stderr,
+    )
+    for scenario in scenarios:
+        latency = scenario["detection_latency_seconds"]
+        print(
+            f"{scenario['policy']:<10} "
+            f"一括化{'あり' if scenario['batching'] else 'なし'} "
+            f"フィード{'あり' if scenario['feed_prefilter'] else 'なし'}: "
+            f"{scenario['quota_units']:>6} units/日 "
+            f"({scenario['budget_ratio'] * 100:.0f}%{'' if scenario['fits_budget'] else ' 超過'}), "
+            f"最大 {scenario['peak_api_requests_per_minute']} req/分, "
+            f"検知遅延 p50 {latency.get('p50', 0):.0f}s / p95 {latency.get('p95', 0):.0f}s"
+            + ("  ← 現在の設定" if scenario["current"] else ""),
+            file=sys.stderr,
+        )
+
+    report = {
+        "schema_version": SCHEMA_VERSION,
+        "benchmark": "quota_planner",
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "channels": len(profiles),
+        "hot_channels": sum(1 for profile in profiles if profile.hot),
+        "streams_per_day": round(sum(profile.streams_per_day for profile in profiles), 1),
+        "assumptions": {
+            "grid_seconds": options.grid,
+            "live_check_interval": options.live_check_interval,
+            "batch_size": options.batch_size,
+            "budget": options.budget,
+            "scheduled_ratio": options.scheduled_ratio,
+            "stream_seconds": options.stream_duration,
+            "uploads_per_day": options.uploads_per_day,
+            "feed_lag": options.feed_lag,
+            "cold_every": options.cold_every,
+            "days": max(1, args.days),
+            "seed": args.seed,
+        },
+        "scenarios": scenarios,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,445 @@
+"""スケールベンチマーク
+
+ローカルの代替YouTube・Discordサーバーに対して、実際の MonitorStreamsUseCase を
+1k / 10k / 50k チャンネルなどの規模で動かし、以下を計測する。
+
+- 監視サイクルの所要時間（実時間）とCPU時間
+- ピークメモリ（最大RSS）
+- エンドポイント別のAPI呼び出し数・消費クォータ・HTTP往復数
+- 配信開始から検知・通知到達までの遅延（p50/p95/p99）
+
+結果はJSONで出力し、--baseline で前回の結果と比較して性能の劣化を検出できる。
+規模ごとにサーバーと監視処理を別プロセスで動かし、CPU時間・メモリに代替サーバーの分を含めない。
+
+使用方法:
+    python -m benchmarks.scale_benchmark --channels 1000 10000 50000 --output bench.json
+    python -m benchmarks.scale_benchmark --channels 1000 --baseline bench.json
+"""
+
+import argparse
+import json
+import logging
+import math
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import requests
+
+from domain.entities.channel import Channel
+from domain.repositories.state_repository import StateRepository
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.webhook_config import WebhookConfig
+from application.services.latency_recorder import DETECTION, END_TO_END, LatencyRecorder
+from application.services.monitor_pipeline import MonitorPipeline
+from application.services.stream_change_detector import StreamChangeDetector
+from application.services.stream_fetch_service import StreamFetchService
+from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from infrastructure.discord.discord_notification_gateway import DiscordNotificationGateway
+from infrastructure.persistence.json_state_repository import JsonStateRepository
+from infrastructure.youtube.youtube_stream_repository import (
+    QuotaExceededError,
+    YouTubeStreamRepository,
+)
+from benchmarks.fake_servers import (
+    FakeDiscordServer,
+    FakeServerConfig,
+    FakeYouTubeServer,
+    channel_id_for,
+)
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+# --baseline で比較する指標（値が大きいほど悪い）
+COMPARED_METRICS = ("cycle_seconds_p50", "cpu_seconds_per_cycle", "peak_rss_mb", "quota_units")
+
+
+@dataclass
+class Scenario:
+    """1つの規模のベンチマーク条件"""
+
+    channels: int
+    cycles: int = 5  # 初回サイクルの後に計測するサイクル数
+    go_live_per_cycle: int = (
+        -1
+    )  # サイクルごとに配信開始するチャンネル数（負の場合はチャンネル数の1%）
+    end_per_cycle: int = 0  # サイクルごとに配信終了するチャンネル数
+    webhooks: int = 10  # チャンネルに割り当てるWebhookの種類
+    batch_size: int = 50
+    fetch_workers: int = 2
+    notify_workers: int = 4
+    state: str = "memory"  # memory / json
+    youtube: FakeServerConfig = field(default_factory=FakeServerConfig)
+    discord: FakeServerConfig = field(default_factory=FakeServerConfig)
+
+    @property
+    def go_live(self) -> int:
+        if self.go_live_per_cycle >= 0:
+            return self.go_live_per_cycle
+        return max(1, self.channels // 100)
+
+
+class InMemoryStateRepository(StateRepository):
+    """状態をメモリにのみ保持するリポジトリ（状態ファイルの書き込みを計測から除く場合に使用）"""
+
+    def __init__(self):
+        self._states = {}
+        self.saves = 0
+
+    def get_state(self, channel_id):
+        return self._states.get(str(channel_id))
+
+    def save_state(self, channel_id, state):
+        self._states[str(channel_id)] = state
+        self.saves += 1
+
+
+def generate_channels(scenario: Scenario) -> List[Channel]:
+    """代替YouTubeサーバーに存在するチャンネルの監視設定を生成（通知先は api_base_url で付け替える）"""
+    return [
+        Channel(
+            id=ChannelId(channel_id_for(i)),
+            name=f"bench-{i}",
+            webhooks=[
+                WebhookConfig(
+                    url=(
+                        "https://discord.com/api/webhooks/"
+                        f"{100000 + i % scenario.webhooks}/bench-token"
+                    )
+                )
+            ],
+        )
+        for i in range(scenario.channels)
+    ]
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    """最近傍順位法の p50/p95/p99 と最大・平均"""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    result = {f"p{p}": ordered[max(1, math.ceil(p / 100 * len(ordered))) - 1] for p in (50, 95, 99)}
+    result["max"] = ordered[-1]
+    result["mean"] = sum(ordered) / len(ordered)
+    return result
+
+
+def _peak_rss_mb() -> float:
+    """このプロセスの最大RSS（MB）"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux は KB、macOS は bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _diff_calls(after: Dict[str, int], before: Dict[str, int]) -> Dict[str, int]:
+    return {key: value - before.get(key, 0) for key, value in after.items()}
+
+
+def run_scenario(scenario: Scenario, youtube_url: str, discord_url: str) -> Dict:
+    """
+    起動済みの代替サーバーに対して1つの規模のベンチマークを実行
+
+    Args:
+        scenario: ベンチマーク条件
+        youtube_url: 代替YouTubeサーバーのベースURL
+        discord_url: 代替DiscordサーバーのベースURL
+
+    Returns:
+        サイクルごとの計測値と集計
+    """
+    channels = generate_channels(scenario)
+    with tempfile.TemporaryDirectory() as state_dir:
+        if scenario.state == "json":
+            state_repository: StateRepository = JsonStateRepository(
+                str(Path(state_dir) / "state.json")
+            )
+        else:
+            state_repository = InMemoryStateRepository()
+
+        stream_repository = YouTubeStreamRepository(
+            "bench-api-key", batch_size=scenario.batch_size, api_endpoint=youtube_url
+        )
+        fetch_service = StreamFetchService(stream_repository)
+        latency_recorder = LatencyRecorder()
+        use_case = MonitorStreamsUseCase(
+            stream_repository=stream_repository,
+            notification_gateway=DiscordNotificationGateway(api_base_url=discord_url),
+            state_repository=state_repository,
+            change_detector=StreamChangeDetector(),
+            fetch_service=fetch_service,
+            pipeline=MonitorPipeline(
+                fetch_service,
+                fetch_workers=scenario.fetch_workers,
+                notify_workers=scenario.notify_workers,
+                chunk_size=scenario.batch_size,
+            ),
+            latency_recorder=latency_recorder,
+        )
+
+        cycles = []
+        quota_exceeded = False
+        # 0番目は初回サイクル（全チャンネルの過去動画を確認するため重い）
+        for cycle in range(scenario.cycles + 1):
+            went_live = 0
+            if cycle > 0:
+                response = requests.post(
+                    f"{youtube_url}_control/advance",
+                    json={"go_live": scenario.go_live, "end": scenario.end_per_cycle},
+                    timeout=30,
+                )
+                went_live = len(response.json()["started"])
+
+            before = requests.get(f"{youtube_url}_control/stats", timeout=30).json()
+            notified_before = latency_recorder.summary().get(END_TO_END, {}).get("count", 0)
+            wall_started = time.perf_counter()
+            cpu_started = time.process_time()
+            try:
+                use_case.execute(channels)
+            except QuotaExceededError:
+                quota_exceeded = True
+            wall = time.perf_counter() - wall_started
+            cpu = time.process_time() - cpu_started
+            after = requests.get(f"{youtube_url}_control/stats", timeout=30).json()
+
+            cycles.append(
+                {
+                    "cycle": cycle,
+                    "warmup": cycle == 0,
+                    "wall_seconds": wall,
+                    "cpu_seconds": cpu,
+                    "api_calls": _diff_calls(after["calls"], before["calls"]),
+                    "api_errors": _diff_calls(after["errors"], before["errors"]),
+                    "quota_units": after["quota_units"] - before["quota_units"],
+                    "http_requests": after["http_requests"] - before["http_requests"],
+                    "went_live": went_live,
+                    "notifications": latency_recorder.summary().get(END_TO_END, {}).get("count", 0)
+                    - notified_before,
+                    "quota_exceeded": quota_exceeded,
+                }
+            )
+            logger.info(
+                f"{scenario.channels}チャンネル サイクル{cycle}: {wall:.2f}秒 "
+                f"(CPU {cpu:.2f}秒, クォータ {cycles[-1]['quota_units']} units)"
+            )
+            if quota_exceeded:
+                break
+
+    discord_stats = requests.get(f"{discord_url}_control/stats", timeout=30).json()
+    youtube_stats = requests.get(f"{youtube_url}_control/stats", timeout=30).json()
+    measured = [c for c in cycles if not c["warmup"]]
+    latency = latency_recorder.summary()
+    cycle_seconds = _percentiles([c["wall_seconds"] for c in measured])
+    cpu_total = sum(c["cpu_seconds"] for c in measured)
+
+    return {
+        "channels": scenario.channels,
+        "scenario": asdict(scenario),
+        "cycles": cycles,
+        "summary": {
+            "first_cycle_seconds": cycles[0]["wall_seconds"],
+            "cycle_seconds": cycle_seconds,
+            "cycle_seconds_p50": cycle_seconds.get("p50"),
+            "cpu_seconds_total": cpu_total,
+            "cpu_seconds_per_cycle": cpu_total / len(measured) if measured else None,
+            "peak_rss_mb": _peak_rss_mb(),
+            "api_calls": youtube_stats["calls"],
+            "api_errors": youtube_stats["errors"],
+            "quota_units": youtube_stats["quota_units"],
+            "http_requests": youtube_stats["http_requests"],
+            "notifications": latency.get(END_TO_END, {}).get("count", 0),
+            "discord_requests": discord_stats["requests"],
+            "discord_errors": discord_stats["errors"],
+            "detection_latency_seconds": latency.get(DETECTION, {}),
+            "end_to_end_latency_seconds": latency.get(END_TO_END, {}),
+            "state_saves": getattr(state_repository, "saves", None),
+            "quota_exceeded": quota_exceeded,
+        },
+    }
+
+
+def _serve(scenario: Scenario, connection) -> None:
+    """代替サーバーを起動してURLを親プロセスに渡し、停止の合図まで待つ（子プロセス）"""
+    youtube = FakeYouTubeServer(scenario.channels, scenario.youtube)
+    discord = FakeDiscordServer(scenario.discord)
+    youtube.start()
+    discord.start()
+    connection.send((youtube.url, discord.url))
+    connection.recv()
+    youtube.stop()
+    discord.stop()
+
+
+def _measure(scenario: Scenario, youtube_url: str, discord_url: str, log_level: str, queue):
+    """ベンチマークを実行して結果を親プロセスに渡す（子プロセス）"""
+    logging.basicConfig(level=log_level, format="%(asctime)s - %(levelname)s - %(message)s")
+    try:
+        queue.put(run_scenario(scenario, youtube_url, discord_url))
+    except Exception as e:
+        logger.error(f"ベンチマーク失敗: {e}", exc_info=True)
+        queue.put({"channels": scenario.channels, "error": str(e)})
+
+
+def run_isolated(scenario: Scenario, log_level: str = "WARNING") -> Dict:
+    """代替サーバーと監視処理をそれぞれ別プロセスで動かしてベンチマークを実行"""
+    parent_connection, child_connection = multiprocessing.Pipe()
+    server = multiprocessing.Process(target=_serve, args=(scenario, child_connection))
+    server.start()
+    try:
+        youtube_url, discord_url = parent_connection.recv()
+        queue: multiprocessing.Queue = multiprocessing.Queue()
+        runner = multiprocessing.Process(
+            target=_measure, args=(scenario, youtube_url, discord_url, log_level, queue)
+        )
+        runner.start()
+        result: Dict = queue.get()
+        runner.join()
+        return result
+    finally:
+        parent_connection.send("stop")
+        server.join(timeout=10)
+
+
+def compare(results: List[Dict], baseline: Dict, tolerance: float) -> List[str]:
+    """
+    前回の結果と比較し、許容範囲を超えて悪化した指標を返す
+
+    Args:
+        results: 今回の規模ごとの結果
+        baseline: 前回の出力（JSON）
+        tolerance: 許容する悪化の割合（0.2 で20%）
+    """
+    previous = {r["channels"]: r.get("summary", {}) for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        before = previous.get(result["channels"])
+        if before is None or "summary" not in result:
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = before.get(metric), result["summary"].get(metric)
+            if old and new is not None and new > old * (1 + tolerance):
+                regressions.append(
+                    f"{result['channels']}チャンネル {metric}: {old:.3f} → {new:.3f} "
+                    f"(+{(new / old - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="スケールベンチマーク")
+    parser.add_argument("--channels", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--cycles", type=int, default=5, help="初回の後に計測するサイクル数")
+    parser.add_argument(
+        "--go-live",
+        type=int,
+        default=-1,
+        help="サイクルごとの配信開始数（既定はチャンネル数の1%%）",
+    )
+    parser.add_argument("--end", type=int, default=0, help="サイクルごとの配信終了数")
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--fetch-workers", type=int, default=2)
+    parser.add_argument("--notify-workers", type=int, default=4)
+    parser.add_argument(
+        "--state",
+        choices=["memory", "json"],
+        default="memory",
+        help="状態の保存先（json で状態ファイルの書き込みも計測）",
+    )
+    parser.add_argument(
+        "--youtube-latency", type=float, default=0.0, help="HTTP往復ごとの遅延（秒）"
+    )
+    parser.add_argument("--youtube-error-rate", type=float, default=0.0)
+    parser.add_argument("--quota-limit", type=int, default=0, help="クォータ上限（0で無制限）")
+    parser.add_argument("--discord-latency", type=float, default=0.0)
+    parser.add_argument("--discord-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="結果のJSONの出力先（省略時は標準出力）")
+    parser.add_argument("--baseline", help="比較する前回の結果（JSON）")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="許容する悪化の割合")
+    parser.add_argument("--log-level", default="WARNING")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    started_at = datetime.now(timezone.utc)
+    results = []
+    for channel_count in args.channels:
+        scenario = Scenario(
+            channels=channel_count,
+            cycles=args.cycles,
+            go_live_per_cycle=args.go_live,
+            end_per_cycle=args.end,
+            batch_size=args.batch_size,
+            fetch_workers=args.fetch_workers,
+            notify_workers=args.notify_workers,
+            state=args.state,
+            youtube=FakeServerConfig(
+                latency=args.youtube_latency,
+                error_rate=args.youtube_error_rate,
+                quota_limit=args.quota_limit,
+                seed=args.seed,
+            ),
+            discord=FakeServerConfig(
+                latency=args.discord_latency, error_rate=args.discord_error_rate, seed=args.seed
+            ),
+        )
+        result = run_isolated(scenario, args.log_level)
+        results.append(result)
+
+        summary = result.get("summary")
+        if summary is None:
+            print(f"{channel_count:>7}チャンネル: 失敗 ({result.get('error')})", file=sys.stderr)
+            continue
+        detection = summary["detection_latency_seconds"]
+        print(
+            f"{channel_count:>7}チャンネル: "
+            f"サイクル p50 {summary['cycle_seconds_p50'] or 0:.2f}秒 "
+            f"(初回 {summary['first_cycle_seconds']:.2f}秒) / "
+            f"CPU {summary['cpu_seconds_per_cycle'] or 0:.2f}秒/サイクル / "
+            f"RSS {summary['peak_rss_mb']:.0f}MB / "
+            f"クォータ {summary['quota_units']} units / "
+            f"検知遅延 p95 {detection.get('p95', 0):.2f}秒",
+            file=sys.stderr,
+        )
+
+    report = {
+        "schema_version": SCHEMA_VERSION,
+        "benchmark": "scale",
+        "started_at": started_at.isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"性能劣化: {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
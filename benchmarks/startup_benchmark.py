@@ -0,0 +1,252 @@
+"""起動時間ベンチマーク
+
+新しいPythonプロセスで以下を計測する（デプロイ・再起動・--once 実行の速さの指標）。
+
+- import: main モジュールの読み込み時間（python -X importtime の累積値）と、
+  その時点で読み込まれている重い依存ライブラリ
+- first_cycle: プロセスの起動から、ローカルの代替YouTube・Discordサーバーに対する
+  最初の監視サイクルが完了するまでの時間（内訳: 読み込み / クライアント生成 / サイクル）
+
+いずれも複数回計測して中央値を出力する。結果はJSON。
+
+使用方法:
+    python -m benchmarks.startup_benchmark --runs 5 --channels 100 --output startup.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SCHEMA_VERSION = 1
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# main の読み込み時点で読み込まれていないことが望ましい重い依存（必要になった時点で読み込む）
+HEAVY_MODULES = ("googleapiclient", "requests", "http.server")
+
+# 子プロセスで実行するコード（計測対象の読み込みより前に時刻を取る）
+_FIRST_CYCLE_CHILD = (
+    "import time; started = time.perf_counter(); import sys; "
+    "from benchmarks.startup_benchmark import first_cycle; "
+    "first_cycle(sys.argv[1], sys.argv[2], int(sys.argv[3]), started)"
+)
+
+
+def _run_python(args: List[str]) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+
+def _cumulative_import_seconds(importtime_output: str, module: str) -> float:
+    """python -X importtime の出力から、トップレベルで読み込んだモジュールの累積時間（秒）"""
+    for line in importtime_output.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].rstrip() == f" {module}":
+            return int(parts[1]) / 1_000_000
+    raise ValueError(f"{module} の読み込み時間が見つかりません")
+
+
+def measure_import(module: str = "main", runs: int = 5) -> Dict:
+    """
+    新しいプロセスでモジュールを読み込む時間を計測
+
+    Args:
+        module: 読み込むモジュール
+        runs: 計測回数
+
+    Returns:
+        読み込み時間（秒）の中央値・最小値と、読み込み済みの重い依存
+    """
+    code = (
+        f"import sys, json; import {module}; "
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    seconds = []
+    loaded: List[str] = []
+    for _ in range(runs):
+        completed = _run_python(["-X", "importtime", "-c", code])
+        seconds.append(_cumulative_import_seconds(completed.stderr, module))
+        loaded = json.loads(completed.stdout.strip().splitlines()[-1])
+    return {
+        "module": module,
+        "seconds_p50": statistics.median(seconds),
+        "seconds_min": min(seconds),
+        "heavy_modules_loaded": loaded,
+    }
+
+
+def first_cycle(youtube_url: str, discord_url: str, channel_count: int, started: float) -> None:
+    """
+    最初の監視サイクルを実行して内訳をJSONで標準出力に書く（子プロセス）
+
+    Args:
+        youtube_url: 代替YouTubeサーバーのベースURL
+        discord_url: 代替DiscordサーバーのベースURL
+        channel_count: 監視するチャンネル数
+        started: プロセス起動直後の time.perf_counter()
+    """
+    import main  # noqa: F401 本番と同じ読み込みを再現する
+    from domain.entities.channel import Channel
+    from domain.value_objects.channel_id import ChannelId
+    from domain.value_objects.webhook_config import WebhookConfig
+    from application.services.monitor_pipeline import MonitorPipeline
+    from application.services.stream_change_detector import StreamChangeDetector
+    from application.services.stream_fetch_service import StreamFetchService
+    from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+    from infrastructure.discord.discord_notification_gateway import DiscordNotificationGateway
+    from infrastructure.persistence.json_state_repository import JsonStateRepository
+    from benchmarks.fake_servers import channel_id_for
+
+    imported = time.perf_counter()
+
+    from infrastructure.youtube.youtube_stream_repository import YouTubeStreamRepository
+
+    stream_repository = YouTubeStreamRepository("bench-api-key", api_endpoint=youtube_url)
+    fetch_service = StreamFetchService(stream_repository)
+    channels = [
+        Channel(
+            id=ChannelId(channel_id_for(i)),
+            name=f"bench-{i}",
+            webhooks=[WebhookConfig(url=f"https://discord.com/api/webhooks/{100000 + i}/token")],
+        )
+        for i in range(channel_count)
+    ]
+    state_path = Path(os.environ["STARTUP_BENCHMARK_STATE_DIR"]) / "state.json"
+    use_case = MonitorStreamsUseCase(
+        stream_repository=stream_repository,
+        notification_gateway=DiscordNotificationGateway(api_base_url=discord_url),
+        state_repository=JsonStateRepository(str(state_path)),
+        change_detector=StreamChangeDetector(),
+        fetch_service=fetch_service,
+        pipeline=MonitorPipeline(fetch_service),
+    )
+    built = time.perf_counter()
+
+    use_case.execute(channels)
+    finished = time.perf_counter()
+
+    print(
+        json.dumps(
+            {
+                "import_seconds": imported - started,
+                "client_seconds": built - imported,
+                "cycle_seconds": finished - built,
+                "total_seconds": finished - started,
+            }
+        )
+    )
+
+
+def measure_first_cycle(channel_count: int = 100, runs: int = 5, go_live: int = 1) -> Dict:
+    """
+    プロセスの起動から最初の監視サイクルの完了までの時間を計測
+
+    Args:
+        channel_count: 監視するチャンネル数
+        runs: 計測回数（毎回新しいプロセス・新しい状態ファイルで実行）
+        go_live: 起動時点で配信中のチャンネル数（最初のサイクルで通知する）
+
+    Returns:
+        プロセス全体の時間と内訳の中央値
+    """
+    import tempfile
+
+    from benchmarks.fake_servers import FakeDiscordServer, FakeYouTubeServer
+
+    youtube = FakeYouTubeServer(channel_count)
+    discord = FakeDiscordServer()
+    youtube.start()
+    discord.start()
+    try:
+        youtube.advance(go_live)
+        samples = []
+        for _ in range(runs):
+            with tempfile.TemporaryDirectory() as state_dir:
+                env = {**os.environ, "STARTUP_BENCHMARK_STATE_DIR": state_dir}
+                process_started = time.perf_counter()
+                completed = subprocess.run(
+                    [
+                        sys.executable,
+                        "-c",
+                        _FIRST_CYCLE_CHILD,
+                        youtube.url,
+                        discord.url,
+                        str(channel_count),
+                    ],
+                    cwd=ROOT,
+                    env=env,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                process_seconds = time.perf_counter() - process_started
+            sample = json.loads(completed.stdout.strip().splitlines()[-1])
+            sample["process_seconds"] = process_seconds
+            samples.append(sample)
+        notifications = discord.stats()["requests"]
+    finally:
+        youtube.stop()
+        discord.stop()
+
+    summary = {
+        f"{key}_p50": statistics.median(sample[key] for sample in samples) for key in samples[0]
+    }
+    return {"channels": channel_count, "runs": runs, "notifications": notifications, **summary}
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="起動時間ベンチマーク")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--channels", type=int, default=100, help="最初のサイクルのチャンネル数")
+    parser.add_argument("--go-live", type=int, default=1, help="起動時点で配信中のチャンネル数")
+    parser.add_argument("--output", help="結果のJSONの出力先（省略時は標準出力）")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    started_at = datetime.now(timezone.utc)
+    imports = measure_import("main", runs=args.runs)
+    cycle = measure_first_cycle(args.channels, runs=args.runs, go_live=args.go_live)
+    print(
+        f"import main: {imports['seconds_p50'] * 1000:.0f}ms "
+        f"(読み込み済みの重い依存: {', '.join(imports['heavy_modules_loaded']) or 'なし'}) / "
+        f"最初のサイクル完了まで: {cycle['process_seconds_p50']:.2f}秒 "
+        f"(読み込み {cycle['import_seconds_p50']:.2f}秒, "
+        f"クライアント生成 {cycle['client_seconds_p50']:.2f}秒, "
+        f"サイクル {cycle['cycle_seconds_p50']:.2f}秒)",
+        file=sys.stderr,
+    )
+
+    report = {
+        "schema_version": SCHEMA_VERSION,
+        "benchmark": "startup",
+        "started_at": started_at.isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "import": imports,
+        "first_cycle": cycle,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -25,6 +25,46 @@ class Settings:
     channels: List[Channel]
     notification_color: int
     log_level: str
+    live_check_interval: int = 0
+    api_batch_size: int = 50
+    cache_ttl: int = 0
+    cache_negative_ttl: int = 0
+    cache_stale_ttl: int = 0
+    tenant_name: str = ""
+    pipeline_fetch_workers: int = 2
+    pipeline_notify_workers: int = 4
+    pipeline_queue_size: int = 100
+    metrics_port: int = 0
+    metrics_host: str = "127.0.0.1"
+    metrics_stall_seconds: int = 900
+    tracing_exporter: str = ""
+    tracing_file: str = "logs/traces.jsonl"
+    tracing_endpoint: str = "http://127.0.0.1:4318/v1/traces"
+    tracing_sample_ratio: float = 1.0
+    log_format: str = "text"
+    log_sample_ratio: float = 1.0
+    warm_state_path: str = "data/warm_state.json"
+    warm_state_save_interval: int = 300
+    reload_watch_interval: int = 5
+    control_port: int = 0
+    control_host: str = "127.0.0.1"
+    control_token: str = ""
+    shard_worker_id: str = ""
+    shard_store: str = "data/shared.db"
+    shard_heartbeat_interval: int = 10
+    shard_member_ttl: int = 30
+    shard_replicas: int = 100
+    ha_instance_id: str = ""
+    ha_store: str = "data/shared.db"
+    ha_lease_ttl: int = 15
+    ha_renew_interval: int = 5
+    notified_history_size: int = 16
+    notified_history_bloom_bits: int = 0
+    quota_degradation_enabled: bool = True
+    quota_probe_interval: int = 900
+    quota_feed_workers: int = 8
+    channel_onboarding_enabled: bool = True
+    channel_onboarding_revalidate_interval: int = 604800
 
     @classmethod
     def load(cls, config_path: str = "config/config.json") -> "Settings":
@@ -77,6 +117,57 @@ class Settings:
             channels=channels,
             notification_color=config_data.get("notification", {}).get("color", 16711680),
             log_level=config_data.get("log_level", "INFO"),
+            live_check_interval=config_data.get("live_check_interval", 0),
+            api_batch_size=config_data.get("api_batch_size", 50),
+            cache_ttl=config_data.get("cache", {}).get("ttl", 0),
+            cache_negative_ttl=config_data.get("cache", {}).get("negative_ttl", 0),
+            cache_stale_ttl=config_data.get("cache", {}).get("stale_ttl", 0),
+            tenant_name=config_data.get("tenant_name", ""),
+            pipeline_fetch_workers=config_data.get("pipeline", {}).get("fetch_workers", 2),
+            pipeline_notify_workers=config_data.get("pipeline", {}).get("notify_workers", 4),
+            pipeline_queue_size=config_data.get("pipeline", {}).get("queue_size", 100),
+            metrics_port=config_data.get("metrics", {}).get("port", 0),
+            metrics_host=config_data.get("metrics", {}).get("host", "127.0.0.1"),
+            metrics_stall_seconds=config_data.get("metrics", {}).get("stall_seconds", 900),
+            tracing_exporter=config_data.get("tracing", {}).get("exporter", ""),
+            tracing_file=config_data.get("tracing", {}).get("file", "logs/traces.jsonl"),
+            tracing_endpoint=config_data.get("tracing", {}).get(
+                "endpoint", "http://127.0.0.1:4318/v1/traces"
+            ),
+            tracing_sample_ratio=config_data.get("tracing", {}).get("sample_ratio", 1.0),
+            log_format=config_data.get("logging", {}).get("format", "text"),
+            log_sample_ratio=config_data.get("logging", {}).get("sample_ratio", 1.0),
+            warm_state_path=config_data.get("warm_state", {}).get("path", "data/warm_state.json"),
+            warm_state_save_interval=config_data.get("warm_state", {}).get("save_interval", 300),
+            reload_watch_interval=config_data.get("reload", {}).get("watch_interval", 5),
+            control_port=config_data.get("control", {}).get("port", 0),
+            control_host=config_data.get("control", {}).get("host", "127.0.0.1"),
+            control_token=os.getenv("CONTROL_API_TOKEN")
+            or config_data.get("control", {}).get("token", ""),
+            shard_worker_id=config_data.get("shard", {}).get("worker_id", ""),
+            shard_store=config_data.get("shard", {}).get("store", "data/shared.db"),
+            shard_heartbeat_interval=config_data.get("shard", {}).get("heartbeat_interval", 10),
+            shard_member_ttl=config_data.get("shard", {}).get("member_ttl", 30),
+            shard_replicas=config_data.get("shard", {}).get("replicas", 100),
+            ha_instance_id=config_data.get("ha", {}).get("instance_id", ""),
+            ha_store=config_data.get("ha", {}).get("store", "data/shared.db"),
+            ha_lease_ttl=config_data.get("ha", {}).get("lease_ttl", 15),
+            ha_renew_interval=config_data.get("ha", {}).get("renew_interval", 5),
+            notified_history_size=config_data.get("notified_history", {}).get("size", 16),
+            notified_history_bloom_bits=config_data.get("notified_history", {}).get(
+                "bloom_bits", 0
+            ),
+            quota_degradation_enabled=config_data.get("quota_degradation", {}).get(
+                "enabled", True
+            ),
+            quota_probe_interval=config_data.get("quota_degradation", {}).get(
+                "probe_interval", 900
+            ),
+            quota_feed_workers=config_data.get("quota_degradation", {}).get("feed_workers", 8),
+            channel_onboarding_enabled=config_data.get("onboarding", {}).get("enabled", True),
+            channel_onboarding_revalidate_interval=config_data.get("onboarding", {}).get(
+                "revalidate_interval", 604800
+            ),
         )
 
     @staticmethod
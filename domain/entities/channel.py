@@ -13,7 +13,7 @@ from domain.value_objects.channel_id import ChannelId
 from domain.value_objects.webhook_config import WebhookConfig
 
 
-@dataclass(frozen=True)  # イミュータブル
+@dataclass(frozen=True, slots=True)  # イミュータブル
 class Channel:
     """YouTubeチャンネルを表すエンティティ"""
 
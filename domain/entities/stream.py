@@ -8,10 +8,11 @@
 
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 from domain.value_objects.stream_status import StreamStatus
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Stream:
     """YouTube配信を表すエンティティ"""
 
@@ -20,6 +21,8 @@ class Stream:
     thumbnail_url: str
     started_at: datetime
     status: StreamStatus
+    concurrent_viewers: Optional[int] = None  # 配信中の同時視聴者数（取得できた場合のみ）
+    ended_at: Optional[datetime] = None  # 配信終了時刻（actualEndTime）
 
     def __post_init__(self):
         if not self.video_id:
@@ -31,6 +34,10 @@ class Stream:
         """配信中かどうか"""
         return self.status == StreamStatus.LIVE
 
+    def is_ended(self) -> bool:
+        """配信が終了しているかどうか"""
+        return self.status == StreamStatus.ENDED
+
     def __eq__(self, other) -> bool:
         """同一性はvideo_idで判断"""
         if not isinstance(other, Stream):
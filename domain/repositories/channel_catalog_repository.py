@@ -0,0 +1,41 @@
+"""チャンネル情報のリポジトリインターフェース（抽象）
+
+監視対象チャンネルの存在とアップロードプレイリストIDを確認する。
+Infrastructure層で実装される
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.channel_metadata import ChannelMetadata
+
+
+class ChannelCatalogRepository(ABC):
+    """YouTubeチャンネルの情報を取得するためのリポジトリインターフェース"""
+
+    @abstractmethod
+    def lookup_channels(
+        self, channel_ids: List[ChannelId]
+    ) -> Dict[ChannelId, Optional[ChannelMetadata]]:
+        """
+        複数チャンネルの情報をまとめて取得
+
+        Args:
+            channel_ids: 取得対象のチャンネルID
+
+        Returns:
+            チャンネルID → チャンネル情報（存在しない・停止されたチャンネルは None）
+
+        Raises:
+            QuotaExceededError: APIクォータ超過時
+            RepositoryError: 取得エラー（一部でも取得できなかった場合）
+        """
+        pass
+
+    def register_channels(self, channels: Iterable[ChannelMetadata]) -> None:
+        """
+        確認済みのチャンネル情報を登録（保存しておいた情報の復元用）
+
+        デフォルト実装は何もしない。取得時にチャンネル情報を使う実装はオーバーライドする。
+        """
+        pass
@@ -0,0 +1,41 @@
+"""リポジトリのエラー（抽象）
+
+リポジトリの実装はこれらを送出し、アプリケーション層は実装（APIクライアントなど）を
+読み込まずにエラーを判定する
+"""
+
+from datetime import datetime
+from typing import Optional
+
+
+class RepositoryError(Exception):
+    """リポジトリエラー"""
+
+    pass
+
+
+class QuotaExceededError(Exception):
+    """YouTube APIクォータ超過エラー"""
+
+    def __init__(self, message: str = "", reset_at: Optional[datetime] = None):
+        """
+        Args:
+            message: エラーメッセージ
+            reset_at: クォータがリセットされる時刻（タイムゾーン付き。不明な場合はNone）
+        """
+        super().__init__(message)
+        self.reset_at = reset_at
+
+    def seconds_until_reset(self, now: datetime) -> Optional[int]:
+        """
+        クォータのリセットまでの秒数
+
+        Args:
+            now: 現在時刻（タイムゾーン付き）
+
+        Returns:
+            リセットまでの秒数（リセット時刻が不明な場合はNone、過ぎている場合は0）
+        """
+        if self.reset_at is None:
+            return None
+        return max(0, int((self.reset_at - now).total_seconds()))
@@ -0,0 +1,30 @@
+"""冪等キーのリポジトリインターフェース（抽象）"""
+
+from abc import ABC, abstractmethod
+
+
+class IdempotencyKeyRepository(ABC):
+    """同じ処理（通知）を複数のインスタンスで重複して行わないためのキーの記録"""
+
+    @abstractmethod
+    def claim(self, key: str) -> bool:
+        """
+        キーを記録する（記録済みかの確認と記録は不可分に行う）
+
+        Args:
+            key: 冪等キー
+
+        Returns:
+            新たに記録した場合True（他のインスタンスが記録済みの場合はFalse）
+        """
+        pass
+
+    @abstractmethod
+    def release(self, key: str) -> None:
+        """
+        キーの記録を取り消す（処理に失敗し、再試行できるようにする場合）
+
+        Args:
+            key: 冪等キー
+        """
+        pass
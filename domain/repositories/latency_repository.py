@@ -0,0 +1,21 @@
+"""通知遅延記録のリポジトリインターフェース（抽象）"""
+
+from abc import ABC, abstractmethod
+from application.dto.notification_latency_dto import NotificationLatencyDto
+
+
+class LatencyRepository(ABC):
+    """通知遅延の記録を永続化するためのリポジトリインターフェース"""
+
+    @abstractmethod
+    def append(self, record: NotificationLatencyDto) -> None:
+        """
+        通知遅延の記録を追記
+
+        Args:
+            record: 1件の通知の遅延記録
+
+        Raises:
+            LatencyRepositoryError: 保存エラー
+        """
+        pass
@@ -0,0 +1,47 @@
+"""リースのリポジトリインターフェース（抽象）"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class LeaseRepository(ABC):
+    """複数のインスタンスで1つだけが持てる期限付きのリース（リーダー選出用）"""
+
+    @abstractmethod
+    def try_acquire(self, name: str, holder: str, ttl_seconds: float) -> bool:
+        """
+        リースを取得または延長
+
+        誰も持っていない、期限が切れている、または holder 自身が持っている場合に
+        期限を ttl_seconds 後にして取得する。
+
+        Args:
+            name: リース名
+            holder: 取得するインスタンスのID
+            ttl_seconds: 延長しなかった場合に失効するまでの秒数
+
+        Returns:
+            取得できた場合True
+        """
+        pass
+
+    @abstractmethod
+    def release(self, name: str, holder: str) -> None:
+        """
+        リースを手放す（holder が持っている場合のみ。他のインスタンスが即座に取得できる）
+
+        Args:
+            name: リース名
+            holder: インスタンスのID
+        """
+        pass
+
+    @abstractmethod
+    def holder(self, name: str) -> Optional[str]:
+        """
+        リースを持っているインスタンス
+
+        Returns:
+            インスタンスのID（誰も持っていない・期限切れの場合はNone）
+        """
+        pass
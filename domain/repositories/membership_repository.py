@@ -0,0 +1,39 @@
+"""ワーカーの参加状況のリポジトリインターフェース（抽象）"""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class MembershipRepository(ABC):
+    """シャーディングで協調するワーカーの生存を共有するインターフェース"""
+
+    @abstractmethod
+    def heartbeat(self, worker_id: str, ttl_seconds: float) -> None:
+        """
+        ワーカーの生存を記録（ttl_seconds 以内に再度記録しなければ離脱とみなされる）
+
+        Args:
+            worker_id: ワーカーID
+            ttl_seconds: 生存とみなす秒数
+        """
+        pass
+
+    @abstractmethod
+    def active_members(self) -> List[str]:
+        """
+        生存しているワーカーIDの一覧
+
+        Returns:
+            ワーカーID（昇順）
+        """
+        pass
+
+    @abstractmethod
+    def leave(self, worker_id: str) -> None:
+        """
+        ワーカーの離脱を記録（終了時に呼び出し、他のワーカーに即座に引き継ぐ）
+
+        Args:
+            worker_id: ワーカーID
+        """
+        pass
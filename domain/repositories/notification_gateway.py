@@ -1,15 +1,19 @@
 """通知送信のゲートウェイインターフェース（抽象）"""
 
 from abc import ABC, abstractmethod
+from typing import List, Optional
 from domain.entities.channel import Channel
 from domain.entities.stream import Stream
+from domain.value_objects.webhook_delivery import WebhookDelivery
 
 
 class NotificationGateway(ABC):
     """通知を送信するためのゲートウェイインターフェース"""
 
     @abstractmethod
-    def notify_stream_start(self, channel: Channel, stream: Stream) -> None:
+    def notify_stream_start(
+        self, channel: Channel, stream: Stream
+    ) -> Optional[List[WebhookDelivery]]:
         """
         配信開始通知を送信
 
@@ -17,6 +21,9 @@ class NotificationGateway(ABC):
             channel: 配信を開始したチャンネル
             stream: 開始した配信
 
+        Returns:
+            送信に成功したWebhookごとの送信完了時刻（記録しない実装はNone）
+
         Raises:
             NotificationError: 通知送信エラー
         """
@@ -1,7 +1,7 @@
 """状態管理のリポジトリインターフェース（抽象）"""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional, Sequence
 from domain.value_objects.channel_id import ChannelId
 from application.dto.stream_state_dto import StreamStateDto
 
@@ -35,3 +35,32 @@ class StateRepository(ABC):
             StateRepositoryError: 保存エラー
         """
         pass
+
+    def get_states(self, channel_ids: Sequence[ChannelId]) -> List[Optional[StreamStateDto]]:
+        """
+        複数チャンネルの前回の状態を一括で取得
+
+        既定の実装はチャンネルごとに get_state を呼ぶ。まとめて読める実装は上書きする。
+
+        Args:
+            channel_ids: チャンネルID
+
+        Returns:
+            同じ順の前回の状態（初回のチャンネルはNone）
+        """
+        return [self.get_state(channel_id) for channel_id in channel_ids]
+
+    def save_states(self, states: Dict[ChannelId, StreamStateDto]) -> None:
+        """
+        複数チャンネルの状態を一括で保存
+
+        既定の実装はチャンネルごとに save_state を呼ぶ。まとめて書ける実装は上書きする。
+
+        Args:
+            states: チャンネルID → 保存する状態
+
+        Raises:
+            StateRepositoryError: 保存エラー
+        """
+        for channel_id, state in states.items():
+            self.save_state(channel_id, state)
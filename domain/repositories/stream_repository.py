@@ -4,9 +4,11 @@ Infrastructure層で実装される
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional
 from domain.entities.channel import Channel
 from domain.entities.stream import Stream
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.stream_fetch_result import StreamFetchResult
 
 
 class StreamRepository(ABC):
@@ -27,3 +29,44 @@ class StreamRepository(ABC):
             RepositoryError: APIエラーやネットワークエラー
         """
         pass
+
+    def get_current_streams(self, channels: List[Channel]) -> Dict[ChannelId, StreamFetchResult]:
+        """
+        複数チャンネルの現在の配信を一括取得
+
+        デフォルト実装は get_current_stream をチャンネルごとに呼び出す。
+        実装側でAPI呼び出しをまとめられる場合はオーバーライドする。
+
+        Args:
+            channels: 取得対象のチャンネルリスト
+
+        Returns:
+            チャンネルID → 取得結果（チャンネルごとのエラーは結果のerrorに格納される）
+        """
+        results: Dict[ChannelId, StreamFetchResult] = {}
+        for channel in channels:
+            try:
+                results[channel.id] = StreamFetchResult(stream=self.get_current_stream(channel))
+            except Exception as e:
+                results[channel.id] = StreamFetchResult(error=e)
+        return results
+
+    @abstractmethod
+    def get_streams(self, video_ids: List[str]) -> Dict[str, Stream]:
+        """
+        video IDを指定して配信の現在の状態を一括取得
+
+        配信中として追跡している動画の継続・終了確認に使用する。
+        実装側はAPI呼び出しをまとめて行うことでコストを抑える。
+
+        Args:
+            video_ids: 確認対象のvideo IDリスト
+
+        Returns:
+            video ID → Stream の辞書（削除済みなどで取得できなかった動画は含まれない）
+            Streamのstatusは LIVE / ENDED / OFFLINE（配信予定）のいずれか
+
+        Raises:
+            RepositoryError: APIエラーやネットワークエラー
+        """
+        pass
@@ -0,0 +1,68 @@
+"""新着動画フィードのリポジトリインターフェース（抽象）
+
+APIクォータを消費せずにチャンネルの新着動画を取得する（クォータ超過中の縮退運転で使う）。
+Infrastructure層で実装される
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional
+from domain.entities.channel import Channel
+from domain.entities.stream import Stream
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.stream_fetch_result import StreamFetchResult
+
+
+class UploadFeedRepository(ABC):
+    """チャンネルの新着動画を取得するためのリポジトリインターフェース"""
+
+    @abstractmethod
+    def get_recent_uploads(self, channel: Channel) -> List[Stream]:
+        """
+        チャンネルの最近公開された動画・配信を取得
+
+        Args:
+            channel: 取得対象のチャンネル
+
+        Returns:
+            新しい順の動画（statusは UPLOADED。配信中かどうかは判別できない）
+
+        Raises:
+            RepositoryError: 取得エラー
+        """
+        pass
+
+    def get_latest_uploads(
+        self, channels: List[Channel], since: datetime
+    ) -> Dict[ChannelId, StreamFetchResult]:
+        """
+        複数チャンネルの、指定時刻以降に公開された最新の動画を取得
+
+        デフォルト実装は get_recent_uploads をチャンネルごとに呼び出す。
+        実装側で並行に取得できる場合はオーバーライドする。
+
+        Args:
+            channels: 取得対象のチャンネルリスト
+            since: この時刻（タイムゾーン付き）以降に公開された動画だけを対象にする
+
+        Returns:
+            チャンネルID → 取得結果（新着がないチャンネルは含まない。
+            チャンネルごとのエラーは結果のerrorに格納される）
+        """
+        results: Dict[ChannelId, StreamFetchResult] = {}
+        for channel in channels:
+            try:
+                uploads = self.get_recent_uploads(channel)
+            except Exception as e:
+                results[channel.id] = StreamFetchResult(error=e)
+                continue
+            latest = latest_upload_since(uploads, since)
+            if latest is not None:
+                results[channel.id] = StreamFetchResult(stream=latest)
+        return results
+
+
+def latest_upload_since(uploads: List[Stream], since: datetime) -> Optional[Stream]:
+    """指定時刻以降に公開された動画のうち最新のもの（ない場合はNone）"""
+    candidates = [upload for upload in uploads if upload.started_at >= since]
+    return max(candidates, key=lambda upload: upload.started_at, default=None)
@@ -0,0 +1,31 @@
+"""ウォーム状態のリポジトリインターフェース（抽象）"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class WarmStateRepository(ABC):
+    """プロセスをまたいで引き継ぐキャッシュ・スケジュールのスナップショットを永続化するインターフェース"""
+
+    @abstractmethod
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        保存済みのスナップショットを読み込み
+
+        Returns:
+            スナップショット。保存されていない・読み込めない場合はNone
+        """
+        pass
+
+    @abstractmethod
+    def save(self, snapshot: Dict[str, Any]) -> None:
+        """
+        スナップショットを保存（前回の内容は置き換える）
+
+        Args:
+            snapshot: 保存するスナップショット
+
+        Raises:
+            WarmStateRepositoryError: 保存エラー
+        """
+        pass
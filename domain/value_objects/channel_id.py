@@ -1,32 +1,75 @@
 """チャンネルID値オブジェクト
 
 YouTubeのチャンネルIDの形式を保証する
+
+同じIDのインスタンスは1つだけ作り（インターン）、形式の検証とハッシュの計算は初回のみ行う。
+設定・状態・API応答の間で同じチャンネルIDを何度作っても、メモリと比較のコストは増えない。
+インターンの表は弱参照で持ち、どこからも参照されなくなったIDは表からも消える。
 """
 
-from dataclasses import dataclass
 import re
+import threading
+import weakref
+from typing import Any, Tuple
 
 
-@dataclass(frozen=True)
 class ChannelId:
-    """YouTubeチャンネルIDを表す値オブジェクト"""
+    """YouTubeチャンネルIDを表す値オブジェクト（イミュータブル）"""
 
-    value: str
+    __slots__ = ("value", "_hash", "__weakref__")
 
     # YouTubeチャンネルIDの形式: UCで始まる24文字
     PATTERN = re.compile(r"^UC[a-zA-Z0-9_-]{22}$")
 
-    def __post_init__(self):
-        if not self.PATTERN.match(self.value):
-            raise ValueError(f"不正なチャンネルID形式: {self.value}")
+    # 値 → インスタンス（監視対象から外れ、状態やAPI応答からも参照されなくなったIDは自動的に消える）
+    _instances: "weakref.WeakValueDictionary[str, ChannelId]" = weakref.WeakValueDictionary()
+    _instances_lock = threading.Lock()
+
+    value: str
+    _hash: int
+
+    def __new__(cls, value: str) -> "ChannelId":
+        instance = cls._instances.get(value)
+        if instance is not None:
+            return instance
+        if not isinstance(value, str) or not cls.PATTERN.match(value):
+            raise ValueError(f"不正なチャンネルID形式: {value}")
+        with cls._instances_lock:
+            instance = cls._instances.get(value)
+            if instance is None:
+                instance = super().__new__(cls)
+                object.__setattr__(instance, "value", value)
+                object.__setattr__(instance, "_hash", hash(value))
+                cls._instances[value] = instance
+        return instance
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"ChannelId はイミュータブルです: {name}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"ChannelId はイミュータブルです: {name}")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (ChannelId, (self.value,))
+
+    def __copy__(self) -> "ChannelId":
+        return self
+
+    def __deepcopy__(self, memo: Any) -> "ChannelId":
+        return self
+
+    def __repr__(self) -> str:
+        return f"ChannelId(value={self.value!r})"
 
     def __str__(self) -> str:
         return self.value
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, ChannelId):
             return False
         return self.value == other.value
 
     def __hash__(self) -> int:
-        return hash(self.value)
+        return self._hash
@@ -0,0 +1,17 @@
+"""チャンネル情報値オブジェクト
+
+channels.list で存在を確認したYouTubeチャンネルの情報を表す
+"""
+
+from dataclasses import dataclass
+
+from domain.value_objects.channel_id import ChannelId
+
+
+@dataclass(frozen=True, slots=True)
+class ChannelMetadata:
+    """確認済みのYouTubeチャンネルの情報"""
+
+    channel_id: ChannelId
+    title: str  # YouTube上のチャンネル名
+    uploads_playlist_id: str  # アップロード動画のプレイリストID（通常は "UC..." → "UU..."）
@@ -0,0 +1,22 @@
+"""配信取得結果値オブジェクト
+
+複数チャンネルを一括取得した際の、チャンネルごとの結果（配信 or エラー）を表す
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from domain.entities.stream import Stream
+
+
+@dataclass(frozen=True, slots=True)
+class StreamFetchResult:
+    """チャンネル1件分の配信取得結果"""
+
+    stream: Optional[Stream] = None  # 配信中の場合はStream、配信していない場合はNone
+    error: Optional[Exception] = None  # 取得に失敗した場合の例外
+
+    @property
+    def ok(self) -> bool:
+        """取得に成功したかどうか"""
+        return self.error is None
@@ -9,3 +9,4 @@ class StreamStatus(Enum):
     LIVE = auto()  # 配信中
     OFFLINE = auto()  # 未配信
     ENDED = auto()  # 配信終了
+    UPLOADED = auto()  # 新着の動画・配信（クォータ超過中にフィードで検知。配信中かは未確認）
@@ -1,32 +1,78 @@
 """Webhook設定値オブジェクト
 
 Discord WebhookのURLとメンションをセットで管理する
+
+同じURL・メンションのインスタンスは1つだけ作り（インターン）、多数のチャンネルで共有する。
+形式の検証は初回のみ行う。インターンの表は弱参照で持ち、使われなくなったWebhookは表からも消える。
 """
 
-from dataclasses import dataclass
 import re
+import threading
+import weakref
+from typing import Any, Tuple
 
 
-@dataclass(frozen=True)
 class WebhookConfig:
-    """Discord Webhook設定を表す値オブジェクト"""
+    """Discord Webhook設定を表す値オブジェクト（イミュータブル）"""
 
-    url: str
-    mention: str = ""
+    __slots__ = ("url", "mention", "_hash", "__weakref__")
 
     # Discord Webhook URLの形式: https://discord.com/api/webhooks/{id}/{token}
     WEBHOOK_PATTERN = re.compile(
         r"^https://discord(?:app)?\.com/api/webhooks/\d+/[A-Za-z0-9_-]+$"
     )
 
-    def __post_init__(self):
-        if not self.WEBHOOK_PATTERN.match(self.url):
-            raise ValueError(f"不正なWebhook URL形式: {self.url}")
+    # (URL, メンション) → インスタンス（設定の再読み込みや制御APIで外したWebhookは自動的に消える）
+    _instances: "weakref.WeakValueDictionary[Tuple[str, str], WebhookConfig]" = (
+        weakref.WeakValueDictionary()
+    )
+    _instances_lock = threading.Lock()
+
+    url: str
+    mention: str
+    _hash: int
+
+    def __new__(cls, url: str, mention: str = "") -> "WebhookConfig":
+        key = (url, mention)
+        instance = cls._instances.get(key)
+        if instance is not None:
+            return instance
+        if not isinstance(url, str) or not cls.WEBHOOK_PATTERN.match(url):
+            raise ValueError(f"不正なWebhook URL形式: {url}")
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = super().__new__(cls)
+                object.__setattr__(instance, "url", url)
+                object.__setattr__(instance, "mention", mention)
+                object.__setattr__(instance, "_hash", hash(key))
+                cls._instances[key] = instance
+        return instance
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"WebhookConfig はイミュータブルです: {name}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"WebhookConfig はイミュータブルです: {name}")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (WebhookConfig, (self.url, self.mention))
+
+    def __copy__(self) -> "WebhookConfig":
+        return self
+
+    def __deepcopy__(self, memo: Any) -> "WebhookConfig":
+        return self
+
+    def __repr__(self) -> str:
+        return f"WebhookConfig(url={self.url!r}, mention={self.mention!r})"
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, WebhookConfig):
             return False
         return self.url == other.url and self.mention == other.mention
 
     def __hash__(self) -> int:
-        return hash((self.url, self.mention))
+        return self._hash
@@ -0,0 +1,31 @@
+"""Webhook配信結果値オブジェクト
+
+通知が1つのWebhookに届いた時刻を表す
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class WebhookDelivery:
+    """1つのWebhookへの通知送信が完了したことを表す値オブジェクト"""
+
+    webhook_url: str
+    delivered_at: datetime  # 送信完了時刻（タイムゾーン付き）
+
+    @property
+    def webhook_id(self) -> str:
+        """
+        WebhookのID部分
+
+        URLにはトークンが含まれるため、ログや永続化にはこちらを使用する。
+        https://discord.com/api/webhooks/{id}/{token} 形式でない場合は空文字列。
+        """
+        return webhook_id_of(self.webhook_url)
+
+
+def webhook_id_of(webhook_url: str) -> str:
+    """Webhook URLのID部分（トークンを含まない識別子、取り出せない場合は空文字列）"""
+    parts = webhook_url.rstrip("/").split("/")
+    return parts[-2] if len(parts) >= 2 and parts[-2].isdigit() else ""
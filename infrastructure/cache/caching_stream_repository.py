@@ -0,0 +1,294 @@
+"""キャッシュ付き配信情報取得リポジトリ
+
+任意のStreamRepositoryをラップするデコレーター
+
+- チャンネルごとのTTL（配信中はttl、未配信はnegative_ttl）
+- 同一チャンネルへの同時問い合わせは1回のAPI呼び出しにまとめる（single-flight）
+- TTL切れ後もstale_ttlの間は古い値を返しつつ、バックグラウンドで再取得する
+  （stale-while-revalidate）。再取得は1つのワーカースレッドで、同時に期限切れになった
+  チャンネルをまとめて get_current_streams で行う
+- 再取得に失敗した場合（クォータ超過を含む）は古い値を破棄し、次の問い合わせで
+  ラップ先を呼び出してエラーを呼び出し側に返す
+- ヒット/ミスなどのカウンターを保持
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from domain.entities.channel import Channel
+from domain.entities.stream import Stream
+from domain.repositories.stream_repository import StreamRepository
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.stream_fetch_result import StreamFetchResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """キャッシュの統計情報"""
+
+    hits: int = 0  # TTL内のヒット（配信中）
+    negative_hits: int = 0  # TTL内のヒット（未配信）
+    stale_hits: int = 0  # TTL切れの値を返してバックグラウンド再取得したもの
+    misses: int = 0  # キャッシュになくAPIを呼び出したもの
+    coalesced: int = 0  # 実行中の問い合わせに相乗りしたもの
+    refreshes: int = 0  # バックグラウンド再取得の完了数
+    errors: int = 0  # 取得エラー数（エラーはキャッシュしない）
+
+    @property
+    def hit_ratio(self) -> float:
+        """API呼び出しを伴わずに返せた割合"""
+        served = self.hits + self.negative_hits + self.stale_hits + self.coalesced
+        total = served + self.misses
+        return served / total if total else 0.0
+
+
+@dataclass
+class _CacheEntry:
+    """キャッシュエントリ"""
+
+    stream: Optional[Stream]
+    expires_at: float  # この時刻まではそのまま返す
+    stale_until: float  # この時刻までは古い値を返しつつ再取得する
+
+
+class _InFlight:
+    """実行中の問い合わせ（single-flight用）"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = StreamFetchResult()
+
+
+class CachingStreamRepository(StreamRepository):
+    """配信情報取得結果をキャッシュするStreamRepositoryのデコレーター"""
+
+    def __init__(
+        self,
+        inner: StreamRepository,
+        ttl: float = 60,
+        negative_ttl: float = 60,
+        stale_ttl: float = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            inner: ラップするリポジトリ
+            ttl: 配信中の結果をキャッシュする秒数
+            negative_ttl: 未配信の結果をキャッシュする秒数
+            stale_ttl: TTL切れ後、古い値を返しつつ再取得する猶予秒数（0で無効）
+            clock: 単調増加する時刻を返す関数（テスト用）
+        """
+        self._inner = inner
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._stale_ttl = stale_ttl
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._entries: Dict[ChannelId, _CacheEntry] = {}
+        self._in_flight: Dict[ChannelId, _InFlight] = {}
+        self._stats = CacheStats()
+        # バックグラウンド再取得の依頼（1つのワーカースレッドが順に処理する）
+        self._refresh_queue: "queue.SimpleQueue[Tuple[List[Channel], Dict[ChannelId, _InFlight]]]"
+        self._refresh_queue = queue.SimpleQueue()
+        self._refresh_worker: Optional[threading.Thread] = None
+
+    def stats(self) -> CacheStats:
+        """統計情報のスナップショットを取得"""
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+    def invalidate(self, channel_id: ChannelId) -> None:
+        """チャンネルのキャッシュを破棄"""
+        with self._lock:
+            self._entries.pop(channel_id, None)
+
+    def clear(self) -> None:
+        """全てのキャッシュを破棄"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_current_stream(self, channel: Channel) -> Optional[Stream]:
+        """キャッシュを考慮してチャンネルの現在の配信を取得"""
+        cached, flight, is_leader, refresh = self._lookup(channel)
+        if refresh is not None:
+            self._refresh_in_background([channel], {channel.id: refresh})
+        if flight is None:
+            return cached
+
+        if is_leader:
+            self._load([channel], {channel.id: flight}, single=True)
+        else:
+            flight.event.wait()
+
+        if flight.result.error is not None:
+            raise flight.result.error
+        return flight.result.stream
+
+    def get_current_streams(self, channels: List[Channel]) -> Dict[ChannelId, StreamFetchResult]:
+        """キャッシュにないチャンネルのみラップ先でまとめて取得"""
+        results: Dict[ChannelId, StreamFetchResult] = {}
+        to_load: List[Channel] = []
+        own_flights: Dict[ChannelId, _InFlight] = {}
+        waiting: Dict[ChannelId, _InFlight] = {}
+        to_refresh: List[Channel] = []
+        refresh_flights: Dict[ChannelId, _InFlight] = {}
+
+        for channel in channels:
+            cached, flight, is_leader, refresh = self._lookup(channel)
+            if refresh is not None:
+                to_refresh.append(channel)
+                refresh_flights[channel.id] = refresh
+            if flight is None:
+                results[channel.id] = StreamFetchResult(stream=cached)
+            elif is_leader:
+                to_load.append(channel)
+                own_flights[channel.id] = flight
+            else:
+                waiting[channel.id] = flight
+
+        if to_refresh:
+            # 同時に期限切れになったチャンネルは1回の一括取得でまとめて再取得する
+            self._refresh_in_background(to_refresh, refresh_flights)
+
+        if to_load:
+            self._load(to_load, own_flights)
+            for channel_id, flight in own_flights.items():
+                results[channel_id] = flight.result
+
+        for channel_id, flight in waiting.items():
+            flight.event.wait()
+            results[channel_id] = flight.result
+
+        return results
+
+    def get_streams(self, video_ids: List[str]) -> Dict[str, Stream]:
+        """配信中の動画の継続確認は常に最新の情報が必要なためキャッシュしない"""
+        return self._inner.get_streams(video_ids)
+
+    def _lookup(
+        self, channel: Channel
+    ) -> Tuple[Optional[Stream], Optional[_InFlight], bool, Optional[_InFlight]]:
+        """
+        キャッシュを参照
+
+        Returns:
+            (キャッシュ値, 待つべき問い合わせ, 自分が問い合わせを行うか, 再取得の問い合わせ)
+            問い合わせが不要な場合は (値, None, False, None)。
+            古い値を返す場合、再取得が必要なら4つ目を呼び出し側がワーカーに依頼する
+        """
+        now = self._clock()
+
+        with self._lock:
+            entry = self._entries.get(channel.id)
+
+            if entry is not None and now < entry.expires_at:
+                if entry.stream is None:
+                    self._stats.negative_hits += 1
+                else:
+                    self._stats.hits += 1
+                return entry.stream, None, False, None
+
+            if entry is not None and now < entry.stale_until:
+                self._stats.stale_hits += 1
+                refresh: Optional[_InFlight] = None
+                if channel.id not in self._in_flight:
+                    refresh = _InFlight()
+                    self._in_flight[channel.id] = refresh
+                return entry.stream, None, False, refresh
+
+            flight = self._in_flight.get(channel.id)
+            if flight is not None:
+                self._stats.coalesced += 1
+                return None, flight, False, None
+
+            flight = _InFlight()
+            self._in_flight[channel.id] = flight
+            self._stats.misses += 1
+            return None, flight, True, None
+
+    def _load(
+        self, channels: List[Channel], flights: Dict[ChannelId, _InFlight], single: bool = False
+    ) -> None:
+        """
+        ラップ先から取得し、キャッシュと実行中の問い合わせを更新
+
+        Args:
+            channels: 取得対象のチャンネル
+            flights: チャンネルID → 完了を通知する問い合わせ
+            single: 1チャンネルのみ get_current_stream で取得するか
+        """
+        try:
+            if single:
+                channel = channels[0]
+                try:
+                    fetched = {
+                        channel.id: StreamFetchResult(
+                            stream=self._inner.get_current_stream(channel)
+                        )
+                    }
+                except Exception as e:
+                    fetched = {channel.id: StreamFetchResult(error=e)}
+            else:
+                fetched = self._inner.get_current_streams(channels)
+        except Exception as e:
+            fetched = {channel.id: StreamFetchResult(error=e) for channel in channels}
+
+        now = self._clock()
+        with self._lock:
+            for channel in channels:
+                result = fetched.get(channel.id) or StreamFetchResult(
+                    error=RuntimeError(f"取得結果がありません: {channel.id}")
+                )
+
+                if result.ok:
+                    ttl = self._ttl if result.stream is not None else self._negative_ttl
+                    self._entries[channel.id] = _CacheEntry(
+                        stream=result.stream,
+                        expires_at=now + ttl,
+                        stale_until=now + ttl + self._stale_ttl,
+                    )
+                else:
+                    # 古い値を返し続けず、次の問い合わせではラップ先のエラー（クォータ超過など）を返す
+                    self._entries.pop(channel.id, None)
+                    self._stats.errors += 1
+
+                flight = flights[channel.id]
+                flight.result = result
+                if self._in_flight.get(channel.id) is flight:
+                    del self._in_flight[channel.id]
+                flight.event.set()
+
+    def _refresh_in_background(
+        self, channels: List[Channel], flights: Dict[ChannelId, _InFlight]
+    ) -> None:
+        """古い値を返した後の再取得をワーカースレッドに依頼"""
+        self._refresh_queue.put((channels, flights))
+        with self._lock:
+            if self._refresh_worker is None:
+                self._refresh_worker = threading.Thread(
+                    target=self._run_refresh_worker, name="cache-refresh", daemon=True
+                )
+                self._refresh_worker.start()
+
+    def _run_refresh_worker(self) -> None:
+        """再取得の依頼を順に処理する（チャンネルごとにスレッドを作らない）"""
+        while True:
+            channels, flights = self._refresh_queue.get()
+            self._load(channels, flights)
+            with self._lock:
+                self._stats.refreshes += len(channels)
+            failed = [channel for channel in channels if flights[channel.id].result.error]
+            if failed:
+                logger.warning(
+                    f"キャッシュの再取得に失敗しました（{len(failed)}/{len(channels)}チャンネル、"
+                    f"次回はラップ先から取得します）: {flights[failed[0].id].result.error}"
+                )
+            else:
+                logger.debug(f"キャッシュを再取得: {len(channels)}チャンネル")
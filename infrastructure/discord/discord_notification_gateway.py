@@ -4,13 +4,17 @@ NotificationGatewayインターフェースの具象実装
 """
 
 import logging
-import requests
-from datetime import datetime
-from typing import Optional
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 
 from domain.entities.channel import Channel
 from domain.entities.stream import Stream
 from domain.repositories.notification_gateway import NotificationGateway
+from domain.value_objects.stream_status import StreamStatus
+from domain.value_objects.webhook_delivery import WebhookDelivery, webhook_id_of
+from infrastructure.metrics import monitor_metrics as metrics
+from application.services.tracer import get_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -24,55 +28,82 @@ class NotificationError(Exception):
 class DiscordNotificationGateway(NotificationGateway):
     """Discord Webhookを使用した通知送信の実装"""
 
-    def __init__(self, color: int = 16711680):
+    def __init__(self, color: int = 16711680, api_base_url: Optional[str] = None):
         """
         Args:
             color: 埋め込みの色（デフォルト: 赤）
+            api_base_url: Webhookの送信先のベースURL（ベンチマーク用のローカルサーバーなど、
+                省略時はWebhook URLのとおりDiscordに送信）
         """
         self._color = color
+        self._api_base_url = api_base_url.rstrip("/") + "/" if api_base_url else None
 
-    def notify_stream_start(self, channel: Channel, stream: Stream) -> None:
+    def notify_stream_start(self, channel: Channel, stream: Stream) -> List[WebhookDelivery]:
         """
         配信開始通知を複数のDiscord Webhookに送信
 
         複数のwebhookが設定されている場合、全てに送信を試みる。
         - 1つでも成功すれば通知成功とみなす
         - 全て失敗した場合のみNotificationErrorを投げる
+
+        Returns:
+            送信に成功したWebhookごとの送信完了時刻
         """
         if not channel.webhooks:
             raise NotificationError(f"チャンネル '{channel.name}' にWebhookが設定されていません")
 
         embed = self._create_embed(channel, stream)
-        success_count = 0
+        deliveries: List[WebhookDelivery] = []
         failed_webhooks = []
 
-        logger.info(f"Discord通知送信開始: {channel.name} (Webhook数: {len(channel.webhooks)})")
+        log_fields = {"channel_id": str(channel.id), "video_id": stream.video_id}
+        logger.debug(
+            "Discord通知送信開始: %s (Webhook数: %d)",
+            channel.name,
+            len(channel.webhooks),
+            extra=log_fields,
+        )
 
         for webhook_config in channel.webhooks:
             try:
                 self._send_to_webhook(webhook_config.url, webhook_config.mention, embed)
-                success_count += 1
-                logger.info(
-                    f"Discord通知送信成功: {channel.name} -> {webhook_config.url[:50]}..."
+                deliveries.append(
+                    WebhookDelivery(webhook_config.url, delivered_at=datetime.now(timezone.utc))
+                )
+                logger.debug(
+                    "Discord通知送信成功: %s -> %s",
+                    channel.name,
+                    webhook_id_of(webhook_config.url),
+                    extra=log_fields,
                 )
             except Exception as e:
                 failed_webhooks.append((webhook_config.url, str(e)))
                 logger.warning(
-                    f"Discord通知送信失敗: {channel.name} -> {webhook_config.url[:50]}... - {e}"
+                    "Discord通知送信失敗: %s -> %s - %s",
+                    channel.name,
+                    webhook_id_of(webhook_config.url),
+                    e,
+                    extra=log_fields,
                 )
 
         # 結果のサマリーをログ出力
         logger.info(
-            f"Discord通知送信完了: {channel.name} - 成功: {success_count}/{len(channel.webhooks)}"
+            "Discord通知送信完了: %s - 成功: %d/%d",
+            channel.name,
+            len(deliveries),
+            len(channel.webhooks),
+            extra={**log_fields, "event": "notification_sent"},
         )
 
         # 全て失敗した場合のみエラーを投げる
-        if success_count == 0:
+        if not deliveries:
             error_msg = f"全てのWebhookへの送信に失敗: {channel.name}\n"
             for url, error in failed_webhooks:
                 error_msg += f"  - {url[:50]}...: {error}\n"
             raise NotificationError(error_msg)
 
+        return deliveries
+
     def _send_to_webhook(self, webhook_url: str, mention: str, embed: dict) -> None:
         """
         単一のWebhookに通知を送信
@@ -85,26 +116,50 @@ class DiscordNotificationGateway(NotificationGateway):
         Raises:
             NotificationError: 送信に失敗した場合
         """
-        try:
-            payload = {"content": mention, "embeds": [embed]}
-            response = requests.post(webhook_url, json=payload, timeout=10)
+        # requests の読み込み（約0.1秒）は起動時ではなく最初の通知送信時に行う
+        import requests
 
-            if response.status_code != 204:
-                raise NotificationError(
-                    f"Discord API エラー: status={response.status_code}, body={response.text}"
-                )
+        with get_tracer().span("discord.webhook", webhook_id=webhook_id_of(webhook_url)) as span:
+            started = time.monotonic()
+            try:
+                payload: Dict[str, Any] = {"content": mention, "embeds": [embed]}
+                response = requests.post(self._resolve_url(webhook_url), json=payload, timeout=10)
+                metrics.DISCORD_RESPONSES.inc(status=str(response.status_code))
+                span.set_attribute("status_code", response.status_code)
+
+                if response.status_code != 204:
+                    raise NotificationError(
+                        f"Discord API エラー: status={response.status_code}, body={response.text}"
+                    )
+
+            except requests.RequestException as e:
+                metrics.DISCORD_RESPONSES.inc(status="error")
+                raise NotificationError(f"通知送信失敗: {e}") from e
+
+            finally:
+                metrics.DISCORD_SEND_DURATION.observe(time.monotonic() - started)
 
-        except requests.RequestException as e:
-            raise NotificationError(f"通知送信失敗: {e}") from e
+    def _resolve_url(self, webhook_url: str) -> str:
+        """送信先URL（api_base_url 指定時は /api/webhooks/ 以降を付け替える）"""
+        if self._api_base_url is None or "/api/webhooks/" not in webhook_url:
+            return webhook_url
+        return self._api_base_url + "api/webhooks/" + webhook_url.split("/api/webhooks/", 1)[1]
 
     def _create_embed(self, channel: Channel, stream: Stream) -> dict:
         """埋め込み（Embed）を作成"""
+        if stream.status == StreamStatus.UPLOADED:
+            # クォータ超過中にフィードで検知した新着（配信中かは確認できていない）
+            title = f"🆕 {channel.name} が新しい動画・配信を公開しました"
+            footer = "YouTube（クォータ超過中のためフィードで検知）"
+        else:
+            title = f"🔴 {channel.name} が配信を開始しました!"
+            footer = "YouTube Live"
         return {
-            "title": f"🔴 {channel.name} が配信を開始しました!",
+            "title": title,
             "description": stream.title,
             "url": f"https://www.youtube.com/watch?v={stream.video_id}",
             "color": self._color,
             "image": {"url": stream.thumbnail_url},
             "timestamp": datetime.utcnow().isoformat(),
-            "footer": {"text": "YouTube Live"},
+            "footer": {"text": footer},
         }
@@ -1,18 +1,130 @@
-"""ロギング設定"""
+"""ロギング設定
 
+ログはキュー経由で出力する。呼び出し側はレコードをキューに入れるだけで戻り、
+メッセージの組み立て・整形・ファイル書き込みはバックグラウンドのリスナースレッドで行う。
+
+- ファイル出力は text（従来の1行形式）と json（1レコード1行のJSON）から選択できる
+- ログには監視サイクルID（トレースID）を付与し、extra で渡した channel_id などはJSONの項目になる
+- チャンネルごとの定常的なDEBUG / INFOログはサンプリングで間引ける
+  （WARNING以上と、event を持つログ（配信開始の検知など）は常に残す）
+"""
+
+import atexit
+import json
 import logging
+import queue
+import zlib
+from datetime import datetime, timezone
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, Optional
+
+from application.services.tracer import get_tracer
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
 
+class _DeferredQueueHandler(QueueHandler):
+    """レコードを整形せずにそのままキューへ渡すQueueHandler
 
-def setup_logging(log_level: str = "INFO", log_file: str = "logs/monitor.log") -> None:
+    標準の QueueHandler はプロセス間で受け渡せるよう呼び出し側のスレッドで
+    メッセージを組み立てるが、同一プロセス内のキューではその必要がないため、
+    %形式の引数の展開と例外の整形もリスナースレッドに任せる。
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# LogRecord が標準で持つ属性（これ以外は extra で渡された項目としてJSONに出力する）
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class CycleContextFilter(logging.Filter):
+    """実行中の監視サイクルのID（トレースID）をレコードに付与する
+
+    呼び出し側のスレッドで実行する必要があるため、キューに入れる前のハンドラーに付ける。
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "cycle_id"):
+            span = get_tracer().current_span()
+            record.cycle_id = span.trace_id if span is not None else None
+        return True
+
+
+class ChannelSamplingFilter(logging.Filter):
+    """チャンネルごとの定常的なログを間引く
+
+    channel_id を持つ INFO 以下のログのうち、event を持たないものが対象。
+    採否はチャンネルIDと監視サイクルIDから決めるため、採用されたチャンネルの
+    そのサイクルのログはまとめて残る。
+    """
+
+    def __init__(self, sample_ratio: float):
+        super().__init__()
+        self._threshold = int(min(1.0, max(0.0, sample_ratio)) * 0xFFFFFFFF)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or getattr(record, "event", None):
+            return True
+        channel_id = getattr(record, "channel_id", None)
+        if channel_id is None:
+            return True
+        key = f"{channel_id}:{getattr(record, 'cycle_id', None)}".encode()
+        return zlib.crc32(key) <= self._threshold
+
+
+class JsonLineFormatter(logging.Formatter):
+    """1レコードを1行のJSONに整形する"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and value is not None:
+                data[key] = value
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def setup_logging(
+    log_level: str = "INFO",
+    log_file: str = "logs/monitor.log",
+    log_format: str = "text",
+    sample_ratio: float = 1.0,
+) -> None:
     """
     ロギングを設定
 
+    再度呼び出した場合は前回の設定を停止してから設定し直す。
+
     Args:
         log_level: ログレベル（DEBUG, INFO, WARNING, ERROR）
         log_file: ログファイルパス
+        log_format: ファイルの出力形式（text / json）
+        sample_ratio: チャンネルごとの定常的なログを残す割合（0.0〜1.0）
+
+    Raises:
+        ValueError: 出力形式が不正な場合
     """
+    global _listener, _queue_handler
+
+    if log_format not in ("text", "json"):
+        raise ValueError(
+            f"logging.format は text / json のいずれかを指定してください: {log_format}"
+        )
+
+    shutdown_logging()
+
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -29,14 +141,41 @@ def setup_logging(log_level: str = "INFO", log_file: str = "logs/monitor.log") -
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
     # ファイルハンドラー（ローテーション付き）
     file_handler = RotatingFileHandler(
         log_file, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"  # 10MB
     )
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    file_handler.setFormatter(JsonLineFormatter() if log_format == "json" else formatter)
+
+    # ルートロガーにはキューへ入れるだけのハンドラーを付け、出力はリスナースレッドで行う
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = _DeferredQueueHandler(log_queue)
+    _queue_handler.addFilter(CycleContextFilter())
+    if sample_ratio < 1.0:
+        _queue_handler.addFilter(ChannelSamplingFilter(sample_ratio))
+    logger.addHandler(_queue_handler)
+    _listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    _listener.start()
 
     logger.info("ロギング設定完了")
+
+
+def shutdown_logging() -> None:
+    """キューに残っているログを出力しきってからリスナーを停止（未設定の場合は何もしない）"""
+    global _listener, _queue_handler
+
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+# 終了処理を呼ばずに終了した場合もキューに残ったログを失わないようにする
+atexit.register(shutdown_logging)
@@ -0,0 +1,80 @@
+"""アプリケーション層の統計をメトリクスとして出力するコレクター
+
+MetricsRegistry.register_collector に登録し、スクレイプ時に最新の値を出力する。
+"""
+
+from typing import Callable, List
+
+from application.services.latency_recorder import PERCENTILES, LatencyRecorder
+from application.services.monitor_pipeline import MonitorPipeline
+from infrastructure.metrics.registry import render_samples
+
+
+def pipeline_collector(pipeline: MonitorPipeline) -> Callable[[], List[str]]:
+    """パイプラインのステージごとのカウンターを出力するコレクター"""
+
+    def collect() -> List[str]:
+        stats = pipeline.stats()
+        return [
+            *render_samples(
+                "monitor_pipeline_processed_total",
+                "counter",
+                "パイプラインの各ステージで処理した件数",
+                [({"stage": stage}, s.processed) for stage, s in stats.items()],
+            ),
+            *render_samples(
+                "monitor_pipeline_errors_total",
+                "counter",
+                "パイプラインの各ステージでのエラー数",
+                [({"stage": stage}, s.errors) for stage, s in stats.items()],
+            ),
+            *render_samples(
+                "monitor_pipeline_busy_seconds_total",
+                "counter",
+                "パイプラインの各ステージが処理に費やした時間",
+                [({"stage": stage}, s.busy_seconds) for stage, s in stats.items()],
+            ),
+            *render_samples(
+                "monitor_pipeline_queue_depth",
+                "gauge",
+                "パイプラインの各ステージの入力キューの長さ",
+                [({"stage": stage}, s.queue_depth) for stage, s in stats.items()],
+            ),
+            *render_samples(
+                "monitor_pipeline_max_queue_depth",
+                "gauge",
+                "パイプラインの各ステージの入力キューの最大長",
+                [({"stage": stage}, s.max_queue_depth) for stage, s in stats.items()],
+            ),
+        ]
+
+    return collect
+
+
+def latency_collector(recorder: LatencyRecorder) -> Callable[[], List[str]]:
+    """通知遅延（全体）のパーセンタイルを出力するコレクター"""
+
+    def collect() -> List[str]:
+        samples = []
+        counts = []
+        for metric, summary in recorder.summary().items():
+            for p in PERCENTILES:
+                if f"p{p}" in summary:
+                    samples.append(({"metric": metric, "quantile": str(p / 100)}, summary[f"p{p}"]))
+            counts.append(({"metric": metric}, summary["count"]))
+        return [
+            *render_samples(
+                "notification_latency_seconds",
+                "gauge",
+                "配信開始から通知到達までの遅延（metric: end_to_end/detection/queue/dispatch）",
+                samples,
+            ),
+            *render_samples(
+                "notification_latency_samples_total",
+                "counter",
+                "通知遅延の記録件数",
+                counts,
+            ),
+        ]
+
+    return collect
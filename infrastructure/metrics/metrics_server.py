@@ -0,0 +1,98 @@
+"""メトリクス・ヘルスチェック用の組み込みHTTPサーバー
+
+- GET /metrics: Prometheusのテキスト形式でメトリクスを出力
+- GET /healthz: 監視サイクルが止まっていなければ200、止まっていれば503
+
+標準ライブラリの http.server をバックグラウンドスレッドで動かす。
+"""
+
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional, Tuple
+
+from infrastructure.metrics.registry import REGISTRY, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE_METRICS = "text/plain; version=0.0.4; charset=utf-8"
+
+# ヘルスチェック関数: (正常か, 説明)
+HealthCheck = Callable[[], Tuple[bool, str]]
+
+
+class MetricsServer:
+    """/metrics と /healthz を提供するHTTPサーバー"""
+
+    def __init__(
+        self,
+        port: int,
+        host: str = "127.0.0.1",
+        registry: MetricsRegistry = REGISTRY,
+        health_check: Optional[HealthCheck] = None,
+    ):
+        """
+        Args:
+            port: 待ち受けポート（0の場合は空いているポートを使用）
+            host: 待ち受けアドレス（既定はローカルのみ）
+            registry: 出力するメトリクスのレジストリ
+            health_check: /healthz で呼び出す関数（省略時は常に正常）
+        """
+        self._host = host
+        self._port = port
+        self._registry = registry
+        self._health_check = health_check or (lambda: (True, "ok"))
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        """実際に待ち受けているポート"""
+        return self._server.server_address[1] if self._server else self._port
+
+    def start(self) -> None:
+        """バックグラウンドで待ち受けを開始"""
+        registry = self._registry
+        health_check = self._health_check
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                if path == "/metrics":
+                    self._respond(200, registry.render(), CONTENT_TYPE_METRICS)
+                elif path == "/healthz":
+                    healthy, detail = health_check()
+                    self._respond(200 if healthy else 503, detail + "\n")
+                else:
+                    self._respond(404, "not found\n")
+
+            def _respond(self, status, body, content_type="text/plain; charset=utf-8"):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                # スクレイプのたびにアクセスログを出さない
+                logger.debug(f"metrics: {self.address_string()} {format % args}")
+
+        self._server = ThreadingHTTPServer((self._host, self._port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"メトリクスサーバー起動: http://{self._host}:{self.port}/metrics")
+
+    def stop(self) -> None:
+        """待ち受けを停止"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._server = None
+        self._thread = None
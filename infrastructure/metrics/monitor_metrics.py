@@ -0,0 +1,111 @@
+"""監視システムのメトリクス定義
+
+各レイヤーはここで定義したメトリクスに記録し、MetricsServer が /metrics で出力する。
+"""
+
+from infrastructure.metrics.registry import REGISTRY
+
+# 監視サイクル
+CYCLE_DURATION = REGISTRY.histogram("monitor_cycle_duration_seconds", "監視サイクル1回の所要時間")
+CYCLES = REGISTRY.counter(
+    "monitor_cycles_total",
+    "監視サイクルの実行回数（result: success/quota/degraded/error）",
+    ["result"],
+)
+CYCLE_CHANNELS = REGISTRY.gauge(
+    "monitor_cycle_channels", "直近の監視サイクルで確認したチャンネル数"
+)
+CHANNELS_CHECKED = REGISTRY.counter("monitor_channels_checked_total", "確認したチャンネル数の累計")
+LAST_SUCCESS = REGISTRY.gauge(
+    "monitor_last_success_timestamp_seconds", "最後に監視サイクルが成功した時刻（UNIX時間）"
+)
+SECONDS_SINCE_LAST_SUCCESS = REGISTRY.gauge(
+    "monitor_seconds_since_last_success", "最後に監視サイクルが成功してからの経過秒数"
+)
+CONFIG_RELOADS = REGISTRY.counter(
+    "monitor_config_reloads_total",
+    "設定の再読み込み回数（result: applied/unchanged/error）",
+    ["result"],
+)
+FORCED_CHECKS = REGISTRY.counter(
+    "monitor_forced_checks_total",
+    "制御APIから依頼された臨時チェックの回数（result: success/quota/error）",
+    ["result"],
+)
+SHARD_MEMBERS = REGISTRY.gauge(
+    "monitor_shard_members", "シャーディングで協調している生存中のワーカー数"
+)
+SHARD_OWNED_CHANNELS = REGISTRY.gauge(
+    "monitor_shard_owned_channels", "このワーカーが担当しているチャンネル数"
+)
+SHARD_REBALANCES = REGISTRY.counter(
+    "monitor_shard_rebalances_total", "ワーカーの増減による担当の再割り当て回数"
+)
+LEADER = REGISTRY.gauge(
+    "monitor_leader", "冗長構成でこのインスタンスがリーダー（稼働系）か（1: リーダー、0: 待機系）"
+)
+NOTIFICATIONS_DEDUPLICATED = REGISTRY.counter(
+    "monitor_notifications_deduplicated_total",
+    "他のインスタンスが送信済みのため送信しなかった配信開始通知の件数",
+)
+QUOTA_DEGRADED = REGISTRY.gauge(
+    "monitor_quota_degraded",
+    "クォータ超過で縮退運転（新着動画フィードでの検知）中か（1: 縮退運転中、0: 通常）",
+)
+QUOTA_PROBES = REGISTRY.counter(
+    "monitor_quota_probes_total",
+    "縮退運転中のクォータの回復の確認（result: recovered / quota / error）",
+    ["result"],
+)
+QUARANTINED_CHANNELS = REGISTRY.gauge(
+    "monitor_quarantined_channels",
+    "存在を確認できなかったため隔離中（監視しない）のチャンネル数",
+)
+
+# YouTube Data API
+API_CALLS = REGISTRY.counter(
+    "youtube_api_calls_total",
+    "YouTube APIの呼び出し回数（バッチ内の個別リクエスト単位）",
+    ["endpoint"],
+)
+QUOTA_UNITS = REGISTRY.counter(
+    "youtube_quota_units_total", "消費したYouTube APIクォータ（units）", ["endpoint"]
+)
+QUOTA_UNITS_TODAY = REGISTRY.gauge(
+    "youtube_quota_units_today",
+    "その日（JST 18:00 リセット）に消費したYouTube APIクォータ（再起動をまたいで引き継ぐ）",
+)
+API_RETRIES = REGISTRY.counter(
+    "youtube_api_retries_total", "YouTube APIのリトライ回数", ["endpoint"]
+)
+API_ERRORS = REGISTRY.counter(
+    "youtube_api_errors_total",
+    "YouTube APIのエラー回数（reason: quota/client/server/other）",
+    ["endpoint", "reason"],
+)
+
+# Discord
+DISCORD_SEND_DURATION = REGISTRY.histogram(
+    "discord_send_duration_seconds", "Discord Webhookへの送信1回の所要時間"
+)
+DISCORD_RESPONSES = REGISTRY.counter(
+    "discord_responses_total",
+    "Discord Webhookの応答（status: HTTPステータス or error）",
+    ["status"],
+)
+
+# 状態の永続化
+STATE_FLUSH_DURATION = REGISTRY.histogram(
+    "state_flush_duration_seconds",
+    "状態ファイルの書き込み1回の所要時間",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+# YouTube APIのエンドポイントごとのクォータコスト
+QUOTA_COST = {"playlistItems.list": 1, "videos.list": 1, "channels.list": 1, "search.list": 100}
+
+
+def record_api_call(endpoint: str, count: int = 1) -> None:
+    """YouTube APIの呼び出しとクォータ消費を記録"""
+    API_CALLS.inc(count, endpoint=endpoint)
+    QUOTA_UNITS.inc(QUOTA_COST.get(endpoint, 1) * count, endpoint=endpoint)
@@ -0,0 +1,277 @@
+"""Prometheusテキスト形式のメトリクス
+
+外部ライブラリに依存しない最小限の Counter / Gauge / Histogram と、
+Prometheusのテキスト形式（text/plain; version=0.0.4）への出力を提供する。
+
+ホットパスでの記録は辞書の更新とロック1回のみで、出力はスクレイプ時に行う。
+"""
+
+import math
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+LabelValues = Tuple[str, ...]
+
+# 秒単位のヒストグラムの既定バケット
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+def _escape(value: str) -> str:
+    """ラベル値のエスケープ"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """サンプル値の出力形式"""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """ラベルの出力形式（ラベルなしは空文字列）"""
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def render_samples(
+    name: str, metric_type: str, documentation: str, samples: Iterable[Tuple[Dict[str, str], float]]
+) -> List[str]:
+    """
+    ラベルと値の組からテキスト形式の行を作成（コレクター用）
+
+    Args:
+        name: メトリクス名
+        metric_type: counter / gauge / summary など
+        documentation: 説明
+        samples: (ラベル, 値) の組
+    """
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {metric_type}"]
+    for labels, value in samples:
+        lines.append(
+            f"{name}{_format_labels(list(labels), list(labels.values()))} {_format_value(value)}"
+        )
+    return lines
+
+
+class _Metric(ABC):
+    """メトリクスの共通部分"""
+
+    TYPE = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: ラベルが一致しません: {sorted(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        """サンプル行"""
+        pass
+
+    def render(self) -> List[str]:
+        """HELP / TYPE 行とサンプル行"""
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.TYPE}",
+            *self._samples(),
+        ]
+
+
+_MetricT = TypeVar("_MetricT", bound=_Metric)
+
+
+class Counter(_Metric):
+    """単調増加するカウンター"""
+
+    TYPE = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """カウンターを増やす"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        """現在の値"""
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def total(self) -> float:
+        """全ラベルの値の合計"""
+        with self._lock:
+            return sum(self._values.values())
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    """任意に上下する値（関数を設定した場合はスクレイプ時に評価）"""
+
+    TYPE = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._function: Optional[Callable[[], Optional[float]]] = None
+
+    def set(self, value: float, **labels: str) -> None:
+        """値を設定"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def set_function(self, function: Callable[[], Optional[float]]) -> None:
+        """スクレイプ時に値を計算する関数を設定（ラベルなしのみ、Noneを返すと出力しない）"""
+        self._function = function
+
+    def value(self, **labels: str) -> Optional[float]:
+        """現在の値"""
+        if self._function is not None:
+            return self._function()
+        with self._lock:
+            return self._values.get(self._key(labels))
+
+    def _samples(self) -> List[str]:
+        if self._function is not None:
+            value = self._function()
+            return [] if value is None else [f"{self.name} {_format_value(value)}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """累積バケットのヒストグラム"""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._buckets = tuple(sorted(buckets))
+        # ラベル値 → (バケットごとの件数, 合計, 件数)
+        self._values: Dict[LabelValues, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """値を記録"""
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key) or ([0] * len(self._buckets), 0.0, 0)
+            for i, bound in enumerate(self._buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._values[key] = (counts, total + value, count + 1)
+
+    def count(self, **labels: str) -> int:
+        """記録した件数"""
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+        return entry[2] if entry else 0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, (list(c), t, n)) for key, (c, t, n) in self._values.items())
+
+        lines: List[str] = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self._buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames + ("le",), key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames + ("le",), key + ("+Inf",))
+            lines.append(f"{self.name}_bucket{labels} {count}")
+            base = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{base} {_format_value(total)}")
+            lines.append(f"{self.name}_count{base} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """メトリクスの登録とテキスト形式への出力"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[str]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Counterを登録（同名が登録済みの場合はそれを返す）"""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Gaugeを登録（同名が登録済みの場合はそれを返す）"""
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Histogramを登録（同名が登録済みの場合はそれを返す）"""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[str]]) -> None:
+        """スクレイプ時にテキスト形式の行を返す関数を登録"""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """全メトリクスをPrometheusのテキスト形式で出力"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        for collector in collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: "_MetricT") -> "_MetricT":
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"{metric.name} は別の種類で登録済みです")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+
+# アプリケーション全体で共有する既定のレジストリ
+REGISTRY = MetricsRegistry()
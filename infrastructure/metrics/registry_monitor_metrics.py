@@ -0,0 +1,33 @@
+"""MonitorMetrics のレジストリ実装（MetricsServer の /metrics で出力する）"""
+
+from application.services.monitor_metrics import MonitorMetrics
+from infrastructure.metrics import monitor_metrics as metrics
+
+
+class RegistryMonitorMetrics(MonitorMetrics):
+    """monitor_metrics で定義したメトリクスに記録する"""
+
+    def shard_rebalanced(self, members: int) -> None:
+        metrics.SHARD_MEMBERS.set(members)
+        metrics.SHARD_REBALANCES.inc()
+
+    def shard_owned_channels(self, count: int) -> None:
+        metrics.SHARD_OWNED_CHANNELS.set(count)
+
+    def leader_changed(self, is_leader: bool) -> None:
+        metrics.LEADER.set(1 if is_leader else 0)
+
+    def quota_degraded(self, active: bool) -> None:
+        metrics.QUOTA_DEGRADED.set(1 if active else 0)
+
+    def quota_probed(self, result: str) -> None:
+        metrics.QUOTA_PROBES.inc(result=result)
+
+    def quarantined_channels(self, count: int) -> None:
+        metrics.QUARANTINED_CHANNELS.set(count)
+
+    def notification_deduplicated(self) -> None:
+        metrics.NOTIFICATIONS_DEDUPLICATED.inc()
+
+    def quota_units_total(self) -> float:
+        return metrics.QUOTA_UNITS.total()
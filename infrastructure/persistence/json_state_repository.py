@@ -5,12 +5,15 @@ StateRepositoryインターフェースの具象実装
 
 import json
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Dict, List, Optional, Sequence
 
 from domain.value_objects.channel_id import ChannelId
 from domain.repositories.state_repository import StateRepository
 from application.dto.stream_state_dto import StreamStateDto
+from infrastructure.metrics import monitor_metrics as metrics
 
 logger = logging.getLogger(__name__)
 
@@ -31,22 +34,45 @@ class JsonStateRepository(StateRepository):
         """
         self._file_path = Path(file_path)
         self._state_cache: Dict[str, StreamStateDto] = {}
+        # 検出ステージと通知ワーカーから同時に保存されるため、書き込みを直列化する
+        self._lock = threading.Lock()
         self._load_from_file()
 
     def get_state(self, channel_id: ChannelId) -> Optional[StreamStateDto]:
         """チャンネルの状態を取得"""
-        return self._state_cache.get(str(channel_id))
+        return self._state_cache.get(channel_id.value)
 
     def save_state(self, channel_id: ChannelId, state: StreamStateDto) -> None:
         """チャンネルの状態を保存"""
         try:
-            self._state_cache[str(channel_id)] = state
-            self._save_to_file()
+            with self._lock:
+                self._state_cache[channel_id.value] = state
+                self._save_to_file()
             logger.debug(f"状態保存完了: {channel_id}")
         except Exception as e:
             logger.error(f"状態保存エラー: {e}", exc_info=True)
             raise StateRepositoryError(f"状態保存失敗: {e}") from e
 
+    def get_states(self, channel_ids: Sequence[ChannelId]) -> List[Optional[StreamStateDto]]:
+        """複数チャンネルの状態を取得"""
+        cache = self._state_cache
+        return [cache.get(channel_id.value) for channel_id in channel_ids]
+
+    def save_states(self, states: Dict[ChannelId, StreamStateDto]) -> None:
+        """複数チャンネルの状態をまとめて保存（ファイルへの書き込みは1回）"""
+        if not states:
+            return
+        try:
+            with self._lock:
+                self._state_cache.update(
+                    (channel_id.value, state) for channel_id, state in states.items()
+                )
+                self._save_to_file()
+            logger.debug("状態保存完了: %dチャンネル", len(states))
+        except Exception as e:
+            logger.error(f"状態保存エラー: {e}", exc_info=True)
+            raise StateRepositoryError(f"状態保存失敗: {e}") from e
+
     def _load_from_file(self) -> None:
         """ファイルから状態を読み込み"""
         if not self._file_path.exists():
@@ -70,6 +96,8 @@ class JsonStateRepository(StateRepository):
 
     def _save_to_file(self) -> None:
         """状態をファイルに保存"""
+        started = time.monotonic()
+
         # ディレクトリが存在しない場合は作成
         self._file_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -77,3 +105,5 @@ class JsonStateRepository(StateRepository):
 
         with open(self._file_path, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+
+        metrics.STATE_FLUSH_DURATION.observe(time.monotonic() - started)
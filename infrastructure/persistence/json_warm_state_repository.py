@@ -0,0 +1,62 @@
+"""JSON形式でのウォーム状態の永続化実装
+
+WarmStateRepositoryインターフェースの具象実装
+書き込み途中で終了してもスナップショットが壊れないよう、一時ファイルに書いてから置き換える。
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from domain.repositories.warm_state_repository import WarmStateRepository
+
+logger = logging.getLogger(__name__)
+
+
+class WarmStateRepositoryError(Exception):
+    """ウォーム状態リポジトリエラー"""
+
+    pass
+
+
+class JsonWarmStateRepository(WarmStateRepository):
+    """JSON形式でウォーム状態のスナップショットを保存する実装"""
+
+    def __init__(self, file_path: str):
+        """
+        Args:
+            file_path: スナップショットのファイルパス
+        """
+        self._file_path = Path(file_path)
+        self._lock = threading.Lock()
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """スナップショットを読み込み（壊れている場合は警告してNone）"""
+        if not self._file_path.exists():
+            logger.info("ウォーム状態のスナップショットがないため、キャッシュなしで開始します")
+            return None
+        try:
+            with open(self._file_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"ウォーム状態の読み込みに失敗（キャッシュなしで開始）: {e}")
+            return None
+        if not isinstance(snapshot, dict):
+            logger.warning("ウォーム状態の形式が不正なため、キャッシュなしで開始します")
+            return None
+        return snapshot
+
+    def save(self, snapshot: Dict[str, Any]) -> None:
+        """スナップショットを一時ファイルに書いてから置き換える"""
+        temp_path = self._file_path.with_name(self._file_path.name + ".tmp")
+        try:
+            with self._lock:
+                self._file_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(snapshot, f, ensure_ascii=False)
+                os.replace(temp_path, self._file_path)
+        except OSError as e:
+            raise WarmStateRepositoryError(f"ウォーム状態の保存に失敗: {e}") from e
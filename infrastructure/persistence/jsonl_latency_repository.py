@@ -0,0 +1,45 @@
+"""JSON Lines形式での通知遅延記録の永続化実装
+
+LatencyRepositoryインターフェースの具象実装
+1行に1件の通知の記録を追記する（後から集計・分析するため）
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+
+from domain.repositories.latency_repository import LatencyRepository
+from application.dto.notification_latency_dto import NotificationLatencyDto
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyRepositoryError(Exception):
+    """通知遅延リポジトリエラー"""
+
+    pass
+
+
+class JsonlLatencyRepository(LatencyRepository):
+    """JSON Lines形式で通知遅延を追記する実装"""
+
+    def __init__(self, file_path: str):
+        """
+        Args:
+            file_path: 記録ファイルのパス
+        """
+        self._file_path = Path(file_path)
+        # 複数の通知ワーカーから同時に追記されるため、書き込みを直列化する
+        self._lock = threading.Lock()
+
+    def append(self, record: NotificationLatencyDto) -> None:
+        """通知遅延の記録を1行追記"""
+        line = json.dumps(record.to_dict(), ensure_ascii=False)
+        try:
+            with self._lock:
+                self._file_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self._file_path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+        except OSError as e:
+            raise LatencyRepositoryError(f"通知遅延の記録に失敗: {e}") from e
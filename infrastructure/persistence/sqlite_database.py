@@ -0,0 +1,31 @@
+"""複数プロセスで共有するSQLiteデータベース
+
+シャーディング・冗長構成のワーカーが同じファイルを読み書きするため、
+WALモード（読み込みと書き込みを並行できる）とロック待ちのタイムアウトを設定して開く。
+接続はスレッド間で共有し、呼び出し側のロックで直列化する。
+"""
+
+import sqlite3
+from pathlib import Path
+
+# 他のプロセスの書き込みを待つ最大秒数
+BUSY_TIMEOUT_SECONDS = 10.0
+
+
+def open_database(path: str) -> sqlite3.Connection:
+    """
+    共有のSQLiteデータベースを開く（ファイル・ディレクトリがなければ作成）
+
+    Args:
+        path: データベースファイルのパス
+
+    Returns:
+        自動コミット（isolation_level=None）の接続
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(
+        path, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None, check_same_thread=False
+    )
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
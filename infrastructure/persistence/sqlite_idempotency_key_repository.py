@@ -0,0 +1,82 @@
+"""SQLiteでの冪等キーの実装
+
+IdempotencyKeyRepositoryインターフェースの具象実装
+キーは (名前空間, キー) の主キーで記録し、記録済みの確認と記録を1つのINSERT文で不可分に行う。
+保持期間を過ぎたキーは定期的に削除する。
+"""
+
+import threading
+from typing import Optional
+
+from domain.repositories.idempotency_key_repository import IdempotencyKeyRepository
+from application.services.clock import Clock, SystemClock
+from infrastructure.persistence.sqlite_database import open_database
+
+# 保持期間を過ぎたキーを削除する間隔（秒）
+PRUNE_INTERVAL_SECONDS = 3600
+
+
+class SqliteIdempotencyKeyRepository(IdempotencyKeyRepository):
+    """共有のSQLiteデータベースで冪等キーを記録する実装（複数プロセスで共有可能）"""
+
+    def __init__(
+        self,
+        database_path: str,
+        namespace: str = "",
+        retention_days: int = 30,
+        clock: Optional[Clock] = None,
+    ):
+        """
+        Args:
+            database_path: 共有データベースのパス
+            namespace: キーの名前空間（マルチテナントモードのテナント名、単一設定は ""）
+            retention_days: キーを保持する日数
+            clock: 記録時刻と、保持期間を過ぎたキーを削除する間隔の判定に使う時計
+        """
+        self._namespace = namespace
+        self._retention_seconds = retention_days * 86400
+        self._clock = clock if clock is not None else SystemClock()
+        self._lock = threading.Lock()
+        self._pruned_at: Optional[float] = None
+        self._connection = open_database(database_path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS idempotency_keys ("
+            " namespace TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " claimed_at REAL NOT NULL,"
+            " PRIMARY KEY (namespace, key))"
+        )
+
+    def claim(self, key: str) -> bool:
+        self._prune_if_due()
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT OR IGNORE INTO idempotency_keys (namespace, key, claimed_at)"
+                " VALUES (?, ?, ?)",
+                (self._namespace, key, self._clock.time()),
+            )
+        return cursor.rowcount == 1
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM idempotency_keys WHERE namespace = ? AND key = ?",
+                (self._namespace, key),
+            )
+
+    def _prune_if_due(self) -> None:
+        """保持期間を過ぎたキーを削除（PRUNE_INTERVAL_SECONDS に1回）"""
+        now = self._clock.monotonic()
+        if self._pruned_at is not None and now - self._pruned_at < PRUNE_INTERVAL_SECONDS:
+            return
+        self._pruned_at = now
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM idempotency_keys WHERE claimed_at < ?",
+                (self._clock.time() - self._retention_seconds,),
+            )
+
+    def close(self) -> None:
+        """データベースの接続を閉じる"""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,63 @@
+"""SQLiteでのリースの実装
+
+LeaseRepositoryインターフェースの具象実装
+リースごとに保持者と期限（UNIX秒）を1行で持ち、取得・延長は1つのUPSERT文で不可分に行う。
+"""
+
+import threading
+from typing import Optional
+
+from domain.repositories.lease_repository import LeaseRepository
+from application.services.clock import Clock, SystemClock
+from infrastructure.persistence.sqlite_database import open_database
+
+
+class SqliteLeaseRepository(LeaseRepository):
+    """共有のSQLiteデータベースでリースを管理する実装"""
+
+    def __init__(self, database_path: str, clock: Optional[Clock] = None):
+        """
+        Args:
+            database_path: 共有データベースのパス
+            clock: リースの期限に使う時計（プロセス間で比較するためUNIX秒を使う）
+        """
+        self._clock = clock if clock is not None else SystemClock()
+        self._lock = threading.Lock()
+        self._connection = open_database(database_path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS leases ("
+            " name TEXT PRIMARY KEY,"
+            " holder TEXT NOT NULL,"
+            " expires_at REAL NOT NULL)"
+        )
+
+    def try_acquire(self, name: str, holder: str, ttl_seconds: float) -> bool:
+        now = self._clock.time()
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO leases (name, holder, expires_at) VALUES (?, ?, ?)"
+                " ON CONFLICT (name) DO UPDATE"
+                " SET holder = excluded.holder, expires_at = excluded.expires_at"
+                " WHERE leases.holder = excluded.holder OR leases.expires_at <= ?",
+                (name, holder, now + ttl_seconds, now),
+            )
+        return cursor.rowcount == 1
+
+    def release(self, name: str, holder: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM leases WHERE name = ? AND holder = ?", (name, holder)
+            )
+
+    def holder(self, name: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT holder FROM leases WHERE name = ? AND expires_at > ?",
+                (name, self._clock.time()),
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def close(self) -> None:
+        """データベースの接続を閉じる"""
+        with self._lock:
+            self._connection.close()
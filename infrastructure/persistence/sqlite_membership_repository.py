@@ -0,0 +1,55 @@
+"""SQLiteでのワーカーの参加状況の共有実装
+
+MembershipRepositoryインターフェースの具象実装
+ワーカーごとに生存期限（UNIX秒）を1行で持ち、期限内の行を生存しているワーカーとみなす。
+"""
+
+import threading
+from typing import List, Optional
+
+from domain.repositories.membership_repository import MembershipRepository
+from application.services.clock import Clock, SystemClock
+from infrastructure.persistence.sqlite_database import open_database
+
+
+class SqliteMembershipRepository(MembershipRepository):
+    """共有のSQLiteデータベースでワーカーの生存を管理する実装"""
+
+    def __init__(self, database_path: str, clock: Optional[Clock] = None):
+        """
+        Args:
+            database_path: 共有データベースのパス
+            clock: 生存期限に使う時計（プロセス間で比較するためUNIX秒を使う）
+        """
+        self._clock = clock if clock is not None else SystemClock()
+        self._lock = threading.Lock()
+        self._connection = open_database(database_path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS shard_members ("
+            " worker_id TEXT PRIMARY KEY,"
+            " expires_at REAL NOT NULL)"
+        )
+
+    def heartbeat(self, worker_id: str, ttl_seconds: float) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO shard_members (worker_id, expires_at) VALUES (?, ?)",
+                (worker_id, self._clock.time() + ttl_seconds),
+            )
+
+    def active_members(self) -> List[str]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT worker_id FROM shard_members WHERE expires_at > ? ORDER BY worker_id",
+                (self._clock.time(),),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def leave(self, worker_id: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM shard_members WHERE worker_id = ?", (worker_id,))
+
+    def close(self) -> None:
+        """データベースの接続を閉じる"""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,138 @@
+"""SQLiteでの状態永続化実装
+
+StateRepositoryインターフェースの具象実装
+複数のワーカープロセスで1つのデータベースを共有する（シャーディングで担当が移ったチャンネルの
+前回の状態を新しい担当のワーカーが引き継ぐ）。状態はチャンネルごとの行として保存するため、
+保存のたびに全チャンネル分を書き直すことはない。
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+from domain.value_objects.channel_id import ChannelId
+from domain.repositories.state_repository import StateRepository
+from application.dto.stream_state_dto import StreamStateDto
+from infrastructure.metrics import monitor_metrics as metrics
+from infrastructure.persistence.json_state_repository import StateRepositoryError
+from infrastructure.persistence.sqlite_database import open_database
+
+logger = logging.getLogger(__name__)
+
+# 一括取得の1回の問い合わせに含めるチャンネル数（SQLiteのパラメーター数の上限より小さくする）
+_SELECT_BATCH_SIZE = 500
+
+
+class SqliteStateRepository(StateRepository):
+    """SQLiteで状態を永続化する実装（複数プロセスで共有可能）"""
+
+    def __init__(self, database_path: str, namespace: str = ""):
+        """
+        Args:
+            database_path: 共有データベースのパス
+            namespace: 状態の名前空間（マルチテナントモードのテナント名、単一設定は ""）
+        """
+        self._namespace = namespace
+        self._lock = threading.Lock()
+        self._connection = open_database(database_path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS stream_state ("
+            " namespace TEXT NOT NULL,"
+            " channel_id TEXT NOT NULL,"
+            " state TEXT NOT NULL,"
+            " PRIMARY KEY (namespace, channel_id))"
+        )
+
+    def get_state(self, channel_id: ChannelId) -> Optional[StreamStateDto]:
+        """チャンネルの状態を取得（他のワーカーが保存した最新の状態を読む）"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT state FROM stream_state WHERE namespace = ? AND channel_id = ?",
+                (self._namespace, str(channel_id)),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return StreamStateDto.from_dict(json.loads(row[0]))
+        except (ValueError, KeyError) as e:
+            logger.error(f"状態の読み込みエラー: {channel_id}: {e}")
+            return None
+
+    def save_state(self, channel_id: ChannelId, state: StreamStateDto) -> None:
+        """チャンネルの状態を保存"""
+        started = time.monotonic()
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO stream_state (namespace, channel_id, state)"
+                    " VALUES (?, ?, ?)",
+                    (self._namespace, str(channel_id), json.dumps(state.to_dict())),
+                )
+            logger.debug("状態保存完了: %s", channel_id)
+        except Exception as e:
+            logger.error(f"状態保存エラー: {e}", exc_info=True)
+            raise StateRepositoryError(f"状態保存失敗: {e}") from e
+        metrics.STATE_FLUSH_DURATION.observe(time.monotonic() - started)
+
+    def get_states(self, channel_ids: Sequence[ChannelId]) -> List[Optional[StreamStateDto]]:
+        """複数チャンネルの状態をまとめて取得"""
+        rows: Dict[str, str] = {}
+        for start in range(0, len(channel_ids), _SELECT_BATCH_SIZE):
+            end = start + _SELECT_BATCH_SIZE
+            batch = [channel_id.value for channel_id in channel_ids[start:end]]
+            placeholders = ",".join("?" * len(batch))
+            with self._lock:
+                rows.update(
+                    self._connection.execute(
+                        "SELECT channel_id, state FROM stream_state"
+                        f" WHERE namespace = ? AND channel_id IN ({placeholders})",
+                        (self._namespace, *batch),
+                    ).fetchall()
+                )
+
+        states: List[Optional[StreamStateDto]] = []
+        for channel_id in channel_ids:
+            row = rows.get(channel_id.value)
+            state = None
+            if row is not None:
+                try:
+                    state = StreamStateDto.from_dict(json.loads(row))
+                except (ValueError, KeyError) as e:
+                    logger.error(f"状態の読み込みエラー: {channel_id}: {e}")
+            states.append(state)
+        return states
+
+    def save_states(self, states: Dict[ChannelId, StreamStateDto]) -> None:
+        """複数チャンネルの状態を1つのトランザクションで保存"""
+        if not states:
+            return
+        started = time.monotonic()
+        rows = [
+            (self._namespace, channel_id.value, json.dumps(state.to_dict()))
+            for channel_id, state in states.items()
+        ]
+        try:
+            with self._lock:
+                self._connection.execute("BEGIN IMMEDIATE")
+                try:
+                    self._connection.executemany(
+                        "INSERT OR REPLACE INTO stream_state (namespace, channel_id, state)"
+                        " VALUES (?, ?, ?)",
+                        rows,
+                    )
+                except BaseException:
+                    self._connection.execute("ROLLBACK")
+                    raise
+                self._connection.execute("COMMIT")
+            logger.debug("状態保存完了: %dチャンネル", len(rows))
+        except Exception as e:
+            logger.error(f"状態保存エラー: {e}", exc_info=True)
+            raise StateRepositoryError(f"状態保存失敗: {e}") from e
+        metrics.STATE_FLUSH_DURATION.observe(time.monotonic() - started)
+
+    def close(self) -> None:
+        """データベースの接続を閉じる"""
+        with self._lock:
+            self._connection.close()
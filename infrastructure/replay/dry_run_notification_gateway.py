@@ -0,0 +1,39 @@
+"""送信しない通知ゲートウェイ
+
+記録の再生やシミュレーションで、Discordに送信せずに通知内容をログに出力する
+"""
+
+import logging
+from datetime import timezone
+from typing import List, Optional, Tuple
+
+from domain.entities.channel import Channel
+from domain.entities.stream import Stream
+from domain.repositories.notification_gateway import NotificationGateway
+from domain.value_objects.webhook_delivery import WebhookDelivery
+from application.services.clock import Clock, SystemClock
+
+logger = logging.getLogger(__name__)
+
+
+class DryRunNotificationGateway(NotificationGateway):
+    """通知をログに出力するだけのゲートウェイ"""
+
+    def __init__(self, clock: Optional[Clock] = None):
+        """
+        Args:
+            clock: 送信完了時刻に使う時計（省略時は実際の時刻）
+        """
+        self._clock = clock if clock is not None else SystemClock()
+        self.notifications: List[Tuple[Channel, Stream]] = []  # 送信したことにした通知
+
+    def notify_stream_start(
+        self, channel: Channel, stream: Stream
+    ) -> Optional[List[WebhookDelivery]]:
+        now = self._clock.now(timezone.utc)
+        self.notifications.append((channel, stream))
+        logger.info(
+            f"[dry-run] 配信開始通知: {channel.name} - {stream.title} "
+            f"({stream.video_id}) → {len(channel.webhooks)}件のWebhook"
+        )
+        return [WebhookDelivery(webhook.url, now) for webhook in channel.webhooks]
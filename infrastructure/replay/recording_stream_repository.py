@@ -0,0 +1,141 @@
+"""API応答を記録する配信情報取得リポジトリ
+
+任意のStreamRepositoryをラップするデコレーター。
+取得結果を1呼び出し1行のJSONLとして追記し、ReplayStreamRepository で再生できるようにする。
+
+記録の形式:
+    {"at": "...", "kind": "channels", "results": {チャンネルID: {"stream": {...} | null}
+                                                 | {"error": {"type": ..., "message": ...}}}}
+    {"at": "...", "kind": "videos", "requested": [video ID, ...], "streams": {video ID: {...}}}
+"""
+
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from domain.entities.channel import Channel
+from domain.entities.stream import Stream
+from domain.repositories.errors import QuotaExceededError, RepositoryError
+from domain.repositories.stream_repository import StreamRepository
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.stream_fetch_result import StreamFetchResult
+from domain.value_objects.stream_status import StreamStatus
+from application.services.clock import Clock, SystemClock
+
+logger = logging.getLogger(__name__)
+
+
+def stream_to_dict(stream: Stream) -> Dict[str, Any]:
+    """StreamをJSONに変換"""
+    return {
+        "video_id": stream.video_id,
+        "title": stream.title,
+        "thumbnail_url": stream.thumbnail_url,
+        "started_at": stream.started_at.isoformat(),
+        "status": stream.status.name,
+        "concurrent_viewers": stream.concurrent_viewers,
+        "ended_at": stream.ended_at.isoformat() if stream.ended_at else None,
+    }
+
+
+def stream_from_dict(data: Dict[str, Any]) -> Stream:
+    """JSONからStreamを復元"""
+    return Stream(
+        video_id=data["video_id"],
+        title=data["title"],
+        thumbnail_url=data["thumbnail_url"],
+        started_at=datetime.fromisoformat(data["started_at"]),
+        status=StreamStatus[data["status"]],
+        concurrent_viewers=data.get("concurrent_viewers"),
+        ended_at=datetime.fromisoformat(data["ended_at"]) if data.get("ended_at") else None,
+    )
+
+
+def error_to_dict(error: Exception) -> Dict[str, Any]:
+    """取得エラーをJSONに変換（クォータ超過とそれ以外を区別し、リセット時刻も記録する）"""
+    if isinstance(error, QuotaExceededError):
+        return {
+            "type": "quota",
+            "message": str(error),
+            "reset_at": error.reset_at.isoformat() if error.reset_at else None,
+        }
+    return {"type": "repository", "message": str(error)}
+
+
+def error_from_dict(data: Dict[str, Any]) -> Exception:
+    """JSONから取得エラーを復元"""
+    if data.get("type") == "quota":
+        reset_at = datetime.fromisoformat(data["reset_at"]) if data.get("reset_at") else None
+        return QuotaExceededError(data.get("message", ""), reset_at=reset_at)
+    return RepositoryError(data.get("message", ""))
+
+
+class RecordingStreamRepository(StreamRepository):
+    """取得結果をJSONLファイルに記録するStreamRepositoryのデコレーター"""
+
+    def __init__(self, inner: StreamRepository, file_path: str, clock: Optional[Clock] = None):
+        """
+        Args:
+            inner: ラップするリポジトリ
+            file_path: 記録先のJSONLファイル（追記）
+            clock: 記録時刻に使う時計（省略時は実際の時刻）
+        """
+        self._inner = inner
+        self._file_path = Path(file_path)
+        self._clock = clock if clock is not None else SystemClock()
+        self._lock = threading.Lock()
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        logger.info(f"API応答を記録します: {self._file_path}")
+
+    def get_current_stream(self, channel: Channel) -> Optional[Stream]:
+        try:
+            stream = self._inner.get_current_stream(channel)
+        except Exception as e:
+            self._record_channels({channel.id: StreamFetchResult(error=e)})
+            raise
+        self._record_channels({channel.id: StreamFetchResult(stream=stream)})
+        return stream
+
+    def get_current_streams(self, channels: List[Channel]) -> Dict[ChannelId, StreamFetchResult]:
+        results = self._inner.get_current_streams(channels)
+        self._record_channels(results)
+        return results
+
+    def get_streams(self, video_ids: List[str]) -> Dict[str, Stream]:
+        # 呼び出し全体の失敗は再生できる観測がないため記録しない
+        streams = self._inner.get_streams(video_ids)
+        self._append(
+            {
+                "kind": "videos",
+                "requested": list(video_ids),
+                "streams": {
+                    video_id: stream_to_dict(stream) for video_id, stream in streams.items()
+                },
+            }
+        )
+        return streams
+
+    def _record_channels(self, results: Dict[ChannelId, StreamFetchResult]) -> None:
+        entries: Dict[str, Dict[str, Any]] = {}
+        for channel_id, result in results.items():
+            if result.error is not None:
+                entries[str(channel_id)] = {"error": error_to_dict(result.error)}
+            else:
+                entries[str(channel_id)] = {
+                    "stream": stream_to_dict(result.stream) if result.stream else None
+                }
+        self._append({"kind": "channels", "results": entries})
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        record = {"at": self._clock.now(timezone.utc).isoformat(), **record}
+        line = json.dumps(record, ensure_ascii=False)
+        try:
+            with self._lock:
+                with open(self._file_path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+        except OSError as e:
+            # 記録の失敗で監視を止めない
+            logger.warning(f"API応答の記録に失敗: {e}")
@@ -0,0 +1,131 @@
+"""記録したAPI応答を再生する配信情報取得リポジトリ
+
+RecordingStreamRepository が記録したJSONLを読み込み、時計の現在時刻の時点で
+チャンネル・動画ごとに最後に観測された結果を返す。YouTube APIは呼び出さない。
+
+仮想時計（VirtualClock）と組み合わせると、記録した1日分の監視を数秒で再現できる。
+"""
+
+import bisect
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from domain.entities.channel import Channel
+from domain.entities.stream import Stream
+from domain.repositories.stream_repository import StreamRepository
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.stream_fetch_result import StreamFetchResult
+from application.services.clock import Clock, VirtualClock
+from infrastructure.replay.recording_stream_repository import error_from_dict, stream_from_dict
+
+logger = logging.getLogger(__name__)
+
+# (観測時刻のUNIX秒, 観測内容) を時刻順に並べたもの
+_Timeline = List[Tuple[float, Dict[str, Any]]]
+
+
+class ReplayStreamRepository(StreamRepository):
+    """記録したAPI応答を時計の時刻に合わせて返すリポジトリ"""
+
+    def __init__(self, file_path: str, clock: Optional[Clock] = None):
+        """
+        Args:
+            file_path: RecordingStreamRepository が記録したJSONLファイル
+            clock: 再生位置を決める時計（省略時は記録の開始時刻から始まる仮想時計）
+
+        Raises:
+            ValueError: 記録が空の場合
+        """
+        self._channels: Dict[str, _Timeline] = {}
+        self._videos: Dict[str, _Timeline] = {}
+        self._times: List[datetime] = []
+        self._load(Path(file_path))
+        if not self._times:
+            raise ValueError(f"再生する記録がありません: {file_path}")
+        self.clock: Clock = clock if clock is not None else VirtualClock(self.started_at)
+        logger.info(
+            f"記録を再生します: {file_path} "
+            f"({self.started_at.isoformat()} 〜 {self.ended_at.isoformat()}, "
+            f"{len(self._channels)}チャンネル / {len(self._videos)}動画)"
+        )
+
+    @property
+    def started_at(self) -> datetime:
+        """記録の開始時刻"""
+        return self._times[0]
+
+    @property
+    def ended_at(self) -> datetime:
+        """記録の終了時刻"""
+        return self._times[-1]
+
+    def get_current_stream(self, channel: Channel) -> Optional[Stream]:
+        observation = self._latest(self._channels, str(channel.id))
+        if observation is None:
+            return None
+        if "error" in observation:
+            raise error_from_dict(observation["error"])
+        return stream_from_dict(observation["stream"]) if observation.get("stream") else None
+
+    def get_current_streams(self, channels: List[Channel]) -> Dict[ChannelId, StreamFetchResult]:
+        results: Dict[ChannelId, StreamFetchResult] = {}
+        for channel in channels:
+            try:
+                results[channel.id] = StreamFetchResult(stream=self.get_current_stream(channel))
+            except Exception as e:
+                results[channel.id] = StreamFetchResult(error=e)
+        return results
+
+    def get_streams(self, video_ids: List[str]) -> Dict[str, Stream]:
+        streams: Dict[str, Stream] = {}
+        for video_id in video_ids:
+            observation = self._latest(self._videos, video_id)
+            if observation is not None and observation.get("stream"):
+                streams[video_id] = stream_from_dict(observation["stream"])
+        return streams
+
+    def _latest(self, timelines: Dict[str, _Timeline], key: str) -> Optional[Dict[str, Any]]:
+        """現在時刻以前で最後の観測（まだ観測がない場合はNone）"""
+        timeline = timelines.get(key)
+        if not timeline:
+            return None
+        index = bisect.bisect_right(timeline, self.clock.time(), key=lambda item: item[0])
+        return timeline[index - 1][1] if index > 0 else None
+
+    def _load(self, path: Path) -> None:
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    at = datetime.fromisoformat(record["at"])
+                except (ValueError, KeyError) as e:
+                    logger.warning(f"記録の{line_number}行目を読み飛ばしました: {e}")
+                    continue
+                self._times.append(at)
+                self._add(record, at.timestamp())
+
+        self._times.sort()
+        for timelines in (self._channels, self._videos):
+            for timeline in timelines.values():
+                timeline.sort(key=lambda item: item[0])
+
+    def _add(self, record: Dict[str, Any], at: float) -> None:
+        if record.get("kind") == "channels":
+            for channel_id, observation in record.get("results", {}).items():
+                self._channels.setdefault(channel_id, []).append((at, observation))
+                # チャンネル単位の観測も、その動画の状態として video ID 指定の問い合わせに使う
+                stream = observation.get("stream")
+                if stream:
+                    self._videos.setdefault(stream["video_id"], []).append((at, observation))
+        elif record.get("kind") == "videos":
+            streams = record.get("streams", {})
+            for video_id in record.get("requested", []):
+                # 要求したのに返らなかった動画は削除済みとして記録する
+                self._videos.setdefault(video_id, []).append(
+                    (at, {"stream": streams.get(video_id)})
+                )
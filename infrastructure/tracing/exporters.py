@@ -0,0 +1,184 @@
+"""スパンのエクスポーター
+
+- JsonlSpanExporter: 1スパン1行のJSONLファイル（サイズでローテーション）
+- OtlpHttpSpanExporter: OTLP/HTTP（JSON）でローカルのコレクターへ送信
+"""
+
+import json
+import logging
+import queue
+import threading
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Any, Dict, List
+
+import requests
+
+from application.services.tracer import Span, SpanExporter
+
+logger = logging.getLogger(__name__)
+
+
+class JsonlSpanExporter(SpanExporter):
+    """スパンを1行1件のJSONとしてローテーション付きファイルに追記する"""
+
+    def __init__(self, file_path: str, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5):
+        """
+        Args:
+            file_path: 出力先ファイルパス
+            max_bytes: ローテーションするファイルサイズ
+            backup_count: 残す世代数
+        """
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        # ローテーションと排他制御はログのファイルハンドラーと同じ仕組みを使う
+        self._handler = RotatingFileHandler(
+            file_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str)
+        self._handler.handle(logging.makeLogRecord({"msg": line, "levelno": logging.INFO}))
+
+    def shutdown(self) -> None:
+        self._handler.close()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """属性値をOTLPのAnyValueに変換"""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+def to_otlp_span(span: Span) -> Dict[str, Any]:
+    """スパンをOTLP/JSONのSpanに変換"""
+    otlp_span: Dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,  # SPAN_KIND_INTERNAL
+        "startTimeUnixNano": str(span.start_time_ns),
+        "endTimeUnixNano": str(span.end_time_ns or span.start_time_ns),
+        "attributes": _otlp_attributes(span.attributes),
+        "events": [
+            {
+                "name": name,
+                "timeUnixNano": str(timestamp),
+                "attributes": _otlp_attributes(attributes),
+            }
+            for name, timestamp, attributes in span.events
+        ],
+        # STATUS_CODE_OK = 1, STATUS_CODE_ERROR = 2
+        "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+    }
+    if span.parent_span_id:
+        otlp_span["parentSpanId"] = span.parent_span_id
+    return otlp_span
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    """OTLP/HTTP（JSON）でスパンをまとめて送信する
+
+    送信はバックグラウンドスレッドで行い、監視処理を待たせない。
+    コレクターが止まっている間に溜まったスパンは上限を超えた分から捨てる。
+    """
+
+    DEFAULT_ENDPOINT = "http://127.0.0.1:4318/v1/traces"
+
+    def __init__(
+        self,
+        endpoint: str = DEFAULT_ENDPOINT,
+        service_name: str = "live-stream-discord-bot",
+        batch_size: int = 256,
+        flush_interval: float = 5.0,
+        max_queue_size: int = 2048,
+        timeout: float = 5.0,
+    ):
+        """
+        Args:
+            endpoint: コレクターのトレース受信URL
+            service_name: リソース属性 service.name
+            batch_size: 1回の送信にまとめる最大スパン数
+            flush_interval: 送信間隔（秒）
+            max_queue_size: 送信待ちスパン数の上限
+            timeout: 送信のタイムアウト（秒）
+        """
+        self._endpoint = endpoint
+        self._service_name = service_name
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._timeout = timeout
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._stopped = threading.Event()
+        self._dropped = 0
+        self._thread = threading.Thread(target=self._run, name="otlp-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self._dropped += 1
+
+    def shutdown(self) -> None:
+        self._stopped.set()
+        self._thread.join(timeout=self._timeout + 1)
+        self._flush()
+
+    def payload(self, spans: List[Span]) -> Dict[str, Any]:
+        """OTLP/JSONの ExportTraceServiceRequest"""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes({"service.name": self._service_name})
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "live-stream-discord-bot"},
+                            "spans": [to_otlp_span(span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._flush_interval):
+            self._flush()
+
+    def _flush(self) -> None:
+        """送信待ちのスパンを batch_size 件ずつ送信"""
+        while True:
+            spans: List[Span] = []
+            while len(spans) < self._batch_size:
+                try:
+                    spans.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not spans:
+                break
+
+            try:
+                response = requests.post(
+                    self._endpoint, json=self.payload(spans), timeout=self._timeout
+                )
+                if response.status_code >= 300:
+                    logger.warning(f"OTLPコレクターへの送信に失敗: status={response.status_code}")
+            except requests.RequestException as e:
+                logger.warning(f"OTLPコレクターへの送信に失敗: {e}")
+
+            if self._dropped:
+                logger.warning(
+                    f"送信待ちの上限を超えたため {self._dropped}件のスパンを破棄しました"
+                )
+                self._dropped = 0
@@ -0,0 +1,86 @@
+"""同梱のディスカバリー文書
+
+googleapiclient の build() は YouTube Data API の全メソッド・全スキーマを含む
+ディスカバリー文書（約400KB）を読み込み、リソースを取得するたびに全メソッドの
+説明文を組み立てる。本アプリが使うメソッドだけに絞り、説明文を除いた文書を
+同梱して build_from_document() に渡すことで、クライアントの生成と
+リクエストの組み立てを軽くする。
+
+同梱の文書は googleapiclient に含まれる文書から生成する:
+    python -m infrastructure.youtube.discovery
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+
+DOCUMENT_PATH = Path(__file__).with_name("youtube.v3.json")
+
+# 使用するリソースとメソッド
+METHODS = {
+    "playlistItems": ("list",),
+    "videos": ("list",),
+    "channels": ("list",),
+}
+
+# クライアントの生成とリクエストの組み立てに不要なキー
+_DROPPED_KEYS = {"description", "enumDescriptions"}
+_DROPPED_TOP_LEVEL_KEYS = {"auth", "description", "documentationLink", "icons", "schemas"}
+
+
+@lru_cache(maxsize=1)
+def load_discovery_document() -> str:
+    """同梱のディスカバリー文書（JSON文字列）"""
+    return DOCUMENT_PATH.read_text(encoding="utf-8")
+
+
+def _strip(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _strip(v) for k, v in value.items() if k not in _DROPPED_KEYS}
+    if isinstance(value, list):
+        return [_strip(v) for v in value]
+    return value
+
+
+def trim_discovery_document(document: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    ディスカバリー文書を使用するメソッドだけに絞る
+
+    レスポンスのスキーマは名前だけを残す（googleapiclient はレスポンスの有無で
+    JSONとして解析するかを決め、スキーマは説明文の生成にしか使わない）。
+    """
+    trimmed = {k: v for k, v in document.items() if k not in _DROPPED_TOP_LEVEL_KEYS}
+    trimmed["parameters"] = _strip(document["parameters"])
+    trimmed["resources"] = {
+        resource: {
+            "methods": {
+                method: _strip(document["resources"][resource]["methods"][method])
+                for method in methods
+            }
+        }
+        for resource, methods in METHODS.items()
+    }
+    trimmed["schemas"] = {
+        method["response"]["$ref"]: {"id": method["response"]["$ref"], "type": "object"}
+        for resource in trimmed["resources"].values()
+        for method in resource["methods"].values()
+    }
+    return trimmed
+
+
+def main() -> None:
+    """googleapiclient に含まれる文書から同梱の文書を再生成"""
+    import googleapiclient
+
+    source = Path(googleapiclient.__file__).parent / "discovery_cache/documents/youtube.v3.json"
+    document = json.loads(source.read_text(encoding="utf-8"))
+    trimmed = trim_discovery_document(document)
+    DOCUMENT_PATH.write_text(
+        json.dumps(trimmed, ensure_ascii=False, indent=1, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    print(f"{DOCUMENT_PATH} を生成しました (revision {trimmed.get('revision')})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""YouTube APIクォータの消費台帳
+
+その日（JST 18:00 始まり、quota_reset を参照）の消費量をエンドポイントごとに記録し、
+再起動をまたいで引き継げるようにする。
+"""
+
+import threading
+from datetime import timezone
+from typing import Any, Dict, Optional
+
+from application.services.clock import Clock, SystemClock
+from application.services.quota_reset import quota_day
+from application.services.warm_state import WarmStateComponent
+from infrastructure.metrics import monitor_metrics as metrics
+
+
+class QuotaLedger(WarmStateComponent):
+    """その日のクォータ消費量をエンドポイントごとに記録する台帳（スレッドセーフ）"""
+
+    def __init__(self, clock: Optional[Clock] = None):
+        """
+        Args:
+            clock: クォータの日の判定に使う時計（省略時は実際の時刻）
+        """
+        self._clock = clock if clock is not None else SystemClock()
+        self._lock = threading.Lock()
+        self._day = quota_day(self._clock.now(timezone.utc))
+        self._units: Dict[str, int] = {}
+        metrics.QUOTA_UNITS_TODAY.set_function(self.used)
+
+    def record(self, endpoint: str, count: int = 1) -> None:
+        """
+        API呼び出しによるクォータ消費を記録
+
+        Args:
+            endpoint: エンドポイント（playlistItems.list など）
+            count: 呼び出し回数
+        """
+        units = metrics.QUOTA_COST.get(endpoint, 1) * count
+        with self._lock:
+            self._roll_over()
+            self._units[endpoint] = self._units.get(endpoint, 0) + units
+
+    def used(self) -> int:
+        """その日に消費したクォータ（units）"""
+        with self._lock:
+            self._roll_over()
+            return sum(self._units.values())
+
+    def by_endpoint(self) -> Dict[str, int]:
+        """その日のエンドポイントごとの消費量"""
+        with self._lock:
+            self._roll_over()
+            return dict(self._units)
+
+    def _roll_over(self) -> None:
+        """クォータの日が変わっていれば台帳をリセット（ロックを取得して呼び出す）"""
+        day = quota_day(self._clock.now(timezone.utc))
+        if day != self._day:
+            self._day = day
+            self._units = {}
+
+    def export_warm_state(self) -> Dict[str, Any]:
+        """クォータの日とエンドポイントごとの消費量"""
+        with self._lock:
+            self._roll_over()
+            return {"day": self._day, "units": dict(self._units)}
+
+    def restore_warm_state(self, state: Dict[str, Any]) -> None:
+        """同じクォータの日に保存した消費量を引き継ぐ（日が変わっていれば捨てる）"""
+        with self._lock:
+            self._roll_over()
+            if state.get("day") != self._day:
+                return
+            for endpoint, units in state.get("units", {}).items():
+                self._units[endpoint] = self._units.get(endpoint, 0) + int(units)
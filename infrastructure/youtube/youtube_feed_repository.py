@@ -0,0 +1,122 @@
+"""YouTubeのRSSフィードを使用した新着動画取得実装
+
+UploadFeedRepositoryインターフェースの具象実装
+
+- https://www.youtube.com/feeds/videos.xml?channel_id=... はAPIキー不要でクォータを消費しない
+- チャンネルごとに最新15件の動画・配信（公開時刻の新しい順）を返す
+- 配信中かどうかは含まれないため、取得した動画の status は UPLOADED
+- 複数チャンネルはスレッドプールで並行に取得する
+"""
+
+import logging
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from domain.entities.channel import Channel
+from domain.entities.stream import Stream
+from domain.repositories.errors import RepositoryError
+from domain.repositories.upload_feed_repository import UploadFeedRepository, latest_upload_since
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.stream_fetch_result import StreamFetchResult
+from domain.value_objects.stream_status import StreamStatus
+from application.services.tracer import get_tracer
+
+logger = logging.getLogger(__name__)
+
+FEED_URL = "https://www.youtube.com/feeds/videos.xml"
+
+_NAMESPACES = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "yt": "http://www.youtube.com/xml/schemas/2015",
+    "media": "http://search.yahoo.com/mrss/",
+}
+
+
+def parse_feed(text: str) -> List[Stream]:
+    """
+    フィード（Atom）を動画のリストに変換
+
+    Returns:
+        新しい順の動画（status は UPLOADED）
+
+    Raises:
+        RepositoryError: フィードを解析できない場合
+    """
+    try:
+        root = ET.fromstring(text)
+    except ET.ParseError as e:
+        raise RepositoryError(f"フィードを解析できません: {e}") from e
+
+    uploads = []
+    for entry in root.findall("atom:entry", _NAMESPACES):
+        video_id = entry.findtext("yt:videoId", namespaces=_NAMESPACES)
+        published = entry.findtext("atom:published", namespaces=_NAMESPACES)
+        if not video_id or not published:
+            continue
+        thumbnail = entry.find("media:group/media:thumbnail", _NAMESPACES)
+        thumbnail_url = thumbnail.get("url") if thumbnail is not None else None
+        uploads.append(
+            Stream(
+                video_id=video_id,
+                title=entry.findtext("atom:title", namespaces=_NAMESPACES) or video_id,
+                thumbnail_url=thumbnail_url or f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg",
+                started_at=datetime.fromisoformat(published.replace("Z", "+00:00")),
+                status=StreamStatus.UPLOADED,
+            )
+        )
+    uploads.sort(key=lambda upload: upload.started_at, reverse=True)
+    return uploads
+
+
+class YouTubeFeedRepository(UploadFeedRepository):
+    """YouTubeのRSSフィードを使用した新着動画取得の実装"""
+
+    def __init__(self, workers: int = 8, timeout: float = 10, feed_url: Optional[str] = None):
+        """
+        Args:
+            workers: 複数チャンネルを並行に取得するスレッド数
+            timeout: 1回の取得のタイムアウト（秒）
+            feed_url: フィードのURL（ベンチマーク用のローカルサーバーなど、省略時は本番）
+        """
+        self._workers = max(1, workers)
+        self._timeout = timeout
+        self._feed_url = feed_url or FEED_URL
+
+    def get_recent_uploads(self, channel: Channel) -> List[Stream]:
+        # requests の読み込みは縮退運転で最初にフィードを取得する時に行う
+        import requests
+
+        with get_tracer().span("youtube.feed", channel_id=channel.id.value) as span:
+            try:
+                response = requests.get(
+                    self._feed_url,
+                    params={"channel_id": channel.id.value},
+                    timeout=self._timeout,
+                )
+            except requests.RequestException as e:
+                raise RepositoryError(f"フィードの取得に失敗 ({channel.id}): {e}") from e
+            span.set_attribute("status_code", response.status_code)
+            if response.status_code != 200:
+                raise RepositoryError(
+                    f"フィードの取得に失敗 ({channel.id}): status={response.status_code}"
+                )
+            return parse_feed(response.text)
+
+    def get_latest_uploads(
+        self, channels: List[Channel], since: datetime
+    ) -> Dict[ChannelId, StreamFetchResult]:
+        def fetch(channel: Channel) -> Optional[StreamFetchResult]:
+            try:
+                latest = latest_upload_since(self.get_recent_uploads(channel), since)
+            except Exception as e:
+                return StreamFetchResult(error=e)
+            return StreamFetchResult(stream=latest) if latest is not None else None
+
+        results: Dict[ChannelId, StreamFetchResult] = {}
+        with ThreadPoolExecutor(max_workers=min(self._workers, max(1, len(channels)))) as pool:
+            for channel, result in zip(channels, pool.map(fetch, channels)):
+                if result is not None:
+                    results[channel.id] = result
+        return results
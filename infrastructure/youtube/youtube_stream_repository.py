@@ -5,80 +5,213 @@ StreamRepositoryインターフェースの具象実装
 コスト最適化版:
 - search.list (100 units) → playlistItems.list (1 unit) + videos.list (1 unit)
 - 合計コスト: 2 units/回（1/50に削減）
+- 配信中の動画の継続・終了確認: videos.list で最大50件を 1 unit で一括確認
+- 複数チャンネルの一括取得: HTTPバッチ（multipart）で最大N件のリクエストを1往復にまとめる
+- 終了済みと判明している動画は videos.list の対象から除外
+- APIクライアントはスレッドごとに生成（複数の取得ワーカーから同時に呼び出せる）
+- APIクライアントは使用するメソッドだけに絞った同梱のディスカバリー文書から生成
+- 最新動画IDと終了済み動画IDはウォーム状態として保存・復元できる
+  （再起動直後も終了済みの動画を videos.list の対象から除外できる）
+- チャンネルの存在確認: channels.list で最大50件を 1 unit で一括確認し、
+  実際のアップロードプレイリストIDを覚えておく（UC→UU の変換はまだ確認していない場合だけ）
 """
 
-from typing import Optional, List, Callable, TypeVar
+from typing import Any, Optional, List, Dict, Iterable, Set, Tuple, Callable, TypeVar
 import logging
+import threading
 import time
-from datetime import datetime, timezone, timedelta
-from googleapiclient.discovery import build
+from datetime import datetime, timezone
+from functools import partial
+from googleapiclient.discovery import build_from_document
 from googleapiclient.errors import HttpError
+from googleapiclient.http import BatchHttpRequest
 
 from domain.entities.channel import Channel
 from domain.entities.stream import Stream
+from domain.repositories.channel_catalog_repository import ChannelCatalogRepository
+from domain.repositories.errors import QuotaExceededError, RepositoryError
 from domain.repositories.stream_repository import StreamRepository
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.channel_metadata import ChannelMetadata
+from domain.value_objects.stream_fetch_result import StreamFetchResult
 from domain.value_objects.stream_status import StreamStatus
+from application.services.quota_reset import next_quota_reset
+from application.services.tracer import get_tracer
+from application.services.warm_state import WarmStateComponent
+from infrastructure.metrics import monitor_metrics as metrics
+from infrastructure.youtube.discovery import load_discovery_document
+from infrastructure.youtube.quota_ledger import QuotaLedger
 
 logger = logging.getLogger(__name__)
 
 
-class RepositoryError(Exception):
-    """リポジトリエラー"""
+T = TypeVar("T")
 
-    pass
 
+class YouTubeStreamRepository(StreamRepository, ChannelCatalogRepository, WarmStateComponent):
+    """YouTube APIを使用した配信情報取得の実装（コスト最適化版）"""
 
-class QuotaExceededError(Exception):
-    """YouTube APIクォータ超過エラー"""
+    # 最新何件の動画をチェックするか
+    MAX_RECENT_VIDEOS = 20
 
-    pass
+    # videos.list 1回で指定できるvideo IDの上限（APIの仕様）
+    MAX_IDS_PER_VIDEOS_REQUEST = 50
 
+    # channels.list 1回で指定できるチャンネルIDの上限（APIの仕様）
+    MAX_IDS_PER_CHANNELS_REQUEST = 50
 
-T = TypeVar("T")
+    # 1回のHTTPバッチにまとめるリクエスト数のデフォルト（Googleの推奨上限は50件）
+    DEFAULT_BATCH_SIZE = 50
 
+    # videos.list で取得するフィールド（レスポンスサイズ削減）
+    VIDEO_FIELDS = (
+        "items(id,"
+        "snippet(title,publishedAt,liveBroadcastContent,thumbnails/high/url),"
+        "liveStreamingDetails(actualStartTime,actualEndTime,concurrentViewers))"
+    )
 
-class YouTubeStreamRepository(StreamRepository):
-    """YouTube APIを使用した配信情報取得の実装（コスト最適化版）"""
+    # playlistItems.list で取得するフィールド
+    PLAYLIST_FIELDS = "items(contentDetails/videoId)"
 
-    # 最新何件の動画をチェックするか
-    MAX_RECENT_VIDEOS = 20
+    # channels.list で取得するフィールド
+    CHANNEL_FIELDS = "items(id,snippet/title,contentDetails/relatedPlaylists/uploads)"
 
     # リトライ設定
     MAX_RETRIES = 3
     RETRY_BACKOFF_BASE = 2  # 秒
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        api_endpoint: Optional[str] = None,
+        quota_ledger: Optional[QuotaLedger] = None,
+    ):
         """
         Args:
             api_key: YouTube Data API v3のAPIキー
+            batch_size: 1回のHTTPバッチにまとめるリクエスト数（1以下でバッチ無効）
+            api_endpoint: APIのベースURL（ベンチマーク用のローカルサーバーなど、省略時は本番）
+            quota_ledger: その日のクォータ消費を記録する台帳（省略時は記録しない）
         """
         self._api_key = api_key
-        self._youtube = build("youtube", "v3", developerKey=api_key)
-
-    @staticmethod
-    def _calculate_wait_until_jst_18() -> int:
+        self._quota_ledger = quota_ledger
+        self._batch_size = batch_size
+        self._api_endpoint = api_endpoint.rstrip("/") + "/" if api_endpoint else None
+        # httplib2はスレッドセーフではないため、APIクライアントはスレッドごとに生成する
+        self._local = threading.local()
+        self._local.youtube = self._build_client()
+
+        # チャンネルごとの最新動画ID（プレイリストの先頭N件）
+        self._recent_video_ids: Dict[str, List[str]] = {}
+        # チャンネルごとの終了済み動画ID（通常動画・終了したアーカイブは再び配信中にならない）
+        self._ended_video_ids: Dict[str, Set[str]] = {}
+        # channels.list で確認したアップロードプレイリストID
+        self._uploads_playlist_ids: Dict[str, str] = {}
+
+    @property
+    def _youtube(self):
+        """呼び出し元スレッド用のAPIクライアント"""
+        youtube = getattr(self._local, "youtube", None)
+        if youtube is None:
+            youtube = self._build_client()
+            self._local.youtube = youtube
+        return youtube
+
+    def _build_client(self):
+        """APIクライアントを生成（同梱のディスカバリー文書を使い、ネットワークにアクセスしない）"""
+        if self._api_endpoint is None:
+            return build_from_document(load_discovery_document(), developerKey=self._api_key)
+        return build_from_document(
+            load_discovery_document(),
+            developerKey=self._api_key,
+            client_options={"api_endpoint": self._api_endpoint},
+        )
+
+    def _new_batch(self) -> BatchHttpRequest:
+        """HTTPバッチを生成（バッチの送信先はディスカバリー文書の rootUrl 固定のため個別に指定）"""
+        if self._api_endpoint is None:
+            return self._youtube.new_batch_http_request()
+        return BatchHttpRequest(batch_uri=self._api_endpoint + "batch")
+
+    def export_warm_state(self) -> Dict[str, Any]:
+        """チャンネルごとの最新動画ID（プレイリストの先頭）と終了済み動画ID"""
+        return {
+            "recent_video_ids": {
+                channel_id: list(video_ids)
+                for channel_id, video_ids in self._recent_video_ids.items()
+            },
+            "ended_video_ids": {
+                channel_id: sorted(video_ids)
+                for channel_id, video_ids in self._ended_video_ids.items()
+                if video_ids
+            },
+        }
+
+    def restore_warm_state(self, state: Dict[str, Any]) -> None:
+        """export_warm_state の内容を復元"""
+        self._recent_video_ids = {
+            channel_id: list(video_ids)
+            for channel_id, video_ids in state.get("recent_video_ids", {}).items()
+        }
+        self._ended_video_ids = {
+            channel_id: set(video_ids)
+            for channel_id, video_ids in state.get("ended_video_ids", {}).items()
+        }
+        logger.info(f"終了済み動画IDを復元: {len(self._ended_video_ids)}チャンネル")
+
+    def _classify_http_error(self, e: HttpError, operation_name: str) -> Optional[Exception]:
         """
-        JST 18:00までの待機時間（秒）を計算
+        HttpErrorをリトライ可否で分類
+
+        Args:
+            e: 発生したHttpError
+            operation_name: 操作名（ログ用）
 
         Returns:
-            JST 18:00までの秒数
+            リトライしないエラーの場合は送出すべき例外、リトライ対象の場合はNone
         """
-        # 現在のJST時刻を取得
-        jst = timezone(timedelta(hours=9))
-        now_jst = datetime.now(jst)
+        endpoint = self._endpoint_of(operation_name)
+
+        # クォータ超過エラーをチェック
+        if e.resp.status == 403:
+            error_details = e.error_details if hasattr(e, "error_details") else []
+            for error in error_details:
+                if isinstance(error, dict) and error.get("reason") == "quotaExceeded":
+                    metrics.API_ERRORS.inc(endpoint=endpoint, reason="quota")
+                    # クォータ超過エラー（リセット時刻を付けて上位レイヤーに渡す）
+                    reset_at = next_quota_reset(datetime.now(timezone.utc))
+                    logger.error(
+                        f"YouTube APIクォータ超過を検出しました"
+                        f"（リセット: {reset_at.strftime('%Y-%m-%d %H:%M')} JST）"
+                    )
+                    return QuotaExceededError(
+                        f"クォータ超過（リセット: {reset_at.isoformat()}）", reset_at=reset_at
+                    )
 
-        # 今日のJST 18:00
-        today_18_jst = now_jst.replace(hour=18, minute=0, second=0, microsecond=0)
+            # クォータ以外の403エラー（権限エラーなど）
+            metrics.API_ERRORS.inc(endpoint=endpoint, reason="client")
+            return RepositoryError(f"YouTube API エラー ({operation_name}): {e}")
 
-        # 既に18:00を過ぎている場合は明日の18:00
-        if now_jst >= today_18_jst:
-            reset_time = today_18_jst + timedelta(days=1)
-        else:
-            reset_time = today_18_jst
+        # 400 (bad request) や 404 はリトライしない
+        if e.resp.status in [400, 404]:
+            metrics.API_ERRORS.inc(endpoint=endpoint, reason="client")
+            return RepositoryError(f"YouTube API エラー ({operation_name}): {e}")
+
+        # 500番台エラーはリトライ対象
+        metrics.API_ERRORS.inc(endpoint=endpoint, reason="server")
+        return None
 
-        # 待機時間を計算
-        wait_seconds = int((reset_time - now_jst).total_seconds())
-        return wait_seconds
+    def _record_api_call(self, endpoint: str, count: int = 1) -> None:
+        """API呼び出しをメトリクスとクォータ台帳に記録"""
+        metrics.record_api_call(endpoint, count)
+        if self._quota_ledger is not None:
+            self._quota_ledger.record(endpoint, count)
+
+    @staticmethod
+    def _endpoint_of(operation_name: str) -> str:
+        """操作名（例: "videos.list (チャンネル名)"）からエンドポイント名を取り出す"""
+        return operation_name.split(" ", 1)[0]
 
     def _retry_on_error(self, func: Callable[[], T], operation_name: str) -> T:
         """
@@ -96,64 +229,172 @@ class YouTubeStreamRepository(StreamRepository):
             RepositoryError: その他のエラーでリトライ回数を超えた場合
         """
         last_error = None
+        endpoint = self._endpoint_of(operation_name)
+
+        with get_tracer().span(f"youtube.{endpoint}", operation=operation_name) as span:
+            for attempt in range(self.MAX_RETRIES):
+                if attempt > 0:
+                    metrics.API_RETRIES.inc(endpoint=endpoint)
+                self._record_api_call(endpoint)
+                span.set_attribute("attempts", attempt + 1)
+                try:
+                    return func()
+                except HttpError as e:
+                    fatal_error = self._classify_http_error(e, operation_name)
+                    if fatal_error is not None:
+                        raise fatal_error from e
+
+                    last_error = e
+                    wait_time = self.RETRY_BACKOFF_BASE**attempt
+                    logger.warning(
+                        f"{operation_name} 失敗 (試行 {attempt + 1}/{self.MAX_RETRIES}): {e}. "
+                        f"{wait_time}秒後にリトライします..."
+                    )
+                    span.add_event("attempt_failed", attempt=attempt + 1, error=str(e))
+                    if attempt < self.MAX_RETRIES - 1:
+                        span.add_event("retry_sleep", seconds=wait_time)
+                        time.sleep(wait_time)
+                except Exception as e:
+                    # その他の例外もリトライ対象
+                    metrics.API_ERRORS.inc(endpoint=endpoint, reason="other")
+                    last_error = e
+                    wait_time = self.RETRY_BACKOFF_BASE**attempt
+                    logger.warning(
+                        f"{operation_name} で予期しないエラー (試行 {attempt + 1}/{self.MAX_RETRIES}): {e}. "
+                        f"{wait_time}秒後にリトライします..."
+                    )
+                    span.add_event("attempt_failed", attempt=attempt + 1, error=str(e))
+                    if attempt < self.MAX_RETRIES - 1:
+                        span.add_event("retry_sleep", seconds=wait_time)
+                        time.sleep(wait_time)
+
+            # 全リトライ失敗
+            raise RepositoryError(
+                f"{operation_name} が{self.MAX_RETRIES}回のリトライ後も失敗しました: {last_error}"
+            ) from last_error
+
+    def _execute_batch(
+        self, requests: Dict[str, Callable[[], object]], operation_name: str
+    ) -> Tuple[Dict[str, dict], Dict[str, Exception]]:
+        """
+        複数のリクエストをHTTPバッチ（multipart）でまとめて実行する
 
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                return func()
-            except HttpError as e:
-                # クォータ超過エラーをチェック
-                if e.resp.status == 403:
-                    error_details = e.error_details if hasattr(e, "error_details") else []
-                    for error in error_details:
-                        if error.get("reason") == "quotaExceeded":
-                            # クォータ超過エラー
-                            wait_seconds = self._calculate_wait_until_jst_18()
-                            logger.error(
-                                f"YouTube APIクォータ超過を検出しました。"
-                                f"JST 18:00まで待機します（約{wait_seconds // 3600}時間{(wait_seconds % 3600) // 60}分）"
-                            )
-                            raise QuotaExceededError(
-                                f"クォータ超過。JST 18:00まで{wait_seconds}秒待機が必要です"
-                            )
+        batch_size件ごとに1往復のHTTPリクエストにまとめ、レスポンスとエラーを
+        リクエストIDごとに振り分ける。500番台などのリトライ対象エラーは、
+        失敗したリクエストのみを指数バックオフ後に再バッチする。
 
-                    # クォータ以外の403エラー（権限エラーなど）
-                    raise RepositoryError(f"YouTube API エラー ({operation_name}): {e}") from e
+        Args:
+            requests: リクエストID → HttpRequestを生成する関数
+            operation_name: 操作名（ログ用）
 
-                # 400 (bad request) や 404 はリトライしない
-                if e.resp.status in [400, 404]:
-                    raise RepositoryError(f"YouTube API エラー ({operation_name}): {e}") from e
+        Returns:
+            (リクエストID → レスポンス, リクエストID → 例外)
+            クォータ超過時は未完了の全リクエストに QuotaExceededError が入る
+        """
+        responses: Dict[str, dict] = {}
+        errors: Dict[str, Exception] = {}
+        pending = dict(requests)
+        last_errors: Dict[str, Exception] = {}
+        quota_error: Optional[QuotaExceededError] = None
+        endpoint = self._endpoint_of(operation_name)
+
+        with get_tracer().span(
+            f"youtube.{endpoint}", operation=operation_name, requests=len(requests)
+        ) as span:
+            for attempt in range(self.MAX_RETRIES):
+                retry: Dict[str, Callable[[], object]] = {}
+                request_ids = list(pending)
+                if attempt > 0:
+                    metrics.API_RETRIES.inc(len(request_ids), endpoint=endpoint)
+
+                for start in range(0, len(request_ids), self._batch_size):
+                    end = start + self._batch_size
+                    chunk = request_ids[start:end]
+
+                    if quota_error is not None:
+                        # クォータ超過後は残りを送信しない
+                        for request_id in chunk:
+                            errors[request_id] = quota_error
+                        continue
+
+                    def callback(request_id, response, exception):
+                        nonlocal quota_error
+                        if exception is None:
+                            responses[request_id] = response
+                            return
+
+                        if isinstance(exception, HttpError):
+                            fatal_error = self._classify_http_error(
+                                exception, f"{operation_name} [{request_id}]"
+                            )
+                            if isinstance(fatal_error, QuotaExceededError):
+                                quota_error = quota_error or fatal_error
+                                errors[request_id] = quota_error
+                                return
+                            if fatal_error is not None:
+                                errors[request_id] = fatal_error
+                                return
+
+                        retry[request_id] = pending[request_id]
+                        last_errors[request_id] = exception
+
+                    batch = self._new_batch()
+                    for request_id in chunk:
+                        batch.add(pending[request_id](), callback=callback, request_id=request_id)
+                    self._record_api_call(endpoint, len(chunk))
+
+                    with get_tracer().span(
+                        "youtube.batch", endpoint=endpoint, attempt=attempt + 1, size=len(chunk)
+                    ) as batch_span:
+                        try:
+                            batch.execute()
+                        except Exception as e:
+                            metrics.API_ERRORS.inc(endpoint=endpoint, reason="other")
+                            batch_span.record_error(e)
+                            # 通信エラーなどでバッチ全体が失敗した場合、未応答のリクエストをリトライ
+                            for request_id in chunk:
+                                if request_id not in responses and request_id not in errors:
+                                    retry[request_id] = pending[request_id]
+                                    last_errors[request_id] = e
+
+                span.set_attribute("attempts", attempt + 1)
+                if quota_error is not None:
+                    for request_id in retry:
+                        errors[request_id] = quota_error
+                    span.set_attribute("quota_exceeded", True)
+                    return responses, errors
+
+                pending = retry
+                if not pending:
+                    break
 
-                # 500番台エラーはリトライ対象
-                last_error = e
                 wait_time = self.RETRY_BACKOFF_BASE**attempt
                 logger.warning(
-                    f"{operation_name} 失敗 (試行 {attempt + 1}/{self.MAX_RETRIES}): {e}. "
-                    f"{wait_time}秒後にリトライします..."
+                    f"{operation_name} で{len(pending)}件失敗 (試行 {attempt + 1}/{self.MAX_RETRIES}). "
+                    f"{wait_time}秒後に失敗分をリトライします..."
                 )
+                span.add_event("attempt_failed", attempt=attempt + 1, failed=len(pending))
                 if attempt < self.MAX_RETRIES - 1:
+                    span.add_event("retry_sleep", seconds=wait_time)
                     time.sleep(wait_time)
-            except Exception as e:
-                # その他の例外もリトライ対象
-                last_error = e
-                wait_time = self.RETRY_BACKOFF_BASE**attempt
-                logger.warning(
-                    f"{operation_name} で予期しないエラー (試行 {attempt + 1}/{self.MAX_RETRIES}): {e}. "
-                    f"{wait_time}秒後にリトライします..."
+
+            # 全リトライ失敗
+            for request_id in pending:
+                last_error = last_errors.get(request_id)
+                errors[request_id] = RepositoryError(
+                    f"{operation_name} [{request_id}] が{self.MAX_RETRIES}回のリトライ後も"
+                    f"失敗しました: {last_error}"
                 )
-                if attempt < self.MAX_RETRIES - 1:
-                    time.sleep(wait_time)
 
-        # 全リトライ失敗
-        raise RepositoryError(
-            f"{operation_name} が{self.MAX_RETRIES}回のリトライ後も失敗しました: {last_error}"
-        ) from last_error
+            span.set_attribute("errors", len(errors))
+            return responses, errors
 
     def _get_uploads_playlist_id(self, channel_id: str) -> str:
         """
-        チャンネルIDからアップロードプレイリストIDを生成
+        チャンネルのアップロードプレイリストIDを取得
 
-        YouTubeの仕様: チャンネルID "UC..." → アップロードプレイリストID "UU..."
-        (最初の'C'を'U'に置換)
+        channels.list で確認済みの場合はそのIDを使う。未確認の場合はYouTubeの仕様に従い
+        チャンネルID "UC..." → アップロードプレイリストID "UU..."（最初の'C'を'U'に置換）とする
 
         Args:
             channel_id: YouTubeチャンネルID
@@ -161,12 +402,93 @@ class YouTubeStreamRepository(StreamRepository):
         Returns:
             アップロードプレイリストID
         """
+        uploads_playlist_id = self._uploads_playlist_ids.get(channel_id)
+        if uploads_playlist_id:
+            return uploads_playlist_id
         if channel_id.startswith("UC"):
             return "UU" + channel_id[2:]
         else:
             # 非標準的なチャンネルIDの場合はエラー
             raise RepositoryError(f"非標準的なチャンネルID形式: {channel_id}")
 
+    def _channels_request(self, channel_ids: List[str]):
+        """channels.list のリクエストを生成 (1 unit, 最大50件)"""
+        return self._youtube.channels().list(
+            part="snippet,contentDetails",
+            id=",".join(channel_ids),
+            maxResults=self.MAX_IDS_PER_CHANNELS_REQUEST,
+            fields=self.CHANNEL_FIELDS,
+        )
+
+    def _playlist_items_request(self, uploads_playlist_id: str):
+        """playlistItems.list のリクエストを生成 (1 unit)"""
+        return self._youtube.playlistItems().list(
+            part="contentDetails",
+            playlistId=uploads_playlist_id,
+            maxResults=self.MAX_RECENT_VIDEOS,
+            fields=self.PLAYLIST_FIELDS,
+        )
+
+    def _videos_request(self, video_ids: List[str]):
+        """videos.list のリクエストを生成 (1 unit, 最大50件)"""
+        return self._youtube.videos().list(
+            part="snippet,liveStreamingDetails",
+            id=",".join(video_ids),
+            fields=self.VIDEO_FIELDS,
+        )
+
+    def _select_candidates(self, channel_id: str, playlist_response: dict) -> List[str]:
+        """
+        playlistItems.list のレスポンスから videos.list で確認が必要な動画IDを選ぶ
+
+        終了済みと判明している動画は除外する。終了済みキャッシュは最新N件に
+        含まれる動画のみ保持するため、チャンネルあたりのサイズはN件で頭打ちになる。
+
+        Args:
+            channel_id: チャンネルID
+            playlist_response: playlistItems.list のレスポンス
+
+        Returns:
+            確認が必要な動画IDのリスト（プレイリスト順）
+        """
+        video_ids = [
+            item["contentDetails"]["videoId"] for item in playlist_response.get("items", [])
+        ]
+        self._recent_video_ids[channel_id] = video_ids
+
+        ended = self._ended_video_ids.get(channel_id, set()).intersection(video_ids)
+        self._ended_video_ids[channel_id] = ended
+
+        return [video_id for video_id in video_ids if video_id not in ended]
+
+    def _remember_streams(self, channel_id: str, streams: Dict[str, Stream]) -> None:
+        """videos.list の結果から終了済みの動画を記録"""
+        ended = self._ended_video_ids.setdefault(channel_id, set())
+        for stream in streams.values():
+            if stream.is_ended():
+                ended.add(stream.video_id)
+
+    def _parse_videos(self, videos_response: dict) -> Dict[str, Stream]:
+        """videos.list のレスポンスを video ID → Stream に変換（解析できない動画はスキップ）"""
+        streams: Dict[str, Stream] = {}
+        for video in videos_response.get("items", []):
+            try:
+                stream = self._parse_video(video)
+            except (KeyError, ValueError) as e:
+                logger.warning(f"動画情報の解析に失敗 ({video.get('id')}): {e}")
+                continue
+            streams[stream.video_id] = stream
+        return streams
+
+    @staticmethod
+    def _find_live_stream(video_ids: List[str], streams: Dict[str, Stream]) -> Optional[Stream]:
+        """プレイリスト順で最初に見つかった配信中の動画を返す"""
+        for video_id in video_ids:
+            stream = streams.get(video_id)
+            if stream is not None and stream.is_live():
+                return stream
+        return None
+
     def get_current_stream(self, channel: Channel) -> Optional[Stream]:
         """
         チャンネルの現在の配信を取得
@@ -174,78 +496,54 @@ class YouTubeStreamRepository(StreamRepository):
         コスト最適化版:
         1. playlistItems.list で最新N件の動画IDを取得 (1 unit)
         2. videos.list で一括取得してliveBroadcastContent='live'をチェック (1 unit)
-        合計: 2 units/回
+        合計: 2 units/回（全て終了済みの動画なら videos.list は省略）
         """
         try:
             # Step 1: アップロードプレイリストIDを取得
-            uploads_playlist_id = self._get_uploads_playlist_id(str(channel.id))
+            channel_id = str(channel.id)
+            uploads_playlist_id = self._get_uploads_playlist_id(channel_id)
 
             # Step 2: playlistItems.listで最新N件の動画IDを取得 (1 unit) - リトライ付き
-            def fetch_playlist_items():
-                playlist_request = self._youtube.playlistItems().list(
-                    part="contentDetails",
-                    playlistId=uploads_playlist_id,
-                    maxResults=self.MAX_RECENT_VIDEOS,
-                )
-                return playlist_request.execute()
-
             playlist_response = self._retry_on_error(
-                fetch_playlist_items, f"playlistItems.list ({channel.name})"
+                lambda: self._playlist_items_request(uploads_playlist_id).execute(),
+                f"playlistItems.list ({channel.name})",
             )
 
-            items = playlist_response.get("items", [])
-            if not items:
-                logger.debug(f"動画なし: {channel.name}")
+            if not playlist_response.get("items"):
+                logger.debug("動画なし: %s", channel.name, extra={"channel_id": channel_id})
                 return None
 
-            # 動画IDのリストを作成
-            video_ids = [item["contentDetails"]["videoId"] for item in items]
-
-            # Step 3: videos.listで一括取得 (1 unit) - リトライ付き
-            def fetch_videos():
-                videos_request = self._youtube.videos().list(
-                    part="snippet,liveStreamingDetails", id=",".join(video_ids)
+            # 終了済みの動画を除いた確認対象の動画ID
+            video_ids = self._select_candidates(channel_id, playlist_response)
+            if not video_ids:
+                logger.debug(
+                    "配信なし（新しい動画なし）: %s", channel.name, extra={"channel_id": channel_id}
                 )
-                return videos_request.execute()
+                return None
 
-            videos_response = self._retry_on_error(fetch_videos, f"videos.list ({channel.name})")
+            # Step 3: videos.listで一括取得 (1 unit) - リトライ付き
+            videos_response = self._retry_on_error(
+                lambda: self._videos_request(video_ids).execute(),
+                f"videos.list ({channel.name})",
+            )
 
             # Step 4: liveBroadcastContent='live'の動画を探す
-            for video in videos_response.get("items", []):
-                snippet = video["snippet"]
-                live_broadcast_content = snippet.get("liveBroadcastContent", "none")
-
-                if live_broadcast_content == "live":
-                    # 配信中の動画を発見
-                    video_id = video["id"]
-
-                    # liveStreamingDetailsから実際の開始時刻を取得
-                    live_details = video.get("liveStreamingDetails", {})
-                    actual_start_time = live_details.get("actualStartTime")
-
-                    if actual_start_time:
-                        started_at = datetime.fromisoformat(
-                            actual_start_time.replace("Z", "+00:00")
-                        )
-                    else:
-                        # フォールバック: 公開日時を使用
-                        started_at = datetime.fromisoformat(
-                            snippet["publishedAt"].replace("Z", "+00:00")
-                        )
-
-                    stream = Stream(
-                        video_id=video_id,
-                        title=snippet["title"],
-                        thumbnail_url=snippet["thumbnails"]["high"]["url"],
-                        started_at=started_at,
-                        status=StreamStatus.LIVE,
-                    )
-
-                    logger.debug(f"配信中: {channel.name} - {stream.title}")
-                    return stream
+            streams = self._parse_videos(videos_response)
+            self._remember_streams(channel_id, streams)
+
+            stream = self._find_live_stream(video_ids, streams)
+            if stream is not None:
+                # 配信中の動画を発見
+                logger.debug(
+                    "配信中: %s - %s",
+                    channel.name,
+                    stream.title,
+                    extra={"channel_id": channel_id, "video_id": stream.video_id},
+                )
+                return stream
 
             # 配信中の動画がない
-            logger.debug(f"配信なし: {channel.name}")
+            logger.debug("配信なし: %s", channel.name, extra={"channel_id": channel_id})
             return None
 
         except QuotaExceededError:
@@ -259,3 +557,273 @@ class YouTubeStreamRepository(StreamRepository):
         except Exception as e:
             logger.error(f"予期しないエラー ({channel.name}): {e}", exc_info=True)
             raise RepositoryError(f"配信情報取得エラー: {e}") from e
+
+    def get_current_streams(self, channels: List[Channel]) -> Dict[ChannelId, StreamFetchResult]:
+        """
+        複数チャンネルの現在の配信をHTTPバッチで一括取得
+
+        1. 各チャンネルの playlistItems.list を batch_size 件ずつ1往復にまとめる
+        2. 確認が必要な動画IDを全チャンネル分まとめて50件ずつ videos.list に詰め、
+           それらもHTTPバッチで送信する
+
+        クォータ消費は playlistItems.list がチャンネル数分、videos.list が
+        ceil(確認対象の動画数 / 50) 回となる。
+        """
+        results: Dict[ChannelId, StreamFetchResult] = {}
+
+        if self._batch_size <= 1:
+            # バッチ無効時はチャンネルごとに取得（クォータ超過後は残りを送信しない）
+            quota_error: Optional[QuotaExceededError] = None
+            for channel in channels:
+                if quota_error is not None:
+                    results[channel.id] = StreamFetchResult(error=quota_error)
+                    continue
+                try:
+                    results[channel.id] = StreamFetchResult(stream=self.get_current_stream(channel))
+                except QuotaExceededError as e:
+                    quota_error = e
+                    results[channel.id] = StreamFetchResult(error=e)
+                except RepositoryError as e:
+                    results[channel.id] = StreamFetchResult(error=e)
+            return results
+
+        channels_by_key: Dict[str, Channel] = {}
+        playlist_requests: Dict[str, Callable[[], object]] = {}
+
+        for channel in channels:
+            channel_id = str(channel.id)
+            try:
+                uploads_playlist_id = self._get_uploads_playlist_id(channel_id)
+            except RepositoryError as e:
+                results[channel.id] = StreamFetchResult(error=e)
+                continue
+            channels_by_key[channel_id] = channel
+            playlist_requests[channel_id] = partial(
+                self._playlist_items_request, uploads_playlist_id
+            )
+
+        # Step 1: playlistItems.list をバッチ実行
+        playlist_responses, playlist_errors = self._execute_batch(
+            playlist_requests, "playlistItems.list"
+        )
+        for channel_id, error in playlist_errors.items():
+            results[channels_by_key[channel_id].id] = StreamFetchResult(error=error)
+
+        candidates: Dict[str, List[str]] = {}
+        for channel_id, playlist_response in playlist_responses.items():
+            channel = channels_by_key[channel_id]
+            try:
+                video_ids = self._select_candidates(channel_id, playlist_response)
+            except (KeyError, TypeError) as e:
+                results[channel.id] = StreamFetchResult(
+                    error=RepositoryError(f"配信情報取得エラー ({channel.name}): {e}")
+                )
+                continue
+
+            if not video_ids:
+                logger.debug(
+                    "配信なし（新しい動画なし）: %s", channel.name, extra={"channel_id": channel_id}
+                )
+                results[channel.id] = StreamFetchResult(stream=None)
+                continue
+            candidates[channel_id] = video_ids
+
+        quota_errors = [e for e in playlist_errors.values() if isinstance(e, QuotaExceededError)]
+        if quota_errors:
+            # クォータ超過後は videos.list を送信しない
+            for channel_id in candidates:
+                results[channels_by_key[channel_id].id] = StreamFetchResult(error=quota_errors[0])
+            return results
+
+        # Step 2: 確認対象の動画IDを50件ずつ詰めて videos.list をバッチ実行
+        unique_ids = list(dict.fromkeys(v for ids in candidates.values() for v in ids))
+        chunk_of: Dict[str, str] = {}
+        video_requests: Dict[str, Callable[[], object]] = {}
+        for start in range(0, len(unique_ids), self.MAX_IDS_PER_VIDEOS_REQUEST):
+            end = start + self.MAX_IDS_PER_VIDEOS_REQUEST
+            chunk = unique_ids[start:end]
+            request_id = f"videos-{start // self.MAX_IDS_PER_VIDEOS_REQUEST}"
+            video_requests[request_id] = partial(self._videos_request, chunk)
+            for video_id in chunk:
+                chunk_of[video_id] = request_id
+
+        video_responses, video_errors = self._execute_batch(video_requests, "videos.list")
+
+        streams: Dict[str, Stream] = {}
+        for video_response in video_responses.values():
+            streams.update(self._parse_videos(video_response))
+
+        # Step 3: チャンネルごとに結果を振り分け
+        for channel_id, video_ids in candidates.items():
+            channel = channels_by_key[channel_id]
+            failed = [chunk_of[v] for v in video_ids if chunk_of[v] in video_errors]
+            if failed:
+                results[channel.id] = StreamFetchResult(error=video_errors[failed[0]])
+                continue
+
+            channel_streams = {v: streams[v] for v in video_ids if v in streams}
+            self._remember_streams(channel_id, channel_streams)
+
+            stream = self._find_live_stream(video_ids, channel_streams)
+            if stream is not None:
+                logger.debug(
+                    "配信中: %s - %s",
+                    channel.name,
+                    stream.title,
+                    extra={"channel_id": channel_id, "video_id": stream.video_id},
+                )
+            results[channel.id] = StreamFetchResult(stream=stream)
+
+        logger.debug(
+            "一括取得完了: %dチャンネル (playlistItems %d件, videos %d件)",
+            len(channels),
+            len(playlist_requests),
+            len(video_requests),
+            extra={"quota_units": len(playlist_requests) + len(video_requests)},
+        )
+        return results
+
+    def lookup_channels(
+        self, channel_ids: List[ChannelId]
+    ) -> Dict[ChannelId, Optional[ChannelMetadata]]:
+        """
+        複数チャンネルの存在とアップロードプレイリストIDを channels.list で一括確認
+
+        channels.list は1回で最大50件のIDを指定できるため、コストは ceil(N / 50) units。
+        存在しない・停止されたチャンネルは応答に含まれないため None とする。
+        確認したアップロードプレイリストIDは以降の playlistItems.list で使う。
+        """
+        unique_ids = list(dict.fromkeys(str(channel_id) for channel_id in channel_ids))
+        chunks: List[List[str]] = []
+        for start in range(0, len(unique_ids), self.MAX_IDS_PER_CHANNELS_REQUEST):
+            end = start + self.MAX_IDS_PER_CHANNELS_REQUEST
+            chunks.append(unique_ids[start:end])
+
+        responses: List[dict] = []
+        if self._batch_size <= 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                responses.append(
+                    self._retry_on_error(
+                        self._channels_request(chunk).execute,
+                        f"channels.list ({len(chunk)}件)",
+                    )
+                )
+        else:
+            batch_responses, errors = self._execute_batch(
+                {
+                    f"channels-{index}": partial(self._channels_request, chunk)
+                    for index, chunk in enumerate(chunks)
+                },
+                "channels.list",
+            )
+            if errors:
+                quota_errors = [e for e in errors.values() if isinstance(e, QuotaExceededError)]
+                raise quota_errors[0] if quota_errors else next(iter(errors.values()))
+            responses.extend(batch_responses.values())
+
+        results: Dict[ChannelId, Optional[ChannelMetadata]] = {
+            ChannelId(channel_id): None for channel_id in unique_ids
+        }
+        requested = set(unique_ids)
+        for response in responses:
+            for item in response.get("items", []):
+                channel_id = item.get("id")
+                if channel_id not in requested:
+                    continue
+                uploads = (
+                    item.get("contentDetails", {}).get("relatedPlaylists", {}).get("uploads")
+                    or "UU" + channel_id[2:]
+                )
+                metadata = ChannelMetadata(
+                    channel_id=ChannelId(channel_id),
+                    title=item.get("snippet", {}).get("title", ""),
+                    uploads_playlist_id=uploads,
+                )
+                results[metadata.channel_id] = metadata
+        self.register_channels(metadata for metadata in results.values() if metadata is not None)
+        return results
+
+    def register_channels(self, channels: Iterable[ChannelMetadata]) -> None:
+        """確認済みのアップロードプレイリストIDを以降の playlistItems.list で使う"""
+        for metadata in channels:
+            self._uploads_playlist_ids[str(metadata.channel_id)] = metadata.uploads_playlist_id
+
+    def get_streams(self, video_ids: List[str]) -> Dict[str, Stream]:
+        """
+        video IDを指定して配信の現在の状態を一括取得
+
+        videos.list は1回で最大50件のIDを指定できるため、
+        配信中の動画がN件あってもコストは ceil(N / 50) units で済む。
+        """
+        streams: Dict[str, Stream] = {}
+        unique_ids = list(dict.fromkeys(video_ids))
+
+        for start in range(0, len(unique_ids), self.MAX_IDS_PER_VIDEOS_REQUEST):
+            end = start + self.MAX_IDS_PER_VIDEOS_REQUEST
+            chunk = unique_ids[start:end]
+
+            videos_response = self._retry_on_error(
+                self._videos_request(chunk).execute,
+                f"videos.list (配信中 {len(chunk)}件)",
+            )
+            streams.update(self._parse_videos(videos_response))
+
+        return streams
+
+    @staticmethod
+    def _parse_video(video: dict) -> Stream:
+        """
+        videos.list のレスポンス1件をStreamに変換
+
+        判定ルール:
+        - actualEndTime がある → ENDED
+        - liveBroadcastContent='live' → LIVE
+        - liveBroadcastContent='upcoming' → OFFLINE（配信予定）
+        - それ以外（通常動画・アーカイブ） → ENDED
+
+        Args:
+            video: videos.list の items 要素
+
+        Returns:
+            Streamオブジェクト
+        """
+        snippet = video["snippet"]
+        live_broadcast_content = snippet.get("liveBroadcastContent", "none")
+
+        # liveStreamingDetailsから実際の開始・終了時刻を取得
+        live_details = video.get("liveStreamingDetails", {})
+        actual_start_time = live_details.get("actualStartTime")
+        actual_end_time = live_details.get("actualEndTime")
+
+        if actual_start_time:
+            started_at = datetime.fromisoformat(actual_start_time.replace("Z", "+00:00"))
+        else:
+            # フォールバック: 公開日時を使用
+            started_at = datetime.fromisoformat(snippet["publishedAt"].replace("Z", "+00:00"))
+
+        ended_at = (
+            datetime.fromisoformat(actual_end_time.replace("Z", "+00:00"))
+            if actual_end_time
+            else None
+        )
+
+        if ended_at is not None:
+            status = StreamStatus.ENDED
+        elif live_broadcast_content == "live":
+            status = StreamStatus.LIVE
+        elif live_broadcast_content == "upcoming":
+            status = StreamStatus.OFFLINE
+        else:
+            status = StreamStatus.ENDED
+
+        concurrent_viewers = live_details.get("concurrentViewers")
+
+        return Stream(
+            video_id=video["id"],
+            title=snippet["title"],
+            thumbnail_url=snippet["thumbnails"]["high"]["url"],
+            started_at=started_at,
+            status=status,
+            concurrent_viewers=int(concurrent_viewers) if concurrent_viewers else None,
+            ended_at=ended_at,
+        )
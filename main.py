@@ -2,64 +2,575 @@
 YouTube配信監視システム - メインエントリーポイント
 
 Composition Root: 依存性の注入を行う
+
+使用方法:
+    python main.py                                    # config/config.json で起動
+    python main.py --config a.json --config b.json    # マルチテナントモード
+    python main.py --record data/recording.jsonl      # API応答を記録しながら監視
+    python main.py --replay data/recording.jsonl      # 記録を仮想時計で再生（通知は送信しない）
+    python main.py --once [--due-only]                # 1サイクルだけ実行して終了（cron用）
+    python main.py --worker-id w1                     # 複数のワーカーでチャンネルを分担
+    python main.py --instance-id a                    # 稼働系・待機系の冗長構成
 """
 
+import argparse
 import logging
+import tempfile
+from datetime import timedelta
 from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from config.settings import Settings
-from infrastructure.logging.logger_config import setup_logging
+from infrastructure.logging.logger_config import setup_logging, shutdown_logging
 
 # Domain (interfaces only - no imports from infrastructure)
+from domain.repositories.state_repository import StateRepository
+from domain.repositories.idempotency_key_repository import IdempotencyKeyRepository
+from domain.repositories.stream_repository import StreamRepository
+from domain.repositories.upload_feed_repository import UploadFeedRepository
+from domain.repositories.channel_catalog_repository import ChannelCatalogRepository
+from domain.value_objects.channel_id import ChannelId
 from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from application.use_cases.multi_tenant_monitor_use_case import (
+    MultiTenantMonitorUseCase,
+    Tenant,
+    deduplicate_channels,
+)
 from application.services.stream_change_detector import StreamChangeDetector
+from application.services.stream_fetch_service import StreamFetchService
+from application.services.monitor_pipeline import MonitorPipeline
+from application.services.latency_recorder import LatencyRecorder
+from application.services.live_set_tracker import LiveSetTracker
+from application.services.monitored_channels import MonitoredChannels
+from application.services.shard_assignment import ShardAssignment
+from application.services.leader_election import LeaderElection
+from application.services.quota_degradation import QuotaDegradation
+from application.services.channel_onboarding import ChannelOnboarding
+from application.services.monitor_metrics import MonitorMetrics
+from application.services.tracer import SpanExporter, Tracer, get_tracer, set_tracer
+from application.services.warm_state import WarmStateSnapshot
 
 # Infrastructure (concrete implementations)
-from infrastructure.youtube.youtube_stream_repository import YouTubeStreamRepository
 from infrastructure.discord.discord_notification_gateway import DiscordNotificationGateway
 from infrastructure.persistence.json_state_repository import JsonStateRepository
+from infrastructure.persistence.jsonl_latency_repository import JsonlLatencyRepository
+from infrastructure.persistence.json_warm_state_repository import JsonWarmStateRepository
+from infrastructure.cache.caching_stream_repository import CachingStreamRepository
+from infrastructure.metrics.collectors import latency_collector, pipeline_collector
+from infrastructure.metrics.registry import REGISTRY
+from infrastructure.metrics.registry_monitor_metrics import RegistryMonitorMetrics
+from infrastructure.replay.recording_stream_repository import RecordingStreamRepository
+from infrastructure.replay.replay_stream_repository import ReplayStreamRepository
+from infrastructure.replay.dry_run_notification_gateway import DryRunNotificationGateway
 
 # Presentation
+from presentation.cli.config_reloader import ConfigReloader, config_fingerprint
 from presentation.cli.monitor_controller import MonitorController
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CONFIG_PATH = "config/config.json"
+DEFAULT_STATE_PATH = "data/state.json"
+TENANT_STATE_DIR = "data/tenants"
+LATENCY_LOG_PATH = "data/latency.jsonl"
+WARM_STATE_PATH = "data/warm_state.json"
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="YouTube配信監視システム")
+    parser.add_argument(
+        "--config",
+        action="append",
+        dest="configs",
+        metavar="PATH",
+        help=(
+            "設定ファイルのパス（複数指定でマルチテナントモード: "
+            "チャンネルの取得を共有し、通知先と状態はテナントごとに分離）"
+        ),
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        help="YouTube APIの取得結果をJSONLファイルに記録する（--replay で再生できる）",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        help=(
+            "記録した取得結果を仮想時計で再生する（APIは呼び出さず、通知はログ出力のみ。"
+            "記録の終了時刻に達したら終了）"
+        ),
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help=(
+            "監視サイクルを1回だけ実行して終了する（cron・サーバーレス用）。"
+            "キャッシュと次回の予定時刻は --warm-state に保存して次回の実行に引き継ぐ。"
+            "終了コード: 0=成功, 1=失敗, 3=一部のチャンネルで失敗, 75=クォータ超過"
+        ),
+    )
+    parser.add_argument(
+        "--due-only",
+        action="store_true",
+        help="--once で、前回の実行で記録した予定時刻に達したチェックだけを行う",
+    )
+    parser.add_argument(
+        "--warm-state",
+        metavar="PATH",
+        help=(
+            "再起動・単発実行をまたいで引き継ぐキャッシュ・クォータ消費・予定時刻の保存先"
+            f"（既定: config.json の warm_state.path、未設定の場合は {WARM_STATE_PATH}）"
+        ),
+    )
+    parser.add_argument(
+        "--worker-id",
+        metavar="ID",
+        help=(
+            "シャーディングでのこのワーカーのID（config.json の shard.worker_id より優先）。"
+            "同じ shard.store を使うワーカーでチャンネルを分担する"
+        ),
+    )
+    parser.add_argument(
+        "--instance-id",
+        metavar="ID",
+        help=(
+            "冗長構成でのこのインスタンスのID（config.json の ha.instance_id より優先）。"
+            "同じ ha.store を使うインスタンスのうちリースを持つ1つだけが監視する"
+        ),
+    )
+    args = parser.parse_args(argv)
+    if args.record and args.replay:
+        parser.error("--record と --replay は同時に指定できません")
+    if args.once and args.replay:
+        parser.error("--once と --replay は同時に指定できません")
+    if args.due_only and not args.once:
+        parser.error("--due-only は --once と組み合わせて指定してください")
+    if not args.configs:
+        args.configs = [DEFAULT_CONFIG_PATH]
+    return args
+
+
+def build_stream_repository(
+    settings: Settings,
+    record_path: Optional[str] = None,
+    warm_state: Optional[WarmStateSnapshot] = None,
+) -> Tuple[StreamRepository, ChannelCatalogRepository]:
+    """配信情報取得リポジトリと、チャンネルの確認に使うリポジトリを生成（全テナントで共有）"""
+    # googleapiclient の読み込みが重いため、API を使う場合（--replay 以外）だけ読み込む
+    from infrastructure.youtube.quota_ledger import QuotaLedger
+    from infrastructure.youtube.youtube_stream_repository import YouTubeStreamRepository
+
+    quota_ledger = QuotaLedger()
+    youtube_repository = YouTubeStreamRepository(
+        settings.youtube_api_key, batch_size=settings.api_batch_size, quota_ledger=quota_ledger
+    )
+    if warm_state is not None:
+        # 終了済み動画IDを引き継ぎ、再起動直後の videos.list を減らす
+        warm_state.register("youtube", youtube_repository)
+        warm_state.register("quota", quota_ledger)
+    stream_repository: StreamRepository = youtube_repository
+    if record_path:
+        # キャッシュより内側で記録し、実際のAPI応答だけを残す
+        stream_repository = RecordingStreamRepository(stream_repository, record_path)
+    if settings.cache_ttl > 0 or settings.cache_negative_ttl > 0:
+        # 同一チャンネルへの重複問い合わせをキャッシュで吸収
+        stream_repository = CachingStreamRepository(
+            stream_repository,
+            ttl=settings.cache_ttl,
+            negative_ttl=settings.cache_negative_ttl,
+            stale_ttl=settings.cache_stale_ttl,
+        )
+    return stream_repository, youtube_repository
+
+
+def build_feed_repository(settings: Settings) -> Optional[UploadFeedRepository]:
+    """クォータ超過中の縮退運転で使うRSSフィードのリポジトリ（無効の場合は None）"""
+    if not settings.quota_degradation_enabled:
+        return None
+    from infrastructure.youtube.youtube_feed_repository import YouTubeFeedRepository
+
+    return YouTubeFeedRepository(workers=settings.quota_feed_workers)
+
+
+def build_channel_onboarding(
+    settings: Settings,
+    catalog: ChannelCatalogRepository,
+    config_paths: List[str],
+    metrics: MonitorMetrics,
+) -> Optional[ChannelOnboarding]:
+    """チャンネルの確認と隔離（無効の場合はNone）"""
+    if not settings.channel_onboarding_enabled:
+        return None
+    return ChannelOnboarding(
+        catalog,
+        config_fingerprint=config_fingerprint(config_paths),
+        revalidate_interval=settings.channel_onboarding_revalidate_interval,
+        metrics=metrics,
+    )
+
+
+def build_tracer(settings: Settings) -> Tracer:
+    """トレーサーを生成（tracing.exporter が未設定の場合は記録しない）"""
+    if not settings.tracing_exporter:
+        return Tracer()
+    # エクスポーターは requests を使うため、トレース有効時だけ読み込む
+    from infrastructure.tracing.exporters import JsonlSpanExporter, OtlpHttpSpanExporter
+
+    exporter: SpanExporter
+    if settings.tracing_exporter == "jsonl":
+        exporter = JsonlSpanExporter(settings.tracing_file)
+    elif settings.tracing_exporter == "otlp":
+        exporter = OtlpHttpSpanExporter(settings.tracing_endpoint)
+    else:
+        raise ValueError(
+            f"tracing.exporter は jsonl / otlp のいずれかを指定してください: "
+            f"{settings.tracing_exporter}"
+        )
+    logger.info(
+        f"トレース有効: {settings.tracing_exporter} (サンプリング率 {settings.tracing_sample_ratio})"
+    )
+    return Tracer(exporter, sample_ratio=settings.tracing_sample_ratio)
+
+
+def build_replay_controller(settings: Settings, replay_path: str) -> MonitorController:
+    """
+    記録の再生用のControllerを生成
+
+    記録の開始時刻から始まる仮想時計で監視ループを回し、待機は時刻を進めるだけにする。
+    通知は送信せず、状態は一時ディレクトリに保存して本番の状態ファイルを汚さない。
+    """
+    stream_repository = ReplayStreamRepository(replay_path)
+    clock = stream_repository.clock
+    fetch_service = StreamFetchService(stream_repository)
+    use_case = MonitorStreamsUseCase(
+        stream_repository=stream_repository,
+        notification_gateway=DryRunNotificationGateway(clock),
+        state_repository=JsonStateRepository(
+            str(Path(tempfile.mkdtemp(prefix="replay-")) / "state.json")
+        ),
+        change_detector=StreamChangeDetector(),
+        fetch_service=fetch_service,
+        pipeline=MonitorPipeline(fetch_service, chunk_size=settings.api_batch_size, clock=clock),
+        clock=clock,
+    )
+    return MonitorController(
+        use_case=use_case,
+        channels=settings.channels,
+        check_interval=settings.check_interval,
+        live_check_interval=settings.live_check_interval,
+        clock=clock,
+        # 最後の観測を反映するため、終了時刻の直後のサイクルまで実行する
+        run_until=stream_repository.ended_at + timedelta(seconds=1),
+    )
+
+
+def build_control_server(
+    settings: Settings,
+    controller: MonitorController,
+    live_set: LiveSetTracker,
+    state_repositories: Dict[str, StateRepository],
+):
+    """制御APIのサーバーを生成（control.port が 0 の場合は None）"""
+    if settings.control_port <= 0:
+        return None
+    # http.server の読み込みは制御APIを有効にした場合だけ行う（起動時間の短縮）
+    from presentation.api.control_server import ControlServer
+
+    return ControlServer(
+        controller,
+        settings.control_port,
+        host=settings.control_host,
+        token=settings.control_token,
+        live_set=live_set,
+        state_repositories=state_repositories,
+    )
+
+
+def build_shard(
+    settings: Settings,
+    worker_id: str,
+    on_released: Callable[[ChannelId], None],
+    metrics: MonitorMetrics,
+) -> ShardAssignment:
+    """シャーディングの割り当てを生成（ワーカーの生存は shard.store で共有する）"""
+    from infrastructure.persistence.sqlite_membership_repository import (
+        SqliteMembershipRepository,
+    )
+
+    return ShardAssignment(
+        worker_id,
+        SqliteMembershipRepository(settings.shard_store),
+        replicas=settings.shard_replicas,
+        heartbeat_interval=settings.shard_heartbeat_interval,
+        member_ttl=settings.shard_member_ttl,
+        on_released=on_released,
+        metrics=metrics,
+    )
+
+
+def build_leader_election(
+    settings: Settings, instance_id: str, metrics: MonitorMetrics
+) -> LeaderElection:
+    """冗長構成のリーダー選出を生成（リースは ha.store で共有する）"""
+    from infrastructure.persistence.sqlite_lease_repository import SqliteLeaseRepository
+
+    return LeaderElection(
+        instance_id,
+        SqliteLeaseRepository(settings.ha_store),
+        lease_ttl=settings.ha_lease_ttl,
+        renew_interval=settings.ha_renew_interval,
+        metrics=metrics,
+    )
+
+
+def shared_store_for(settings: Settings, worker_id: str, instance_id: str) -> str:
+    """シャーディング・冗長構成で状態と通知の冪等キーを共有するストア（どちらも無効の場合は ""）"""
+    if worker_id and instance_id and settings.shard_store != settings.ha_store:
+        raise ValueError(
+            "シャーディングと冗長構成を併用する場合は shard.store と ha.store を同じにしてください"
+        )
+    if instance_id:
+        return settings.ha_store
+    if worker_id:
+        return settings.shard_store
+    return ""
+
+
+def worker_path(path: str, worker_id: str) -> str:
+    """ワーカーごとのファイルのパス（data/warm_state.json → data/warm_state.w1.json）"""
+    file_path = Path(path)
+    return str(file_path.with_name(f"{file_path.stem}.{worker_id}{file_path.suffix}"))
+
 
-def main():
+def tenant_name_for(settings: Settings, config_path: str) -> str:
+    """テナント名を決定（config.jsonの tenant_name、なければファイル名）"""
+    return settings.tenant_name or Path(config_path).stem
+
+
+def main(argv: Optional[List[str]] = None):
     """メイン処理"""
     try:
+        args = parse_args(argv)
+
         # 1. 設定読み込み
-        settings = Settings.load("config/config.json")
+        all_settings = [Settings.load(config_path) for config_path in args.configs]
+        settings = all_settings[0]
 
         # 2. ロギング設定
-        setup_logging(settings.log_level, "logs/monitor.log")
+        setup_logging(
+            settings.log_level,
+            "logs/monitor.log",
+            log_format=settings.log_format,
+            sample_ratio=settings.log_sample_ratio,
+        )
 
         logger.info("YouTube配信監視システムを起動します")
 
+        if args.replay:
+            if len(all_settings) > 1:
+                raise ValueError("--replay は設定ファイル1つでのみ使用できます")
+            build_replay_controller(settings, args.replay).start()
+            return 0
+
         # 3. Infrastructure層のインスタンス生成（具象実装）
-        stream_repository = YouTubeStreamRepository(settings.youtube_api_key)
-        notification_gateway = DiscordNotificationGateway(color=settings.notification_color)
-        state_repository = JsonStateRepository("data/state.json")
+        set_tracer(build_tracer(settings))
+        worker_id = args.worker_id or settings.shard_worker_id
+        instance_id = args.instance_id or settings.ha_instance_id
+        shared_store = shared_store_for(settings, worker_id, instance_id)
+        local_id = ".".join(filter(None, [worker_id, instance_id]))
+        warm_state_path = args.warm_state or settings.warm_state_path
+        if local_id and warm_state_path and not args.warm_state:
+            # キャッシュ・クォータ消費・予定時刻はワーカー・インスタンスごとに保存する
+            warm_state_path = worker_path(warm_state_path, local_id)
+        warm_state = (
+            WarmStateSnapshot(JsonWarmStateRepository(warm_state_path)) if warm_state_path else None
+        )
+        stream_repository, catalog = build_stream_repository(
+            settings, record_path=args.record, warm_state=warm_state
+        )
 
         # 4. Application層のサービス生成
+        # アプリケーション層のメトリクスは /metrics で出力するレジストリに記録する
+        monitor_metrics = RegistryMonitorMetrics()
         change_detector = StreamChangeDetector()
+        fetch_service = StreamFetchService(
+            stream_repository, feed_repository=build_feed_repository(settings)
+        )
+        degradation = (
+            QuotaDegradation(
+                stream_repository,
+                probe_interval=settings.quota_probe_interval,
+                metrics=monitor_metrics,
+            )
+            if fetch_service.supports_uploads_feed
+            else None
+        )
+        onboarding = build_channel_onboarding(settings, catalog, args.configs, monitor_metrics)
+        if warm_state is not None:
+            warm_state.register("live_set", fetch_service.live_set)
+            if degradation is not None:
+                # 単発実行でも縮退運転を次の実行に引き継ぐ
+                warm_state.register("quota_degradation", degradation)
+            if onboarding is not None:
+                # 確認済みのアップロードプレイリストIDと隔離を引き継ぎ、再起動時に確認しなおさない
+                warm_state.register("onboarding", onboarding)
+        pipeline = MonitorPipeline(
+            fetch_service,
+            fetch_workers=settings.pipeline_fetch_workers,
+            notify_workers=settings.pipeline_notify_workers,
+            chunk_size=settings.api_batch_size,
+            queue_size=settings.pipeline_queue_size,
+            metrics=monitor_metrics,
+        )
+        # 配信開始 → 通知到達の遅延（全テナント共通で集計）
+        latency_recorder = LatencyRecorder(JsonlLatencyRepository(LATENCY_LOG_PATH))
+
+        def build_state_repository(json_path: str, namespace: str) -> StateRepository:
+            """状態の保存先（シャーディング・冗長構成では担当が移っても引き継げるよう共有）"""
+            if not shared_store:
+                return JsonStateRepository(json_path)
+            from infrastructure.persistence.sqlite_state_repository import SqliteStateRepository
+
+            return SqliteStateRepository(shared_store, namespace=namespace)
+
+        def build_idempotency_keys(namespace: str) -> Optional[IdempotencyKeyRepository]:
+            """通知の冪等キー（共有ストアを使う場合のみ。担当の引き継ぎ時の重複通知を防ぐ）"""
+            if not shared_store:
+                return None
+            from infrastructure.persistence.sqlite_idempotency_key_repository import (
+                SqliteIdempotencyKeyRepository,
+            )
+
+            return SqliteIdempotencyKeyRepository(shared_store, namespace=namespace)
 
         # 5. Use Case生成（依存性注入）
         # ポイント: Use Caseは抽象（インターフェース）のみを知っている
-        use_case = MonitorStreamsUseCase(
-            stream_repository=stream_repository,  # StreamRepository型として注入
-            notification_gateway=notification_gateway,  # NotificationGateway型として注入
-            state_repository=state_repository,  # StateRepository型として注入
-            change_detector=change_detector,
-        )
+        use_case: Union[MonitorStreamsUseCase, MultiTenantMonitorUseCase]
+        if len(all_settings) == 1:
+            notification_gateway = DiscordNotificationGateway(color=settings.notification_color)
+            state_repository = build_state_repository(DEFAULT_STATE_PATH, "")
+
+            use_case = MonitorStreamsUseCase(
+                stream_repository=stream_repository,  # StreamRepository型として注入
+                notification_gateway=notification_gateway,  # NotificationGateway型として注入
+                state_repository=state_repository,  # StateRepository型として注入
+                change_detector=change_detector,
+                fetch_service=fetch_service,
+                pipeline=pipeline,
+                latency_recorder=latency_recorder,
+                idempotency_keys=build_idempotency_keys(""),
+                notified_history_size=settings.notified_history_size,
+                notified_bloom_bits=settings.notified_history_bloom_bits,
+                metrics=monitor_metrics,
+            )
+            channels = settings.channels
+            tenants = None
+            state_repositories: Dict[str, StateRepository] = {"": state_repository}
+        else:
+            # マルチテナント: 取得は共有、通知先と状態の保存先はテナントごと
+            tenants = []
+            state_repositories = {}
+            for config_path, tenant_settings in zip(args.configs, all_settings):
+                name = tenant_name_for(tenant_settings, config_path)
+                state_repositories[name] = build_state_repository(
+                    str(Path(TENANT_STATE_DIR) / name / "state.json"), name
+                )
+                tenant_use_case = MonitorStreamsUseCase(
+                    stream_repository=stream_repository,
+                    notification_gateway=DiscordNotificationGateway(
+                        color=tenant_settings.notification_color
+                    ),
+                    state_repository=state_repositories[name],
+                    change_detector=change_detector,
+                    fetch_service=fetch_service,
+                    pipeline=pipeline,
+                    latency_recorder=latency_recorder,
+                    idempotency_keys=build_idempotency_keys(name),
+                    notified_history_size=tenant_settings.notified_history_size,
+                    notified_bloom_bits=tenant_settings.notified_history_bloom_bits,
+                    metrics=monitor_metrics,
+                )
+                tenants.append(Tenant(name, tenant_settings.channels, tenant_use_case))
+                logger.info(f"テナント '{name}': {len(tenant_settings.channels)}チャンネル")
+
+            use_case = MultiTenantMonitorUseCase(fetch_service, tenants, pipeline=pipeline)
+            channels = deduplicate_channels(tenants)
+            logger.info(
+                f"マルチテナントモード: {len(tenants)}テナント / "
+                f"重複排除後 {len(channels)}チャンネル"
+            )
 
         # 6. Presentation層（Controller）生成
+        # 複数テナントの場合は最も短い間隔に合わせる
+        live_check_intervals = [
+            s.live_check_interval for s in all_settings if s.live_check_interval > 0
+        ]
+        if settings.metrics_port > 0:
+            REGISTRY.register_collector(pipeline_collector(pipeline))
+            REGISTRY.register_collector(latency_collector(latency_recorder))
+
+        def forget_channel(channel_id: ChannelId) -> None:
+            """監視対象から外れたチャンネルを配信中セットとキャッシュから外す"""
+            fetch_service.live_set.untrack(channel_id)
+            if isinstance(stream_repository, CachingStreamRepository):
+                stream_repository.invalidate(channel_id)
+
+        def remove_channel(channel_id: ChannelId) -> None:
+            """監視対象から削除したチャンネルの確認結果も破棄する（再び追加したら確認しなおす）"""
+            forget_channel(channel_id)
+            if onboarding is not None:
+                onboarding.forget(channel_id)
+
+        # 監視対象チャンネルは設定の再読み込みと制御APIで稼働中に変更できる
+        # （クライアント・キャッシュ・状態は再利用する）
+        monitored = MonitoredChannels(channels, tenants=tenants, on_removed=remove_channel)
+        config_reloader = ConfigReloader(
+            args.configs, all_settings, monitored, watch_interval=settings.reload_watch_interval
+        )
+
+        shard = (
+            build_shard(settings, worker_id, forget_channel, monitor_metrics) if worker_id else None
+        )
+        leader = (
+            build_leader_election(settings, instance_id, monitor_metrics) if instance_id else None
+        )
+
         controller = MonitorController(
-            use_case=use_case, channels=settings.channels, check_interval=settings.check_interval
+            use_case=use_case,
+            channels=channels,
+            check_interval=min(s.check_interval for s in all_settings),
+            live_check_interval=min(live_check_intervals) if live_check_intervals else 0,
+            metrics_port=settings.metrics_port,
+            metrics_host=settings.metrics_host,
+            stall_seconds=settings.metrics_stall_seconds,
+            warm_state=warm_state,
+            warm_state_interval=settings.warm_state_save_interval,
+            config_reloader=config_reloader,
+            monitored=monitored,
+            shard=shard,
+            leader=leader,
+            degradation=degradation,
+            onboarding=onboarding,
         )
 
-        # 7. 監視開始
-        controller.start()
+        # 7. 監視開始（前回の終了時のキャッシュと予定時刻を引き継ぐ）
+        if warm_state is not None:
+            warm_state.register("scheduler", controller)
+            warm_state.restore()
+        if args.once:
+            return controller.run_once(due_only=args.due_only)
+        control_server = build_control_server(
+            settings, controller, fetch_service.live_set, state_repositories
+        )
+        if control_server is not None:
+            control_server.start()
+        try:
+            controller.start()
+        finally:
+            if control_server is not None:
+                control_server.stop()
 
     except ValueError as e:
         print(f"設定エラー: {e}")
@@ -75,7 +586,9 @@ def main():
         return 1
 
     finally:
+        get_tracer().shutdown()
         logger.info("システム終了")
+        shutdown_logging()
 
     return 0
 
@@ -0,0 +1,350 @@
+"""制御API
+
+稼働中の監視に対して、監視対象チャンネルの一覧・追加・削除・臨時チェックと状態の参照を
+ローカルのHTTP（JSON）で提供する。
+
+- GET    /state                      監視の状態（次回の予定時刻・チャンネル数・ヘルスチェック・
+                                     隔離中のチャンネル）
+- GET    /channels                   監視対象チャンネルの一覧
+- POST   /channels                   チャンネルを追加（{"id", "name", "webhooks": [{"url", "mention"}],
+                                     "tenant"}、tenant はマルチテナントモードのみ）
+- GET    /channels/{id}              チャンネルの設定・配信中の追跡・前回の状態
+- DELETE /channels/{id}?tenant=...   チャンネルを削除
+- POST   /channels/{id}/check        臨時チェック（通常の監視と同じキャッシュ・クォータの記録を使う）
+
+追加・削除・臨時チェックは MonitorController が監視サイクルの間に監視スレッドで反映・実行する。
+応答は反映まで待つが、wait 秒（既定30秒）を過ぎた場合は 202 を返す（処理はその後に行われる）。
+変更は設定ファイルには保存しない（再起動すると設定ファイルの内容に戻る）。
+
+標準ライブラリの http.server をバックグラウンドスレッドで動かす。
+"""
+
+import hmac
+import json
+import logging
+import threading
+from concurrent.futures import CancelledError, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from domain.entities.channel import Channel
+from domain.repositories.errors import QuotaExceededError
+from domain.repositories.state_repository import StateRepository
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.webhook_config import WebhookConfig
+from application.services.channel_set_diff import ChannelSetDiff
+from application.services.leader_election import NotLeaderError
+from application.services.live_set_tracker import LiveSetTracker
+from presentation.cli.monitor_controller import MonitorController
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE_JSON = "application/json; charset=utf-8"
+
+# リクエストボディの上限（チャンネル1件の追加に十分な大きさ）
+MAX_BODY_BYTES = 64 * 1024
+
+# (HTTPステータス, 応答のJSON)
+Response = Tuple[int, Dict[str, Any]]
+
+
+class ControlError(Exception):
+    """HTTPステータス付きのエラー（202 は受け付けたが処理が終わっていないことを表す）"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ControlServer:
+    """監視対象チャンネルを稼働中に操作するHTTPサーバー"""
+
+    def __init__(
+        self,
+        controller: MonitorController,
+        port: int,
+        host: str = "127.0.0.1",
+        token: str = "",
+        live_set: Optional[LiveSetTracker] = None,
+        state_repositories: Optional[Dict[str, StateRepository]] = None,
+        wait_seconds: float = 30.0,
+    ):
+        """
+        Args:
+            controller: 操作対象の監視
+            port: 待ち受けポート（0の場合は空いているポートを使用）
+            host: 待ち受けアドレス（既定はローカルのみ）
+            token: 指定した場合は Authorization: Bearer <token> を必須にする
+            live_set: 配信中の追跡状況を参照する配信中セット
+            state_repositories: 前回の状態を参照するリポジトリ（テナント名 → リポジトリ、
+                                単一設定の場合のキーは ""）
+            wait_seconds: 追加・削除・臨時チェックの反映を待つ既定の秒数
+        """
+        self._controller = controller
+        self._host = host
+        self._port = port
+        self._token = token
+        self._live_set = live_set
+        self._state_repositories = state_repositories or {}
+        self._wait_seconds = wait_seconds
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        """実際に待ち受けているポート"""
+        return self._server.server_address[1] if self._server else self._port
+
+    def start(self) -> None:
+        """バックグラウンドで待ち受けを開始"""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self._dispatch("GET")
+
+            def do_POST(self):
+                self._dispatch("POST")
+
+            def do_DELETE(self):
+                self._dispatch("DELETE")
+
+            def _dispatch(self, method):
+                if not server._authorized(self.headers.get("Authorization", "")):
+                    self._respond(401, {"error": "unauthorized"})
+                    return
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                    if length > MAX_BODY_BYTES:
+                        raise ControlError(413, "リクエストが大きすぎます")
+                    body = self.rfile.read(length) if length else b""
+                    status, payload = server.handle(method, self.path, body)
+                except ControlError as e:
+                    status = e.status
+                    payload = {"error": str(e)} if status >= 400 else {"message": str(e)}
+                except Exception as e:
+                    logger.error(f"制御APIでエラー発生: {e}", exc_info=True)
+                    status, payload = 500, {"error": "internal error"}
+                self._respond(status, payload)
+
+            def _respond(self, status, payload):
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", CONTENT_TYPE_JSON)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                logger.info(f"control: {self.address_string()} {format % args}")
+
+        self._server = ThreadingHTTPServer((self._host, self._port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="control-server", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"制御API起動: http://{self._host}:{self.port}/channels")
+
+    def stop(self) -> None:
+        """待ち受けを停止"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._server = None
+        self._thread = None
+
+    def _authorized(self, header: str) -> bool:
+        if not self._token:
+            return True
+        return hmac.compare_digest(header.encode(), f"Bearer {self._token}".encode())
+
+    def handle(self, method: str, path: str, body: bytes = b"") -> Response:
+        """
+        リクエストを処理
+
+        Args:
+            method: HTTPメソッド
+            path: パス（クエリ文字列を含む）
+            body: リクエストボディ（JSON）
+
+        Returns:
+            (HTTPステータス, 応答のJSON)
+
+        Raises:
+            ControlError: リクエストが不正な場合・対象が見つからない場合
+        """
+        url = urlsplit(path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split("/") if part]
+
+        if parts == ["state"] and method == "GET":
+            return 200, self._state()
+        if parts == ["channels"]:
+            if method == "GET":
+                channels = self._controller.monitored.channels()
+                return 200, {"channels": [self._summary(channel) for channel in channels]}
+            if method == "POST":
+                return self._add(self._parse_json(body), query)
+        if len(parts) >= 2 and parts[0] == "channels":
+            channel_id = self._parse_channel_id(parts[1])
+            if len(parts) == 2 and method == "GET":
+                return 200, self._detail(channel_id)
+            if len(parts) == 2 and method == "DELETE":
+                return self._remove(channel_id, query)
+            if parts[2:] == ["check"] and method == "POST":
+                return self._check(channel_id, query)
+        raise ControlError(404, f"not found: {method} {url.path}")
+
+    def _state(self) -> Dict[str, Any]:
+        healthy, detail = self._controller.health()
+        leader = self._controller.leader
+        degradation = self._controller.degradation
+        onboarding = self._controller.onboarding
+        monitored = self._controller.monitored
+        return {
+            "channels": len(monitored.channels()),
+            "tenants": monitored.tenant_names(),
+            "live": len(self._live_set) if self._live_set is not None else None,
+            "healthy": healthy,
+            "health": detail,
+            "leader": leader.leader() if leader is not None else None,
+            "quota_degraded": degradation is not None and degradation.active,
+            "quota_reset_at": (
+                degradation.reset_at.isoformat()
+                if degradation is not None and degradation.reset_at is not None
+                else None
+            ),
+            "quarantined_channels": (
+                [str(channel_id) for channel_id in onboarding.quarantined()]
+                if onboarding is not None
+                else []
+            ),
+            **self._controller.export_warm_state(),
+        }
+
+    def _summary(self, channel: Channel) -> Dict[str, Any]:
+        """チャンネルの概要（Webhook URLはトークンを含むため件数のみ）"""
+        summary: Dict[str, Any] = {
+            "id": str(channel.id),
+            "name": channel.name,
+            "webhooks": len(channel.webhooks),
+            "live_video_id": (
+                self._live_set.get_video_id(channel.id) if self._live_set is not None else None
+            ),
+        }
+        if self._controller.monitored.is_multi_tenant:
+            summary["tenants"] = self._controller.monitored.tenants_of(channel.id)
+        return summary
+
+    def _detail(self, channel_id: ChannelId) -> Dict[str, Any]:
+        channel = self._controller.monitored.find(channel_id)
+        if channel is None:
+            raise ControlError(404, f"監視対象ではありません: {channel_id}")
+        detail = self._summary(channel)
+        detail["mentions"] = [webhook.mention for webhook in channel.webhooks]
+        if self._live_set is not None:
+            detail["concurrent_viewers"] = self._live_set.get_concurrent_viewers(channel_id)
+        detail["state"] = {}
+        for tenant, repository in self._state_repositories.items():
+            state = repository.get_state(channel_id)
+            detail["state"][tenant] = state.to_dict() if state is not None else None
+        return detail
+
+    def _add(self, data: Dict[str, Any], query: Dict[str, str]) -> Response:
+        try:
+            channel = Channel(
+                id=ChannelId(str(data["id"])),
+                name=str(data["name"]),
+                webhooks=[
+                    WebhookConfig(url=str(webhook["url"]), mention=str(webhook.get("mention", "")))
+                    for webhook in data.get("webhooks", [])
+                ],
+                mention=str(data.get("mention", "")),
+            )
+        except KeyError as e:
+            raise ControlError(400, f"必須の項目がありません: {e}")
+        except (TypeError, AttributeError, ValueError) as e:
+            raise ControlError(400, str(e))
+        tenant = data.get("tenant") or query.get("tenant")
+
+        def add():
+            monitored = self._controller.monitored
+            if any(c.id == channel.id for c in monitored.tenant_channels(tenant)):
+                raise ControlError(409, f"既に監視対象です: {channel.id}")
+            monitored.apply(ChannelSetDiff(added=[channel]), tenant=tenant)
+            logger.info(f"制御APIでチャンネルを追加: {channel.name} ({channel.id})")
+
+        self._wait(self._controller.call_soon(add), query)
+        return 201, self._summary(channel)
+
+    def _remove(self, channel_id: ChannelId, query: Dict[str, str]) -> Response:
+        tenant = query.get("tenant")
+
+        def remove():
+            monitored = self._controller.monitored
+            channel = next(
+                (c for c in monitored.tenant_channels(tenant) if c.id == channel_id), None
+            )
+            if channel is None:
+                raise ControlError(404, f"監視対象ではありません: {channel_id}")
+            monitored.apply(ChannelSetDiff(removed=[channel]), tenant=tenant)
+            logger.info(f"制御APIでチャンネルを削除: {channel.name} ({channel.id})")
+
+        self._wait(self._controller.call_soon(remove), query)
+        return 200, {"id": str(channel_id), "removed": True}
+
+    def _check(self, channel_id: ChannelId, query: Dict[str, str]) -> Response:
+        if self._controller.monitored.find(channel_id) is None:
+            raise ControlError(404, f"監視対象ではありません: {channel_id}")
+        summary = self._wait(self._controller.request_check([channel_id]), query)
+        detail = self._detail(channel_id)
+        detail["cycle"] = {
+            "live": summary.live,
+            "started": summary.started,
+            "notified": summary.notified,
+            "errors": summary.errors,
+        }
+        return 200, detail
+
+    def _wait(self, future: Future, query: Dict[str, str]) -> Any:
+        """監視スレッドでの処理を待つ（待ちきれない場合は202、処理の失敗はエラー応答）"""
+        try:
+            timeout = float(query.get("wait", self._wait_seconds))
+        except ValueError:
+            raise ControlError(400, f"wait は秒数で指定してください: {query.get('wait')}")
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # 監視サイクルの実行中。処理は次の待機中に行われる
+            raise ControlError(202, "受け付けました（監視サイクルの終了後に処理します）")
+        except CancelledError:
+            raise ControlError(503, "監視を終了しています")
+        except QuotaExceededError as e:
+            raise ControlError(429, f"YouTube APIクォータ超過: {e}")
+        except NotLeaderError:
+            raise ControlError(503, "待機系のインスタンスです（リーダーに依頼してください）")
+        except ValueError as e:
+            raise ControlError(400, str(e))
+
+    @staticmethod
+    def _parse_json(body: bytes) -> Dict[str, Any]:
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError as e:
+            raise ControlError(400, f"JSONを解析できません: {e}")
+        if not isinstance(data, dict):
+            raise ControlError(400, "JSONオブジェクトを指定してください")
+        return data
+
+    @staticmethod
+    def _parse_channel_id(value: str) -> ChannelId:
+        try:
+            return ChannelId(value)
+        except ValueError as e:
+            raise ControlError(400, str(e))
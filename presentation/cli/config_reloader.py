@@ -0,0 +1,184 @@
+"""設定の再読み込み
+
+SIGHUP の受信、または設定ファイルの更新の検知を契機に設定ファイルを読み直し、
+監視対象チャンネルとWebhookの変更だけを差分で反映する。
+
+- 全ての設定ファイルを読み込んで検証できた場合だけ反映する（失敗時は現在の設定のまま）
+- YouTubeクライアント・キャッシュ・状態・次回の予定時刻は作り直さない
+- 差分は設定ファイルの前回の内容との比較で求めて MonitoredChannels に適用するため、
+  制御APIで追加・削除したチャンネルは設定ファイルで変更されない限りそのまま残る
+- チャンネル以外の設定の変更は再起動後に反映する（警告のみ）
+"""
+
+import hashlib
+import logging
+import os
+from dataclasses import fields
+from typing import List, Optional, Tuple
+
+from application.services.channel_set_diff import ChannelSetDiff, diff_channels
+from application.services.clock import Clock, SystemClock
+from application.services.monitored_channels import MonitoredChannels
+from config.settings import Settings
+from infrastructure.metrics import monitor_metrics as metrics
+
+logger = logging.getLogger(__name__)
+
+# 設定ファイルの更新の判定に使う (更新時刻ns, サイズ)。ファイルがない場合はNone
+_Signature = Optional[Tuple[int, int]]
+
+
+def config_fingerprint(config_paths: List[str]) -> str:
+    """
+    設定ファイルの内容のフィンガープリント（内容が変わった場合だけ変わる）
+
+    更新時刻だけの変更（touch・同じ内容の書き直し）では変わらない。
+    読み込めないファイルは空として扱う。
+    """
+    digest = hashlib.sha256()
+    for path in config_paths:
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+        except OSError:
+            content = b""
+        digest.update(hashlib.sha256(content).digest())
+    return digest.hexdigest()
+
+
+class ConfigReloader:
+    """設定ファイルを読み直して監視対象チャンネルの差分を反映する"""
+
+    def __init__(
+        self,
+        config_paths: List[str],
+        settings: List[Settings],
+        monitored: MonitoredChannels,
+        watch_interval: int = 5,
+        clock: Optional[Clock] = None,
+    ):
+        """
+        Args:
+            config_paths: 設定ファイルのパス（起動時と同じ順序）
+            settings: 起動時に読み込んだ設定（config_paths と同じ順序）
+            monitored: 差分を適用する監視対象チャンネル（マルチテナントモードでは
+                       テナントが config_paths と同じ順序であること）
+            watch_interval: 設定ファイルの更新を確認する間隔（秒、0で無効・SIGHUPのみ）
+            clock: 確認間隔の計測に使う時計
+        """
+        if len(config_paths) != len(settings):
+            raise ValueError("config_paths と settings の数が一致しません")
+        if monitored.is_multi_tenant and len(monitored.tenant_names()) != len(settings):
+            raise ValueError("テナントと settings の数が一致しません")
+
+        self._config_paths = list(config_paths)
+        self._settings = list(settings)
+        self._monitored = monitored
+        self._watch_interval = watch_interval
+        self._clock = clock if clock is not None else SystemClock()
+        self._signatures = self._read_signatures()
+        self._polled_at = self._clock.monotonic()
+
+    def poll(self) -> bool:
+        """
+        前回の読み込みの後に設定ファイルが更新されたか（watch_interval ごとに確認する）
+
+        Returns:
+            更新されていればTrue（確認間隔に達していない場合はFalse）
+        """
+        if self._watch_interval <= 0:
+            return False
+        now = self._clock.monotonic()
+        if now - self._polled_at < self._watch_interval:
+            return False
+        self._polled_at = now
+        return self._read_signatures() != self._signatures
+
+    def reload(self) -> bool:
+        """
+        設定ファイルを読み直し、監視対象チャンネルの変更を反映
+
+        Returns:
+            変更を反映した場合はTrue（変更がない場合・読み込みに失敗した場合はFalse）
+        """
+        # 読み込みに失敗した内容を確認のたびに読み直さないよう、先に記録する
+        self._signatures = self._read_signatures()
+
+        try:
+            new_settings = [Settings.load(path) for path in self._config_paths]
+            self._validate(new_settings)
+        except Exception as e:
+            # 書きかけのファイル・不正な値では反映しない
+            logger.error(f"設定の再読み込みに失敗したため、現在の設定で監視を続けます: {e}")
+            metrics.CONFIG_RELOADS.inc(result="error")
+            return False
+
+        diffs = [
+            diff_channels(old.channels, new.channels)
+            for old, new in zip(self._settings, new_settings)
+        ]
+        self._warn_restart_required(new_settings)
+        self._settings = new_settings
+
+        if all(diff.is_empty for diff in diffs):
+            logger.info("設定を再読み込みしました（監視対象チャンネルの変更なし）")
+            metrics.CONFIG_RELOADS.inc(result="unchanged")
+            return False
+
+        # ここまでで全ての設定の検証が済んでいるため、以降は失敗しない
+        tenants: List[Optional[str]] = [*self._monitored.tenant_names()] or [None]
+        for path, tenant, diff in zip(self._config_paths, tenants, diffs):
+            if not diff.is_empty:
+                self._monitored.apply(diff, tenant=tenant)
+                self._log_diff(path, diff)
+        logger.info(f"設定を再読み込みしました: 監視チャンネル数 {len(self._monitored.channels())}")
+        metrics.CONFIG_RELOADS.inc(result="applied")
+        return True
+
+    def fingerprint(self) -> str:
+        """設定ファイルの現在の内容のフィンガープリント"""
+        return config_fingerprint(self._config_paths)
+
+    def _validate(self, new_settings: List[Settings]) -> None:
+        """再読み込みで反映できない変更を検出"""
+        for path, old, new in zip(self._config_paths, self._settings, new_settings):
+            # テナント名は状態ファイルの保存先を決めるため、稼働中には変更できない
+            if old.tenant_name != new.tenant_name:
+                raise ValueError(
+                    f"{path}: tenant_name の変更は再起動が必要です "
+                    f"({old.tenant_name!r} → {new.tenant_name!r})"
+                )
+
+    def _warn_restart_required(self, new_settings: List[Settings]) -> None:
+        """チャンネル以外の設定の変更を警告（再起動後に反映）"""
+        for path, old, new in zip(self._config_paths, self._settings, new_settings):
+            changed = [
+                f.name
+                for f in fields(Settings)
+                if f.name != "channels" and getattr(old, f.name) != getattr(new, f.name)
+            ]
+            if changed:
+                logger.warning(
+                    f"{path}: 次の設定の変更は再起動後に反映されます: {', '.join(changed)}"
+                )
+
+    @staticmethod
+    def _log_diff(path: str, diff: ChannelSetDiff) -> None:
+        logger.info(f"{path}: 監視対象チャンネルの変更 ({diff.describe()})")
+        for channel in diff.added:
+            logger.info(f"  + {channel.name} ({channel.id}) - Webhook数: {len(channel.webhooks)}")
+        for channel in diff.removed:
+            logger.info(f"  - {channel.name} ({channel.id})")
+        for channel in diff.changed:
+            logger.info(f"  * {channel.name} ({channel.id}) - Webhook数: {len(channel.webhooks)}")
+
+    def _read_signatures(self) -> List[_Signature]:
+        signatures: List[_Signature] = []
+        for path in self._config_paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                signatures.append(None)
+                continue
+            signatures.append((stat.st_mtime_ns, stat.st_size))
+        return signatures
@@ -4,35 +4,135 @@
 """
 
 import logging
-import time
+import queue
 import signal
-from datetime import datetime
-from typing import List
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 import pytz
 
 from domain.entities.channel import Channel
+from domain.repositories.errors import QuotaExceededError
+from domain.value_objects.channel_id import ChannelId
 from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
-from infrastructure.youtube.youtube_stream_repository import QuotaExceededError
+from application.use_cases.multi_tenant_monitor_use_case import MultiTenantMonitorUseCase
+from application.services.channel_onboarding import ChannelOnboarding
+from application.services.clock import Clock, SystemClock
+from application.services.leader_election import LeaderElection, NotLeaderError
+from application.services.monitor_pipeline import CycleSummary
+from application.services.monitored_channels import MonitoredChannels
+from application.services.quota_degradation import QuotaDegradation
+from application.services.quota_reset import next_quota_reset
+from application.services.shard_assignment import ShardAssignment
+from application.services.warm_state import WarmStateComponent, WarmStateSnapshot
+from infrastructure.metrics import monitor_metrics as metrics
+
+if TYPE_CHECKING:
+    from infrastructure.metrics.metrics_server import MetricsServer
+    from presentation.cli.config_reloader import ConfigReloader
 
 logger = logging.getLogger(__name__)
 
+# run_once の終了コード
+EXIT_OK = 0
+EXIT_ERROR = 1  # 監視サイクルが失敗した
+EXIT_PARTIAL = 3  # 一部のチャンネルの取得・検出・通知に失敗した
+EXIT_QUOTA_EXCEEDED = 75  # クォータ超過（EX_TEMPFAIL: リセット後に再実行する）
 
-class MonitorController:
+# 予定時刻の直前に起動された場合もチェックを行う猶予（cronの起動時刻のずれを吸収）
+DUE_TOLERANCE_SECONDS = 5
+
+
+class MonitorController(WarmStateComponent):
     """監視を制御するCLIコントローラー"""
 
     def __init__(
-        self, use_case: MonitorStreamsUseCase, channels: List[Channel], check_interval: int
+        self,
+        use_case: Union[MonitorStreamsUseCase, MultiTenantMonitorUseCase],
+        channels: List[Channel],
+        check_interval: int,
+        live_check_interval: int = 0,
+        metrics_port: int = 0,
+        metrics_host: str = "127.0.0.1",
+        stall_seconds: int = 900,
+        clock: Optional[Clock] = None,
+        run_until: Optional[datetime] = None,
+        warm_state: Optional[WarmStateSnapshot] = None,
+        warm_state_interval: int = 300,
+        config_reloader: Optional["ConfigReloader"] = None,
+        monitored: Optional[MonitoredChannels] = None,
+        shard: Optional[ShardAssignment] = None,
+        leader: Optional[LeaderElection] = None,
+        degradation: Optional[QuotaDegradation] = None,
+        onboarding: Optional[ChannelOnboarding] = None,
     ):
         """
         Args:
-            use_case: 配信監視ユースケース
-            channels: 監視対象チャンネル
+            use_case: 配信監視ユースケース（マルチテナントモードではテナントをまとめたもの）
+            channels: 監視対象チャンネル（monitored を指定した場合は無視）
             check_interval: チェック間隔（秒）
+            live_check_interval: 配信中チャンネルの継続・終了確認間隔（秒、0で無効）
+            metrics_port: /metrics と /healthz を提供するポート（0で無効）
+            metrics_host: メトリクスサーバーの待ち受けアドレス
+            stall_seconds: 監視サイクルの成功がこの秒数途絶えたら停止とみなす（/healthz 用）
+            clock: スケジュールと待機に使う時計（省略時は実際の時刻、再生時は仮想時計）
+            run_until: この時刻（タイムゾーン付き）を過ぎたら監視を終了する（省略時は無期限）
+            warm_state: キャッシュ・予定時刻のスナップショット（監視サイクルの後に定期的に、
+                        および終了時に保存する。省略時は保存しない）
+            warm_state_interval: スナップショットを保存する間隔（秒）
+            config_reloader: SIGHUP・設定ファイルの更新で監視対象チャンネルを差し替える
+                             （待機中に反映する。省略時は再読み込みしない）
+            monitored: 稼働中に変更できる監視対象チャンネル（省略時は channels から作成）
+            shard: 複数のワーカーでチャンネルを分担する場合の割り当て（担当分だけを監視する。
+                   省略時は全チャンネルを監視）
+            leader: 稼働系・待機系の冗長構成のリーダー選出（リーダーの間だけ監視する。
+                    省略時は常に監視）
+            degradation: クォータ超過中の縮退運転（新着動画フィードで検知し、クォータの回復を
+                         確認して通常の監視に戻る。省略時はクォータのリセットまで監視を止める）
+            onboarding: チャンネルの確認と隔離（監視の前に未確認のチャンネルを確認し、
+                        見つからないチャンネルを監視しない。省略時は確認しない）
         """
         self._use_case = use_case
-        self._channels = channels
+        self._monitored = monitored if monitored is not None else MonitoredChannels(channels)
         self._check_interval = check_interval
+        self._live_check_interval = live_check_interval
         self._running = False
+        self._clock = clock if clock is not None else SystemClock()
+        self._run_until = run_until
+
+        self._metrics_server: Optional["MetricsServer"] = None
+        if metrics_port > 0:
+            # http.server の読み込みはメトリクスを有効にした場合だけ行う（起動時間の短縮）
+            from infrastructure.metrics import metrics_server
+
+            self._metrics_server = metrics_server.MetricsServer(
+                metrics_port, host=metrics_host, health_check=self.health
+            )
+        self._stall_seconds = stall_seconds
+        self._started_at = self._clock.monotonic()
+        self._last_success_at: Optional[float] = None  # 最後に監視サイクルが成功した時刻
+        self._quota_wait_until: Optional[float] = None  # クォータ超過で待機中の場合の終了時刻
+        # 次回の通常チェック・配信中チェックの予定時刻（UNIX秒、ウォーム状態として引き継ぐ）
+        self._next_check_at: Optional[float] = None
+        self._next_live_check_at: Optional[float] = None
+        self._warm_state = warm_state
+        self._warm_state_interval = warm_state_interval
+        self._warm_state_saved_at: Optional[float] = None
+        self._config_reloader = config_reloader
+        self._reload_requested = False
+        self._shard = shard
+        self._leader = leader
+        self._degradation = degradation
+        self._onboarding = onboarding
+        # 待機系からリーダーになった場合に待機を打ち切り、すぐに監視サイクルを行う
+        self._wake_requested = False
+        # 別スレッド（制御API）から依頼され、監視サイクルの間に監視スレッドで実行する処理
+        self._commands: "queue.SimpleQueue[Tuple[Callable[[], Any], Future]]" = queue.SimpleQueue()
+        # 臨時チェックの依頼（チャンネルID, 結果）。次の待機中または通常の監視サイクルでまとめて行う
+        self._check_requests: List[Tuple[List[ChannelId], Future]] = []
+        self._check_lock = threading.Lock()
+        metrics.SECONDS_SINCE_LAST_SUCCESS.set_function(self._seconds_since_last_success)
 
     def start(self) -> None:
         """監視を開始"""
@@ -41,39 +141,65 @@ class MonitorController:
         # シグナルハンドラー設定（Ctrl+C対応）
         signal.signal(signal.SIGINT, self._handle_shutdown)
         signal.signal(signal.SIGTERM, self._handle_shutdown)
+        if self._config_reloader is not None and hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, self._handle_reload)
 
         logger.info("=" * 60)
         logger.info("YouTube配信監視システム起動")
-        logger.info(f"監視チャンネル数: {len(self._channels)}")
+        logger.info(f"監視チャンネル数: {len(self.channels)}")
+        if self._shard is not None:
+            logger.info(f"シャーディング有効: ワーカーID {self._shard.worker_id}")
+        if self._leader is not None:
+            logger.info(f"冗長構成: インスタンスID {self._leader.instance_id}")
         logger.info(f"チェック間隔: {self._check_interval}秒 (5分)")
+        if self._live_check_interval > 0:
+            logger.info(f"配信中チャンネルの確認間隔: {self._live_check_interval}秒")
         logger.info("=" * 60)
 
-        for channel in self._channels:
+        for channel in self.channels:
             webhook_count = len(channel.webhooks)
             logger.info(f"  - {channel.name} ({channel.id}) - Webhook数: {webhook_count}")
 
         logger.info("=" * 60)
         logger.info("監視開始（Ctrl+Cで終了）")
 
-        # 初回は即座にチェック
+        if self._metrics_server is not None:
+            self._metrics_server.start()
+        if self._leader is not None:
+            self._leader.start()
+
+        # 初回は即座にチェック（ウォーム状態から次回の予定時刻を引き継いだ場合はその時刻まで待つ）
         first_check = True
+        restored_wait = True
 
         # 監視ループ
         while self._running:
+            if self._run_until is not None and self._clock.now(timezone.utc) >= self._run_until:
+                logger.info("終了時刻に達したため監視を終了します")
+                break
+
+            self._wake_requested = False
             try:
+                if restored_wait:
+                    # 待機中の配信中チェックのエラー（クォータ超過など）も通常のサイクルと同様に扱う
+                    restored_wait = False
+                    if self._wait_for_restored_schedule():
+                        continue
+
                 # 現在時刻（JST）を取得
                 jst = pytz.timezone("Asia/Tokyo")
-                now_jst = datetime.now(jst)
+                now_jst = self._clock.now(jst)
                 logger.info(f"チェック実行: {now_jst.strftime('%Y-%m-%d %H:%M:%S JST')}")
 
-                self._use_case.execute(self._channels)
+                self._run_cycle()
+                self._save_warm_state()
 
                 if self._running:  # 終了フラグチェック
                     # 次の5の倍数まで待機
-                    wait_seconds = self._calculate_wait_until_next_5min()
+                    wait_seconds = self._schedule_next_checks()
 
                     # 次のチェック時刻を計算（表示用）
-                    next_time = datetime.now(jst).replace(second=0, microsecond=0)
+                    next_time = self._clock.now(jst).replace(second=0, microsecond=0)
                     minutes_now = next_time.minute
                     next_5min = ((minutes_now // 5) + 1) * 5
                     if next_5min >= 60:
@@ -89,30 +215,35 @@ class MonitorController:
                     if first_check:
                         first_check = False
 
-                    self._wait_with_interrupt_check(
-                        wait_seconds, check_interval=1, show_progress=False
-                    )
+                    self._wait_with_live_checks(wait_seconds)
 
             except QuotaExceededError as e:
-                # クォータ超過エラー: JST 18:00まで待機
                 logger.error(f"YouTube APIクォータ超過: {e}")
+                if self._degradation is not None:
+                    # 縮退運転に切り替え、通常と同じ間隔で新着動画フィードを確認する
+                    self._degradation.enter(e)
+                    if self._running:
+                        self._wait_with_live_checks(self._schedule_next_checks())
+                    continue
 
-                # エラーメッセージから待機秒数を抽出
-                wait_seconds = self._extract_wait_seconds(str(e))
+                # 縮退運転しない場合はクォータのリセットまで待機
+                wait_seconds = self._quota_wait_seconds(e)
 
                 if wait_seconds > 0:
                     hours = wait_seconds // 3600
                     minutes = (wait_seconds % 3600) // 60
-                    logger.info(f"JST 18:00まで待機します（約{hours}時間{minutes}分）...")
+                    logger.info(f"クォータのリセットまで待機します（約{hours}時間{minutes}分）...")
                     logger.info("待機中はCtrl+Cで中断できます")
 
-                    # 待機（1分ごとにチェックして終了フラグを確認）
-                    self._wait_with_interrupt_check(wait_seconds)
+                    # 待機（1秒ごとに終了フラグと制御APIからの依頼を確認）
+                    self._quota_wait_until = self._clock.monotonic() + wait_seconds
+                    self._wait_with_interrupt_check(wait_seconds, check_interval=1)
+                    self._quota_wait_until = None
 
                     if self._running:
                         logger.info("待機完了。監視を再開します...")
                 else:
-                    logger.error("待機時間の計算に失敗しました。60秒後にリトライします...")
+                    logger.error("リセット時刻を過ぎています。60秒後にリトライします...")
                     self._wait_with_interrupt_check(60, check_interval=1, show_progress=False)
 
             except Exception as e:
@@ -121,22 +252,249 @@ class MonitorController:
                     self._check_interval, check_interval=1, show_progress=False
                 )
 
-    def _extract_wait_seconds(self, error_message: str) -> int:
+        # 終了シグナル（デプロイ時の SIGTERM など）でもキャッシュを引き継げるよう保存する
+        self._save_warm_state(force=True)
+        self._cancel_requests()
+        if self._shard is not None:
+            self._shard.leave()
+        if self._leader is not None:
+            self._leader.stop()
+
+        if self._metrics_server is not None:
+            self._metrics_server.stop()
+
+    def run_once(self, due_only: bool = False) -> int:
         """
-        エラーメッセージから待機秒数を抽出
+        監視サイクルを1回だけ実行して終了コードを返す（cron・サーバーレスからの単発実行用）
+
+        due_only の場合は、前回の実行で記録した予定時刻に達したチェックだけを行う。
+        通常チェックの予定時刻前でも、配信中チェックの予定時刻を過ぎていれば配信中チェックのみ行う。
+        warm_state を指定した場合は、実行後にスナップショットを保存する。
 
         Args:
-            error_message: エラーメッセージ
+            due_only: 予定時刻に達したチェックだけを行う
 
         Returns:
-            待機秒数（抽出失敗時は0）
+            EXIT_OK / EXIT_PARTIAL / EXIT_QUOTA_EXCEEDED / EXIT_ERROR
         """
-        import re
+        exit_code = self._run_once(due_only)
+        self._save_warm_state(force=True)
+        logger.info(f"単発実行を終了します (終了コード {exit_code})")
+        return exit_code
+
+    def _run_once(self, due_only: bool) -> int:
+        """予定に応じて通常チェックまたは配信中チェックを1回実行し、終了コードを返す"""
+        now = self._clock.time()
+        if self._leader is not None and not self._leader.renew():
+            # 単発実行では終了時にリースを手放さず、起動間隔をまたいでリーダーを続ける
+            logger.info(f"待機系のため実行しません (リーダー: {self._leader.leader()})")
+            return EXIT_OK
+        try:
+            if not due_only or self._is_due(self._next_check_at, now):
+                summary = self._run_cycle()
+                self._schedule_next_checks()
+            elif self._live_check_interval > 0 and self._is_due(self._next_live_check_at, now):
+                if self._degraded():
+                    # 縮退運転中はAPIでの配信中チェックを行わない
+                    self._next_live_check_at = now + self._live_check_interval
+                    return EXIT_OK
+                summary = self._use_case.check_live_streams(self._active_channels())
+                self._next_live_check_at = self._clock.time() + self._live_check_interval
+            else:
+                logger.info("予定時刻に達したチェックがないため終了します")
+                return EXIT_OK
+
+        except QuotaExceededError as e:
+            logger.error(f"YouTube APIクォータ超過: {e}")
+            if self._degradation is not None:
+                # 縮退運転に切り替え（状態はウォーム状態で引き継ぐ）、以降の単発実行も
+                # 通常と同じ予定で新着動画フィードとクォータの回復を確認する
+                self._degradation.enter(e)
+                self._schedule_next_checks()
+                return EXIT_QUOTA_EXCEEDED
+            # リセットまでの単発実行ではAPIを呼び出さない
+            wait_seconds = self._quota_wait_seconds(e)
+            if wait_seconds > 0:
+                self._next_check_at = now + wait_seconds
+                self._next_live_check_at = now + wait_seconds
+            return EXIT_QUOTA_EXCEEDED
+
+        except Exception as e:
+            logger.error(f"監視サイクルでエラー発生: {e}", exc_info=True)
+            return EXIT_ERROR
+
+        return EXIT_PARTIAL if summary.errors else EXIT_OK
+
+    @staticmethod
+    def _is_due(scheduled_at: Optional[float], now: float) -> bool:
+        """予定時刻に達したか（予定がない場合は達したとみなす）"""
+        return scheduled_at is None or now >= scheduled_at - DUE_TOLERANCE_SECONDS
+
+    def _schedule_next_checks(self) -> int:
+        """
+        監視サイクルの後に次回の予定時刻を記録
 
-        match = re.search(r"(\d+)秒待機", error_message)
-        if match:
-            return int(match.group(1))
-        return 0
+        Returns:
+            次回の通常チェックまでの待機秒数
+        """
+        wait_seconds = self._calculate_wait_until_next_5min()
+        now = self._clock.time()
+        self._next_check_at = now + wait_seconds
+        if self._live_check_interval > 0:
+            self._next_live_check_at = now + self._live_check_interval
+        return wait_seconds
+
+    def _wait_for_restored_schedule(self) -> bool:
+        """
+        引き継いだ次回の予定時刻が未来の場合、配信中チェックを続けながらその時刻まで待つ
+
+        Returns:
+            待機した場合True（終了・終了時刻の確認からやり直す）
+        """
+        if self._next_check_at is None:
+            return False
+        wait_seconds = int(self._next_check_at - self._clock.time())
+        if wait_seconds <= 0:
+            return False
+        logger.info(f"前回の予定時刻まで {wait_seconds}秒 待機してから通常チェックを再開します")
+        self._wait_with_live_checks(wait_seconds)
+        return True
+
+    def _save_warm_state(self, force: bool = False) -> None:
+        """
+        ウォーム状態を保存
+
+        Args:
+            force: 前回の保存からの経過時間に関係なく保存する
+        """
+        if self._warm_state is None:
+            return
+        now = self._clock.monotonic()
+        if (
+            not force
+            and self._warm_state_saved_at is not None
+            and now - self._warm_state_saved_at < self._warm_state_interval
+        ):
+            return
+        try:
+            self._warm_state.save()
+        except Exception as e:
+            # 次回の起動がキャッシュなしになるだけなので、監視は継続する
+            logger.warning(f"ウォーム状態を保存できませんでした: {e}")
+            return
+        self._warm_state_saved_at = now
+
+    def export_warm_state(self) -> Dict[str, Any]:
+        """次回の通常チェック・配信中チェックの予定時刻"""
+        return {
+            "next_check_at": self._next_check_at,
+            "next_live_check_at": self._next_live_check_at,
+        }
+
+    def restore_warm_state(self, state: Dict[str, Any]) -> None:
+        """export_warm_state の内容を復元"""
+        self._next_check_at = state.get("next_check_at")
+        self._next_live_check_at = state.get("next_live_check_at")
+
+    def _run_cycle(self) -> CycleSummary:
+        """監視サイクルを1回実行し、所要時間と結果をメトリクスに記録"""
+        if self._leader is not None and not self._leader.is_leader:
+            logger.info(f"待機系のため監視サイクルを行いません (リーダー: {self._leader.leader()})")
+            self._resolve(self._take_check_requests(), error=NotLeaderError("待機系です"))
+            return CycleSummary()
+        if self._degradation is not None and not self._degradation.probe_if_due():
+            return self._run_degraded_cycle(self._degradation)
+        channels = self._active_channels()
+        # サイクルの開始前に依頼された臨時チェックはこのサイクルの結果で応答する（重複して取得しない）
+        covered = self._take_check_requests()
+        started = self._clock.monotonic()
+        result = "error"
+        try:
+            channels = self._onboard(channels)
+            summary = self._use_case.execute(channels)
+            result = "success"
+            self._resolve(covered, summary)
+            return summary
+        except BaseException as e:
+            if isinstance(e, QuotaExceededError):
+                result = "quota"
+            self._resolve(covered, error=e)
+            raise
+        finally:
+            finished = self._clock.monotonic()
+            metrics.CYCLE_DURATION.observe(finished - started)
+            metrics.CYCLES.inc(result=result)
+            metrics.CYCLE_CHANNELS.set(len(channels))
+            metrics.CHANNELS_CHECKED.inc(len(channels))
+            if result == "success":
+                self._last_success_at = finished
+                metrics.LAST_SUCCESS.set(self._clock.time())
+
+    def _run_degraded_cycle(self, degradation: QuotaDegradation) -> CycleSummary:
+        """縮退運転中の監視サイクル（新着動画フィードで検知し、APIは呼び出さない）"""
+        channels = self._active_channels()
+        since = degradation.since or self._clock.now(timezone.utc)
+        # 臨時チェックはAPIでの取得が必要なため、縮退運転中は受け付けない
+        self._resolve(self._take_check_requests(), error=self._degraded_error())
+        started = self._clock.monotonic()
+        result = "error"
+        try:
+            summary = self._use_case.execute_degraded(channels, since)
+            result = "degraded"
+            return summary
+        finally:
+            metrics.CYCLE_DURATION.observe(self._clock.monotonic() - started)
+            metrics.CYCLES.inc(result=result)
+            metrics.CYCLE_CHANNELS.set(len(channels))
+
+    def _degraded(self) -> bool:
+        """クォータ超過で縮退運転中か"""
+        return self._degradation is not None and self._degradation.active
+
+    def _degraded_error(self) -> QuotaExceededError:
+        reset_at = self._degradation.reset_at if self._degradation is not None else None
+        return QuotaExceededError("クォータ超過のため縮退運転中です", reset_at=reset_at)
+
+    def _quota_wait_seconds(self, error: QuotaExceededError) -> int:
+        """クォータのリセットまでの秒数（エラーにリセット時刻がない場合は次の JST 18:00 まで）"""
+        now = self._clock.now(timezone.utc)
+        wait_seconds = error.seconds_until_reset(now)
+        if wait_seconds is None:
+            wait_seconds = int((next_quota_reset(now) - now).total_seconds())
+        return wait_seconds
+
+    def _seconds_since_last_success(self) -> Optional[float]:
+        """最後に監視サイクルが成功してからの経過秒数（未成功の場合はNone）"""
+        if self._last_success_at is None:
+            return None
+        return self._clock.monotonic() - self._last_success_at
+
+    def health(self) -> Tuple[bool, str]:
+        """
+        監視サイクルが止まっていないかを判定（/healthz 用）
+
+        クォータ超過による待機中・縮退運転中は正常とみなす。
+
+        Returns:
+            (正常か, 説明)
+        """
+        now = self._clock.monotonic()
+        if self._quota_wait_until is not None and now < self._quota_wait_until:
+            return True, f"quota wait ({int(self._quota_wait_until - now)}s left)"
+        degradation = self._degradation
+        if degradation is not None and degradation.active:
+            return (
+                True,
+                f"degraded: quota exceeded ({degradation.seconds_until_reset()}s left)",
+            )
+        if self._leader is not None and not self._leader.is_leader:
+            return True, "standby"
+
+        last = self._last_success_at if self._last_success_at is not None else self._started_at
+        elapsed = now - last
+        if elapsed > self._stall_seconds:
+            return False, f"stalled: no successful cycle for {int(elapsed)}s"
+        return True, f"ok: last successful cycle {int(elapsed)}s ago"
 
     def _wait_with_interrupt_check(
         self, total_seconds: int, check_interval: int = 60, show_progress: bool = True
@@ -151,10 +509,17 @@ class MonitorController:
         """
         remaining = total_seconds
 
-        while remaining > 0 and self._running:
+        while remaining > 0 and self._running and not self._wake_requested:
             sleep_time = min(check_interval, remaining)
-            time.sleep(sleep_time)
+            self._clock.sleep(sleep_time)
             remaining -= sleep_time
+            self._apply_config_reload()
+            self._process_requests()
+            if self._shard is not None:
+                self._shard.heartbeat_if_due()
+            if self._leader is not None and self._leader.take_promotion():
+                logger.info("リーダーを引き継いだため監視サイクルを開始します")
+                self._wake_requested = True
 
             # 進捗をログ出力（10分ごと、show_progressがTrueの場合のみ）
             if show_progress and remaining > 0 and remaining % 600 == 0:
@@ -162,6 +527,30 @@ class MonitorController:
                 minutes = (remaining % 3600) // 60
                 logger.info(f"残り待機時間: 約{hours}時間{minutes}分")
 
+    def _wait_with_live_checks(self, total_seconds: int) -> None:
+        """
+        次回チェックまで待機しつつ、配信中チャンネルの継続・終了を定期確認
+
+        Args:
+            total_seconds: 待機秒数
+        """
+        if self._live_check_interval <= 0:
+            self._wait_with_interrupt_check(total_seconds, check_interval=1, show_progress=False)
+            return
+
+        remaining = total_seconds
+        while remaining > 0 and self._running and not self._wake_requested:
+            step = min(self._live_check_interval, remaining)
+            self._wait_with_interrupt_check(step, check_interval=1, show_progress=False)
+            remaining -= step
+
+            if remaining > 0 and self._running and not self._wake_requested:
+                if self._degraded():
+                    # 縮退運転中はAPIでの配信中チェックを行わない
+                    continue
+                self._use_case.check_live_streams(self._active_channels())
+                self._next_live_check_at = self._clock.time() + self._live_check_interval
+
     def _calculate_wait_until_next_5min(self) -> int:
         """
         次の5の倍数の分（JST基準）まで何秒待つかを計算
@@ -175,7 +564,7 @@ class MonitorController:
             次の5分の倍数まで何秒待つか
         """
         jst = pytz.timezone("Asia/Tokyo")
-        now_jst = datetime.now(jst)
+        now_jst = self._clock.now(jst)
 
         # 現在の分と秒
         current_minute = now_jst.minute
@@ -196,6 +585,178 @@ class MonitorController:
 
         return seconds_to_wait
 
+    @property
+    def channels(self) -> List[Channel]:
+        """現在の監視対象チャンネル"""
+        return self._monitored.channels()
+
+    @property
+    def monitored(self) -> MonitoredChannels:
+        """稼働中に変更できる監視対象チャンネル"""
+        return self._monitored
+
+    @property
+    def leader(self) -> Optional[LeaderElection]:
+        """冗長構成のリーダー選出（冗長構成でない場合はNone）"""
+        return self._leader
+
+    @property
+    def degradation(self) -> Optional[QuotaDegradation]:
+        """クォータ超過中の縮退運転（縮退運転しない場合はNone）"""
+        return self._degradation
+
+    @property
+    def onboarding(self) -> Optional[ChannelOnboarding]:
+        """チャンネルの確認と隔離（確認しない場合はNone）"""
+        return self._onboarding
+
+    def _active_channels(self) -> List[Channel]:
+        """
+        このワーカーが監視するチャンネル
+
+        シャーディング時は担当分のみ、待機系はなし。隔離中のチャンネルは含めない。
+        """
+        if self._leader is not None and not self._leader.is_leader:
+            return []
+        channels = self.channels if self._shard is None else self._shard.select(self.channels)
+        if self._onboarding is not None:
+            channels = self._onboarding.exclude_quarantined(channels)
+        return channels
+
+    def _onboard(self, channels: List[Channel]) -> List[Channel]:
+        """未確認のチャンネルを確認し、見つからなかったチャンネルを除く（APIを呼び出す前に行う）"""
+        if self._onboarding is None:
+            return channels
+        return self._onboarding.onboard(channels)
+
+    def call_soon(self, func: Callable[[], Any]) -> Future:
+        """
+        監視サイクルの間に監視スレッドで処理を実行する（別スレッドから呼び出す）
+
+        監視対象の変更を監視サイクルの途中に反映しないために使う。
+
+        Returns:
+            処理の戻り値・例外を受け取るFuture
+        """
+        future: Future = Future()
+        self._commands.put((func, future))
+        return future
+
+    def request_check(self, channel_ids: List[ChannelId]) -> Future:
+        """
+        チャンネルの臨時チェックを依頼する（別スレッドから呼び出す）
+
+        通常の監視サイクルと同じユースケース・キャッシュ・クォータの記録を使って監視スレッドで行う。
+        同時に依頼されたチェックは1回の取得にまとめ、通常の監視サイクルが先に始まった場合は
+        その結果で応答する。
+
+        Returns:
+            CycleSummary（クォータ超過で待機中・縮退運転中の場合は QuotaExceededError）を受け取るFuture
+        """
+        future: Future = Future()
+        with self._check_lock:
+            self._check_requests.append((list(channel_ids), future))
+        return future
+
+    def _take_check_requests(self) -> List[Tuple[List[ChannelId], Future]]:
+        with self._check_lock:
+            requests, self._check_requests = self._check_requests, []
+        return requests
+
+    @staticmethod
+    def _resolve(
+        requests: List[Tuple[List[ChannelId], Future]],
+        summary: Optional[CycleSummary] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        for _, future in requests:
+            if not future.set_running_or_notify_cancel():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(summary)
+
+    def _process_requests(self) -> None:
+        """依頼された処理と臨時チェックを実行（監視スレッドで待機中に呼び出す）"""
+        while True:
+            try:
+                func, future = self._commands.get_nowait()
+            except queue.Empty:
+                break
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func())
+            except Exception as e:
+                future.set_exception(e)
+
+        requests = self._take_check_requests()
+        if not requests:
+            return
+        if self._quota_wait_until is not None:
+            # 待機中はAPIを呼び出さない
+            metrics.FORCED_CHECKS.inc(result="quota")
+            self._resolve(requests, error=QuotaExceededError("クォータ超過のため待機中です"))
+            return
+        if self._degraded():
+            metrics.FORCED_CHECKS.inc(result="quota")
+            self._resolve(requests, error=self._degraded_error())
+            return
+        if self._leader is not None and not self._leader.is_leader:
+            self._resolve(requests, error=NotLeaderError("待機系です"))
+            return
+
+        requested = {channel_id for channel_ids, _ in requests for channel_id in channel_ids}
+        # 他のワーカーの担当チャンネルは取得しない（通知の重複を避ける）
+        channels = [channel for channel in self._active_channels() if channel.id in requested]
+        logger.info(f"臨時チェック: {len(channels)}チャンネル")
+        try:
+            channels = self._onboard(channels)
+            summary = self._use_case.execute(channels)
+        except Exception as e:
+            metrics.FORCED_CHECKS.inc(
+                result="quota" if isinstance(e, QuotaExceededError) else "error"
+            )
+            logger.error(f"臨時チェックでエラー発生: {e}")
+            self._resolve(requests, error=e)
+            return
+        metrics.FORCED_CHECKS.inc(result="success")
+        metrics.CHANNELS_CHECKED.inc(len(channels))
+        self._resolve(requests, summary)
+
+    def _cancel_requests(self) -> None:
+        """監視の終了時に未処理の依頼を取り消す"""
+        while True:
+            try:
+                _, future = self._commands.get_nowait()
+            except queue.Empty:
+                break
+            future.cancel()
+        for _, future in self._take_check_requests():
+            future.cancel()
+
+    def _apply_config_reload(self) -> None:
+        """
+        再読み込みが要求された、または設定ファイルが更新された場合に監視対象チャンネルを差し替える
+
+        監視サイクルの間（待機中）に監視スレッドで実行するため、
+        サイクルの途中で監視対象が変わることはない。
+        """
+        if self._config_reloader is None:
+            return
+        requested, self._reload_requested = self._reload_requested, False
+        if not (requested or self._config_reloader.poll()):
+            return
+        self._config_reloader.reload()
+        if self._onboarding is not None:
+            self._onboarding.config_changed(self._config_reloader.fingerprint())
+
+    def _handle_reload(self, signum, frame):
+        """SIGHUPハンドラー（再読み込みは待機中に監視スレッドで行う）"""
+        logger.info("再読み込みシグナルを受信しました...")
+        self._reload_requested = True
+
     def _handle_shutdown(self, signum, frame):
         """シャットダウンハンドラー"""
         logger.info("終了シグナルを受信しました...")
@@ -0,0 +1,59 @@
+"""ユニットテストで共有するテスト用の実装とエンティティの生成"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from domain.entities.channel import Channel
+from domain.entities.stream import Stream
+from domain.repositories.state_repository import StateRepository
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.stream_status import StreamStatus
+from domain.value_objects.webhook_config import WebhookConfig
+from application.dto.stream_state_dto import StreamStateDto
+
+
+class InMemoryStateRepository(StateRepository):
+    """テスト用のインメモリ状態リポジトリ"""
+
+    def __init__(self, round_trip: bool = False):
+        """
+        Args:
+            round_trip: 保存時にJSON形式（to_dict / from_dict）を経由するか
+        """
+        self.states: Dict[str, Any] = {}
+        self._round_trip = round_trip
+
+    def get_state(self, channel_id):
+        state = self.states.get(str(channel_id))
+        if self._round_trip and state is not None:
+            return StreamStateDto.from_dict(state)
+        return state
+
+    def save_state(self, channel_id, state: StreamStateDto):
+        self.states[str(channel_id)] = state.to_dict() if self._round_trip else state
+
+
+def make_channel(channel_id: str, name: Optional[str] = None, webhook: str = "aaa") -> Channel:
+    """テスト用のチャンネル（名前の省略時はIDの末尾から作る）"""
+    return Channel(
+        id=ChannelId(channel_id),
+        name=name if name is not None else f"ch-{channel_id[-6:]}",
+        webhooks=[WebhookConfig(url=f"https://discord.com/api/webhooks/111/{webhook}")],
+    )
+
+
+def make_stream(
+    video_id: str,
+    status: StreamStatus = StreamStatus.LIVE,
+    viewers: Optional[int] = None,
+    started_at: Optional[datetime] = None,
+) -> Stream:
+    """テスト用の配信（開始時刻の省略時は現在時刻）"""
+    return Stream(
+        video_id=video_id,
+        title="テスト配信",
+        thumbnail_url="http://example.com/thumb.jpg",
+        started_at=started_at if started_at is not None else datetime.now(),
+        status=status,
+        concurrent_viewers=viewers,
+    )
@@ -0,0 +1,199 @@
+"""CachingStreamRepositoryのユニットテスト"""
+
+import threading
+import time
+import pytest
+from typing import Optional
+
+from domain.entities.stream import Stream
+from domain.repositories.stream_repository import StreamRepository
+from domain.value_objects.channel_id import ChannelId
+from infrastructure.cache.caching_stream_repository import CachingStreamRepository
+from domain.repositories.errors import QuotaExceededError
+from tests.unit.fakes import make_channel, make_stream
+
+CHANNEL_ID_1 = "UCxxxxxxxxxxxxxxxx111111"
+CHANNEL_ID_2 = "UCxxxxxxxxxxxxxxxx222222"
+
+
+def video_id_of(stream: Optional[Stream]) -> Optional[str]:
+    return stream.video_id if stream is not None else None
+
+
+def wait_for_refreshes(repo: CachingStreamRepository, count: int) -> None:
+    """バックグラウンド再取得の完了を待つ"""
+    deadline = time.time() + 2
+    while repo.stats().refreshes < count and time.time() < deadline:
+        time.sleep(0.01)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingRepository(StreamRepository):
+    """呼び出し回数を数えるテスト用リポジトリ"""
+
+    def __init__(self, streams=None, delay=0.0):
+        self.streams = streams or {}
+        self.delay = delay
+        self.calls = 0
+        self.batch_calls = []
+        self._lock = threading.Lock()
+
+    def get_current_stream(self, channel):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        stream = self.streams.get(channel.id)
+        if isinstance(stream, Exception):
+            raise stream
+        return stream
+
+    def get_current_streams(self, channels):
+        self.batch_calls.append([c.id for c in channels])
+        return super().get_current_streams(channels)
+
+    def get_streams(self, video_ids):
+        return {
+            stream.video_id: stream
+            for stream in self.streams.values()
+            if isinstance(stream, Stream) and stream.video_id in video_ids
+        }
+
+
+class TestCachingStreamRepository:
+    """キャッシュ動作のテスト"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    def test_TTL内はキャッシュを返す(self, clock):
+        """TTL内の2回目の問い合わせはAPIを呼ばない"""
+        channel = make_channel(CHANNEL_ID_1)
+        inner = CountingRepository({channel.id: make_stream("live1")})
+        repo = CachingStreamRepository(inner, ttl=60, negative_ttl=60, clock=clock)
+
+        assert video_id_of(repo.get_current_stream(channel)) == "live1"
+        clock.now += 30
+        assert video_id_of(repo.get_current_stream(channel)) == "live1"
+
+        assert inner.calls == 1
+        assert repo.stats().hits == 1
+        assert repo.stats().misses == 1
+
+    def test_TTL切れで再取得(self, clock):
+        """TTLを過ぎたら再取得する"""
+        channel = make_channel(CHANNEL_ID_1)
+        inner = CountingRepository()
+        repo = CachingStreamRepository(inner, ttl=60, negative_ttl=10, clock=clock)
+
+        assert repo.get_current_stream(channel) is None
+        clock.now += 5
+        assert repo.get_current_stream(channel) is None
+        clock.now += 10
+        assert repo.get_current_stream(channel) is None
+
+        assert inner.calls == 2
+        assert repo.stats().negative_hits == 1
+
+    def test_エラーはキャッシュしない(self, clock):
+        """取得エラーは伝搬し、次回は再取得する"""
+        channel = make_channel(CHANNEL_ID_1)
+        inner = CountingRepository({ChannelId(CHANNEL_ID_1): RuntimeError("api")})
+        repo = CachingStreamRepository(inner, ttl=60, clock=clock)
+
+        with pytest.raises(RuntimeError):
+            repo.get_current_stream(channel)
+        with pytest.raises(RuntimeError):
+            repo.get_current_stream(channel)
+
+        assert inner.calls == 2
+        assert repo.stats().errors == 2
+
+    def test_同時問い合わせは1回にまとめる(self):
+        """同じチャンネルへの同時問い合わせはsingle-flightで1回になる"""
+        channel = make_channel(CHANNEL_ID_1)
+        inner = CountingRepository({channel.id: make_stream("live1")}, delay=0.2)
+        repo = CachingStreamRepository(inner, ttl=60)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(repo.get_current_stream(channel)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert inner.calls == 1
+        assert [video_id_of(s) for s in results] == ["live1"] * 5
+        assert repo.stats().coalesced == 4
+
+    def test_stale_while_revalidate(self, clock):
+        """期限切れ直後は古い値を返し、バックグラウンドで再取得する"""
+        channel = make_channel(CHANNEL_ID_1)
+        inner = CountingRepository({channel.id: make_stream("old")})
+        repo = CachingStreamRepository(inner, ttl=60, stale_ttl=30, clock=clock)
+
+        repo.get_current_stream(channel)
+        inner.streams[channel.id] = make_stream("new")
+        clock.now += 70
+
+        assert video_id_of(repo.get_current_stream(channel)) == "old"
+
+        wait_for_refreshes(repo, 1)
+
+        assert video_id_of(repo.get_current_stream(channel)) == "new"
+        assert inner.calls == 2
+        assert repo.stats().stale_hits == 1
+
+    def test_一括取得はキャッシュにないチャンネルのみ問い合わせ(self, clock):
+        """get_current_streams はミスしたチャンネルのみラップ先に渡す"""
+        channel_1 = make_channel(CHANNEL_ID_1)
+        channel_2 = make_channel(CHANNEL_ID_2)
+        inner = CountingRepository({channel_1.id: make_stream("live1")})
+        repo = CachingStreamRepository(inner, ttl=60, negative_ttl=60, clock=clock)
+
+        repo.get_current_stream(channel_1)
+        results = repo.get_current_streams([channel_1, channel_2])
+
+        assert video_id_of(results[channel_1.id].stream) == "live1"
+        assert results[channel_2.id].ok and results[channel_2.id].stream is None
+        assert inner.batch_calls == [[channel_2.id]]
+
+    def test_期限切れのチャンネルはまとめて1回で再取得する(self, clock):
+        """同時に期限切れになったチャンネルはチャンネルごとにスレッドを作らず一括取得する"""
+        channels = [make_channel(CHANNEL_ID_1), make_channel(CHANNEL_ID_2)]
+        inner = CountingRepository({c.id: make_stream("old") for c in channels})
+        repo = CachingStreamRepository(inner, ttl=60, stale_ttl=30, clock=clock)
+        repo.get_current_streams(channels)
+        clock.now += 70
+
+        results = repo.get_current_streams(channels)
+        wait_for_refreshes(repo, 2)
+
+        assert [video_id_of(r.stream) for r in results.values()] == ["old", "old"]
+        assert inner.batch_calls == [[c.id for c in channels]] * 2
+        assert repo.stats().refreshes == 2
+
+    def test_再取得に失敗したら古い値を返さずエラーを返す(self, clock):
+        """クォータ超過中に古い値を返し続けると縮退運転に切り替わらない"""
+        channel = make_channel(CHANNEL_ID_1)
+        inner = CountingRepository({channel.id: make_stream("old")})
+        repo = CachingStreamRepository(inner, ttl=60, stale_ttl=300, clock=clock)
+        repo.get_current_stream(channel)
+        inner.streams[channel.id] = QuotaExceededError("クォータ超過")
+        clock.now += 70
+
+        assert video_id_of(repo.get_current_stream(channel)) == "old"
+        wait_for_refreshes(repo, 1)
+
+        results = repo.get_current_streams([channel])
+        assert isinstance(results[channel.id].error, QuotaExceededError)
@@ -0,0 +1,208 @@
+"""チャンネルの確認と隔離（ChannelOnboarding）のユニットテスト"""
+
+import os
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from domain.entities.channel import Channel
+from domain.repositories.channel_catalog_repository import ChannelCatalogRepository
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.channel_metadata import ChannelMetadata
+from domain.value_objects.webhook_config import WebhookConfig
+from application.services.channel_onboarding import ChannelOnboarding
+from application.services.clock import VirtualClock
+from application.services.monitor_pipeline import CycleSummary
+from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from domain.repositories.errors import QuotaExceededError, RepositoryError
+from presentation.cli.config_reloader import ConfigReloader, config_fingerprint
+from presentation.cli.monitor_controller import MonitorController
+
+START = datetime(2026, 1, 29, 3, 0, tzinfo=timezone.utc)
+ALIVE_ID = "UCxxxxxxxxxxxxxxxx111111"
+DEAD_ID = "UCxxxxxxxxxxxxxxxx222222"
+
+
+def channel(channel_id: str) -> Channel:
+    return Channel(
+        id=ChannelId(channel_id),
+        name=f"ch-{channel_id[-1]}",
+        webhooks=[WebhookConfig("https://discord.com/api/webhooks/111/aaa")],
+    )
+
+
+def metadata(channel_id: str) -> ChannelMetadata:
+    return ChannelMetadata(ChannelId(channel_id), "配信者", "UU" + channel_id[2:])
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock(START)
+
+
+@pytest.fixture
+def catalog():
+    catalog = Mock(spec=ChannelCatalogRepository)
+    catalog.lookup_channels.side_effect = lambda ids: {
+        channel_id: metadata(str(channel_id)) if str(channel_id) == ALIVE_ID else None
+        for channel_id in ids
+    }
+    return catalog
+
+
+class TestChannelOnboarding:
+    """ChannelOnboarding のテスト"""
+
+    def test_見つからないチャンネルを隔離して除く(self, catalog, clock):
+        onboarding = ChannelOnboarding(catalog, clock=clock)
+
+        channels = onboarding.onboard([channel(ALIVE_ID), channel(DEAD_ID)])
+
+        assert channels == [channel(ALIVE_ID)]
+        assert onboarding.quarantined() == [ChannelId(DEAD_ID)]
+        assert onboarding.metadata(ChannelId(ALIVE_ID)) == metadata(ALIVE_ID)
+        catalog.lookup_channels.assert_called_once_with([ChannelId(ALIVE_ID), ChannelId(DEAD_ID)])
+
+    def test_確認済みと隔離中のチャンネルは確認しなおさない(self, catalog, clock):
+        onboarding = ChannelOnboarding(catalog, revalidate_interval=3600, clock=clock)
+        onboarding.onboard([channel(ALIVE_ID), channel(DEAD_ID)])
+
+        clock.advance(3599)
+        onboarding.onboard([channel(ALIVE_ID), channel(DEAD_ID)])
+        assert catalog.lookup_channels.call_count == 1
+
+        # 確認から revalidate_interval が経過したら確認しなおす（隔離中は確認しない）
+        clock.advance(1)
+        onboarding.onboard([channel(ALIVE_ID), channel(DEAD_ID)])
+        catalog.lookup_channels.assert_called_with([ChannelId(ALIVE_ID)])
+
+    def test_確認に失敗した場合は隔離せずに監視を続ける(self, catalog, clock):
+        catalog.lookup_channels.side_effect = RepositoryError("接続エラー")
+        onboarding = ChannelOnboarding(catalog, clock=clock)
+
+        channels = onboarding.onboard([channel(ALIVE_ID), channel(DEAD_ID)])
+
+        assert channels == [channel(ALIVE_ID), channel(DEAD_ID)]
+        assert onboarding.quarantined() == []
+        # 次の監視サイクルで確認しなおす
+        onboarding.onboard([channel(ALIVE_ID)])
+        assert catalog.lookup_channels.call_count == 2
+
+    def test_クォータ超過は伝搬する(self, catalog, clock):
+        catalog.lookup_channels.side_effect = QuotaExceededError("クォータ超過")
+        onboarding = ChannelOnboarding(catalog, clock=clock)
+
+        with pytest.raises(QuotaExceededError):
+            onboarding.onboard([channel(DEAD_ID)])
+        assert onboarding.quarantined() == []
+
+    def test_設定ファイルの内容が変わったら隔離を解除する(self, catalog, clock):
+        onboarding = ChannelOnboarding(catalog, config_fingerprint="a", clock=clock)
+        onboarding.onboard([channel(DEAD_ID)])
+
+        onboarding.config_changed("a")
+        assert onboarding.quarantined() == [ChannelId(DEAD_ID)]
+
+        onboarding.config_changed("b")
+        assert onboarding.quarantined() == []
+
+    def test_削除したチャンネルは確認結果を破棄する(self, catalog, clock):
+        onboarding = ChannelOnboarding(catalog, clock=clock)
+        onboarding.onboard([channel(ALIVE_ID), channel(DEAD_ID)])
+
+        onboarding.forget(ChannelId(ALIVE_ID))
+        onboarding.forget(ChannelId(DEAD_ID))
+
+        assert onboarding.metadata(ChannelId(ALIVE_ID)) is None
+        assert onboarding.quarantined() == []
+
+
+class TestWarmState:
+    """確認結果の保存と復元のテスト"""
+
+    def test_確認結果を引き継ぎリポジトリに登録する(self, catalog, clock):
+        onboarding = ChannelOnboarding(catalog, config_fingerprint="a", clock=clock)
+        onboarding.onboard([channel(ALIVE_ID), channel(DEAD_ID)])
+        state = onboarding.export_warm_state()
+
+        restored_catalog = Mock(spec=ChannelCatalogRepository)
+        restored = ChannelOnboarding(restored_catalog, config_fingerprint="a", clock=clock)
+        restored.restore_warm_state(state)
+
+        assert restored.onboard([channel(ALIVE_ID), channel(DEAD_ID)]) == [channel(ALIVE_ID)]
+        restored_catalog.lookup_channels.assert_not_called()
+        restored_catalog.register_channels.assert_called_once_with([metadata(ALIVE_ID)])
+
+    def test_設定ファイルの内容が変わっていたら隔離を引き継がない(self, catalog, clock):
+        onboarding = ChannelOnboarding(catalog, config_fingerprint="a", clock=clock)
+        onboarding.onboard([channel(DEAD_ID)])
+
+        restored = ChannelOnboarding(catalog, config_fingerprint="b", clock=clock)
+        restored.restore_warm_state(onboarding.export_warm_state())
+
+        assert restored.quarantined() == []
+
+
+class TestConfigFingerprint:
+    """config_fingerprint のテスト"""
+
+    def test_内容が変わった場合だけ変わる(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text('{"channels": []}', encoding="utf-8")
+        before = config_fingerprint([str(path)])
+
+        os.utime(path, (0, 0))
+        assert config_fingerprint([str(path)]) == before
+
+        path.write_text('{"channels": [1]}', encoding="utf-8")
+        assert config_fingerprint([str(path)]) != before
+
+
+class TestController:
+    """MonitorController でのチャンネルの確認と隔離のテスト"""
+
+    @pytest.fixture
+    def use_case(self):
+        use_case = Mock(spec=MonitorStreamsUseCase)
+        use_case.execute.side_effect = lambda channels: CycleSummary(channels=len(channels))
+        return use_case
+
+    def test_監視の前に確認し隔離中のチャンネルは監視しない(self, use_case, catalog, clock):
+        onboarding = ChannelOnboarding(catalog, clock=clock)
+        controller = MonitorController(
+            use_case=use_case,
+            channels=[channel(ALIVE_ID), channel(DEAD_ID)],
+            check_interval=300,
+            clock=clock,
+            onboarding=onboarding,
+        )
+
+        controller._run_cycle()
+        future = controller.request_check([ChannelId(ALIVE_ID), ChannelId(DEAD_ID)])
+        controller._process_requests()
+
+        assert use_case.execute.call_args_list[0].args[0] == [channel(ALIVE_ID)]
+        assert use_case.execute.call_args_list[1].args[0] == [channel(ALIVE_ID)]
+        assert future.result(timeout=0).channels == 1
+        assert controller._active_channels() == [channel(ALIVE_ID)]
+
+    def test_設定ファイルの変更で隔離を解除する(self, use_case, catalog, clock):
+        reloader = Mock(spec=ConfigReloader)
+        reloader.poll.return_value = True
+        reloader.fingerprint.return_value = "b"
+        onboarding = ChannelOnboarding(catalog, config_fingerprint="a", clock=clock)
+        controller = MonitorController(
+            use_case=use_case,
+            channels=[channel(DEAD_ID)],
+            check_interval=300,
+            clock=clock,
+            config_reloader=reloader,
+            onboarding=onboarding,
+        )
+        controller._run_cycle()
+
+        controller._apply_config_reload()
+
+        assert onboarding.quarantined() == []
+        assert controller._active_channels() == [channel(DEAD_ID)]
@@ -0,0 +1,235 @@
+"""設定の再読み込み（監視対象チャンネルの差分反映）のユニットテスト"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from domain.entities.channel import Channel
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.webhook_config import WebhookConfig
+from application.services.channel_set_diff import ChannelSetDiff, diff_channels
+from application.services.clock import VirtualClock
+from application.services.live_set_tracker import LiveSetTracker
+from application.services.monitor_pipeline import CycleSummary
+from application.services.monitored_channels import MonitoredChannels
+from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from application.use_cases.multi_tenant_monitor_use_case import Tenant
+from config.settings import Settings
+from presentation.cli.config_reloader import ConfigReloader
+from presentation.cli.monitor_controller import MonitorController
+
+START = datetime(2026, 1, 29, 3, 1, tzinfo=timezone.utc)
+
+CHANNEL_ID_1 = "UCxxxxxxxxxxxxxxxx111111"
+CHANNEL_ID_2 = "UCxxxxxxxxxxxxxxxx222222"
+CHANNEL_ID_3 = "UCxxxxxxxxxxxxxxxx333333"
+WEBHOOK_A = "https://discord.com/api/webhooks/111/aaa"
+WEBHOOK_B = "https://discord.com/api/webhooks/222/bbb"
+
+
+def channel(channel_id: str, name: str = "配信者", url: str = WEBHOOK_A) -> Channel:
+    return Channel(id=ChannelId(channel_id), name=name, webhooks=[WebhookConfig(url=url)])
+
+
+def write_config(path, channels, **extra) -> None:
+    """チャンネルID → Webhook URL の辞書から設定ファイルを書く"""
+    config = {
+        "check_interval": 300,
+        "channels": [
+            {"id": channel_id, "name": f"ch-{channel_id[-1]}", "webhooks": [{"url": url}]}
+            for channel_id, url in channels.items()
+        ],
+        **extra,
+    }
+    path.write_text(json.dumps(config), encoding="utf-8")
+
+
+@pytest.fixture(autouse=True)
+def env(monkeypatch):
+    monkeypatch.setenv("YOUTUBE_API_KEY", "test-api-key")
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.com/api/webhooks/999/zzz")
+
+
+class TestDiffChannels:
+    """diff_channels のテスト"""
+
+    def test_追加削除変更を検出(self):
+        """IDが同じでもWebhookや名前が変わったチャンネルは変更として扱う"""
+        old = [channel(CHANNEL_ID_1), channel(CHANNEL_ID_2), channel(CHANNEL_ID_3, name="C")]
+        new = [
+            channel(CHANNEL_ID_1),
+            channel(CHANNEL_ID_2, url=WEBHOOK_B),
+            channel("UCxxxxxxxxxxxxxxxx444444"),
+        ]
+
+        diff = diff_channels(old, new)
+
+        assert [str(c.id) for c in diff.added] == ["UCxxxxxxxxxxxxxxxx444444"]
+        assert [str(c.id) for c in diff.removed] == [CHANNEL_ID_3]
+        assert diff.changed[0].webhooks == [WebhookConfig(url=WEBHOOK_B)]
+        assert diff.describe() == "追加 1 / 削除 1 / 変更 1"
+
+    def test_同じ設定は差分なし(self):
+        assert diff_channels([channel(CHANNEL_ID_1)], [channel(CHANNEL_ID_1)]).is_empty
+
+
+class TestConfigReloader:
+    """ConfigReloader のテスト"""
+
+    @pytest.fixture
+    def config_path(self, tmp_path):
+        path = tmp_path / "config.json"
+        write_config(path, {CHANNEL_ID_1: WEBHOOK_A, CHANNEL_ID_2: WEBHOOK_A})
+        return path
+
+    def reloader(self, config_path, live_set=None):
+        """単一設定の ConfigReloader と監視対象チャンネルを作成"""
+        settings = Settings.load(str(config_path))
+        monitored = MonitoredChannels(
+            settings.channels, on_removed=live_set.untrack if live_set else None
+        )
+        return (
+            ConfigReloader([str(config_path)], [settings], monitored, watch_interval=0),
+            monitored,
+        )
+
+    def test_差分を反映し削除したチャンネルの追跡をやめる(self, config_path):
+        """追加・Webhookの変更を反映し、削除したチャンネルは配信中セットから外す"""
+        live_set = LiveSetTracker()
+        live_set.track(ChannelId(CHANNEL_ID_1), "live1")
+        live_set.track(ChannelId(CHANNEL_ID_2), "live2")
+        reloader, monitored = self.reloader(config_path, live_set)
+
+        write_config(config_path, {CHANNEL_ID_2: WEBHOOK_B, CHANNEL_ID_3: WEBHOOK_A})
+        assert reloader.reload()
+
+        channels = monitored.channels()
+        assert [str(c.id) for c in channels] == [CHANNEL_ID_2, CHANNEL_ID_3]
+        assert channels[0].webhooks == [WebhookConfig(url=WEBHOOK_B)]
+        assert live_set.tracked_channel_ids() == [ChannelId(CHANNEL_ID_2)]
+
+    def test_不正な設定は反映しない(self, config_path):
+        """読み込み・検証に失敗した場合は現在の設定のまま監視を続ける"""
+        reloader, monitored = self.reloader(config_path)
+
+        config_path.write_text('{"channels": [{"id": "invalid", "name": "x"', encoding="utf-8")
+        assert not reloader.reload()
+        write_config(config_path, {"UCinvalid": WEBHOOK_A})
+        assert not reloader.reload()
+
+        assert [str(c.id) for c in monitored.channels()] == [CHANNEL_ID_1, CHANNEL_ID_2]
+
+    def test_チャンネル以外の変更は反映しない(self, config_path):
+        """チャンネルに変更がなければ差し替えない"""
+        reloader, _ = self.reloader(config_path)
+
+        write_config(
+            config_path, {CHANNEL_ID_1: WEBHOOK_A, CHANNEL_ID_2: WEBHOOK_A}, log_level="DEBUG"
+        )
+
+        assert not reloader.reload()
+
+    def test_稼働中に追加したチャンネルは残す(self, config_path):
+        """設定ファイルの前回の内容との差分だけを適用し、制御APIで追加したチャンネルを消さない"""
+        reloader, monitored = self.reloader(config_path)
+        monitored.apply(ChannelSetDiff(added=[channel(CHANNEL_ID_3)]))
+
+        write_config(config_path, {CHANNEL_ID_1: WEBHOOK_B})
+        assert reloader.reload()
+
+        assert [str(c.id) for c in monitored.channels()] == [CHANNEL_ID_1, CHANNEL_ID_3]
+
+    def test_テナントのチャンネルを差し替える(self, tmp_path, config_path):
+        """マルチテナントでは各テナントのチャンネルを差し替え、重複排除した一覧を返す"""
+        other_path = tmp_path / "other.json"
+        write_config(other_path, {CHANNEL_ID_2: WEBHOOK_B})
+        all_settings = [Settings.load(str(config_path)), Settings.load(str(other_path))]
+        tenants = [
+            Tenant("main", all_settings[0].channels, Mock()),
+            Tenant("other", all_settings[1].channels, Mock()),
+        ]
+        live_set = LiveSetTracker()
+        live_set.track(ChannelId(CHANNEL_ID_2), "live2")
+        monitored = MonitoredChannels([], tenants=tenants, on_removed=live_set.untrack)
+        reloader = ConfigReloader(
+            [str(config_path), str(other_path)], all_settings, monitored, watch_interval=0
+        )
+
+        # main から削除しても other に残っているチャンネルは追跡を続ける
+        write_config(config_path, {CHANNEL_ID_1: WEBHOOK_A})
+        assert reloader.reload()
+
+        assert [str(c.id) for c in monitored.channels()] == [CHANNEL_ID_1, CHANNEL_ID_2]
+        assert [str(c.id) for c in tenants[0].channels] == [CHANNEL_ID_1]
+        assert live_set.is_tracked(ChannelId(CHANNEL_ID_2))
+
+
+class TestControllerReload:
+    """MonitorController での再読み込みのテスト"""
+
+    @pytest.fixture
+    def clock(self):
+        return VirtualClock(START)
+
+    def test_設定ファイルの更新を次のサイクルから反映(self, tmp_path, clock):
+        """待機中に更新を検知し、予定時刻を変えずに次のサイクルから新しいチャンネルを監視する"""
+        config_path = tmp_path / "config.json"
+        write_config(config_path, {CHANNEL_ID_1: WEBHOOK_A})
+        settings = Settings.load(str(config_path))
+        monitored = MonitoredChannels(settings.channels)
+        reloader = ConfigReloader(
+            [str(config_path)], [settings], monitored, watch_interval=5, clock=clock
+        )
+
+        def execute(channels):
+            # 1回目のサイクルの直後に設定ファイルを編集する
+            write_config(config_path, {CHANNEL_ID_1: WEBHOOK_A, CHANNEL_ID_2: WEBHOOK_A})
+            return CycleSummary(channels=len(channels))
+
+        use_case = Mock(spec=MonitorStreamsUseCase)
+        use_case.execute.side_effect = execute
+        controller = MonitorController(
+            use_case=use_case,
+            channels=settings.channels,
+            check_interval=300,
+            clock=clock,
+            run_until=START + timedelta(minutes=5),
+            config_reloader=reloader,
+            monitored=monitored,
+        )
+
+        controller.start()
+
+        # 12:01（起動時）と 12:05 の2回
+        first, second = [call.args[0] for call in use_case.execute.call_args_list]
+        assert [str(c.id) for c in first] == [CHANNEL_ID_1]
+        assert [str(c.id) for c in second] == [CHANNEL_ID_1, CHANNEL_ID_2]
+
+    def test_SIGHUPで再読み込み(self, tmp_path, clock):
+        """ファイル監視が無効でも SIGHUP を受信すると待機中に再読み込みする"""
+        config_path = tmp_path / "config.json"
+        write_config(config_path, {CHANNEL_ID_1: WEBHOOK_A})
+        settings = Settings.load(str(config_path))
+        monitored = MonitoredChannels(settings.channels)
+        reloader = ConfigReloader(
+            [str(config_path)], [settings], monitored, watch_interval=0, clock=clock
+        )
+        controller = MonitorController(
+            use_case=Mock(spec=MonitorStreamsUseCase),
+            channels=[],
+            check_interval=300,
+            clock=clock,
+            config_reloader=reloader,
+            monitored=monitored,
+        )
+        controller._running = True
+        write_config(config_path, {CHANNEL_ID_2: WEBHOOK_A})
+
+        controller._wait_with_interrupt_check(1, check_interval=1)
+        assert [str(c.id) for c in controller.channels] == [CHANNEL_ID_1]
+
+        controller._handle_reload(None, None)
+        controller._wait_with_interrupt_check(1, check_interval=1)
+        assert [str(c.id) for c in controller.channels] == [CHANNEL_ID_2]
@@ -0,0 +1,202 @@
+"""制御API（ControlServer）と監視スレッドでの依頼の処理のユニットテスト"""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from domain.entities.channel import Channel
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.webhook_config import WebhookConfig
+from application.dto.stream_state_dto import StreamStateDto
+from application.services.live_set_tracker import LiveSetTracker
+from application.services.monitor_pipeline import CycleSummary
+from application.services.monitored_channels import MonitoredChannels
+from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from domain.repositories.errors import QuotaExceededError
+from presentation.api.control_server import ControlError, ControlServer
+from presentation.cli.monitor_controller import MonitorController
+
+CHANNEL_ID_1 = "UCxxxxxxxxxxxxxxxx111111"
+CHANNEL_ID_2 = "UCxxxxxxxxxxxxxxxx222222"
+WEBHOOK_URL = "https://discord.com/api/webhooks/111/aaa"
+
+
+def channel(channel_id: str) -> Channel:
+    return Channel(
+        id=ChannelId(channel_id), name=f"ch-{channel_id[-1]}", webhooks=[WebhookConfig(WEBHOOK_URL)]
+    )
+
+
+@pytest.fixture
+def use_case():
+    use_case = Mock(spec=MonitorStreamsUseCase)
+    use_case.execute.side_effect = lambda channels: CycleSummary(channels=len(channels), live=1)
+    return use_case
+
+
+@pytest.fixture
+def controller(use_case):
+    return MonitorController(
+        use_case=use_case, channels=[channel(CHANNEL_ID_1)], check_interval=300
+    )
+
+
+class TestCheckRequests:
+    """MonitorController.request_check のテスト"""
+
+    def test_同時の依頼は1回の取得にまとめる(self, controller, use_case):
+        """待機中に溜まった臨時チェックは1回の execute で処理する"""
+        first = controller.request_check([ChannelId(CHANNEL_ID_1)])
+        second = controller.request_check([ChannelId(CHANNEL_ID_1)])
+
+        controller._process_requests()
+
+        assert use_case.execute.call_count == 1
+        assert use_case.execute.call_args.args[0] == [channel(CHANNEL_ID_1)]
+        assert first.result(timeout=0).live == 1
+        assert second.result(timeout=0) is first.result(timeout=0)
+
+    def test_通常のサイクルで取得した場合は重複して取得しない(self, controller, use_case):
+        """サイクルの開始前に依頼されたチェックはそのサイクルの結果で応答する"""
+        future = controller.request_check([ChannelId(CHANNEL_ID_1)])
+
+        summary = controller._run_cycle()
+        controller._process_requests()
+
+        assert use_case.execute.call_count == 1
+        assert future.result(timeout=0) is summary
+
+    def test_クォータ超過の待機中はAPIを呼び出さない(self, controller, use_case):
+        controller._quota_wait_until = controller._clock.monotonic() + 3600
+        future = controller.request_check([ChannelId(CHANNEL_ID_1)])
+
+        controller._process_requests()
+
+        use_case.execute.assert_not_called()
+        with pytest.raises(QuotaExceededError):
+            future.result(timeout=0)
+
+
+class TestControlServer:
+    """ControlServer のテスト"""
+
+    @pytest.fixture
+    def live_set(self):
+        live_set = LiveSetTracker()
+        live_set.track(ChannelId(CHANNEL_ID_1), "live1")
+        return live_set
+
+    @pytest.fixture
+    def server(self, controller, live_set):
+        state_repository = Mock()
+        state_repository.get_state.return_value = StreamStateDto(
+            is_live=True,
+            video_id="live1",
+            last_checked=datetime(2026, 1, 29, tzinfo=timezone.utc),
+            last_notified=None,
+        )
+        server = ControlServer(
+            controller,
+            0,
+            token="secret",
+            live_set=live_set,
+            state_repositories={"": state_repository},
+            wait_seconds=5,
+        )
+        # 監視スレッドの待機中の処理を模擬する
+        stopped = threading.Event()
+
+        def monitor():
+            while not stopped.wait(0.01):
+                controller._process_requests()
+
+        thread = threading.Thread(target=monitor, daemon=True)
+        thread.start()
+        server.start()
+        yield server
+        server.stop()
+        stopped.set()
+        thread.join(timeout=5)
+
+    @staticmethod
+    def request(server, method, path, body=None, token="secret"):
+        """(ステータス, JSON) を返す"""
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{server.port}{path}",
+            method=method,
+            data=json.dumps(body).encode() if body is not None else None,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def test_一覧追加削除(self, server, controller):
+        """追加・削除は監視スレッドで反映され、Webhook URLは応答に含めない"""
+        new_channel = {"id": CHANNEL_ID_2, "name": "追加", "webhooks": [{"url": WEBHOOK_URL}]}
+        status, body = self.request(server, "POST", "/channels", new_channel)
+        assert status == 201
+        assert body["webhooks"] == 1
+
+        status, body = self.request(server, "GET", "/channels")
+        assert [c["id"] for c in body["channels"]] == [CHANNEL_ID_1, CHANNEL_ID_2]
+        assert body["channels"][0]["live_video_id"] == "live1"
+        assert WEBHOOK_URL not in json.dumps(body)
+
+        assert self.request(server, "POST", "/channels", new_channel)[0] == 409
+        assert self.request(server, "DELETE", f"/channels/{CHANNEL_ID_2}")[0] == 200
+        assert self.request(server, "DELETE", f"/channels/{CHANNEL_ID_2}")[0] == 404
+        assert [str(c.id) for c in controller.channels] == [CHANNEL_ID_1]
+
+    def test_不正なリクエスト(self, server):
+        assert self.request(server, "GET", "/channels", token="wrong")[0] == 401
+        assert self.request(server, "GET", "/channels/invalid")[0] == 400
+        status, body = self.request(server, "POST", "/channels", {"id": CHANNEL_ID_2, "name": "x"})
+        assert status == 400
+        assert "Webhook" in body["error"]
+
+    def test_臨時チェックと状態(self, server, use_case):
+        """臨時チェックはユースケースを通して行い、チャンネルの状態とサイクルの集計を返す"""
+        status, body = self.request(server, "POST", f"/channels/{CHANNEL_ID_1}/check")
+
+        assert status == 200
+        assert body["cycle"]["live"] == 1
+        assert body["state"][""]["video_id"] == "live1"
+        use_case.execute.assert_called_once()
+
+        status, body = self.request(server, "GET", "/state")
+        assert status == 200
+        assert body["channels"] == 1
+        assert body["live"] == 1
+
+    def test_監視サイクルの実行中は202(self, controller, use_case):
+        """待ちきれない場合は受け付けたことだけを返し、処理は監視スレッドで後から行う"""
+        server = ControlServer(controller, 0)
+
+        with pytest.raises(ControlError) as exc_info:
+            server.handle("POST", f"/channels/{CHANNEL_ID_1}/check?wait=0.01")
+        assert exc_info.value.status == 202
+
+        controller._process_requests()
+        use_case.execute.assert_called_once()
+
+
+class TestMonitoredChannels:
+    """MonitoredChannels のテスト"""
+
+    def test_テナントの指定(self):
+        tenant = Mock()
+        tenant.name = "main"
+        tenant.channels = [channel(CHANNEL_ID_1)]
+        monitored = MonitoredChannels([], tenants=[tenant])
+
+        with pytest.raises(ValueError):
+            monitored.tenant_channels(None)
+        assert monitored.tenants_of(ChannelId(CHANNEL_ID_1)) == ["main"]
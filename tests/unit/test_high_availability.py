@@ -0,0 +1,214 @@
+"""冗長構成（リーダー選出・通知の冪等キー）のユニットテスト"""
+
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from domain.entities.channel import Channel
+from domain.entities.stream import Stream
+from domain.repositories.notification_gateway import NotificationGateway
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.webhook_config import WebhookConfig
+from application.services.clock import VirtualClock
+from application.services.leader_election import LeaderElection, NotLeaderError
+from application.services.monitor_pipeline import CycleSummary
+from application.services.stream_change_detector import StreamChangeDetector
+from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from infrastructure.persistence.sqlite_idempotency_key_repository import (
+    SqliteIdempotencyKeyRepository,
+)
+from infrastructure.persistence.sqlite_lease_repository import SqliteLeaseRepository
+from infrastructure.persistence.sqlite_state_repository import SqliteStateRepository
+from presentation.cli.monitor_controller import MonitorController
+from tests.unit.fakes import make_stream
+
+START = datetime(2026, 1, 29, 3, 1, tzinfo=timezone.utc)
+CHANNEL_ID = "UCxxxxxxxxxxxxxxxx111111"
+
+
+def channel() -> Channel:
+    return Channel(
+        id=ChannelId(CHANNEL_ID),
+        name="配信者",
+        webhooks=[WebhookConfig("https://discord.com/api/webhooks/111/aaa")],
+    )
+
+
+def stream(video_id: str = "live1") -> Stream:
+    return make_stream(video_id, started_at=START)
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock(START)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return str(tmp_path / "shared.db")
+
+
+class TestLeaderElection:
+    """SqliteLeaseRepository と LeaderElection のテスト"""
+
+    def test_リースは1つのインスタンスだけが持てる(self, store, clock):
+        leases = SqliteLeaseRepository(store, clock=clock)
+
+        assert leases.try_acquire("monitor", "a", 15)
+        assert not leases.try_acquire("monitor", "b", 15)
+        assert leases.try_acquire("monitor", "a", 15)
+        assert leases.holder("monitor") == "a"
+
+        leases.release("monitor", "b")
+        assert leases.holder("monitor") == "a"
+        leases.release("monitor", "a")
+        assert leases.try_acquire("monitor", "b", 15)
+
+    def test_延長が途絶えると待機系が引き継ぐ(self, store, clock):
+        a = LeaderElection("a", SqliteLeaseRepository(store, clock=clock), clock=clock)
+        b = LeaderElection("b", SqliteLeaseRepository(store, clock=clock), clock=clock)
+        assert a.renew()
+        assert not b.renew()
+
+        # a が停止（延長しない）
+        clock.advance(10)
+        assert not b.renew()
+        clock.advance(6)
+
+        assert not a.is_leader
+        assert b.renew()
+        assert b.take_promotion()
+        assert not b.take_promotion()
+        assert not a.renew()
+        assert a.leader() == "b"
+
+    def test_終了時にリースを手放す(self, store, clock):
+        a = LeaderElection("a", SqliteLeaseRepository(store, clock=clock), clock=clock)
+        b = LeaderElection("b", SqliteLeaseRepository(store, clock=clock), clock=clock)
+        a.renew()
+
+        a.stop()
+
+        assert b.renew()
+
+    def test_延長に失敗しても期限まではリーダー(self, clock):
+        leases = Mock()
+        leases.try_acquire.return_value = True
+        election = LeaderElection("a", leases, clock=clock)
+        election.renew()
+
+        leases.try_acquire.side_effect = OSError("disk I/O error")
+        clock.advance(10)
+        assert election.renew()
+        clock.advance(6)
+        assert not election.renew()
+
+
+class TestIdempotentNotification:
+    """通知の冪等キーのテスト"""
+
+    def test_冪等キーは名前空間ごと(self, store):
+        keys = SqliteIdempotencyKeyRepository(store)
+
+        assert keys.claim("UC:live1")
+        assert not SqliteIdempotencyKeyRepository(store).claim("UC:live1")
+        assert SqliteIdempotencyKeyRepository(store, namespace="tenant").claim("UC:live1")
+
+        keys.release("UC:live1")
+        assert keys.claim("UC:live1")
+
+    def test_保持期間を過ぎたキーは削除する(self, store, clock):
+        SqliteIdempotencyKeyRepository(store, clock=clock).claim("UC:live1")
+        clock.advance(31 * 86400)
+
+        assert SqliteIdempotencyKeyRepository(store, clock=clock).claim("UC:live1")
+
+    def test_削除の間隔は注入した時計で判定する(self, store, clock):
+        keys = SqliteIdempotencyKeyRepository(store, retention_days=1, clock=clock)
+        keys.claim("UC:live1")
+        clock.advance(2 * 86400)
+
+        keys.claim("UC:live2")
+
+        assert keys.claim("UC:live1")
+
+    def build_instance(self, store, gateway):
+        """共有ストアを使う1インスタンス分のユースケース"""
+        return MonitorStreamsUseCase(
+            stream_repository=Mock(),
+            notification_gateway=gateway,
+            state_repository=SqliteStateRepository(store),
+            change_detector=StreamChangeDetector(),
+            idempotency_keys=SqliteIdempotencyKeyRepository(store),
+        )
+
+    def test_同じ配信を2つのインスタンスが検出しても通知は1回(self, store):
+        gateway_a = Mock(spec=NotificationGateway)
+        gateway_b = Mock(spec=NotificationGateway)
+        a = self.build_instance(store, gateway_a)
+        b = self.build_instance(store, gateway_b)
+        job_a = a.detect(channel(), stream())
+        job_b = b.detect(channel(), stream())
+
+        assert a.deliver(job_a)
+        assert b.deliver(job_b)
+
+        gateway_a.notify_stream_start.assert_called_once()
+        gateway_b.notify_stream_start.assert_not_called()
+        # 引き継いだ側も通知済みとして扱い、次のサイクルでは検出しない
+        assert b.detect(channel(), stream()) is None
+
+    def test_送信に失敗した場合は他のインスタンスが再試行できる(self, store):
+        gateway_a = Mock(spec=NotificationGateway)
+        gateway_a.notify_stream_start.side_effect = ConnectionError("timeout")
+        gateway_b = Mock(spec=NotificationGateway)
+        a = self.build_instance(store, gateway_a)
+        b = self.build_instance(store, gateway_b)
+
+        assert not a.deliver(a.detect(channel(), stream()))
+        assert b.deliver(b.detect(channel(), stream()))
+
+        gateway_b.notify_stream_start.assert_called_once()
+
+
+class TestStandbyController:
+    """待機系の MonitorController のテスト"""
+
+    @pytest.fixture
+    def use_case(self):
+        use_case = Mock(spec=MonitorStreamsUseCase)
+        use_case.execute.side_effect = lambda channels: CycleSummary(channels=len(channels))
+        return use_case
+
+    def build(self, store, clock, use_case, instance_id):
+        leader = LeaderElection(instance_id, SqliteLeaseRepository(store, clock=clock), clock=clock)
+        controller = MonitorController(
+            use_case=use_case, channels=[channel()], check_interval=300, clock=clock, leader=leader
+        )
+        return controller, leader
+
+    def test_待機系は監視せずリーダーを引き継いだら再開する(self, store, clock, use_case):
+        _, active = self.build(store, clock, Mock(), "a")
+        standby, leader = self.build(store, clock, use_case, "b")
+        active.renew()
+        leader.renew()
+
+        standby._run_cycle()
+        assert standby.health() == (True, "standby")
+        future = standby.request_check([ChannelId(CHANNEL_ID)])
+        standby._process_requests()
+        with pytest.raises(NotLeaderError):
+            future.result(timeout=0)
+        use_case.execute.assert_not_called()
+
+        # 稼働系が停止し、リースが失効した後の最初の延長で引き継ぐ
+        clock.advance(16)
+        leader.renew()
+        standby._running = True
+        standby._wait_with_interrupt_check(300, check_interval=1)
+        assert standby._wake_requested
+        assert clock.monotonic() == 17
+
+        standby._run_cycle()
+        use_case.execute.assert_called_once_with([channel()])
@@ -0,0 +1,206 @@
+"""LatencyRecorderと通知遅延の記録のユニットテスト"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+from domain.entities.channel import Channel
+from domain.entities.stream import Stream
+from domain.repositories.notification_gateway import NotificationGateway
+from domain.repositories.stream_repository import StreamRepository
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.stream_fetch_result import StreamFetchResult
+from domain.value_objects.stream_status import StreamStatus
+from domain.value_objects.webhook_config import WebhookConfig
+from domain.value_objects.webhook_delivery import WebhookDelivery
+from application.dto.notification_job import NotificationJob
+from application.dto.notification_latency_dto import NotificationLatencyDto
+from application.services.latency_recorder import (
+    DETECTION,
+    DISPATCH,
+    END_TO_END,
+    LatencyHistogram,
+    LatencyRecorder,
+)
+from application.services.stream_change_detector import StreamChangeDetector
+from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from infrastructure.persistence.jsonl_latency_repository import JsonlLatencyRepository
+from tests.unit.fakes import InMemoryStateRepository, make_channel, make_stream
+
+CHANNEL_ID = "UCxxxxxxxxxxxxxxxx111111"
+WEBHOOK_URL = "https://discord.com/api/webhooks/123456/secret-token"
+STARTED_AT = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def make_record(channel_id=CHANNEL_ID, delivered_after=30.0) -> NotificationLatencyDto:
+    return NotificationLatencyDto(
+        channel_id=channel_id,
+        channel_name="テストチャンネル",
+        video_id="live1",
+        started_at=STARTED_AT,
+        detected_at=STARTED_AT + timedelta(seconds=20),
+        queued_at=STARTED_AT + timedelta(seconds=21),
+        deliveries=[WebhookDelivery(WEBHOOK_URL, STARTED_AT + timedelta(seconds=delivered_after))],
+    )
+
+
+class TestLatencyHistogram:
+    """LatencyHistogram のテスト"""
+
+    def test_パーセンタイル(self):
+        """最近傍順位法でp50/p95/p99を計算する"""
+        histogram = LatencyHistogram()
+        for seconds in range(1, 101):
+            histogram.add(float(seconds))
+
+        summary = histogram.summary()
+
+        assert summary["count"] == 100
+        assert summary["p50"] == 50.0
+        assert summary["p95"] == 95.0
+        assert summary["p99"] == 99.0
+        assert summary["max"] == 100.0
+
+    def test_保持数を超えたら古いサンプルを捨てる(self):
+        """パーセンタイルは直近window件から計算し、件数は累計"""
+        histogram = LatencyHistogram(window=2)
+        for seconds in (100.0, 1.0, 2.0):
+            histogram.add(seconds)
+
+        assert histogram.count == 3
+        assert histogram.percentile(99) == 2.0
+
+
+class TestLatencyRecorder:
+    """LatencyRecorder のテスト"""
+
+    def test_チャンネルごとと全体に集計(self):
+        """チャンネルごとのヒストグラムと全体のヒストグラムの両方に記録する"""
+        recorder = LatencyRecorder()
+        recorder.record(make_record(delivered_after=30.0))
+        recorder.record(make_record(channel_id="UCyyyyyyyyyyyyyyyy222222", delivered_after=60.0))
+
+        channel_summary = recorder.summary(CHANNEL_ID)
+        global_summary = recorder.summary()
+
+        assert channel_summary[END_TO_END]["count"] == 1
+        assert channel_summary[END_TO_END]["p99"] == 30.0
+        assert channel_summary[DETECTION]["p50"] == 20.0
+        assert channel_summary[DISPATCH]["p50"] == 9.0
+        assert global_summary[END_TO_END]["count"] == 2
+        assert global_summary[END_TO_END]["p99"] == 60.0
+        assert sorted(recorder.channel_ids()) == [CHANNEL_ID, "UCyyyyyyyyyyyyyyyy222222"]
+
+    def test_JSONLに追記_トークンは保存しない(self, tmp_path):
+        """記録は1行1件で追記され、WebhookはIDのみ保存される"""
+        path = tmp_path / "latency.jsonl"
+        recorder = LatencyRecorder(JsonlLatencyRepository(str(path)))
+
+        recorder.record(make_record())
+        recorder.record(make_record())
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        data = json.loads(lines[0])
+        assert data["deliveries"][0]["webhook_id"] == "123456"
+        assert data["end_to_end_seconds"] == [30.0]
+        assert "secret-token" not in lines[0]
+
+
+class TestMonitorStreamsUseCaseLatency:
+    """ユースケースでの通知遅延記録のテスト"""
+
+    def test_通知ごとに遅延を記録(self):
+        """配信開始の通知でWebhookごとの送信完了時刻が記録される"""
+        channel = Channel(
+            id=ChannelId(CHANNEL_ID),
+            name="テストチャンネル",
+            webhooks=[WebhookConfig(url="https://discord.com/api/webhooks/111/aaa")],
+        )
+        stream = Stream(
+            video_id="live1",
+            title="テスト配信",
+            thumbnail_url="http://example.com/thumb.jpg",
+            started_at=datetime.now(timezone.utc) - timedelta(seconds=45),
+            status=StreamStatus.LIVE,
+        )
+        stream_repo = Mock(spec=StreamRepository)
+        stream_repo.get_current_streams.return_value = {channel.id: StreamFetchResult(stream)}
+        gateway = Mock(spec=NotificationGateway)
+        gateway.notify_stream_start.side_effect = lambda channel, stream: [
+            WebhookDelivery(channel.webhooks[0].url, datetime.now(timezone.utc))
+        ]
+        recorder = LatencyRecorder()
+        use_case = MonitorStreamsUseCase(
+            stream_repository=stream_repo,
+            notification_gateway=gateway,
+            state_repository=InMemoryStateRepository(),
+            change_detector=StreamChangeDetector(),
+            latency_recorder=recorder,
+        )
+
+        use_case.execute([channel])
+
+        summary = recorder.summary(CHANNEL_ID)
+        assert summary[END_TO_END]["count"] == 1
+        assert 45.0 <= summary[END_TO_END]["p50"] < 60.0
+        assert summary[DETECTION]["p50"] <= summary[END_TO_END]["p50"]
+
+    def test_送信できたWebhookがなくても通知処理を続ける(self):
+        """ゲートウェイが空の送信結果を返した場合も例外にせず検知遅延だけ記録する"""
+        channel = Channel(
+            id=ChannelId(CHANNEL_ID),
+            name="テストチャンネル",
+            webhooks=[WebhookConfig(url="https://discord.com/api/webhooks/111/aaa")],
+        )
+        stream = Stream(
+            video_id="live1",
+            title="テスト配信",
+            thumbnail_url="http://example.com/thumb.jpg",
+            started_at=datetime.now(timezone.utc) - timedelta(seconds=45),
+            status=StreamStatus.LIVE,
+        )
+        gateway = Mock(spec=NotificationGateway)
+        gateway.notify_stream_start.return_value = []
+        state_repo = InMemoryStateRepository()
+        recorder = LatencyRecorder()
+        use_case = MonitorStreamsUseCase(
+            stream_repository=Mock(spec=StreamRepository),
+            notification_gateway=gateway,
+            state_repository=state_repo,
+            change_detector=StreamChangeDetector(),
+            latency_recorder=recorder,
+        )
+
+        job = NotificationJob(channel, stream, detected_at=datetime.now(timezone.utc))
+
+        assert use_case.deliver(job) is True
+        summary = recorder.summary(CHANNEL_ID)
+        assert summary[END_TO_END]["count"] == 0
+        assert summary[DETECTION]["count"] == 1
+        assert state_repo.states[CHANNEL_ID].video_id == "live1"
+
+    def test_送信完了時刻を返さないゲートウェイは送信処理の完了時刻で代用する(self):
+        """ゲートウェイがNoneを返した場合は送信処理の完了時刻を通知到達とみなす"""
+        started_at = datetime.now(timezone.utc) - timedelta(seconds=45)
+        gateway = Mock(spec=NotificationGateway)
+        gateway.notify_stream_start.return_value = None
+        recorder = LatencyRecorder()
+        use_case = MonitorStreamsUseCase(
+            stream_repository=Mock(spec=StreamRepository),
+            notification_gateway=gateway,
+            state_repository=InMemoryStateRepository(),
+            change_detector=StreamChangeDetector(),
+            latency_recorder=recorder,
+        )
+
+        job = NotificationJob(
+            make_channel(CHANNEL_ID),
+            make_stream("live1", started_at=started_at),
+            detected_at=datetime.now(timezone.utc),
+        )
+
+        assert use_case.deliver(job) is True
+        summary = recorder.summary(CHANNEL_ID)
+        assert summary[END_TO_END]["count"] == 1
+        assert 45.0 <= summary[END_TO_END]["p50"] < 60.0
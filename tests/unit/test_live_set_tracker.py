@@ -0,0 +1,219 @@
+"""LiveSetTrackerと配信中セットの一括確認のユニットテスト"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+
+from domain.repositories.notification_gateway import NotificationGateway
+from domain.repositories.stream_repository import StreamRepository
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.stream_fetch_result import StreamFetchResult
+from domain.value_objects.stream_status import StreamStatus
+from application.dto.notified_video_index import NotifiedVideoIndex
+from application.dto.stream_state_dto import StreamStateDto
+from application.services.live_set_tracker import LiveSetTracker
+from application.services.stream_change_detector import StreamChangeDetector
+from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from infrastructure.youtube.youtube_stream_repository import YouTubeStreamRepository
+from tests.unit.fakes import InMemoryStateRepository, make_channel, make_stream
+
+CHANNEL_ID_1 = "UCxxxxxxxxxxxxxxxx111111"
+CHANNEL_ID_2 = "UCxxxxxxxxxxxxxxxx222222"
+
+
+class TestLiveSetTracker:
+    """LiveSetTrackerのテスト"""
+
+    def test_refresh_配信継続と終了を判定(self):
+        """配信中の動画は継続、終了した動画はNoneになる"""
+        tracker = LiveSetTracker()
+        tracker.track(ChannelId(CHANNEL_ID_1), "live1")
+        tracker.track(ChannelId(CHANNEL_ID_2), "ended2")
+
+        repo = Mock(spec=StreamRepository)
+        repo.get_streams.return_value = {
+            "live1": make_stream("live1", viewers=1234),
+            "ended2": make_stream("ended2", status=StreamStatus.ENDED),
+        }
+
+        results = tracker.refresh(repo)
+
+        repo.get_streams.assert_called_once()
+        assert sorted(repo.get_streams.call_args[0][0]) == ["ended2", "live1"]
+        live = results[ChannelId(CHANNEL_ID_1)]
+        assert live is not None and live.video_id == "live1"
+        assert results[ChannelId(CHANNEL_ID_2)] is None
+        assert tracker.get_concurrent_viewers(ChannelId(CHANNEL_ID_1)) == 1234
+
+    def test_refresh_削除された動画は終了扱い(self):
+        """取得できなかった動画は配信終了とみなす"""
+        tracker = LiveSetTracker()
+        tracker.track(ChannelId(CHANNEL_ID_1), "deleted")
+
+        repo = Mock(spec=StreamRepository)
+        repo.get_streams.return_value = {}
+
+        assert tracker.refresh(repo) == {ChannelId(CHANNEL_ID_1): None}
+
+    def test_refresh_追跡なしの場合はAPIを呼ばない(self):
+        """追跡中の配信がなければAPIを呼ばない"""
+        tracker = LiveSetTracker()
+        repo = Mock(spec=StreamRepository)
+
+        assert tracker.refresh(repo) == {}
+        repo.get_streams.assert_not_called()
+
+    def test_untrack(self):
+        """追跡対象から外せる"""
+        tracker = LiveSetTracker()
+        tracker.track(ChannelId(CHANNEL_ID_1), "live1")
+        tracker.untrack(ChannelId(CHANNEL_ID_1))
+
+        assert not tracker.is_tracked(ChannelId(CHANNEL_ID_1))
+        assert len(tracker) == 0
+
+
+class TestMonitorStreamsUseCaseLiveSet:
+    """ユースケースでの配信中セット利用のテスト"""
+
+    @pytest.fixture
+    def stream_repo(self):
+        return Mock(spec=StreamRepository)
+
+    @pytest.fixture
+    def state_repo(self):
+        return InMemoryStateRepository()
+
+    @pytest.fixture
+    def use_case(self, stream_repo, state_repo):
+        return MonitorStreamsUseCase(
+            stream_repository=stream_repo,
+            notification_gateway=Mock(spec=NotificationGateway),
+            state_repository=state_repo,
+            change_detector=StreamChangeDetector(),
+        )
+
+    @pytest.fixture
+    def live1(self, state_repo):
+        """配信中（live1）として通知済みのチャンネル"""
+        channel = make_channel(CHANNEL_ID_1)
+        state_repo.save_state(
+            channel.id,
+            StreamStateDto(
+                is_live=True,
+                video_id="live1",
+                last_checked=datetime.now(),
+                last_notified=datetime.now(),
+                notified=NotifiedVideoIndex.empty().with_video("live1", 10, 0),
+            ),
+        )
+        return channel
+
+    def test_配信中チェックは一括確認のみ(self, use_case, stream_repo, state_repo, live1):
+        """配信継続中のチャンネルは配信中チェックで通常の一括取得を行わない"""
+        stream_repo.get_streams.return_value = {"live1": make_stream("live1")}
+
+        use_case.check_live_streams([live1])
+
+        stream_repo.get_current_streams.assert_not_called()
+        assert state_repo.get_state(live1.id).is_live is True
+
+    def test_配信終了を検知して状態を更新(self, use_case, stream_repo, state_repo, live1, caplog):
+        """一括確認で終了した配信は同じ確認の中で通常どおり取得し、未配信状態に更新される"""
+        stream_repo.get_streams.return_value = {
+            "live1": make_stream("live1", status=StreamStatus.ENDED)
+        }
+        stream_repo.get_current_streams.return_value = {live1.id: StreamFetchResult()}
+
+        with caplog.at_level("INFO"):
+            use_case.check_live_streams([live1])
+
+        stream_repo.get_current_streams.assert_called_once_with([live1])
+        assert state_repo.get_state(live1.id).is_live is False
+        assert "配信終了を検知" in caplog.text
+
+    def test_終了直後に始まった次の配信を同じ確認で検知(
+        self, use_case, stream_repo, state_repo, live1
+    ):
+        """追跡中の配信が終了し、すでに次の配信が始まっている場合"""
+        stream_repo.get_streams.return_value = {
+            "live1": make_stream("live1", status=StreamStatus.ENDED)
+        }
+        stream_repo.get_current_streams.return_value = {
+            live1.id: StreamFetchResult(stream=make_stream("live2"))
+        }
+
+        summary = use_case.check_live_streams([live1])
+
+        assert summary.notified == 1
+        assert state_repo.get_state(live1.id).video_id == "live2"
+
+    def test_通常チェックでは配信中チャンネルの並行配信を検知(
+        self, use_case, stream_repo, state_repo, live1
+    ):
+        """追跡中の配信が続いている間に始まった別の配信"""
+        use_case.seed_live_set([live1])
+        stream_repo.get_current_streams.return_value = {
+            live1.id: StreamFetchResult(stream=make_stream("live2"))
+        }
+
+        summary = use_case.execute([live1])
+
+        stream_repo.get_current_streams.assert_called_once_with([live1])
+        stream_repo.get_streams.assert_not_called()
+        assert summary.notified == 1
+        assert state_repo.get_state(live1.id).video_id == "live2"
+
+    def test_一括確認失敗時は次の通常チェックで確認(self, use_case, stream_repo, state_repo, live1):
+        """get_streams が失敗した場合は状態を変えず、通常チェックで確認する"""
+        stream_repo.get_streams.side_effect = RuntimeError("network")
+
+        use_case.check_live_streams([live1])
+
+        stream_repo.get_current_streams.assert_not_called()
+        assert state_repo.get_state(live1.id).is_live is True
+
+        stream_repo.get_current_streams.return_value = {
+            live1.id: StreamFetchResult(stream=make_stream("live1"))
+        }
+        use_case.execute([live1])
+        stream_repo.get_current_streams.assert_called_once_with([live1])
+
+
+class TestParseVideo:
+    """videos.listレスポンスの解析テスト"""
+
+    def _video(self, live_broadcast_content="live", **live_details):
+        return {
+            "id": "vid1",
+            "snippet": {
+                "title": "配信タイトル",
+                "publishedAt": "2026-01-01T00:00:00Z",
+                "liveBroadcastContent": live_broadcast_content,
+                "thumbnails": {"high": {"url": "http://example.com/thumb.jpg"}},
+            },
+            "liveStreamingDetails": live_details,
+        }
+
+    def test_配信中(self):
+        stream = YouTubeStreamRepository._parse_video(
+            self._video(actualStartTime="2026-01-01T01:00:00Z", concurrentViewers="42")
+        )
+        assert stream.is_live()
+        assert stream.concurrent_viewers == 42
+
+    def test_actualEndTimeがあれば終了(self):
+        stream = YouTubeStreamRepository._parse_video(
+            self._video(
+                live_broadcast_content="none",
+                actualStartTime="2026-01-01T01:00:00Z",
+                actualEndTime="2026-01-01T02:00:00Z",
+            )
+        )
+        assert stream.is_ended()
+        assert stream.ended_at is not None
+
+    def test_配信予定は未配信(self):
+        video = self._video(live_broadcast_content="upcoming")
+        stream = YouTubeStreamRepository._parse_video(video)
+        assert stream.status == StreamStatus.OFFLINE
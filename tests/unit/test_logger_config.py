@@ -0,0 +1,117 @@
+"""ロギング設定のユニットテスト"""
+
+import json
+import logging
+import threading
+
+import pytest
+
+from infrastructure.logging.logger_config import (
+    ChannelSamplingFilter,
+    setup_logging,
+    shutdown_logging,
+)
+from application.services.tracer import Tracer
+
+
+class ThreadRecordingArg:
+    """文字列化されたスレッドを記録するログ引数"""
+
+    def __init__(self):
+        self.formatted_in = None
+
+    def __str__(self):
+        self.formatted_in = threading.current_thread().name
+        return "arg"
+
+
+@pytest.fixture
+def restore_root_logger():
+    """ルートロガーのレベルとハンドラーをテスト後に元に戻す"""
+    root = logging.getLogger()
+    level, handlers = root.level, list(root.handlers)
+    yield
+    shutdown_logging()
+    root.setLevel(level)
+    root.handlers[:] = handlers
+
+
+class TestSetupLogging:
+    """setup_logging のテスト"""
+
+    def test_整形と書き込みはリスナースレッドで行う(self, tmp_path, restore_root_logger):
+        """呼び出し側はキューに入れるだけで、%形式の引数の展開もリスナーが行う"""
+        log_file = tmp_path / "monitor.log"
+        setup_logging("DEBUG", str(log_file))
+        arg = ThreadRecordingArg()
+
+        logging.getLogger("test").debug("チャンネル %s をチェック中", arg)
+        shutdown_logging()
+
+        assert "チャンネル arg をチェック中" in log_file.read_text(encoding="utf-8")
+        assert arg.formatted_in is not None
+        assert arg.formatted_in != threading.current_thread().name
+
+    def test_再設定してもハンドラーが重複しない(self, tmp_path, restore_root_logger):
+        """2回目の呼び出しでは前回のリスナーを停止してから設定し直す"""
+        root = logging.getLogger()
+        before = len(root.handlers)
+
+        setup_logging("INFO", str(tmp_path / "a.log"))
+        setup_logging("INFO", str(tmp_path / "b.log"))
+
+        assert len(root.handlers) == before + 1
+
+    def test_JSON形式でextraの項目とサイクルIDを出力(self, tmp_path, restore_root_logger):
+        """extra で渡した項目と、実行中の監視サイクルのトレースIDが項目になる"""
+        log_file = tmp_path / "monitor.log"
+        setup_logging("DEBUG", str(log_file), log_format="json")
+
+        with Tracer().span("monitor.cycle") as cycle:
+            logging.getLogger("test").info(
+                "配信開始を検知: %s",
+                "テストチャンネル",
+                extra={"channel_id": "UC1", "video_id": "v1", "event": "stream_started"},
+            )
+        shutdown_logging()
+
+        lines = [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+        record = next(line for line in lines if line.get("event") == "stream_started")
+        assert record["message"] == "配信開始を検知: テストチャンネル"
+        assert record["level"] == "INFO"
+        assert record["channel_id"] == "UC1"
+        assert record["video_id"] == "v1"
+        assert record["cycle_id"] == cycle.trace_id
+
+    def test_不正な出力形式はエラー(self, tmp_path, restore_root_logger):
+        """text / json 以外はエラー"""
+        with pytest.raises(ValueError):
+            setup_logging("INFO", str(tmp_path / "monitor.log"), log_format="xml")
+
+
+class TestChannelSamplingFilter:
+    """ChannelSamplingFilter のテスト"""
+
+    @staticmethod
+    def make_record(level=logging.DEBUG, **extra):
+        record = logging.makeLogRecord({"levelno": level, "msg": "test", "cycle_id": "c1"})
+        record.__dict__.update(extra)
+        return record
+
+    def test_定常的なチャンネルのログだけを間引く(self):
+        """警告以上・event付き・チャンネル以外のログは常に残す"""
+        drop_all = ChannelSamplingFilter(0.0)
+
+        assert not drop_all.filter(self.make_record(channel_id="UC1"))
+        assert not drop_all.filter(self.make_record(logging.INFO, channel_id="UC1"))
+        assert drop_all.filter(self.make_record(logging.WARNING, channel_id="UC1"))
+        assert drop_all.filter(self.make_record(logging.INFO, channel_id="UC1", event="x"))
+        assert drop_all.filter(self.make_record(logging.INFO))
+
+    def test_採否はチャンネルとサイクルごとに一定(self):
+        """同じチャンネル・サイクルのログは同じ判定になり、全体ではおおよそ指定の割合が残る"""
+        sampling = ChannelSamplingFilter(0.1)
+        kept = [sampling.filter(self.make_record(channel_id=f"UC{i}")) for i in range(2000)]
+
+        assert kept == [sampling.filter(self.make_record(channel_id=f"UC{i}")) for i in range(2000)]
+        assert 100 < sum(kept) < 300
@@ -0,0 +1,103 @@
+"""メモリ削減（スロット・値オブジェクトのインターン）のユニットテスト"""
+
+import copy
+import gc
+import pickle
+
+import pytest
+
+from benchmarks.memory_benchmark import run
+from domain.entities.channel import Channel
+from domain.entities.stream import Stream
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.webhook_config import WebhookConfig
+from application.dto.notified_video_index import NotifiedVideoIndex
+from application.dto.stream_state_dto import StreamStateDto
+
+CHANNEL_ID = "UCxxxxxxxxxxxxxxxx111111"
+WEBHOOK_URL = "https://discord.com/api/webhooks/111/aaa"
+
+
+class TestInterning:
+    """値オブジェクトのインターンのテスト"""
+
+    def test_同じ値のチャンネルIDは同じインスタンス(self):
+        assert ChannelId(CHANNEL_ID) is ChannelId(CHANNEL_ID)
+        assert ChannelId(CHANNEL_ID) is not ChannelId("UCxxxxxxxxxxxxxxxx222222")
+
+    def test_同じURLとメンションのWebhookは同じインスタンス(self):
+        assert WebhookConfig(WEBHOOK_URL, "@everyone") is WebhookConfig(
+            url=WEBHOOK_URL, mention="@everyone"
+        )
+        assert WebhookConfig(WEBHOOK_URL) is not WebhookConfig(WEBHOOK_URL, "@everyone")
+
+    def test_不正な値はキャッシュしない(self):
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                ChannelId("invalid")
+
+    def test_変更できない(self):
+        channel_id = ChannelId(CHANNEL_ID)
+        with pytest.raises(AttributeError):
+            channel_id.value = "UCxxxxxxxxxxxxxxxx222222"
+        with pytest.raises(AttributeError):
+            del WebhookConfig(WEBHOOK_URL).url
+
+    def test_コピーとpickleでも同じインスタンス(self):
+        channel_id = ChannelId(CHANNEL_ID)
+        webhook = WebhookConfig(WEBHOOK_URL, "@everyone")
+
+        assert copy.copy(channel_id) is channel_id
+        assert copy.deepcopy(webhook) is webhook
+        assert pickle.loads(pickle.dumps(channel_id)) is channel_id
+        assert pickle.loads(pickle.dumps(webhook)) is webhook
+
+    def test_参照されなくなったインスタンスは表から消える(self):
+        """監視対象から外れたチャンネル・Webhookのインスタンスが残り続けない"""
+        value = "UCxxxxxxxxxxxxxxxx999999"
+        key = ("https://discord.com/api/webhooks/999/zzz", "")
+        channel_id = ChannelId(value)
+        webhook = WebhookConfig(*key)
+        assert value in ChannelId._instances
+        assert key in WebhookConfig._instances
+
+        del channel_id, webhook
+        gc.collect()
+
+        assert value not in ChannelId._instances
+        assert key not in WebhookConfig._instances
+
+
+class TestSlots:
+    """スロットのテスト"""
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            ChannelId(CHANNEL_ID),
+            WebhookConfig(WEBHOOK_URL),
+            Channel(id=ChannelId(CHANNEL_ID), name="配信者", webhooks=[WebhookConfig(WEBHOOK_URL)]),
+            StreamStateDto.from_dict({"is_live": False, "last_checked": "2026-01-29T12:00:00"}),
+        ],
+    )
+    def test_インスタンスごとの辞書を持たない(self, obj):
+        assert not hasattr(obj, "__dict__")
+
+    def test_エンティティのスロットとフィールドが一致する(self):
+        assert set(Stream.__slots__) == set(Stream.__dataclass_fields__)
+
+    def test_空の通知履歴は共有する(self):
+        a = StreamStateDto.from_dict({"is_live": False, "last_checked": "2026-01-29T12:00:00"})
+        b = StreamStateDto.from_dict({"is_live": False, "last_checked": "2026-01-29T12:00:00"})
+
+        assert a.notified is b.notified is NotifiedVideoIndex.empty()
+
+
+class TestMemoryBenchmark:
+    """memory_benchmark のテスト"""
+
+    def test_従来の表現よりメモリが少ない(self):
+        result = run(channel_count=2000, webhook_count=10)
+
+        assert result["current"]["bytes"] < result["legacy"]["bytes"]
+        assert result["reduction_ratio"] > 0.2
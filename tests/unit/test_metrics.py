@@ -0,0 +1,151 @@
+"""メトリクスとメトリクスサーバーのユニットテスト"""
+
+import time
+import urllib.error
+import urllib.request
+from unittest.mock import Mock
+
+import pytest
+
+from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from infrastructure.metrics import monitor_metrics as metrics
+from infrastructure.metrics.metrics_server import MetricsServer
+from infrastructure.metrics.registry import MetricsRegistry
+from infrastructure.metrics.registry_monitor_metrics import RegistryMonitorMetrics
+from domain.repositories.errors import QuotaExceededError
+from presentation.cli.monitor_controller import MonitorController
+
+
+class TestMetricsRegistry:
+    """MetricsRegistry のテスト"""
+
+    def test_テキスト形式で出力(self):
+        """Counter / Gauge / Histogram がPrometheusのテキスト形式で出力される"""
+        registry = MetricsRegistry()
+        calls = registry.counter("api_calls_total", "呼び出し回数", ["endpoint"])
+        depth = registry.gauge("queue_depth", "キューの長さ")
+        duration = registry.histogram("cycle_seconds", "所要時間", buckets=(1.0, 5.0))
+
+        calls.inc(endpoint="videos.list")
+        calls.inc(2, endpoint="videos.list")
+        depth.set(3)
+        duration.observe(0.5)
+        duration.observe(10.0)
+
+        text = registry.render()
+
+        assert "# TYPE api_calls_total counter" in text
+        assert 'api_calls_total{endpoint="videos.list"} 3' in text
+        assert "queue_depth 3" in text
+        assert 'cycle_seconds_bucket{le="1"} 1' in text
+        assert 'cycle_seconds_bucket{le="5"} 1' in text
+        assert 'cycle_seconds_bucket{le="+Inf"} 2' in text
+        assert "cycle_seconds_count 2" in text
+        assert "cycle_seconds_sum 10.5" in text
+
+    def test_同名の登録は同じメトリクスを返す(self):
+        """同じ名前・種類で登録した場合は既存のメトリクスを共有する"""
+        registry = MetricsRegistry()
+
+        assert registry.counter("x_total", "x") is registry.counter("x_total", "x")
+        with pytest.raises(ValueError):
+            registry.gauge("x_total", "x")
+
+    def test_ラベル不一致はエラー(self):
+        """定義と異なるラベルで記録した場合はValueError"""
+        counter = MetricsRegistry().counter("y_total", "y", ["status"])
+
+        with pytest.raises(ValueError):
+            counter.inc(code="204")
+
+
+class TestRegistryMonitorMetrics:
+    """RegistryMonitorMetrics のテスト"""
+
+    def test_アプリケーション層の記録をメトリクスに反映(self):
+        """サービスから注入された記録先への記録が /metrics で出力するメトリクスに反映される"""
+        monitor_metrics = RegistryMonitorMetrics()
+        probes_before = metrics.QUOTA_PROBES.value(result="quota")
+        deduplicated_before = metrics.NOTIFICATIONS_DEDUPLICATED.value()
+
+        monitor_metrics.quota_degraded(True)
+        monitor_metrics.quota_probed("quota")
+        monitor_metrics.leader_changed(True)
+        monitor_metrics.notification_deduplicated()
+
+        assert metrics.QUOTA_DEGRADED.value() == 1
+        assert metrics.QUOTA_PROBES.value(result="quota") == probes_before + 1
+        assert metrics.LEADER.value() == 1
+        assert metrics.NOTIFICATIONS_DEDUPLICATED.value() == deduplicated_before + 1
+        assert monitor_metrics.quota_units_total() == metrics.QUOTA_UNITS.total()
+
+        monitor_metrics.quota_degraded(False)
+        monitor_metrics.leader_changed(False)
+        assert metrics.QUOTA_DEGRADED.value() == 0
+
+
+class TestMetricsServer:
+    """MetricsServer のテスト"""
+
+    def test_metricsとhealthz(self):
+        """/metrics はテキスト形式、/healthz はヘルスチェックの結果に応じたステータスを返す"""
+        registry = MetricsRegistry()
+        registry.counter("requests_total", "リクエスト数").inc()
+        healthy = {"value": True}
+        server = MetricsServer(
+            0, registry=registry, health_check=lambda: (healthy["value"], "detail")
+        )
+        server.start()
+        try:
+            base = f"http://127.0.0.1:{server.port}"
+            with urllib.request.urlopen(f"{base}/metrics", timeout=5) as response:
+                assert response.status == 200
+                assert "requests_total 1" in response.read().decode("utf-8")
+
+            with urllib.request.urlopen(f"{base}/healthz", timeout=5) as response:
+                assert response.status == 200
+
+            healthy["value"] = False
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen(f"{base}/healthz", timeout=5)
+            assert exc_info.value.code == 503
+        finally:
+            server.stop()
+
+
+class TestMonitorControllerMetrics:
+    """MonitorController のメトリクス記録とヘルスチェックのテスト"""
+
+    @pytest.fixture
+    def use_case(self):
+        return Mock(spec=MonitorStreamsUseCase)
+
+    def test_サイクルの結果を記録(self, use_case):
+        """成功・クォータ超過それぞれのサイクルが記録される"""
+        controller = MonitorController(use_case=use_case, channels=[], check_interval=300)
+        success_before = metrics.CYCLES.value(result="success")
+        quota_before = metrics.CYCLES.value(result="quota")
+
+        controller._run_cycle()
+        use_case.execute.side_effect = QuotaExceededError("quota")
+        with pytest.raises(QuotaExceededError):
+            controller._run_cycle()
+
+        assert metrics.CYCLES.value(result="success") == success_before + 1
+        assert metrics.CYCLES.value(result="quota") == quota_before + 1
+        assert metrics.SECONDS_SINCE_LAST_SUCCESS.value() is not None
+
+    def test_サイクルが止まるとhealthzが失敗(self, use_case):
+        """成功したサイクルが stall_seconds 以上ない場合は異常"""
+        controller = MonitorController(
+            use_case=use_case, channels=[], check_interval=300, stall_seconds=60
+        )
+        controller._run_cycle()
+        assert controller.health()[0] is True
+
+        controller._last_success_at = time.monotonic() - 120
+        assert controller.health()[0] is False
+
+        # クォータ超過による待機中は正常
+        controller._quota_wait_until = time.monotonic() + 3600
+        assert controller.health()[0] is True
@@ -0,0 +1,201 @@
+"""MonitorPipelineのユニットテスト"""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from domain.repositories.notification_gateway import NotificationGateway
+from domain.repositories.stream_repository import StreamRepository
+from domain.value_objects.stream_fetch_result import StreamFetchResult
+from application.services.monitor_pipeline import (
+    DETECT_STAGE,
+    FETCH_STAGE,
+    NOTIFY_STAGE,
+    MonitorPipeline,
+)
+from application.services.stream_change_detector import StreamChangeDetector
+from application.services.stream_fetch_service import StreamFetchService
+from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from domain.repositories.errors import QuotaExceededError
+from tests.unit.fakes import InMemoryStateRepository, make_channel, make_stream
+
+CHANNEL_IDS = [f"UCxxxxxxxxxxxxxxxx{i:06d}" for i in range(1, 5)]
+
+
+class FakeStreamRepository(StreamRepository):
+    """チャンネルID → 配信中の動画ID を返し、取得したチャンクを記録するフェイク"""
+
+    def __init__(self, live):
+        self.live = live
+        self.fetched_chunks = []
+
+    def get_current_stream(self, channel):
+        raise NotImplementedError
+
+    def get_current_streams(self, channels):
+        self.fetched_chunks.append([c.id for c in channels])
+        return {
+            c.id: StreamFetchResult(
+                stream=make_stream(self.live[c.id]) if c.id in self.live else None
+            )
+            for c in channels
+        }
+
+    def get_streams(self, video_ids):
+        return {}
+
+
+@pytest.fixture
+def channels():
+    return [make_channel(c) for c in CHANNEL_IDS]
+
+
+def build(stream_repo, gateway=None, **pipeline_options):
+    fetch_service = StreamFetchService(stream_repo)
+    pipeline = MonitorPipeline(fetch_service, **pipeline_options)
+    state_repo = InMemoryStateRepository()
+    use_case = MonitorStreamsUseCase(
+        stream_repository=stream_repo,
+        notification_gateway=gateway or Mock(spec=NotificationGateway),
+        state_repository=state_repo,
+        change_detector=StreamChangeDetector(),
+        fetch_service=fetch_service,
+        pipeline=pipeline,
+    )
+    return use_case, pipeline, state_repo
+
+
+class TestMonitorPipeline:
+    """MonitorPipeline のテスト"""
+
+    def test_遅い通知が後続の取得を止めない(self, channels):
+        """通知送信中でも残りのチャンクの取得・検出は進む"""
+        repo = FakeStreamRepository(live={channels[0].id: "live1"})
+        release = threading.Event()
+        fetched_during_notify = []
+
+        gateway = Mock(spec=NotificationGateway)
+
+        def slow_notify(channel, stream):
+            # 通知を止めている間に他のチャンクが取得されることを確認
+            release.wait(timeout=5)
+            fetched_during_notify.append(len(repo.fetched_chunks))
+
+        gateway.notify_stream_start.side_effect = slow_notify
+
+        original = repo.get_current_streams
+
+        def fetch_and_release(chunk):
+            results = original(chunk)
+            if len(repo.fetched_chunks) == len(channels):
+                release.set()
+            return results
+
+        use_case, _, state_repo = build(
+            repo, gateway, chunk_size=1, fetch_workers=1, notify_priority_wait=0
+        )
+
+        with patch.object(repo, "get_current_streams", fetch_and_release):
+            use_case.execute(channels)
+
+        assert fetched_during_notify == [len(channels)]
+        assert state_repo.get_state(channels[0].id).is_live is True
+
+    def test_チャンク単位で取得(self, channels):
+        """chunk_size件ごとにまとめて取得する"""
+        repo = FakeStreamRepository(live={})
+        use_case, _, _ = build(repo, chunk_size=3, fetch_workers=1)
+
+        use_case.execute(channels)
+
+        assert sorted(len(chunk) for chunk in repo.fetched_chunks) == [1, 3]
+
+    def test_ステージごとのカウンター(self, channels):
+        """取得・検出・通知の処理件数が記録される"""
+        repo = FakeStreamRepository(live={channels[0].id: "live1", channels[1].id: "live2"})
+        use_case, pipeline, _ = build(repo, chunk_size=2)
+
+        use_case.execute(channels)
+
+        stats = pipeline.stats()
+        assert stats[FETCH_STAGE].processed == 4
+        assert stats[DETECT_STAGE].processed == 4
+        assert stats[NOTIFY_STAGE].processed == 2
+        assert stats[FETCH_STAGE].max_queue_depth >= 1
+        assert all(s.queue_depth == 0 for s in stats.values())
+
+    def test_サイクルの集計を返す(self, channels):
+        """配信中・配信開始・通知・エラーの件数をサイクル単位で集計する"""
+        repo = FakeStreamRepository(live={channels[0].id: "live1", channels[1].id: "live2"})
+        gateway = Mock(spec=NotificationGateway)
+        gateway.notify_stream_start.side_effect = [None, RuntimeError("discord down")]
+        use_case, pipeline, _ = build(repo, gateway, notify_workers=1)
+
+        summary = pipeline.run(channels, use_case.targets(channels))
+
+        assert summary.channels == 4
+        assert summary.live == 2
+        assert summary.started == 2
+        assert summary.notified == 1
+        assert summary.errors == 1
+
+    def test_通知失敗時は状態を更新しない(self, channels):
+        """通知に失敗したチャンネルは次回再試行できるよう状態を保存しない"""
+        repo = FakeStreamRepository(live={channels[0].id: "live1"})
+        gateway = Mock(spec=NotificationGateway)
+        gateway.notify_stream_start.side_effect = RuntimeError("discord down")
+        use_case, pipeline, state_repo = build(repo, gateway)
+
+        use_case.execute(channels[:1])
+
+        assert state_repo.get_state(channels[0].id) is None
+        assert pipeline.stats()[NOTIFY_STAGE].errors == 1
+
+    def test_クォータ超過後は残りのチャンクを取得しない(self, channels):
+        """クォータ超過を検知したら以降の取得を中止し、処理後に送出する"""
+        repo = Mock(spec=StreamRepository)
+        repo.get_current_streams.side_effect = lambda chunk: {
+            c.id: StreamFetchResult(error=QuotaExceededError("quota")) for c in chunk
+        }
+        use_case, _, _ = build(repo, chunk_size=1, fetch_workers=1)
+
+        with pytest.raises(QuotaExceededError):
+            use_case.execute(channels)
+
+        assert repo.get_current_streams.call_count == 1
+
+    def test_チャンクごとにまとめて検出し状態を一括保存する(self, channels):
+        """前回の状態の読み込みと保存はチャンクごとに1回"""
+        repo = FakeStreamRepository(live={channels[0].id: "live1"})
+        use_case, pipeline, state_repo = build(repo, chunk_size=4, fetch_workers=1)
+        state_repo.get_states = Mock(wraps=state_repo.get_states)
+        state_repo.save_states = Mock(wraps=state_repo.save_states)
+
+        pipeline.run(channels, use_case.targets(channels))
+
+        state_repo.get_states.assert_called_once()
+        state_repo.save_states.assert_called_once()
+        (saved,) = state_repo.save_states.call_args.args
+        assert len(saved) == 3
+        assert state_repo.get_state(channels[0].id).is_live is True
+
+    def test_一括検出に失敗した場合は1チャンネルずつ検出する(self, channels):
+        """失敗したチャンネルだけをエラーとして数え、他のチャンネルは検出する"""
+        repo = FakeStreamRepository(live={c.id: f"live{i}" for i, c in enumerate(channels)})
+        use_case, pipeline, state_repo = build(repo, chunk_size=4, fetch_workers=1)
+        broken = channels[1].id
+        get_state = state_repo.get_state
+
+        def get_state_or_fail(channel_id):
+            if channel_id == broken:
+                raise RuntimeError("broken state")
+            return get_state(channel_id)
+
+        state_repo.get_state = get_state_or_fail
+
+        summary = pipeline.run(channels, use_case.targets(channels))
+
+        assert summary.started == 3
+        assert summary.errors == 1
+        assert pipeline.stats()[DETECT_STAGE].errors == 1
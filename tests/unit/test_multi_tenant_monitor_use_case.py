@@ -0,0 +1,125 @@
+"""MultiTenantMonitorUseCaseのユニットテスト"""
+
+import pytest
+from unittest.mock import Mock
+
+from domain.repositories.notification_gateway import NotificationGateway
+from domain.repositories.stream_repository import StreamRepository
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.stream_fetch_result import StreamFetchResult
+from application.services.stream_change_detector import StreamChangeDetector
+from application.services.stream_fetch_service import StreamFetchService
+from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from application.use_cases.multi_tenant_monitor_use_case import (
+    MultiTenantMonitorUseCase,
+    Tenant,
+    deduplicate_channels,
+)
+from domain.repositories.errors import QuotaExceededError
+from tests.unit.fakes import InMemoryStateRepository, make_channel, make_stream
+
+CHANNEL_ID_1 = "UCxxxxxxxxxxxxxxxx111111"
+CHANNEL_ID_2 = "UCxxxxxxxxxxxxxxxx222222"
+CHANNEL_ID_3 = "UCxxxxxxxxxxxxxxxx333333"
+
+
+@pytest.fixture
+def stream_repo():
+    return Mock(spec=StreamRepository)
+
+
+@pytest.fixture
+def fetch_service(stream_repo):
+    return StreamFetchService(stream_repo)
+
+
+@pytest.fixture
+def make_tenant(stream_repo, fetch_service):
+    """テナントと、そのテナント専用の通知ゲートウェイ・状態リポジトリを作成"""
+
+    def _make(name, channels):
+        gateway = Mock(spec=NotificationGateway)
+        state_repo = InMemoryStateRepository()
+        use_case = MonitorStreamsUseCase(
+            stream_repository=stream_repo,
+            notification_gateway=gateway,
+            state_repository=state_repo,
+            change_detector=StreamChangeDetector(),
+            fetch_service=fetch_service,
+        )
+        return Tenant(name, channels, use_case), gateway, state_repo
+
+    return _make
+
+
+class TestDeduplicateChannels:
+    """deduplicate_channels のテスト"""
+
+    def test_ChannelIdで重複排除(self, make_tenant):
+        """複数テナントにある同じチャンネルは1つにまとめる（最初の出現を優先）"""
+        first = make_channel(CHANNEL_ID_1, webhook="aaa")
+        tenant_a, _, _ = make_tenant("a", [first, make_channel(CHANNEL_ID_2)])
+        tenant_b, _, _ = make_tenant(
+            "b", [make_channel(CHANNEL_ID_1, webhook="bbb"), make_channel(CHANNEL_ID_3)]
+        )
+
+        channels = deduplicate_channels([tenant_a, tenant_b])
+
+        assert [c.id for c in channels] == [
+            ChannelId(CHANNEL_ID_1),
+            ChannelId(CHANNEL_ID_2),
+            ChannelId(CHANNEL_ID_3),
+        ]
+        assert channels[0] is first
+
+
+class TestMultiTenantMonitorUseCase:
+    """MultiTenantMonitorUseCase のテスト"""
+
+    def test_共有チャンネルは1回だけ取得(self, stream_repo, fetch_service, make_tenant):
+        """重複チャンネルの取得は1回、通知と状態保存はテナントごとに行う"""
+        tenant_a, gateway_a, state_a = make_tenant(
+            "a", [make_channel(CHANNEL_ID_1), make_channel(CHANNEL_ID_2)]
+        )
+        tenant_b, gateway_b, state_b = make_tenant("b", [make_channel(CHANNEL_ID_1, webhook="bbb")])
+        stream_repo.get_current_streams.return_value = {
+            ChannelId(CHANNEL_ID_1): StreamFetchResult(stream=make_stream("live1")),
+            ChannelId(CHANNEL_ID_2): StreamFetchResult(),
+        }
+        use_case = MultiTenantMonitorUseCase(fetch_service, [tenant_a, tenant_b])
+
+        use_case.execute()
+
+        stream_repo.get_current_streams.assert_called_once()
+        fetched = stream_repo.get_current_streams.call_args[0][0]
+        assert len(fetched) == 2
+
+        gateway_a.notify_stream_start.assert_called_once()
+        notified_channel = gateway_b.notify_stream_start.call_args[0][0]
+        assert notified_channel.webhooks[0].url.endswith("/bbb")
+
+        # 状態はテナントごとに独立して保存される
+        assert state_a.get_state(ChannelId(CHANNEL_ID_2)) is not None
+        assert state_b.get_state(ChannelId(CHANNEL_ID_2)) is None
+
+    def test_テナント名の重複はエラー(self, fetch_service, make_tenant):
+        """同じ名前のテナントは状態の保存先が衝突するため拒否する"""
+        tenants = [make_tenant("a", [])[0], make_tenant("a", [])[0]]
+
+        with pytest.raises(ValueError):
+            MultiTenantMonitorUseCase(fetch_service, tenants)
+
+    def test_クォータ超過は全テナント処理後に送出(self, stream_repo, fetch_service, make_tenant):
+        """クォータ超過があっても他テナントの結果は反映してから送出する"""
+        tenant_a, _, _ = make_tenant("a", [make_channel(CHANNEL_ID_1)])
+        tenant_b, gateway_b, _ = make_tenant("b", [make_channel(CHANNEL_ID_2)])
+        stream_repo.get_current_streams.return_value = {
+            ChannelId(CHANNEL_ID_1): StreamFetchResult(error=QuotaExceededError("quota")),
+            ChannelId(CHANNEL_ID_2): StreamFetchResult(stream=make_stream("live2")),
+        }
+        use_case = MultiTenantMonitorUseCase(fetch_service, [tenant_a, tenant_b])
+
+        with pytest.raises(QuotaExceededError):
+            use_case.execute()
+
+        gateway_b.notify_stream_start.assert_called_once()
@@ -0,0 +1,128 @@
+"""通知済み動画IDの履歴（NotifiedVideoIndex・BloomFilter）のユニットテスト"""
+
+from unittest.mock import Mock
+
+from domain.entities.channel import Channel
+from domain.repositories.notification_gateway import NotificationGateway
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.webhook_config import WebhookConfig
+from application.dto.notified_video_index import NotifiedVideoIndex
+from application.dto.stream_state_dto import StreamStateDto
+from application.services.bloom_filter import BloomFilter
+from application.services.stream_change_detector import StreamChangeDetector
+from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from tests.unit.fakes import InMemoryStateRepository, make_stream
+
+
+class TestNotifiedVideoIndex:
+    """NotifiedVideoIndex のテスト"""
+
+    def test_直近の件数だけ保持する(self):
+        index = NotifiedVideoIndex()
+        for i in range(100):
+            index = index.with_video(f"v{i}", size=4)
+
+        assert index.recent == ["v96", "v97", "v98", "v99"]
+        assert "v99" in index
+        assert "v95" not in index
+
+    def test_再通知した動画は最新に移る(self):
+        index = NotifiedVideoIndex(["a", "b", "c"]).with_video("a", size=3)
+        index = index.with_video("d", size=3)
+
+        assert index.recent == ["c", "a", "d"]
+
+    def test_押し出した動画はブルームフィルターで覚えておく(self):
+        index = NotifiedVideoIndex()
+        for i in range(50):
+            index = index.with_video(f"v{i}", size=4, bloom_bits=2048)
+
+        assert all(f"v{i}" in index for i in range(50))
+        assert index.to_dict()["bloom_count"] == 46
+
+    def test_メモリ使用量は稼働時間によらず一定(self):
+        """ブルームフィルターは容量に達したら作り直し、サイズと偽陽性率を保つ"""
+        index = NotifiedVideoIndex()
+        sizes = set()
+        for i in range(2000):
+            index = index.with_video(f"v{i}", size=8, bloom_bits=1024)
+            sizes.add(len(index.to_dict()["bloom"]) if i >= 8 else 0)
+
+        assert len(index) == 8
+        assert len(sizes - {0}) == 1
+        assert index.to_dict()["bloom_count"] <= BloomFilter(1024).capacity
+
+    def test_保存形式の往復(self):
+        index = NotifiedVideoIndex()
+        for i in range(20):
+            index = index.with_video(f"v{i}", size=4, bloom_bits=512)
+
+        restored = NotifiedVideoIndex.from_dict(index.to_dict())
+
+        assert restored == index
+        assert "v0" in restored
+
+    def test_履歴のない状態ファイルは配信中の動画を引き継ぐ(self):
+        state = StreamStateDto.from_dict(
+            {
+                "is_live": True,
+                "video_id": "live1",
+                "last_checked": "2026-01-29T12:00:00",
+                "last_notified": "2026-01-29T11:00:00",
+            }
+        )
+
+        assert "live1" in state.notified
+
+
+class TestBloomFilter:
+    """BloomFilter のテスト"""
+
+    def test_偽陽性率(self):
+        bloom = BloomFilter(10000)
+        for i in range(bloom.capacity):
+            bloom.add(f"in-{i}")
+
+        assert all(f"in-{i}" in bloom for i in range(bloom.capacity))
+        false_positives = sum(f"out-{i}" in bloom for i in range(10000))
+        assert false_positives / 10000 < 0.03
+
+
+class TestRenotification:
+    """通知済みの配信を再通知しないことのテスト"""
+
+    def setup_method(self):
+        self.channel = Channel(
+            id=ChannelId("UCxxxxxxxxxxxxxxxx111111"),
+            name="配信者",
+            webhooks=[WebhookConfig("https://discord.com/api/webhooks/111/aaa")],
+        )
+        self.gateway = Mock(spec=NotificationGateway)
+        self.use_case = MonitorStreamsUseCase(
+            stream_repository=Mock(),
+            notification_gateway=self.gateway,
+            state_repository=InMemoryStateRepository(round_trip=True),
+            change_detector=StreamChangeDetector(),
+        )
+
+    def observe(self, video_id):
+        """1回の監視サイクルでの検出と通知"""
+        stream = make_stream(video_id) if video_id else None
+        job = self.use_case.detect(self.channel, stream)
+        if job is not None:
+            self.use_case.deliver(job)
+
+    def notified_videos(self):
+        return [c.args[1].video_id for c in self.gateway.notify_stream_start.call_args_list]
+
+    def test_配信中と未配信の揺れでは再通知しない(self):
+        for video_id in ["live1", None, "live1", None, "live1"]:
+            self.observe(video_id)
+
+        assert self.notified_videos() == ["live1"]
+
+    def test_並行配信の切り替えでは再通知しない(self):
+        for video_id in ["a", "b", "a", "b", "a", "c"]:
+            self.observe(video_id)
+
+        assert self.notified_videos() == ["a", "b", "c"]
@@ -0,0 +1,355 @@
+"""クォータ超過中の縮退運転（QuotaDegradation・新着動画フィード）のユニットテスト"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from domain.entities.channel import Channel
+from domain.entities.stream import Stream
+from domain.repositories.notification_gateway import NotificationGateway
+from domain.repositories.stream_repository import StreamRepository
+from domain.repositories.upload_feed_repository import UploadFeedRepository, latest_upload_since
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.stream_status import StreamStatus
+from domain.value_objects.webhook_config import WebhookConfig
+from application.services.clock import VirtualClock
+from application.services.monitor_pipeline import CycleSummary
+from application.services.quota_degradation import PROBE_VIDEO_ID, QuotaDegradation
+from application.services.stream_change_detector import StreamChangeDetector
+from application.services.stream_fetch_service import StreamFetchService
+from application.services.warm_state import WarmStateSnapshot
+from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from infrastructure.persistence.json_warm_state_repository import JsonWarmStateRepository
+from infrastructure.replay.recording_stream_repository import error_from_dict, error_to_dict
+from domain.repositories.errors import QuotaExceededError, RepositoryError
+from infrastructure.youtube.youtube_feed_repository import parse_feed
+from presentation.cli.monitor_controller import EXIT_OK, EXIT_QUOTA_EXCEEDED, MonitorController
+from tests.unit.fakes import InMemoryStateRepository
+
+START = datetime(2026, 1, 29, 3, 1, tzinfo=timezone.utc)
+CHANNEL_ID = "UCxxxxxxxxxxxxxxxx111111"
+
+FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015"
+      xmlns:media="http://search.yahoo.com/mrss/"
+      xmlns="http://www.w3.org/2005/Atom">
+  <title>配信者</title>
+  <entry>
+    <yt:videoId>old1</yt:videoId>
+    <title>過去の動画</title>
+    <published>2026-01-28T10:00:00+00:00</published>
+  </entry>
+  <entry>
+    <yt:videoId>new1</yt:videoId>
+    <title>新しい配信</title>
+    <published>2026-01-29T04:00:00+00:00</published>
+    <media:group>
+      <media:thumbnail url="https://i1.ytimg.com/vi/new1/hqdefault.jpg" width="480" height="360"/>
+    </media:group>
+  </entry>
+</feed>
+"""
+
+
+def channel() -> Channel:
+    return Channel(
+        id=ChannelId(CHANNEL_ID),
+        name="配信者",
+        webhooks=[WebhookConfig("https://discord.com/api/webhooks/111/aaa")],
+    )
+
+
+class FakeFeedRepository(UploadFeedRepository):
+    """テスト用のフィード（チャンネルごとの動画を返す）"""
+
+    def __init__(self, uploads):
+        self.uploads = uploads
+
+    def get_recent_uploads(self, channel):
+        return self.uploads.get(str(channel.id), [])
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock(START)
+
+
+class TestFeed:
+    """フィードの解析と新着の判定のテスト"""
+
+    def test_フィードを新しい順の動画に変換する(self):
+        uploads = parse_feed(FEED)
+
+        assert [upload.video_id for upload in uploads] == ["new1", "old1"]
+        assert uploads[0].status == StreamStatus.UPLOADED
+        assert uploads[0].thumbnail_url == "https://i1.ytimg.com/vi/new1/hqdefault.jpg"
+        assert uploads[1].thumbnail_url == "https://i.ytimg.com/vi/old1/hqdefault.jpg"
+        assert uploads[0].started_at == datetime(2026, 1, 29, 4, 0, tzinfo=timezone.utc)
+
+    def test_解析できないフィードはリポジトリエラー(self):
+        with pytest.raises(RepositoryError):
+            parse_feed("<html>")
+
+    def test_指定時刻以降の最新の動画だけを新着とみなす(self):
+        uploads = parse_feed(FEED)
+
+        latest = latest_upload_since(uploads, START)
+        assert latest is not None and latest.video_id == "new1"
+        assert latest_upload_since(uploads, START + timedelta(hours=2)) is None
+
+    def test_新着のないチャンネルは結果に含めない(self):
+        other = Channel(
+            id=ChannelId("UCxxxxxxxxxxxxxxxx222222"),
+            name="他の配信者",
+            webhooks=[WebhookConfig("https://discord.com/api/webhooks/222/bbb")],
+        )
+        feed = FakeFeedRepository({CHANNEL_ID: parse_feed(FEED)})
+
+        results = feed.get_latest_uploads([channel(), other], START)
+
+        assert list(results) == [ChannelId(CHANNEL_ID)]
+        upload = results[ChannelId(CHANNEL_ID)].stream
+        assert upload is not None and upload.video_id == "new1"
+
+
+class TestQuotaDegradation:
+    """QuotaDegradation のテスト"""
+
+    @pytest.fixture
+    def streams(self):
+        return Mock(spec=StreamRepository)
+
+    def test_リセット時刻の不明なエラーは次のJST18時までとみなす(self, streams, clock):
+        degradation = QuotaDegradation(streams, clock=clock)
+
+        degradation.enter(QuotaExceededError("クォータ超過"))
+
+        assert degradation.active
+        assert degradation.since == START
+        assert degradation.reset_at == datetime(2026, 1, 29, 9, 0, tzinfo=timezone.utc)
+        assert degradation.seconds_until_reset() == 6 * 3600 - 60
+
+    def test_確認の間隔ごとに1回だけクォータを確認する(self, streams, clock):
+        streams.get_streams.side_effect = QuotaExceededError("クォータ超過")
+        degradation = QuotaDegradation(streams, probe_interval=900, clock=clock)
+        degradation.enter(QuotaExceededError("クォータ超過"))
+
+        assert not degradation.probe_if_due()
+        clock.advance(900)
+        assert not degradation.probe_if_due()
+        assert not degradation.probe_if_due()
+
+        streams.get_streams.assert_called_once_with([PROBE_VIDEO_ID])
+        assert degradation.active
+
+    def test_確認に成功したらリセット前でも縮退運転を終了する(self, streams, clock):
+        streams.get_streams.return_value = {}
+        degradation = QuotaDegradation(streams, probe_interval=900, clock=clock)
+        degradation.enter(QuotaExceededError("クォータ超過"))
+
+        clock.advance(900)
+
+        assert degradation.probe_if_due()
+        assert not degradation.active
+        assert degradation.seconds_until_reset() == 0
+
+    def test_リセット時刻を過ぎたら間隔を待たずに確認する(self, streams, clock):
+        streams.get_streams.return_value = {}
+        degradation = QuotaDegradation(streams, probe_interval=3600, clock=clock)
+        degradation.enter(QuotaExceededError("クォータ超過", reset_at=START + timedelta(minutes=5)))
+
+        clock.advance(300)
+
+        assert degradation.probe_if_due()
+        streams.get_streams.assert_called_once()
+
+    def test_確認の応答でリセット時刻を更新する(self, streams, clock):
+        later = START + timedelta(hours=12)
+        streams.get_streams.side_effect = QuotaExceededError("クォータ超過", reset_at=later)
+        degradation = QuotaDegradation(streams, probe_interval=900, clock=clock)
+        degradation.enter(QuotaExceededError("クォータ超過"))
+
+        clock.advance(900)
+        degradation.probe_if_due()
+
+        assert degradation.reset_at == later
+
+
+class TestDegradedController:
+    """縮退運転中の MonitorController のテスト"""
+
+    @pytest.fixture
+    def use_case(self):
+        use_case = Mock(spec=MonitorStreamsUseCase)
+        use_case.execute.side_effect = QuotaExceededError(
+            "クォータ超過", reset_at=START + timedelta(hours=6)
+        )
+        use_case.execute_degraded.side_effect = lambda channels, since: CycleSummary(
+            channels=len(channels)
+        )
+        return use_case
+
+    def test_縮退運転中はフィードで監視しクォータが戻ったら通常の監視に戻る(self, use_case, clock):
+        streams = Mock(spec=StreamRepository)
+        streams.get_streams.side_effect = QuotaExceededError("クォータ超過")
+        degradation = QuotaDegradation(streams, probe_interval=900, clock=clock)
+        controller = MonitorController(
+            use_case=use_case,
+            channels=[channel()],
+            check_interval=300,
+            clock=clock,
+            degradation=degradation,
+        )
+
+        with pytest.raises(QuotaExceededError) as error:
+            controller._run_cycle()
+        degradation.enter(error.value)
+        controller._run_cycle()
+
+        use_case.execute_degraded.assert_called_once_with([channel()], START)
+        assert controller.health() == (True, "degraded: quota exceeded (21600s left)")
+
+        # 臨時チェックは受け付けない
+        future = controller.request_check([ChannelId(CHANNEL_ID)])
+        controller._process_requests()
+        with pytest.raises(QuotaExceededError):
+            future.result(timeout=0)
+
+        # クォータの回復を確認できたら通常の監視に戻る
+        streams.get_streams.side_effect = None
+        streams.get_streams.return_value = {}
+        use_case.execute.side_effect = lambda channels: CycleSummary(channels=len(channels))
+        clock.advance(900)
+        controller._run_cycle()
+
+        use_case.execute.assert_called_with([channel()])
+        assert use_case.execute_degraded.call_count == 1
+        assert not degradation.active
+
+    def test_単発実行でも縮退運転に切り替え次の実行に引き継ぐ(self, use_case, clock, tmp_path):
+        streams = Mock(spec=StreamRepository)
+        streams.get_streams.side_effect = QuotaExceededError("クォータ超過")
+
+        def run() -> int:
+            """新しいプロセスでの --once 実行を再現"""
+            degradation = QuotaDegradation(streams, probe_interval=900, clock=clock)
+            controller = MonitorController(
+                use_case=use_case,
+                channels=[channel()],
+                check_interval=300,
+                clock=clock,
+                degradation=degradation,
+            )
+            snapshot = WarmStateSnapshot(JsonWarmStateRepository(str(tmp_path / "warm.json")))
+            snapshot.register("quota_degradation", degradation)
+            snapshot.register("scheduler", controller)
+            snapshot.restore()
+            exit_code = controller.run_once(due_only=True)
+            snapshot.save()
+            return exit_code
+
+        assert run() == EXIT_QUOTA_EXCEEDED
+        use_case.execute_degraded.assert_not_called()
+
+        # 次の予定時刻（リセット前）の実行はフィードで監視し、確認の間隔まではAPIを呼び出さない
+        clock.advance(240)
+        assert run() == EXIT_OK
+        use_case.execute_degraded.assert_called_once_with([channel()], START)
+        streams.get_streams.assert_not_called()
+
+        # 確認の間隔が経過したらクォータの回復を確認する
+        clock.advance(660)
+        assert run() == EXIT_OK
+        streams.get_streams.assert_called_once_with([PROBE_VIDEO_ID])
+        assert use_case.execute_degraded.call_count == 2
+        assert use_case.execute.call_count == 1
+
+
+class TestExecuteDegraded:
+    """MonitorStreamsUseCase.execute_degraded のテスト"""
+
+    def test_新着の動画を通知し通常の監視の再開後は再通知しない(self, clock):
+        gateway = Mock(spec=NotificationGateway)
+        stream_repository = Mock(spec=StreamRepository)
+        feed = FakeFeedRepository({CHANNEL_ID: parse_feed(FEED)})
+        use_case = MonitorStreamsUseCase(
+            stream_repository=stream_repository,
+            notification_gateway=gateway,
+            state_repository=InMemoryStateRepository(),
+            change_detector=StreamChangeDetector(),
+            fetch_service=StreamFetchService(stream_repository, feed_repository=feed),
+            clock=clock,
+        )
+
+        summary = use_case.execute_degraded([channel()], START)
+        use_case.execute_degraded([channel()], START)
+
+        assert summary.notified == 1
+        gateway.notify_stream_start.assert_called_once()
+        notified = gateway.notify_stream_start.call_args.args[1]
+        assert (notified.video_id, notified.status) == ("new1", StreamStatus.UPLOADED)
+
+        # クォータの回復後、同じ動画が配信中として取得されても再通知しない
+        live = Stream(
+            video_id="new1",
+            title="新しい配信",
+            thumbnail_url="http://example.com/thumb.jpg",
+            started_at=START,
+            status=StreamStatus.LIVE,
+        )
+        stream_repository.get_current_streams.return_value = {ChannelId(CHANNEL_ID): live}
+        assert use_case.detect(channel(), live) is None
+
+    def test_新着の動画は配信中として記録せず通常の監視の再開後に配信終了としない(
+        self, clock, caplog
+    ):
+        stream_repository = Mock(spec=StreamRepository)
+        state_repository = InMemoryStateRepository()
+        feed = FakeFeedRepository({CHANNEL_ID: parse_feed(FEED)})
+        fetch_service = StreamFetchService(stream_repository, feed_repository=feed)
+        use_case = MonitorStreamsUseCase(
+            stream_repository=stream_repository,
+            notification_gateway=Mock(spec=NotificationGateway),
+            state_repository=state_repository,
+            change_detector=StreamChangeDetector(),
+            fetch_service=fetch_service,
+            clock=clock,
+        )
+
+        use_case.execute_degraded([channel()], START)
+        use_case.execute_degraded([channel()], START)
+
+        state = state_repository.get_state(ChannelId(CHANNEL_ID))
+        assert not state.is_live and state.video_id is None
+        assert "new1" in state.notified
+        assert not fetch_service.live_set.is_tracked(ChannelId(CHANNEL_ID))
+
+        # クォータの回復後、配信していないと取得されても配信終了としない
+        with caplog.at_level("INFO"):
+            assert use_case.detect(channel(), None) is None
+        assert "配信終了を検知" not in caplog.text
+
+    def test_フィードが未設定の場合は取得できない(self):
+        with pytest.raises(RuntimeError):
+            StreamFetchService(Mock(spec=StreamRepository)).fetch_uploads([channel()], START)
+
+
+class TestQuotaError:
+    """QuotaExceededError のリセット時刻のテスト"""
+
+    def test_記録と再生でリセット時刻を引き継ぐ(self):
+        reset_at = START + timedelta(hours=6)
+
+        restored = error_from_dict(error_to_dict(QuotaExceededError("超過", reset_at=reset_at)))
+
+        assert isinstance(restored, QuotaExceededError)
+        assert restored.reset_at == reset_at
+        assert restored.seconds_until_reset(START) == 6 * 3600
+
+    def test_リセット時刻が不明な場合(self):
+        error = error_from_dict(error_to_dict(QuotaExceededError("超過")))
+
+        assert isinstance(error, QuotaExceededError)
+        assert error.reset_at is None
+        assert error.seconds_until_reset(START) is None
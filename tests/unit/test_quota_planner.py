@@ -0,0 +1,192 @@
+"""クォータ・検知遅延の見積もり（quota_planner）のユニットテスト"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.quota_planner import (
+    DAY_SECONDS,
+    ChannelProfile,
+    PlanOptions,
+    StreamEvent,
+    build_profiles,
+    main,
+    plan,
+    quota_day_offset,
+    simulate_day,
+)
+
+CHANNEL_ID = "UCxxxxxxxxxxxxxxxx111111"
+TICKS = DAY_SECONDS // 300
+
+
+def profiles(count: int, hot: bool = True):
+    return [
+        ChannelProfile(channel_id=f"UC{i:022d}", streams_per_day=0, hot=hot) for i in range(count)
+    ]
+
+
+def simulate(channels, streams=(), uploads=None, policy="fixed", batching=True, feed=False, **kw):
+    options = PlanOptions(**kw)
+    return simulate_day(channels, list(streams), uploads or {}, policy, batching, feed, options)
+
+
+class TestSimulateDay:
+    """1日分の監視の模擬のテスト"""
+
+    def test_全チャンネルを5分ごとに確認する(self):
+        result = simulate(profiles(3))
+
+        assert result["units"] == {"playlistItems.list": 3 * TICKS, "videos.list": 0}
+
+    def test_配信予定の動画IDは一括化すると50件を1unitに詰める(self):
+        channels = profiles(60)
+        # 全チャンネルが最初の5分間だけ配信予定を持つ
+        streams = [StreamEvent(i, start=300, end=600, scheduled_at=0) for i in range(60)]
+
+        batched = simulate(channels, [StreamEvent(**vars(s)) for s in streams])
+        unbatched = simulate(channels, streams, batching=False)
+
+        # 予定の確認・配信開始の検知・終了の確認（各2 units）
+        assert batched["units"]["videos.list"] == 2 + 2 + 2
+        assert unbatched["units"]["videos.list"] == 60 + 60 + 60
+        assert max(batched["api_requests"].values()) < max(unbatched["api_requests"].values())
+
+    def test_配信開始は次の確認で検知する(self):
+        stream = StreamEvent(0, start=1000, end=5000, scheduled_at=None)
+
+        result = simulate(profiles(1), [stream])
+
+        assert stream.detected_at == 1200
+        assert result["latencies"] == [200.0]
+        assert result["missed"] == 0
+
+    def test_フィードで絞り込むとplaylistItemsを呼ばない(self):
+        stream = StreamEvent(0, start=1000, end=5000, scheduled_at=None)
+
+        result = simulate(profiles(2), [stream], feed=True, feed_lag=300)
+
+        assert result["units"]["playlistItems.list"] == 0
+        # フィードへの反映（1300秒）の後の確認で検知する
+        assert result["latencies"] == [500.0]
+        assert sum(result["feed_requests"].values()) > 0
+
+    def test_通常動画は一度だけ確認する(self):
+        result = simulate(profiles(1), uploads={0: [1000]})
+
+        assert result["units"]["videos.list"] == 1
+
+    def test_配信中は通常チェックの間だけ配信中セットで確認する(self):
+        stream = StreamEvent(0, start=0, end=3600, scheduled_at=None)
+
+        result = simulate(profiles(1), [stream], live_check_interval=60)
+
+        # 配信中も通常チェックでは playlistItems.list を呼ぶ（並行して始まった配信を検知する）
+        assert result["units"]["playlistItems.list"] == TICKS
+        # 通常チェック（12回）と、その間の配信中セットでの確認（4回ずつ）
+        assert result["units"]["videos.list"] == 1 + 12 * 5
+
+    def test_配信中セットで終了を確認したら次の配信を同じ確認で検知する(self):
+        first = StreamEvent(0, start=0, end=330, scheduled_at=None)
+        second = StreamEvent(0, start=340, end=3600, scheduled_at=None)
+
+        simulate(profiles(1), [first, second], live_check_interval=60)
+
+        assert second.detected_at == 360
+
+    def test_最近配信していないチャンネルは間隔を空けて確認する(self):
+        channels = profiles(2, hot=False)
+
+        fixed = simulate(channels)
+        tiered = simulate(channels, policy="tiered", cold_every=3)
+
+        assert tiered["units"]["playlistItems.list"] * 3 == fixed["units"]["playlistItems.list"]
+
+    def test_predictiveは配信開始の時間帯の前後だけ毎回確認する(self):
+        channel = ChannelProfile(CHANNEL_ID, streams_per_day=1, start_offsets=[43200], hot=True)
+        stream = StreamEvent(0, start=43500, end=46000, scheduled_at=None)
+
+        result = simulate([channel], [stream], policy="predictive", cold_every=3)
+
+        assert result["latencies"] == [0.0]
+        assert result["units"]["playlistItems.list"] < TICKS
+
+
+class TestPlan:
+    """見積もり全体のテスト"""
+
+    def test_同じ配信で方式を比較する(self):
+        channels = [ChannelProfile(f"UC{i:022d}", streams_per_day=1, hot=False) for i in range(20)]
+
+        scenarios = plan(channels, PlanOptions(), days=2, seed=1)
+
+        assert len(scenarios) == 12
+        counts = {s["detection_latency_seconds"]["count"] + s["missed_streams"] for s in scenarios}
+        assert len(counts) == 1
+        fixed = scenarios[0]
+        assert (fixed["policy"], fixed["batching"], fixed["feed_prefilter"]) == (
+            "fixed",
+            True,
+            False,
+        )
+        assert fixed["quota_units"] >= 20 * TICKS * 0.9
+        assert fixed["fits_budget"]
+
+    def test_過去の記録から配信頻度と時間帯を推定する(self):
+        now = datetime(2026, 1, 29, 12, 0, tzinfo=timezone.utc)
+        starts = {CHANNEL_ID: [now - timedelta(days=d) for d in range(10)]}
+        states = {"UCxxxxxxxxxxxxxxxx222222": {"last_checked": now.isoformat()}}
+
+        channel, quiet, unknown = build_profiles(
+            [CHANNEL_ID, "UCxxxxxxxxxxxxxxxx222222", "UCxxxxxxxxxxxxxxxx333333"],
+            streams_per_day=0.3,
+            starts=starts,
+            states=states,
+            unknown_hot=False,
+        )
+
+        assert channel.hot and round(channel.streams_per_day, 1) == 1.1
+        assert set(channel.start_offsets) == {quota_day_offset(now)}
+        # 12:00 UTC = 21:00 JST はクォータの日の開始（JST 18:00）から3時間後
+        assert quota_day_offset(now) == 3 * 3600
+        assert not quiet.hot and quiet.streams_per_day == 0.3
+        assert not unknown.hot
+
+
+class TestMain:
+    """コマンドラインのテスト"""
+
+    def test_設定ファイルから見積もりを出力する(self, tmp_path):
+        config = tmp_path / "config.json"
+        config.write_text(
+            json.dumps(
+                {
+                    "live_check_interval": 60,
+                    "api_batch_size": 50,
+                    "channels": [{"id": CHANNEL_ID, "name": "配信者"}],
+                }
+            ),
+            encoding="utf-8",
+        )
+        output = tmp_path / "plan.json"
+
+        assert (
+            main(
+                [
+                    "--config",
+                    str(config),
+                    "--add-channels",
+                    "40",
+                    "--policies",
+                    "fixed",
+                    "--output",
+                    str(output),
+                ]
+            )
+            == 0
+        )
+
+        report = json.loads(output.read_text(encoding="utf-8"))
+        assert report["channels"] == 41
+        assert [s["current"] for s in report["scenarios"]] == [True, False, False, False]
+        assert not report["scenarios"][0]["fits_budget"]
+        assert report["scenarios"][1]["quota_units_by_endpoint"]["playlistItems.list"] == 0
@@ -0,0 +1,165 @@
+"""仮想時計とAPI応答の記録・再生のユニットテスト"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from domain.entities.channel import Channel
+from domain.entities.stream import Stream
+from domain.repositories.stream_repository import StreamRepository
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.stream_fetch_result import StreamFetchResult
+from domain.value_objects.stream_status import StreamStatus
+from domain.value_objects.webhook_config import WebhookConfig
+from application.services.clock import VirtualClock
+from application.services.stream_change_detector import StreamChangeDetector
+from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from infrastructure.replay.dry_run_notification_gateway import DryRunNotificationGateway
+from infrastructure.replay.recording_stream_repository import RecordingStreamRepository
+from infrastructure.replay.replay_stream_repository import ReplayStreamRepository
+from domain.repositories.errors import QuotaExceededError
+from presentation.cli.monitor_controller import MonitorController
+from tests.unit.fakes import InMemoryStateRepository
+
+START = datetime(2026, 1, 29, 0, 0, tzinfo=timezone.utc)
+
+CHANNEL = Channel(
+    id=ChannelId("UCxxxxxxxxxxxxxxxx111111"),
+    name="テストチャンネル",
+    webhooks=[WebhookConfig(url="https://discord.com/api/webhooks/111/aaa")],
+)
+
+
+class ScheduledStreamRepository(StreamRepository):
+    """時計の時刻に応じて配信中かどうかが決まるリポジトリ（10:00〜12:00に配信）"""
+
+    def __init__(self, clock):
+        self._clock = clock
+
+    def _stream(self):
+        now = self._clock.now(timezone.utc)
+        if START + timedelta(hours=10) <= now < START + timedelta(hours=12):
+            status = StreamStatus.LIVE
+        elif now >= START + timedelta(hours=12):
+            status = StreamStatus.ENDED
+        else:
+            return None
+        return Stream(
+            video_id="live1",
+            title="テスト配信",
+            thumbnail_url="http://example.com/thumb.jpg",
+            started_at=START + timedelta(hours=10),
+            status=status,
+        )
+
+    def get_current_stream(self, channel):
+        stream = self._stream()
+        return stream if stream is not None and stream.is_live() else None
+
+    def get_streams(self, video_ids):
+        stream = self._stream()
+        return (
+            {stream.video_id: stream} if stream is not None and stream.video_id in video_ids else {}
+        )
+
+
+class TestVirtualClock:
+    """VirtualClock のテスト"""
+
+    def test_sleepで待たずに時刻が進む(self):
+        """sleep は実時間を消費せず、now / time / monotonic を進める"""
+        clock = VirtualClock(START)
+        started = time.monotonic()
+
+        clock.sleep(3600)
+
+        assert time.monotonic() - started < 1
+        assert clock.now(timezone.utc) == START + timedelta(hours=1)
+        assert clock.time() == START.timestamp() + 3600
+        assert clock.monotonic() == 3600
+
+    def test_過去には戻せない(self):
+        """set で過去の時刻を指定するとエラー"""
+        clock = VirtualClock(START)
+        clock.set(START + timedelta(minutes=5))
+
+        with pytest.raises(ValueError):
+            clock.set(START)
+
+
+class TestRecordAndReplay:
+    """記録と再生のテスト"""
+
+    def test_記録した時点の結果を再生する(self, tmp_path):
+        """再生時はその時刻以前で最後の観測を返し、エラーも復元する"""
+        path = tmp_path / "recording.jsonl"
+        clock = VirtualClock(START)
+        recorder = RecordingStreamRepository(ScheduledStreamRepository(clock), str(path), clock)
+
+        for hour in (9, 10, 12):
+            clock.set(START + timedelta(hours=hour))
+            recorder.get_current_streams([CHANNEL])
+            recorder.get_streams(["live1"])
+
+        replay = ReplayStreamRepository(str(path))
+        assert replay.started_at == START + timedelta(hours=9)
+        assert replay.ended_at == START + timedelta(hours=12)
+
+        # 時計を省略した場合は記録の開始時刻から始まる仮想時計で再生する
+        assert isinstance(replay.clock, VirtualClock)
+        assert replay.get_current_stream(CHANNEL) is None
+        replay.clock.set(START + timedelta(hours=11))
+        live = replay.get_current_stream(CHANNEL)
+        assert live is not None and live.video_id == "live1"
+        assert replay.get_streams(["live1"])["live1"].is_live()
+        replay.clock.set(START + timedelta(hours=12, minutes=30))
+        assert replay.get_current_stream(CHANNEL) is None
+        assert replay.get_streams(["live1"])["live1"].is_ended()
+
+    def test_クォータ超過を記録して再生(self, tmp_path):
+        """チャンネルごとの取得エラーは種類ごと再現する"""
+        path = tmp_path / "recording.jsonl"
+        inner = Mock(spec=StreamRepository)
+        inner.get_current_streams.return_value = {
+            CHANNEL.id: StreamFetchResult(error=QuotaExceededError("クォータ超過"))
+        }
+        RecordingStreamRepository(inner, str(path)).get_current_streams([CHANNEL])
+
+        results = ReplayStreamRepository(str(path)).get_current_streams([CHANNEL])
+
+        assert isinstance(results[CHANNEL.id].error, QuotaExceededError)
+
+    def test_記録した1日分の監視を高速に再現(self, tmp_path):
+        """仮想時計で監視ループを回し、終了時刻に達したら終了する"""
+        path = tmp_path / "recording.jsonl"
+        clock = VirtualClock(START)
+        recorder = RecordingStreamRepository(ScheduledStreamRepository(clock), str(path), clock)
+        while clock.now(timezone.utc) <= START + timedelta(days=1):
+            recorder.get_current_streams([CHANNEL])
+            clock.advance(300)
+
+        replay = ReplayStreamRepository(str(path))
+        gateway = DryRunNotificationGateway(replay.clock)
+        use_case = MonitorStreamsUseCase(
+            stream_repository=replay,
+            notification_gateway=gateway,
+            state_repository=InMemoryStateRepository(),
+            change_detector=StreamChangeDetector(),
+            clock=replay.clock,
+        )
+        controller = MonitorController(
+            use_case=use_case,
+            channels=[CHANNEL],
+            check_interval=300,
+            clock=replay.clock,
+            run_until=replay.ended_at,
+        )
+        started = time.monotonic()
+
+        controller.start()
+
+        assert time.monotonic() - started < 10
+        assert replay.clock.now(timezone.utc) >= replay.ended_at
+        assert [stream.video_id for _, stream in gateway.notifications] == ["live1"]
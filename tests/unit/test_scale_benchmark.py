@@ -0,0 +1,76 @@
+"""スケールベンチマークと代替サーバーのユニットテスト"""
+
+import pytest
+
+from benchmarks.fake_servers import FakeDiscordServer, FakeServerConfig, FakeYouTubeServer
+from benchmarks.scale_benchmark import Scenario, compare, run_scenario
+
+
+@pytest.fixture
+def servers():
+    """代替YouTube・Discordサーバーを起動し、終了後に停止する"""
+    started = []
+
+    def start(channels, youtube_config=None):
+        youtube = FakeYouTubeServer(channels, youtube_config)
+        discord = FakeDiscordServer()
+        for server in (youtube, discord):
+            server.start()
+            started.append(server)
+        return youtube, discord
+
+    yield start
+    for server in started:
+        server.stop()
+
+
+class TestScaleBenchmark:
+    """run_scenario のテスト"""
+
+    def test_配信開始を検知して通知する(self, servers):
+        """HTTPバッチ経由で取得し、配信開始したチャンネル数だけ通知が届く"""
+        youtube, discord = servers(30)
+        scenario = Scenario(channels=30, cycles=2, go_live_per_cycle=3, batch_size=10)
+
+        result = run_scenario(scenario, youtube.url, discord.url)
+
+        summary = result["summary"]
+        assert [c["went_live"] for c in result["cycles"]] == [0, 3, 3]
+        assert summary["notifications"] == 6
+        assert summary["discord_requests"] == 6
+        assert summary["quota_units"] == sum(summary["api_calls"].values())
+        # 10件ずつHTTPバッチにまとめるため、往復数はAPI呼び出し数より少ない
+        assert summary["http_requests"] < summary["quota_units"]
+        assert summary["detection_latency_seconds"]["count"] == 6
+
+    def test_クォータ上限で打ち切り(self, servers):
+        """クォータ上限に達したサイクルで計測を終了する"""
+        youtube, discord = servers(30, FakeServerConfig(quota_limit=40))
+        scenario = Scenario(channels=30, cycles=3, go_live_per_cycle=1, batch_size=10)
+
+        result = run_scenario(scenario, youtube.url, discord.url)
+
+        assert result["summary"]["quota_exceeded"] is True
+        assert result["summary"]["quota_units"] <= 40
+        assert result["cycles"][-1]["quota_exceeded"] is True
+
+
+class TestCompare:
+    """compare のテスト"""
+
+    def test_許容範囲を超えた悪化を報告(self):
+        """前回より許容範囲を超えて大きくなった指標のみ返す"""
+        baseline = {
+            "results": [
+                {"channels": 1000, "summary": {"cycle_seconds_p50": 1.0, "peak_rss_mb": 100.0}}
+            ]
+        }
+        results = [
+            {"channels": 1000, "summary": {"cycle_seconds_p50": 1.5, "peak_rss_mb": 110.0}},
+            {"channels": 5000, "summary": {"cycle_seconds_p50": 9.0}},
+        ]
+
+        regressions = compare(results, baseline, tolerance=0.2)
+
+        assert len(regressions) == 1
+        assert "cycle_seconds_p50" in regressions[0]
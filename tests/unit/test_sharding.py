@@ -0,0 +1,209 @@
+"""チャンネルのシャーディング（コンシステントハッシュ・共有ストア・割り当て）のユニットテスト"""
+
+import json
+import subprocess
+import sys
+import textwrap
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import Mock
+
+import pytest
+
+from domain.entities.channel import Channel
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.webhook_config import WebhookConfig
+from application.dto.stream_state_dto import StreamStateDto
+from application.services.clock import VirtualClock
+from application.services.consistent_hash import ConsistentHashRing
+from application.services.monitor_pipeline import CycleSummary
+from application.services.shard_assignment import ShardAssignment
+from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from infrastructure.persistence.sqlite_membership_repository import SqliteMembershipRepository
+from infrastructure.persistence.sqlite_state_repository import SqliteStateRepository
+from presentation.cli.monitor_controller import MonitorController
+
+START = datetime(2026, 1, 29, 3, 1, tzinfo=timezone.utc)
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def channel_ids(count: int):
+    return [f"UC{index:022d}" for index in range(count)]
+
+
+def channel(channel_id: str) -> Channel:
+    return Channel(
+        id=ChannelId(channel_id),
+        name="配信者",
+        webhooks=[WebhookConfig("https://discord.com/api/webhooks/111/aaa")],
+    )
+
+
+class TestConsistentHashRing:
+    """ConsistentHashRing のテスト"""
+
+    def test_担当は偏りなく分かれる(self):
+        ring = ConsistentHashRing(["w1", "w2", "w3", "w4"])
+        counts: Dict[str, int] = {}
+        for key in channel_ids(10000):
+            owner = ring.owner(key)
+            counts[owner] = counts.get(owner, 0) + 1
+
+        assert set(counts) == {"w1", "w2", "w3", "w4"}
+        assert all(1500 < count < 3500 for count in counts.values())
+
+    def test_ワーカーの追加で移るのは約N分の1(self):
+        """4 → 5 ワーカーで担当が変わるのは約 1/5 で、移る先は追加したワーカーだけ"""
+        keys = channel_ids(10000)
+        before = ConsistentHashRing(["w1", "w2", "w3", "w4"])
+        after = ConsistentHashRing(["w1", "w2", "w3", "w4", "w5"])
+
+        moved = [key for key in keys if before.owner(key) != after.owner(key)]
+
+        assert 0.1 < len(moved) / len(keys) < 0.3
+        assert {after.owner(key) for key in moved} == {"w5"}
+
+    def test_ワーカーがいない場合(self):
+        with pytest.raises(ValueError):
+            ConsistentHashRing().owner("UC0")
+
+
+class TestSqliteStores:
+    """共有ストア（SQLite）のテスト"""
+
+    def test_状態は別のインスタンスから読める(self, tmp_path):
+        """担当が移った先のワーカーが前回の状態を引き継ぐ"""
+        path = str(tmp_path / "shared.db")
+        state = StreamStateDto(is_live=True, video_id="v1", last_checked=START, last_notified=START)
+        channel_id = ChannelId(channel_ids(1)[0])
+
+        SqliteStateRepository(path).save_state(channel_id, state)
+        other = SqliteStateRepository(path)
+
+        assert other.get_state(channel_id) == state
+        assert SqliteStateRepository(path, namespace="other").get_state(channel_id) is None
+
+    def test_生存の期限切れと離脱(self, tmp_path):
+        clock = VirtualClock(START)
+        membership = SqliteMembershipRepository(str(tmp_path / "shared.db"), clock=clock)
+        membership.heartbeat("w1", 30)
+        membership.heartbeat("w2", 30)
+        clock.advance(20)
+        membership.heartbeat("w2", 30)
+
+        clock.advance(15)
+        assert membership.active_members() == ["w2"]
+
+        membership.leave("w2")
+        assert membership.active_members() == []
+
+
+class TestShardAssignment:
+    """ShardAssignment と MonitorController の連携のテスト"""
+
+    @pytest.fixture
+    def clock(self):
+        return VirtualClock(START)
+
+    @pytest.fixture
+    def membership(self, tmp_path, clock):
+        return SqliteMembershipRepository(str(tmp_path / "shared.db"), clock=clock)
+
+    def test_ワーカーの増減で担当が移る(self, membership, clock):
+        channels = [channel(channel_id) for channel_id in channel_ids(200)]
+        released: List[ChannelId] = []
+        w1 = ShardAssignment("w1", membership, clock=clock, on_released=released.append)
+        w2 = ShardAssignment("w2", membership, clock=clock)
+
+        assert w1.select(channels) == channels
+
+        w2.select(channels)
+        owned_1 = w1.select(channels)
+        owned_2 = w2.select(channels)
+        assert len(owned_1) + len(owned_2) == len(channels)
+        assert not {c.id for c in owned_1} & {c.id for c in owned_2}
+        assert set(released) == {c.id for c in owned_2}
+
+        # w2 が終了すると w1 がすべて引き継ぐ
+        w2.leave()
+        assert w1.select(channels) == channels
+
+    def test_生存の記録が途絶えたワーカーの担当を引き継ぐ(self, membership, clock):
+        channels = [channel(channel_id) for channel_id in channel_ids(50)]
+        w1 = ShardAssignment("w1", membership, clock=clock)
+        ShardAssignment("w2", membership, clock=clock).heartbeat_if_due()
+        assert len(w1.select(channels)) < len(channels)
+
+        clock.advance(31)
+
+        assert w1.select(channels) == channels
+
+    def test_監視サイクルは担当分だけ取得する(self, membership, clock):
+        channels = [channel(channel_id) for channel_id in channel_ids(20)]
+        ShardAssignment("w2", membership, clock=clock).heartbeat_if_due()
+        shard = ShardAssignment("w1", membership, clock=clock)
+        use_case = Mock(spec=MonitorStreamsUseCase)
+        use_case.execute.side_effect = lambda targets: CycleSummary(channels=len(targets))
+        controller = MonitorController(
+            use_case=use_case, channels=channels, check_interval=300, clock=clock, shard=shard
+        )
+
+        controller._run_cycle()
+
+        targets = use_case.execute.call_args.args[0]
+        assert 0 < len(targets) < len(channels)
+        assert all(shard.owns(target.id) for target in targets)
+
+
+WORKER_SCRIPT = textwrap.dedent("""
+    import json, sys, time
+    from domain.entities.channel import Channel
+    from domain.value_objects.channel_id import ChannelId
+    from domain.value_objects.webhook_config import WebhookConfig
+    from application.services.shard_assignment import ShardAssignment
+    from infrastructure.persistence.sqlite_membership_repository import (
+        SqliteMembershipRepository,
+    )
+
+    path, worker_id, workers, count = sys.argv[1], sys.argv[2], int(sys.argv[3]), int(sys.argv[4])
+    channels = [
+        Channel(
+            id=ChannelId(f"UC{index:022d}"),
+            name="x",
+            webhooks=[WebhookConfig("https://discord.com/api/webhooks/111/aaa")],
+        )
+        for index in range(count)
+    ]
+    membership = SqliteMembershipRepository(path)
+    shard = ShardAssignment(worker_id, membership, heartbeat_interval=1, member_ttl=60)
+    deadline = time.monotonic() + 30
+    while len(membership.active_members()) < workers and time.monotonic() < deadline:
+        shard.heartbeat_if_due()
+        time.sleep(0.05)
+    print(json.dumps([str(channel.id) for channel in shard.select(channels)]))
+    """)
+
+
+def test_複数プロセスで重複なく分担する(tmp_path):
+    """同じ共有ストアを使うプロセスが、すべてのチャンネルを重複なく分担する"""
+    path = str(tmp_path / "shared.db")
+    workers = ["w1", "w2", "w3"]
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "-c", WORKER_SCRIPT, path, worker_id, str(len(workers)), "300"],
+            cwd=ROOT,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        for worker_id in workers
+    ]
+    owned = []
+    for process in processes:
+        stdout, _ = process.communicate(timeout=60)
+        assert process.returncode == 0
+        owned.append(set(json.loads(stdout)))
+
+    assert all(owned)
+    assert sum(len(ids) for ids in owned) == 300
+    assert set().union(*owned) == set(channel_ids(300))
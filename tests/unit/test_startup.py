@@ -0,0 +1,63 @@
+"""起動の高速化（同梱のディスカバリー文書・遅延読み込み）のユニットテスト"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from infrastructure.youtube.discovery import METHODS, load_discovery_document
+from infrastructure.youtube.youtube_stream_repository import YouTubeStreamRepository
+from benchmarks.startup_benchmark import HEAVY_MODULES, measure_first_cycle
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+class TestDiscoveryDocument:
+    """同梱のディスカバリー文書のテスト"""
+
+    def test_使用するメソッドだけを含む(self):
+        """文書には使用するリソース・メソッドだけが含まれる"""
+        document = json.loads(load_discovery_document())
+
+        assert {
+            resource: tuple(value["methods"]) for resource, value in document["resources"].items()
+        } == METHODS
+
+    def test_同梱の文書でリクエストを組み立てる(self):
+        """ネットワークに接続せずにクライアントを生成し、JSONの応答を要求する"""
+        repository = YouTubeStreamRepository("test-api-key", api_endpoint="http://127.0.0.1:1/")
+
+        request = repository._videos_request(["abc", "def"])
+
+        assert request.uri.startswith("http://127.0.0.1:1/youtube/v3/videos?")
+        assert "alt=json" in request.uri
+        assert "id=abc%2Cdef" in request.uri
+        assert "key=test-api-key" in request.uri
+
+
+class TestLazyImport:
+    """起動時に重い依存を読み込まないことのテスト"""
+
+    def test_mainの読み込みで重い依存を読み込まない(self):
+        """googleapiclient・requests・http.server は使う時点まで読み込まない"""
+        code = (
+            "import sys, json; import main; "
+            f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+
+        assert json.loads(completed.stdout.strip().splitlines()[-1]) == []
+
+
+class TestStartupBenchmark:
+    """起動時間ベンチマークのテスト"""
+
+    def test_最初のサイクルの完了までを計測(self):
+        """新しいプロセスで最初のサイクルを実行し、配信中のチャンネルを通知する"""
+        result = measure_first_cycle(channel_count=5, runs=1, go_live=1)
+
+        assert result["notifications"] == 1
+        assert 0 < result["import_seconds_p50"] < result["process_seconds_p50"]
+        assert result["cycle_seconds_p50"] > 0
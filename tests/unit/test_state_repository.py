@@ -0,0 +1,66 @@
+"""状態リポジトリの一括取得・一括保存のユニットテスト"""
+
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from domain.value_objects.channel_id import ChannelId
+from application.dto.notified_video_index import NotifiedVideoIndex
+from application.dto.stream_state_dto import StreamStateDto
+from infrastructure.persistence.json_state_repository import JsonStateRepository
+from infrastructure.persistence.sqlite_state_repository import SqliteStateRepository
+
+
+def channel_id(index: int) -> ChannelId:
+    return ChannelId(f"UC{index:022d}")
+
+
+def state(index: int) -> StreamStateDto:
+    return StreamStateDto(
+        is_live=index % 2 == 0,
+        video_id=f"video{index}" if index % 2 == 0 else None,
+        last_checked=datetime(2026, 1, 29, 12, 0),
+        last_notified=None,
+        notified=NotifiedVideoIndex([f"video{index}"]),
+    )
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def make_repository(request, tmp_path):
+    if request.param == "json":
+        return lambda: JsonStateRepository(str(tmp_path / "state.json"))
+    return lambda: SqliteStateRepository(str(tmp_path / "shared.db"))
+
+
+class TestBulkStateRepository:
+    """get_states / save_states のテスト"""
+
+    def test_一括保存した状態を一括取得できる(self, make_repository):
+        states = {channel_id(i): state(i) for i in range(1200)}
+        make_repository().save_states(states)
+
+        ids = [channel_id(i) for i in range(1300)]
+        loaded = make_repository().get_states(ids)
+
+        assert loaded[:1200] == [states[i] for i in ids[:1200]]
+        assert loaded[1200:] == [None] * 100
+
+    def test_1件ずつの保存と同じ内容(self, make_repository):
+        repository = make_repository()
+        repository.save_state(channel_id(1), state(1))
+        repository.save_states({channel_id(2): state(2)})
+
+        assert repository.get_states([channel_id(2), channel_id(1)]) == [state(2), state(1)]
+        assert repository.get_state(channel_id(2)) == state(2)
+
+    def test_JSONの一括保存はファイルを1回だけ書き込む(self, tmp_path):
+        repository = JsonStateRepository(str(tmp_path / "state.json"))
+
+        with patch.object(repository, "_save_to_file", wraps=repository._save_to_file) as save:
+            repository.save_states({channel_id(i): state(i) for i in range(100)})
+
+        save.assert_called_once()
+        data = json.loads((tmp_path / "state.json").read_text(encoding="utf-8"))
+        assert len(data) == 100
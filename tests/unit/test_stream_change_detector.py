@@ -5,6 +5,7 @@ from datetime import datetime
 
 from domain.entities.stream import Stream
 from domain.value_objects.stream_status import StreamStatus
+from application.dto.notified_video_index import NotifiedVideoIndex
 from application.dto.stream_state_dto import StreamStateDto
 from application.services.stream_change_detector import StreamChangeDetector
 
@@ -135,3 +136,83 @@ class TestStreamChangeDetector:
         result = self.detector.is_stream_ended(None, None)
 
         assert result is False
+
+
+class TestDetectChanges:
+    """StreamChangeDetector.detect_changes（一括検出）のテスト"""
+
+    def setup_method(self):
+        self.detector = StreamChangeDetector()
+        self.now = datetime(2026, 1, 29, 12, 0)
+
+    def state(self, is_live, video_id=None, notified=()):
+        return StreamStateDto(
+            is_live=is_live,
+            video_id=video_id,
+            last_checked=datetime(2026, 1, 29, 11, 55),
+            last_notified=datetime(2026, 1, 29, 11, 0) if notified else None,
+            notified=NotifiedVideoIndex(notified),
+        )
+
+    def stream(self, video_id):
+        return Stream(
+            video_id=video_id,
+            title="テスト配信",
+            thumbnail_url="http://example.com/thumb.jpg",
+            started_at=datetime.now(),
+            status=StreamStatus.LIVE,
+        )
+
+    def test_変化の種類ごとに分類する(self):
+        previous = [
+            None,
+            self.state(False),
+            self.state(True, "a", notified=["a"]),
+            self.state(True, "a", notified=["a"]),
+            self.state(True, "a", notified=["a"]),
+            None,
+            self.state(False, notified=["a"]),
+            self.state(True, "b", notified=["a", "b"]),
+        ]
+        streams = [
+            self.stream("x"),
+            self.stream("x"),
+            self.stream("a"),
+            self.stream("b"),
+            None,
+            None,
+            None,
+            self.stream("a"),
+        ]
+
+        changes = self.detector.detect_changes(previous, streams, self.now)
+
+        assert changes.started == [0, 1, 3]
+        assert changes.continued == [2, 7]
+        assert changes.ended == [4]
+        assert changes.went_offline == [5]
+        updates = dict(changes.updates)
+        assert sorted(updates) == [2, 4, 5, 7]
+        assert updates[7].video_id == "a" and updates[7].is_live
+        assert updates[7].last_checked == self.now
+        assert updates[4].is_live is False
+        assert updates[4].last_notified == previous[4].last_notified
+        assert "a" in updates[4].notified
+
+    def test_1件ずつの判定と一致する(self):
+        states = [None, self.state(False), self.state(True, "a", notified=["a"])]
+        states += [self.state(False, notified=["a"]), self.state(True, "b", notified=["b"])]
+        streams = [None, self.stream("a"), self.stream("b")]
+        pairs = [(p, s) for p in states for s in streams]
+
+        changes = self.detector.detect_changes(
+            [p for p, _ in pairs], [s for _, s in pairs], self.now
+        )
+
+        for i, (p, s) in enumerate(pairs):
+            assert (i in changes.started) == self.detector.is_stream_started(p, s)
+            assert (i in changes.ended) == self.detector.is_stream_ended(p, s)
+
+    def test_件数が一致しない場合はエラー(self):
+        with pytest.raises(ValueError):
+            self.detector.detect_changes([None], [], self.now)
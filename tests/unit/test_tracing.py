@@ -0,0 +1,192 @@
+"""構造化トレースのユニットテスト"""
+
+import json
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from domain.entities.channel import Channel
+from domain.entities.stream import Stream
+from domain.repositories.notification_gateway import NotificationGateway
+from domain.repositories.stream_repository import StreamRepository
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.stream_fetch_result import StreamFetchResult
+from domain.value_objects.stream_status import StreamStatus
+from domain.value_objects.webhook_config import WebhookConfig
+from application.services.stream_change_detector import StreamChangeDetector
+from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from application.services.tracer import SpanExporter, Tracer, get_tracer, set_tracer
+from infrastructure.tracing.exporters import JsonlSpanExporter, OtlpHttpSpanExporter
+from infrastructure.youtube.youtube_stream_repository import (
+    RepositoryError,
+    YouTubeStreamRepository,
+)
+from tests.unit.fakes import InMemoryStateRepository
+
+CHANNEL_ID = "UCxxxxxxxxxxxxxxxx111111"
+
+
+class InMemorySpanExporter(SpanExporter):
+    """終了したスパンをリストに保持するエクスポーター"""
+
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+    def by_name(self, name):
+        return [span for span in self.spans if span.name == name]
+
+
+@pytest.fixture
+def exporter():
+    """共有のトレーサーをテスト用に差し替え、終了後に元に戻す"""
+    previous = get_tracer()
+    exporter = InMemorySpanExporter()
+    set_tracer(Tracer(exporter))
+    yield exporter
+    set_tracer(previous)
+
+
+class TestTracer:
+    """Tracer のテスト"""
+
+    def test_入れ子のスパンは親子関係を持つ(self, exporter):
+        """同じスレッド内のスパンは現在のスパンの子になり、例外は記録して再送出する"""
+        tracer = get_tracer()
+        with tracer.span("cycle", channels=2) as root:
+            with tracer.span("channel") as child:
+                child.add_event("retry_sleep", seconds=1)
+            with pytest.raises(ValueError):
+                with tracer.span("failing"):
+                    raise ValueError("boom")
+
+        channel, failing, cycle = exporter.spans
+        assert cycle is root and cycle.parent_span_id is None
+        assert channel.parent_span_id == root.span_id
+        assert channel.trace_id == root.trace_id
+        assert channel.events[0][0] == "retry_sleep"
+        assert failing.error == "ValueError: boom"
+        assert cycle.attributes == {"channels": 2}
+        assert tracer.current_span() is None
+
+    def test_サンプリングはルートで決まり子に引き継がれる(self):
+        """記録しないサイクルの子スパンも記録しない"""
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter, sample_ratio=0.0)
+
+        with tracer.span("cycle") as root:
+            with tracer.span("channel") as child:
+                child.set_attribute("x", 1)
+
+        assert root.sampled is False and child.sampled is False
+        assert child.trace_id == root.trace_id
+        assert exporter.spans == []
+
+    def test_エクスポーター未設定は記録しない(self):
+        """既定のトレーサーはスパンを記録しない"""
+        with Tracer().span("cycle") as span:
+            pass
+
+        assert span.sampled is False
+        assert span.duration_seconds is None
+
+
+class TestExporters:
+    """エクスポーターのテスト"""
+
+    def test_JSONLに出力してローテーション(self, tmp_path):
+        """1スパン1行で追記し、サイズを超えたら世代を分ける"""
+        path = tmp_path / "traces.jsonl"
+        exporter = JsonlSpanExporter(str(path), max_bytes=600, backup_count=2)
+        tracer = Tracer(exporter)
+
+        for i in range(10):
+            with tracer.span("cycle", index=i):
+                pass
+        exporter.shutdown()
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        data = json.loads(lines[-1])
+        assert data["name"] == "cycle"
+        assert data["attributes"] == {"index": 9}
+        assert data["status"] == "ok"
+        assert (tmp_path / "traces.jsonl.1").exists()
+        assert not (tmp_path / "traces.jsonl.3").exists()
+
+    def test_OTLPのJSON形式に変換して送信(self):
+        """シャットダウン時に溜まったスパンをOTLP/HTTPの形式で送信する"""
+        exporter = OtlpHttpSpanExporter("http://collector/v1/traces", flush_interval=60)
+        tracer = Tracer(exporter)
+        with tracer.span("cycle") as root:
+            with tracer.span("youtube.videos.list", attempts=2):
+                pass
+
+        with patch("infrastructure.tracing.exporters.requests.post") as mock_post:
+            mock_post.return_value.status_code = 200
+            tracer.shutdown()
+
+        payload = mock_post.call_args.kwargs["json"]
+        spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        assert [span["name"] for span in spans] == ["youtube.videos.list", "cycle"]
+        assert spans[0]["parentSpanId"] == root.span_id
+        assert spans[0]["attributes"] == [{"key": "attempts", "value": {"intValue": "2"}}]
+        assert spans[1]["status"] == {"code": 1}
+
+
+class TestInstrumentation:
+    """監視処理のスパンのテスト"""
+
+    def test_監視サイクルの子にチャンネルごとのスパン(self, exporter):
+        """パイプラインのワーカースレッドのスパンも監視サイクルの子として記録される"""
+        channel = Channel(
+            id=ChannelId(CHANNEL_ID),
+            name="テストチャンネル",
+            webhooks=[WebhookConfig(url="https://discord.com/api/webhooks/111/aaa")],
+        )
+        stream = Stream(
+            video_id="live1",
+            title="テスト配信",
+            thumbnail_url="http://example.com/thumb.jpg",
+            started_at=datetime.now(),
+            status=StreamStatus.LIVE,
+        )
+        stream_repo = Mock(spec=StreamRepository)
+        stream_repo.get_current_streams.return_value = {channel.id: StreamFetchResult(stream)}
+        use_case = MonitorStreamsUseCase(
+            stream_repository=stream_repo,
+            notification_gateway=Mock(spec=NotificationGateway),
+            state_repository=InMemoryStateRepository(),
+            change_detector=StreamChangeDetector(),
+        )
+
+        use_case.execute([channel])
+
+        (cycle,) = exporter.by_name("monitor.cycle")
+        (fetch,) = exporter.by_name("pipeline.fetch")
+        (detect,) = exporter.by_name("channel.detect")
+        (notify,) = exporter.by_name("channel.notify")
+        for span in (fetch, detect, notify):
+            assert span.trace_id == cycle.trace_id
+            assert span.parent_span_id == cycle.span_id
+        assert detect.attributes["channel_id"] == CHANNEL_ID
+        assert detect.events[0][0] == "stream_started"
+        assert notify.attributes["delivered"] is True
+
+    def test_API呼び出しのリトライと待機を記録(self, exporter):
+        """試行回数・失敗・リトライ前の待機がAPI呼び出しのスパンに記録される"""
+        repository = YouTubeStreamRepository("test-api-key")
+        func = Mock(side_effect=ConnectionError("reset"))
+
+        with patch("infrastructure.youtube.youtube_stream_repository.time.sleep"):
+            with pytest.raises(RepositoryError):
+                repository._retry_on_error(func, "videos.list (テスト)")
+
+        (span,) = exporter.by_name("youtube.videos.list")
+        events = [name for name, _, _ in span.events]
+        assert span.attributes["attempts"] == YouTubeStreamRepository.MAX_RETRIES
+        assert events.count("attempt_failed") == YouTubeStreamRepository.MAX_RETRIES
+        assert events.count("retry_sleep") == YouTubeStreamRepository.MAX_RETRIES - 1
+        assert span.error.startswith("RepositoryError")
@@ -0,0 +1,337 @@
+"""ウォーム状態のスナップショット（単発実行・再起動時の引き継ぎ）のユニットテスト"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+from unittest.mock import Mock
+
+import pytest
+
+from domain.entities.channel import Channel
+from domain.value_objects.channel_id import ChannelId
+from domain.value_objects.webhook_config import WebhookConfig
+from application.services.clock import VirtualClock
+from application.services.live_set_tracker import LiveSetTracker
+from application.services.monitor_pipeline import CycleSummary
+from application.services.quota_reset import next_quota_reset
+from application.services.stream_change_detector import StreamChangeDetector
+from application.services.warm_state import WarmStateComponent, WarmStateSnapshot
+from application.use_cases.monitor_streams_use_case import MonitorStreamsUseCase
+from infrastructure.discord.discord_notification_gateway import DiscordNotificationGateway
+from infrastructure.persistence.json_state_repository import JsonStateRepository
+from infrastructure.persistence.json_warm_state_repository import JsonWarmStateRepository
+from domain.repositories.errors import QuotaExceededError
+from infrastructure.youtube.quota_ledger import QuotaLedger
+from infrastructure.youtube.youtube_stream_repository import YouTubeStreamRepository
+from presentation.cli.monitor_controller import (
+    EXIT_ERROR,
+    EXIT_OK,
+    EXIT_PARTIAL,
+    EXIT_QUOTA_EXCEEDED,
+    MonitorController,
+)
+from benchmarks.fake_servers import FakeDiscordServer, FakeYouTubeServer, channel_id_for
+
+# JST 12:01:00（次の5分の倍数まで240秒）
+START = datetime(2026, 1, 29, 3, 1, tzinfo=timezone.utc)
+
+CHANNEL_ID = ChannelId("UCxxxxxxxxxxxxxxxx111111")
+
+
+class Counter(WarmStateComponent):
+    """状態を出し入れするだけのコンポーネント"""
+
+    def __init__(self):
+        self.value = 0
+
+    def export_warm_state(self) -> Dict[str, Any]:
+        return {"value": self.value}
+
+    def restore_warm_state(self, state: Dict[str, Any]) -> None:
+        self.value = state["value"]
+
+
+class TestWarmStateSnapshot:
+    """WarmStateSnapshot と JsonWarmStateRepository のテスト"""
+
+    def test_保存した状態を復元(self, tmp_path):
+        """コンポーネントごとの状態を1ファイルに保存し、別のインスタンスに復元する"""
+        path = tmp_path / "warm_state.json"
+        counter = Counter()
+        counter.value = 42
+        snapshot = WarmStateSnapshot(JsonWarmStateRepository(str(path)))
+        snapshot.register("counter", counter)
+        snapshot.save()
+
+        restored = Counter()
+        snapshot = WarmStateSnapshot(JsonWarmStateRepository(str(path)))
+        snapshot.register("counter", restored)
+
+        assert snapshot.restore() == 1
+        assert restored.value == 42
+        assert not path.with_name("warm_state.json.tmp").exists()
+
+    def test_壊れたファイルは無視して開始(self, tmp_path):
+        """読み込めないスナップショットは警告のみで、空の状態のまま開始する"""
+        path = tmp_path / "warm_state.json"
+        path.write_text("{broken", encoding="utf-8")
+        counter = Counter()
+        snapshot = WarmStateSnapshot(JsonWarmStateRepository(str(path)))
+        snapshot.register("counter", counter)
+
+        assert snapshot.restore() == 0
+        assert counter.value == 0
+
+    def test_オブジェクトでないファイルは無視して開始(self, tmp_path):
+        """JSONとして読めてもスナップショットの形式でなければ空の状態のまま開始する"""
+        path = tmp_path / "warm_state.json"
+        path.write_text("[1, 2]", encoding="utf-8")
+
+        assert JsonWarmStateRepository(str(path)).load() is None
+
+    def test_終了済み動画IDを引き継ぐ(self):
+        """復元した終了済みの動画は videos.list の確認対象から除外される"""
+        repository = YouTubeStreamRepository("test-api-key")
+        repository.restore_warm_state({"ended_video_ids": {"UCxxx": ["old1", "old2"]}})
+        playlist = {"items": [{"contentDetails": {"videoId": v}} for v in ("new1", "old1", "old2")]}
+
+        assert repository._select_candidates("UCxxx", playlist) == ["new1"]
+        assert repository.export_warm_state()["ended_video_ids"] == {"UCxxx": ["old1", "old2"]}
+
+
+class TestQuotaLedger:
+    """QuotaLedger のテスト"""
+
+    def test_JST18時に消費量をリセット(self):
+        """クォータの日が変わると消費量は0から数え直す"""
+        clock = VirtualClock(START)
+        ledger = QuotaLedger(clock)
+        ledger.record("playlistItems.list", 3)
+        ledger.record("search.list")
+
+        assert ledger.used() == 103
+        assert next_quota_reset(START).hour == 18
+
+        clock.set(next_quota_reset(START))
+        assert ledger.used() == 0
+
+    def test_同じ日の消費量だけを引き継ぐ(self):
+        """再起動後も同じクォータの日であれば消費量を引き継ぐ"""
+        clock = VirtualClock(START)
+        ledger = QuotaLedger(clock)
+        ledger.record("videos.list", 5)
+        state = ledger.export_warm_state()
+
+        restored = QuotaLedger(clock)
+        restored.restore_warm_state(state)
+        assert restored.by_endpoint() == {"videos.list": 5}
+
+        clock.set(next_quota_reset(START))
+        expired = QuotaLedger(clock)
+        expired.restore_warm_state(state)
+        assert expired.used() == 0
+
+
+class TestLiveSetTrackerWarmState:
+    """LiveSetTracker のウォーム状態のテスト"""
+
+    def test_追跡中の配信を引き継ぐ(self):
+        """video IDと同時視聴者数を復元する"""
+        tracker = LiveSetTracker()
+        tracker.track(CHANNEL_ID, "live1")
+        tracker._concurrent_viewers[CHANNEL_ID] = 120
+
+        restored = LiveSetTracker()
+        restored.restore_warm_state(tracker.export_warm_state())
+
+        assert restored.get_video_id(CHANNEL_ID) == "live1"
+        assert restored.get_concurrent_viewers(CHANNEL_ID) == 120
+
+
+class TestWarmRestart:
+    """常駐プロセスでのウォーム状態の保存・引き継ぎのテスト"""
+
+    @pytest.fixture
+    def clock(self):
+        return VirtualClock(START)
+
+    def test_定期的に保存し終了時にも保存(self, tmp_path, clock):
+        """監視サイクルの後に保存間隔ごとに保存し、監視の終了時にも保存する"""
+        use_case = Mock(spec=MonitorStreamsUseCase)
+        repository = Mock(wraps=JsonWarmStateRepository(str(tmp_path / "warm.json")))
+        snapshot = WarmStateSnapshot(repository, clock)
+        controller = MonitorController(
+            use_case=use_case,
+            channels=[],
+            check_interval=300,
+            clock=clock,
+            run_until=START + timedelta(minutes=29),
+            warm_state=snapshot,
+            warm_state_interval=900,
+        )
+        snapshot.register("scheduler", controller)
+
+        controller.start()
+
+        # サイクルは 12:01, 12:05, ..., 12:25 の6回、保存は 12:01 / 12:20 と終了時の3回
+        assert use_case.execute.call_count == 6
+        assert repository.save.call_count == 3
+        saved = JsonWarmStateRepository(str(tmp_path / "warm.json")).load()
+        assert saved is not None
+        assert saved["components"]["scheduler"]["next_check_at"] == clock.time()
+
+    def test_引き継いだ予定時刻まで通常チェックを待つ(self, clock):
+        """再起動直後に予定外の通常チェックを行わない"""
+        use_case = Mock(spec=MonitorStreamsUseCase)
+        controller = MonitorController(
+            use_case=use_case,
+            channels=[],
+            check_interval=300,
+            clock=clock,
+            run_until=START + timedelta(minutes=4, seconds=1),
+        )
+        controller.restore_warm_state({"next_check_at": clock.time() + 240})
+
+        controller.start()
+
+        # 12:01 の起動時ではなく予定どおり 12:05 に1回だけ実行する
+        assert use_case.execute.call_count == 1
+        assert clock.now(timezone.utc) >= START + timedelta(minutes=9)
+
+    def test_予定時刻までの待機中のクォータ超過で停止しない(self, clock):
+        """待機中の配信中チェックのエラーも監視ループで扱い、リセット後に監視を続ける"""
+        use_case = Mock(spec=MonitorStreamsUseCase)
+        use_case.check_live_streams.side_effect = [
+            QuotaExceededError("quota", reset_at=START + timedelta(minutes=3)),
+            *[CycleSummary()] * 10,
+        ]
+        controller = MonitorController(
+            use_case=use_case,
+            channels=[],
+            check_interval=300,
+            live_check_interval=60,
+            clock=clock,
+            run_until=START + timedelta(minutes=3, seconds=30),
+        )
+        controller.restore_warm_state({"next_check_at": clock.time() + 240})
+
+        controller.start()
+
+        # 12:02 の配信中チェックでクォータ超過 → 12:04 のリセットまで待ってから通常チェック
+        use_case.check_live_streams.assert_called_once()
+        use_case.execute.assert_called_once()
+        assert clock.now(timezone.utc) == START + timedelta(minutes=4)
+
+
+class TestRunOnce:
+    """MonitorController.run_once のテスト"""
+
+    @pytest.fixture
+    def clock(self):
+        return VirtualClock(START)
+
+    @pytest.fixture
+    def use_case(self):
+        use_case = Mock(spec=MonitorStreamsUseCase)
+        use_case.execute.return_value = CycleSummary(channels=1)
+        use_case.check_live_streams.return_value = CycleSummary(channels=1)
+        return use_case
+
+    def controller(self, use_case, clock, live_check_interval=0):
+        return MonitorController(
+            use_case=use_case,
+            channels=[],
+            check_interval=300,
+            live_check_interval=live_check_interval,
+            clock=clock,
+        )
+
+    def test_終了コード(self, use_case, clock):
+        """成功・一部失敗・失敗・クォータ超過を終了コードで区別する"""
+        controller = self.controller(use_case, clock)
+        assert controller.run_once() == EXIT_OK
+
+        use_case.execute.return_value = CycleSummary(channels=1, errors=1)
+        assert controller.run_once() == EXIT_PARTIAL
+
+        use_case.execute.side_effect = RuntimeError("boom")
+        assert controller.run_once() == EXIT_ERROR
+
+        use_case.execute.side_effect = QuotaExceededError(
+            "クォータ超過", reset_at=clock.now(timezone.utc) + timedelta(hours=1)
+        )
+        assert controller.run_once() == EXIT_QUOTA_EXCEEDED
+        assert controller.export_warm_state()["next_check_at"] == clock.time() + 3600
+
+    def test_予定時刻に達したチェックだけを行う(self, use_case, clock):
+        """due_only では前回の実行が記録した予定時刻まで通常チェックを行わない"""
+        controller = self.controller(use_case, clock, live_check_interval=60)
+        controller.run_once(due_only=True)
+        state = controller.export_warm_state()
+        assert state["next_check_at"] == clock.time() + 240
+        assert state["next_live_check_at"] == clock.time() + 60
+
+        # 別プロセスでの実行を想定して予定時刻を引き継ぐ
+        controller = self.controller(use_case, clock, live_check_interval=60)
+        controller.restore_warm_state(state)
+
+        clock.advance(30)
+        assert controller.run_once(due_only=True) == EXIT_OK
+        clock.advance(30)
+        controller.run_once(due_only=True)
+        clock.advance(180)
+        controller.run_once(due_only=True)
+
+        assert use_case.execute.call_count == 2
+        assert use_case.check_live_streams.call_count == 1
+
+
+class TestRunOnceWithWarmState:
+    """単発実行を繰り返したときのクォータ消費のテスト"""
+
+    def test_2回目以降は終了済みの動画を確認しない(self, tmp_path):
+        """ウォーム状態を引き継いだ実行は、常駐プロセスの2サイクル目と同じコストで済む"""
+        youtube = FakeYouTubeServer(20)
+        discord = FakeDiscordServer()
+        youtube.start()
+        discord.start()
+        channels = [
+            Channel(
+                id=ChannelId(channel_id_for(i)),
+                name=f"ch{i}",
+                webhooks=[WebhookConfig(url=f"https://discord.com/api/webhooks/{i}/token")],
+            )
+            for i in range(20)
+        ]
+
+        def run():
+            """新しいプロセスでの --once 実行を再現し、消費したクォータを返す"""
+            before = youtube.stats()["quota_units"]
+            repository = YouTubeStreamRepository("test-api-key", api_endpoint=youtube.url)
+            use_case = MonitorStreamsUseCase(
+                stream_repository=repository,
+                notification_gateway=DiscordNotificationGateway(api_base_url=discord.url),
+                state_repository=JsonStateRepository(str(tmp_path / "state.json")),
+                change_detector=StreamChangeDetector(),
+            )
+            controller = MonitorController(use_case=use_case, channels=channels, check_interval=300)
+            snapshot = WarmStateSnapshot(JsonWarmStateRepository(str(tmp_path / "warm.json")))
+            snapshot.register("youtube", repository)
+            snapshot.register("scheduler", controller)
+            snapshot.restore()
+            assert controller.run_once() == EXIT_OK
+            snapshot.save()
+            return youtube.stats()["quota_units"] - before
+
+        try:
+            cold = run()
+            youtube.advance(go_live=1)
+            warm = run()
+        finally:
+            youtube.stop()
+            discord.stop()
+
+        # 初回: playlistItems 20件 + 過去動画400件の videos.list 8回
+        assert cold == 28
+        # 2回目: playlistItems 20件 + 配信を開始した1件の videos.list 1回
+        assert warm == 21
+        assert discord.stats()["requests"] == 1
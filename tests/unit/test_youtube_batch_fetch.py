@@ -0,0 +1,302 @@
+"""YouTubeStreamRepositoryのHTTPバッチ一括取得のユニットテスト"""
+
+import json
+import pytest
+from unittest.mock import patch
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from domain.value_objects.channel_id import ChannelId
+from infrastructure.youtube.youtube_stream_repository import (
+    YouTubeStreamRepository,
+    RepositoryError,
+    QuotaExceededError,
+)
+from tests.unit.fakes import make_channel
+
+CHANNEL_IDS = [f"UCxxxxxxxxxxxxxxxx{i:06d}" for i in range(1, 6)]
+
+
+def http_error(status: int, reason: str = "backendError") -> HttpError:
+    """テスト用のHttpErrorを作成"""
+    content = json.dumps(
+        {"error": {"code": status, "message": reason, "errors": [{"reason": reason}]}}
+    ).encode("utf-8")
+    return HttpError(httplib2.Response({"status": status}), content)
+
+
+def video_item(video_id: str, live_broadcast_content: str = "none") -> dict:
+    return {
+        "id": video_id,
+        "snippet": {
+            "title": f"動画 {video_id}",
+            "publishedAt": "2026-01-01T00:00:00Z",
+            "liveBroadcastContent": live_broadcast_content,
+            "thumbnails": {"high": {"url": "http://example.com/thumb.jpg"}},
+        },
+        "liveStreamingDetails": {},
+    }
+
+
+class FakeRequest:
+    def __init__(self, youtube, kind, kwargs):
+        self._youtube = youtube
+        self.kind = kind
+        self.kwargs = kwargs
+
+    def execute(self):
+        return self._youtube.handle(self)
+
+
+class FakeBatch:
+    def __init__(self, youtube):
+        self._youtube = youtube
+        self._calls = []
+
+    def add(self, request, callback=None, request_id=None):
+        self._calls.append((request, callback, request_id))
+
+    def execute(self):
+        self._youtube.batch_sizes.append(len(self._calls))
+        for request, callback, request_id in self._calls:
+            try:
+                response, exception = request.execute(), None
+            except HttpError as e:
+                response, exception = None, e
+            callback(request_id, response, exception)
+
+
+class FakeYouTube:
+    """playlistItems/videos/channels/new_batch_http_request のみを持つフェイク"""
+
+    def __init__(self, playlists, videos, playlist_errors=None, channels=None):
+        self.playlists = playlists  # playlistId -> [video_id]
+        self.videos_db = videos  # video_id -> liveBroadcastContent
+        self.playlist_errors = playlist_errors or {}  # playlistId -> [HttpError, ...]
+        self.channels_db = channels or {}  # channelId -> アップロードプレイリストID
+        self.calls = []
+        self.batch_sizes = []
+
+    def playlistItems(self):
+        return self._resource("playlistItems")
+
+    def videos(self):
+        return self._resource("videos")
+
+    def channels(self):
+        return self._resource("channels")
+
+    def _resource(self, kind):
+        youtube = self
+
+        class _Resource:
+            def list(self, **kwargs):
+                return FakeRequest(youtube, kind, kwargs)
+
+        return _Resource()
+
+    def new_batch_http_request(self):
+        return FakeBatch(self)
+
+    def handle(self, request):
+        self.calls.append(request)
+        if request.kind == "playlistItems":
+            playlist_id = request.kwargs["playlistId"]
+            errors = self.playlist_errors.get(playlist_id)
+            if errors:
+                raise errors.pop(0)
+            if playlist_id not in self.playlists:
+                raise http_error(404, "playlistNotFound")
+            return {
+                "items": [{"contentDetails": {"videoId": v}} for v in self.playlists[playlist_id]]
+            }
+        ids = request.kwargs["id"].split(",")
+        if request.kind == "channels":
+            return {
+                "items": [
+                    {
+                        "id": c,
+                        "snippet": {"title": f"チャンネル {c[-2:]}"},
+                        "contentDetails": {"relatedPlaylists": {"uploads": self.channels_db[c]}},
+                    }
+                    for c in ids
+                    if c in self.channels_db
+                ]
+            }
+        return {"items": [video_item(v, self.videos_db[v]) for v in ids if v in self.videos_db]}
+
+
+def playlist_id(channel_id: str) -> str:
+    return "UU" + channel_id[2:]
+
+
+@pytest.fixture
+def make_repository():
+    def _make(fake, batch_size=50):
+        with patch(
+            "infrastructure.youtube.youtube_stream_repository.build_from_document",
+            return_value=fake,
+        ):
+            return YouTubeStreamRepository("test_key", batch_size=batch_size)
+
+    return _make
+
+
+class TestBatchFetch:
+    """get_current_streams のテスト"""
+
+    def test_チャンネルごとに結果を振り分け(self, make_repository):
+        """配信中・未配信がチャンネルごとに正しく返る"""
+        fake = FakeYouTube(
+            playlists={
+                playlist_id(CHANNEL_IDS[0]): ["a1", "a2"],
+                playlist_id(CHANNEL_IDS[1]): ["b1"],
+            },
+            videos={"a1": "none", "a2": "live", "b1": "upcoming"},
+        )
+        repo = make_repository(fake)
+        channels = [make_channel(CHANNEL_IDS[0]), make_channel(CHANNEL_IDS[1])]
+
+        results = repo.get_current_streams(channels)
+
+        assert results[channels[0].id].stream.video_id == "a2"
+        assert results[channels[1].id].ok and results[channels[1].id].stream is None
+        # playlistItems 2件 + videos 1件（2チャンネル分を1回に詰める）
+        assert [c.kind for c in fake.calls].count("videos") == 1
+
+    def test_バッチサイズごとに往復をまとめる(self, make_repository):
+        """batch_size件ごとに1回のHTTPバッチになる"""
+        fake = FakeYouTube(
+            playlists={playlist_id(c): [f"v{i}"] for i, c in enumerate(CHANNEL_IDS)},
+            videos={f"v{i}": "none" for i in range(len(CHANNEL_IDS))},
+        )
+        repo = make_repository(fake, batch_size=2)
+
+        repo.get_current_streams([make_channel(c) for c in CHANNEL_IDS])
+
+        # playlistItems: 5件 → 2, 2, 1 / videos: 1件
+        assert fake.batch_sizes == [2, 2, 1, 1]
+
+    def test_404はチャンネル単位のエラー(self, make_repository):
+        """存在しないプレイリストはそのチャンネルのみエラーになる"""
+        fake = FakeYouTube(
+            playlists={playlist_id(CHANNEL_IDS[0]): ["a1"]},
+            videos={"a1": "live"},
+        )
+        repo = make_repository(fake)
+        channels = [make_channel(CHANNEL_IDS[0]), make_channel(CHANNEL_IDS[1])]
+
+        results = repo.get_current_streams(channels)
+
+        assert results[channels[0].id].stream.video_id == "a1"
+        assert isinstance(results[channels[1].id].error, RepositoryError)
+
+    def test_500は失敗分のみリトライ(self, make_repository):
+        """一時的なエラーは失敗したリクエストのみ再バッチされる"""
+        fake = FakeYouTube(
+            playlists={playlist_id(c): [] for c in CHANNEL_IDS[:2]},
+            videos={},
+            playlist_errors={playlist_id(CHANNEL_IDS[1]): [http_error(503)]},
+        )
+        repo = make_repository(fake)
+        channels = [make_channel(c) for c in CHANNEL_IDS[:2]]
+
+        with patch("infrastructure.youtube.youtube_stream_repository.time.sleep"):
+            results = repo.get_current_streams(channels)
+
+        assert all(result.ok for result in results.values())
+        assert fake.batch_sizes == [2, 1]
+
+    def test_クォータ超過は該当チャンネルに伝搬(self, make_repository):
+        """quotaExceededは残りの全チャンネルにQuotaExceededErrorとして返る"""
+        fake = FakeYouTube(
+            playlists={playlist_id(c): ["v"] for c in CHANNEL_IDS},
+            videos={"v": "none"},
+            playlist_errors={playlist_id(CHANNEL_IDS[0]): [http_error(403, "quotaExceeded")]},
+        )
+        repo = make_repository(fake, batch_size=2)
+        channels = [make_channel(c) for c in CHANNEL_IDS]
+
+        results = repo.get_current_streams(channels)
+
+        assert isinstance(results[channels[0].id].error, QuotaExceededError)
+        # 最初のバッチ以降は送信しない
+        assert fake.batch_sizes == [2]
+        assert all(isinstance(results[c.id].error, QuotaExceededError) for c in channels[2:])
+
+    def test_バッチ無効時もクォータ超過後は送信しない(self, make_repository):
+        """batch_size=1 の場合もクォータ超過以降のチャンネルは取得しない"""
+        fake = FakeYouTube(
+            playlists={playlist_id(c): ["v"] for c in CHANNEL_IDS},
+            videos={"v": "none"},
+            playlist_errors={playlist_id(CHANNEL_IDS[0]): [http_error(403, "quotaExceeded")]},
+        )
+        repo = make_repository(fake, batch_size=1)
+        channels = [make_channel(c) for c in CHANNEL_IDS]
+
+        results = repo.get_current_streams(channels)
+
+        assert all(isinstance(r.error, QuotaExceededError) for r in results.values())
+        assert len(fake.calls) == 1
+        assert fake.batch_sizes == []
+
+    def test_終了済みの動画は再確認しない(self, make_repository):
+        """2回目以降、終了済みと判明している動画は videos.list の対象外"""
+        fake = FakeYouTube(
+            playlists={playlist_id(CHANNEL_IDS[0]): ["old1", "old2"]},
+            videos={"old1": "none", "old2": "none"},
+        )
+        repo = make_repository(fake)
+        channel = make_channel(CHANNEL_IDS[0])
+
+        repo.get_current_streams([channel])
+        fake.calls.clear()
+        results = repo.get_current_streams([channel])
+
+        assert results[channel.id].stream is None
+        assert [c.kind for c in fake.calls] == ["playlistItems"]
+
+
+class TestLookupChannels:
+    """lookup_channels のテスト"""
+
+    def test_50件ずつまとめて確認し存在しないチャンネルはNone(self, make_repository):
+        channel_ids = [f"UCxxxxxxxxxxxxxxxx{i:06d}" for i in range(120)]
+        fake = FakeYouTube(
+            playlists={}, videos={}, channels={c: playlist_id(c) for c in channel_ids[1:]}
+        )
+        repo = make_repository(fake)
+
+        results = repo.lookup_channels([ChannelId(c) for c in channel_ids])
+
+        assert [len(c.kwargs["id"].split(",")) for c in fake.calls] == [50, 50, 20]
+        assert fake.batch_sizes == [3]
+        assert results[ChannelId(channel_ids[0])] is None
+        metadata = results[ChannelId(channel_ids[1])]
+        assert metadata.uploads_playlist_id == playlist_id(channel_ids[1])
+        assert metadata.title == "チャンネル 01"
+
+    def test_確認したアップロードプレイリストIDで取得する(self, make_repository):
+        """UC→UU の変換と異なるプレイリストIDも確認後はそのまま使う"""
+        channel_id = CHANNEL_IDS[0]
+        fake = FakeYouTube(
+            playlists={"UUactual": ["v1"]},
+            videos={"v1": "live"},
+            channels={channel_id: "UUactual"},
+        )
+        repo = make_repository(fake, batch_size=1)
+        channel = make_channel(channel_id)
+
+        repo.lookup_channels([channel.id])
+        results = repo.get_current_streams([channel])
+
+        assert results[channel.id].stream.video_id == "v1"
+
+    def test_クォータ超過はそのまま伝搬(self, make_repository):
+        fake = FakeYouTube(playlists={}, videos={})
+        repo = make_repository(fake)
+
+        with patch.object(fake, "handle", side_effect=http_error(403, "quotaExceeded")):
+            with pytest.raises(QuotaExceededError):
+                repo.lookup_channels([ChannelId(c) for c in CHANNEL_IDS])